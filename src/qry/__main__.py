@@ -2,11 +2,118 @@
 
 import argparse
 import sys
+import tempfile
+from pathlib import Path
 
 from qry.app import run
+from qry.application.data_file import is_data_file, load_data_file, table_name_for
+from qry.application.export_tee import ExportTarget, ExportTee
+from qry.application.import_job import (
+    ImportJob,
+    ImportProgress,
+    default_reject_path,
+    default_workers,
+)
+from qry.application.streaming_export import csv_copy, split_batches
 from qry.domains.connection.models import ConnectionConfig, DatabaseType
 from qry.domains.connection.service import ConnectionManager
+from qry.domains.database.factory import AdapterFactory
+from qry.domains.export.base import Exporter
+from qry.domains.export.compression import CompressionOptions
+from qry.domains.export.formats import EXPORTERS, create_exporter, format_for_path
+from qry.domains.export.sql import DEFAULT_TABLE_NAME
 from qry.shared.constants import VERSION
+from qry.shared.exceptions import QryError
+from qry.shared.settings import Settings
+from qry.ui.widgets.widget_export_progress import format_import_progress
+
+
+def export_query(
+    connection: ConnectionConfig,
+    sql: str,
+    exporter: Exporter,
+    targets: list[ExportTarget],
+    compression: CompressionOptions | None = None,
+) -> int:
+    """Run ``sql`` and stream its rows to every target without the TUI.
+
+    The rows are read once however many targets there are. Without
+    targets they go to stdout through ``exporter``. A target is compressed
+    when its extension is ``.gz``, ``.bz2`` or ``.xz``. CSV comes straight
+    from the database when it can produce it (PostgreSQL's COPY).
+    """
+    adapter = AdapterFactory.create(connection)
+    try:
+        adapter.connect()
+        exporters = [target.exporter for target in targets] or [exporter]
+        copy = csv_copy(adapter, sql, None, exporters)
+        if copy is not None:
+            chunks = (b"".join(batch) for batch in copy)
+            if not targets:
+                sys.stdout.buffer.writelines(chunks)
+            else:
+                ExportTee(targets, compression).write_bytes(chunks)
+        else:
+            columns, row_batches = split_batches(adapter.stream(sql))
+            if not targets:
+                exporter.export_stream(columns, row_batches, sys.stdout)
+            else:
+                ExportTee(targets, compression).run(columns, row_batches)
+    except (QryError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        adapter.disconnect()
+    return 0
+
+
+def import_file(connection: ConnectionConfig, job: ImportJob) -> int:
+    """Load ``job``'s file into its table without the TUI, reporting to stderr."""
+    adapter = AdapterFactory.create(connection)
+    try:
+        adapter.connect()
+        count = job.run(adapter)
+    except (QryError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        adapter.disconnect()
+
+    progress = job.progress
+    print(
+        f"Imported {count:,} rows into {job.table} in {progress.elapsed_seconds:.1f}s "
+        f"({progress.rows_per_second:,.0f} rows/s)",
+        file=sys.stderr,
+    )
+    if progress.rejected:
+        print(f"Rejected {progress.rejected:,} rows, see {job.reject_path}", file=sys.stderr)
+    return 0
+
+
+def open_data_file(path: Path, database: Path, table: str) -> int:
+    """Load a data file into a scratch database to query, reporting to stderr."""
+
+    def show_progress(progress: ImportProgress) -> None:
+        print(f"\rLoading {path.name}: {format_import_progress(progress)}", end="", file=sys.stderr)
+
+    on_progress = show_progress if sys.stderr.isatty() else None
+    try:
+        job = load_data_file(path, database, table, on_progress=on_progress)
+    except (QryError, OSError) as e:
+        print(f"\nError: {e}" if on_progress else f"Error: {e}", file=sys.stderr)
+        return 1
+
+    progress = job.progress
+    if on_progress:
+        print(file=sys.stderr)
+    print(
+        f"Loaded {progress.rows:,} rows from {path.name} into table {table} "
+        f"in {progress.elapsed_seconds:.1f}s",
+        file=sys.stderr,
+    )
+    if progress.rejected:
+        print(f"Skipped {progress.rejected:,} rows that could not be read", file=sys.stderr)
+    return 0
 
 
 def main() -> int:
@@ -16,7 +123,51 @@ def main() -> int:
     )
     parser.add_argument("-v", "--version", action="version", version=f"qry {VERSION}")
     parser.add_argument("-c", "--connection", help="Connection name to use", metavar="NAME")
-    parser.add_argument("database", nargs="?", help="SQLite database file path")
+    parser.add_argument(
+        "database",
+        nargs="?",
+        help="SQLite database file path, or a CSV, TSV or JSON file to query as a table",
+    )
+    parser.add_argument(
+        "-e",
+        "--execute",
+        help="Run a query and export its rows instead of opening the TUI",
+        metavar="SQL",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        action="append",
+        default=[],
+        help="Export file, repeat to write several from one run (default: stdout)",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(EXPORTERS),
+        help="Export format (default: from each output's extension, else csv)",
+    )
+    parser.add_argument(
+        "--table",
+        help="Table for SQL and SQLite exports, or to import or load into (default: file name)",
+        metavar="NAME",
+    )
+    parser.add_argument(
+        "-i",
+        "--import",
+        dest="import_path",
+        type=Path,
+        help="Load a CSV, TSV or NDJSON file into a table instead of opening the TUI",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "--rejects",
+        type=Path,
+        help="File for rows that cannot be imported (default: FILE.rejects.csv)",
+        metavar="FILE",
+    )
 
     args = parser.parse_args()
     connection: ConnectionConfig | None = None
@@ -27,6 +178,19 @@ def main() -> int:
         if not connection:
             print(f"Error: Connection '{args.connection}' not found", file=sys.stderr)
             return 1
+    elif args.database and is_data_file(Path(args.database)):
+        data_path = Path(args.database)
+        # Holds the scratch database; removed when main returns
+        scratch = tempfile.TemporaryDirectory(prefix="qry-")
+        database = Path(scratch.name) / "data.db"
+        status = open_data_file(data_path, database, args.table or table_name_for(data_path))
+        if status:
+            return status
+        connection = ConnectionConfig(
+            name=data_path.name,
+            db_type=DatabaseType.SQLITE,
+            path=str(database),
+        )
     elif args.database:
         connection = ConnectionConfig(
             name="cli",
@@ -34,6 +198,41 @@ def main() -> int:
             path=args.database,
         )
 
+    if args.import_path:
+        if connection is None:
+            print("Error: --import needs a connection or database", file=sys.stderr)
+            return 1
+        job = ImportJob(
+            args.import_path,
+            args.table or args.import_path.stem,
+            connection.db_type,
+            reject_path=args.rejects or default_reject_path(args.import_path),
+            workers=default_workers(),
+        )
+        return import_file(connection, job)
+
+    if args.execute:
+        if connection is None:
+            print("Error: --execute needs a connection or database", file=sys.stderr)
+            return 1
+        export_settings = Settings.load().export
+        dialect = connection.db_type
+
+        def exporter_for(output: Path | None) -> Exporter:
+            fmt = args.format or (output and format_for_path(output)) or "csv"
+            return create_exporter(
+                fmt,
+                args.table or DEFAULT_TABLE_NAME,
+                dialect,
+                export_settings.sql_insert_batch_size,
+            )
+
+        targets = [ExportTarget(exporter_for(output), output) for output in args.output]
+        compression = CompressionOptions(
+            level=export_settings.compression_level, threads=export_settings.compression_threads
+        )
+        return export_query(connection, args.execute, exporter_for(None), targets, compression)
+
     run(connection=connection)
     return 0
 
@@ -63,7 +63,7 @@ class QryApp(App):
             self.notify(f"Connection failed: {e}", severity="error")
 
     def action_quit(self) -> None:
-        self._ctx.disconnect()
+        self._ctx.close()
         self.exit()
 
     def action_cancel(self) -> None:
@@ -0,0 +1,53 @@
+"""Data files opened as databases - a CSV, TSV or JSON file loaded into a scratch SQLite file."""
+
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+from qry.application.import_job import ImportJob, ImportProgress, default_workers
+from qry.domains.connection.models import DatabaseType
+from qry.domains.data_import.sources import IMPORT_EXTENSIONS
+from qry.domains.database.sqlite import SQLiteAdapter
+
+
+def is_data_file(path: Path) -> bool:
+    """Whether ``path`` names a data file to load rather than a database."""
+    return path.suffix.lower() in IMPORT_EXTENSIONS
+
+
+def table_name_for(path: Path) -> str:
+    """A table name needing no quotes from the file name: ``access-log.csv`` is ``access_log``."""
+    name = re.sub(r"\W+", "_", path.stem).strip("_")
+    return f"_{name}" if name[:1].isdigit() else name or "data"
+
+
+def load_data_file(
+    path: Path,
+    database: Path,
+    table: str,
+    workers: int | None = None,
+    on_progress: Callable[[ImportProgress], None] | None = None,
+) -> ImportJob:
+    """Load ``path`` into ``table`` of a new SQLite database at ``database``.
+
+    The database is scratch space, so it runs without a journal or syncs
+    to disk; if loading fails the caller throws it away. Large files are
+    parsed by ``workers`` processes, one per CPU by default. Rows that
+    cannot be loaded are counted but not written anywhere.
+    """
+    adapter = SQLiteAdapter(database)
+    adapter.connect()
+    try:
+        adapter.execute("PRAGMA journal_mode = OFF")
+        adapter.execute("PRAGMA synchronous = OFF")
+        job = ImportJob(
+            path,
+            table,
+            DatabaseType.SQLITE,
+            on_progress=on_progress,
+            workers=workers or default_workers(),
+        )
+        job.run(adapter)
+    finally:
+        adapter.disconnect()
+    return job
@@ -0,0 +1,132 @@
+"""Export job - progress reporting and cancellation for long exports."""
+
+import contextlib
+import itertools
+import os
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from qry.application.export_tee import ExportTarget, ExportTee
+from qry.application.job import CancellableJob
+from qry.domains.export.base import RowBatches
+from qry.domains.export.compression import CompressionOptions
+from qry.shared.constants import EXPORT_PROGRESS_INTERVAL_SECONDS, STREAM_BATCH_SIZE
+from qry.shared.exceptions import OperationCancelled
+from qry.shared.models import QueryResult
+
+
+@dataclass
+class ExportProgress:
+    """Snapshot of a running export."""
+
+    rows: int = 0
+    bytes_written: int = 0
+    elapsed_seconds: float = 0.0
+    # Known when exporting a materialized result, None when streaming a query
+    total_rows: int | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        if self.total_rows is None or not self.rows_per_second:
+            return None
+        return max(0, self.total_rows - self.rows) / self.rows_per_second
+
+
+class ExportJob(CancellableJob):
+    """One export of rows into one or more files, observable and cancellable from another thread.
+
+    ``run`` counts rows as batches pass to the exporter and reports an
+    ``ExportProgress`` to ``on_progress`` at most every ``interval_seconds``
+    (and once at the end). ``cancel`` stops the export before the next
+    batch and runs any callbacks registered with ``on_cancel``, e.g. to
+    interrupt a query still producing its first rows; the partial file is
+    removed. With several targets the rows are read once and fed to every
+    exporter through an ``ExportTee``; bytes are summed over all files. A
+    compressed file's progress counts compressed bytes.
+    """
+
+    def __init__(
+        self,
+        targets: list[ExportTarget],
+        total_rows: int | None = None,
+        on_progress: Callable[[ExportProgress], None] | None = None,
+        interval_seconds: float = EXPORT_PROGRESS_INTERVAL_SECONDS,
+        compression: CompressionOptions | None = None,
+    ) -> None:
+        super().__init__()
+        self.targets = targets
+        self.compression = compression
+        self._on_progress = on_progress
+        self._interval_seconds = interval_seconds
+        self._progress = ExportProgress(total_rows=total_rows)
+
+    @property
+    def progress(self) -> ExportProgress:
+        return self._progress
+
+    @property
+    def paths(self) -> list[Path]:
+        return [target.path for target in self.targets]
+
+    def run(self, columns: list[str], row_batches: RowBatches) -> int:
+        """Export the rows, returning how many were written."""
+        start_time = time.perf_counter()
+        tee = ExportTee(self.targets, self.compression)
+        count = tee.run(columns, self._track(row_batches, start_time))
+        self._report(start_time)
+        return count
+
+    def run_copy(self, line_batches: Iterable[list[bytes]]) -> int:
+        """Write CSV the database produced itself, returning the number of rows.
+
+        ``line_batches`` comes from ``DatabaseAdapter.copy_csv``: the header
+        line alone, then batches of row lines. The bytes go to the files (or
+        their compressors) unchanged.
+        """
+        start_time = time.perf_counter()
+        batches = iter(line_batches)
+        header = b"".join(next(batches, []))
+        chunks = (b"".join(batch) for batch in self._track(batches, start_time))
+        ExportTee(self.targets, self.compression).write_bytes(itertools.chain([header], chunks))
+        self._report(start_time)
+        return self._progress.rows
+
+    def run_result(self, result: QueryResult, batch_size: int = STREAM_BATCH_SIZE) -> int:
+        """Export a materialized result, in batches so progress keeps moving."""
+        rows = result.rows
+        batches = (rows[i : i + batch_size] for i in range(0, len(rows), batch_size))
+        return self.run(result.columns, batches)
+
+    def _track(
+        self, row_batches: Iterable[Sequence[Any]], start_time: float
+    ) -> Iterator[Sequence[Any]]:
+        last_report = start_time
+        for batch in row_batches:
+            if self.cancelled:
+                raise OperationCancelled("Export cancelled")
+            yield batch
+            self._progress.rows += len(batch)
+            if time.perf_counter() - last_report >= self._interval_seconds:
+                self._report(start_time)
+                last_report = time.perf_counter()
+        if self.cancelled:
+            raise OperationCancelled("Export cancelled")
+
+    def _report(self, start_time: float) -> None:
+        self._progress.elapsed_seconds = time.perf_counter() - start_time
+        self._progress.bytes_written = sum(map(self._file_size, self.paths))
+        if self._on_progress is not None:
+            self._on_progress(replace(self._progress))
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        with contextlib.suppress(OSError):
+            return os.stat(path).st_size
+        return 0
@@ -0,0 +1,149 @@
+"""Export tee - write one pass over the rows to several files at once."""
+
+import contextlib
+import queue
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from qry.domains.export.base import Exporter, RowBatches
+from qry.domains.export.compression import CompressionOptions, open_output
+from qry.shared.constants import EXPORT_TEE_BUFFER_BATCHES
+from qry.shared.exceptions import OperationCancelled
+
+
+@dataclass
+class ExportTarget:
+    """One output of an export: a format and the file it goes to."""
+
+    exporter: Exporter
+    path: Path
+
+
+# Queue markers: all rows sent / stop and discard the output
+_END = object()
+_ABORT = object()
+
+
+class ExportTee:
+    """Feeds a single stream of row batches to every target's exporter.
+
+    Each target after the first gets a writer thread that reads batches
+    from its own bounded queue (``buffer_batches`` deep); the first target
+    is written on the calling thread. The source is read once, and a slow
+    writer holds back the others by at most its buffer. If any target
+    fails, or the source does, the export stops and raises the first
+    error; targets that had not finished remove their partial files.
+    """
+
+    def __init__(
+        self,
+        targets: list[ExportTarget],
+        compression: CompressionOptions | None = None,
+        buffer_batches: int = EXPORT_TEE_BUFFER_BATCHES,
+    ) -> None:
+        if not targets:
+            raise ValueError("An export needs at least one target")
+        self._targets = targets
+        self._compression = compression
+        self._buffer_batches = max(1, buffer_batches)
+
+    def run(self, columns: list[str], row_batches: RowBatches) -> int:
+        """Export every row to every target, returning the number of rows."""
+        first, *others = self._targets
+        if not others:
+            return first.exporter.export_rows(columns, row_batches, first.path, self._compression)
+
+        queues = [queue.Queue[object](maxsize=self._buffer_batches) for _ in others]
+        errors: list[BaseException] = []
+        failed = threading.Event()
+        threads = [
+            threading.Thread(
+                target=self._write,
+                args=(target, columns, q, errors, failed),
+                name=f"qry-export-{target.path.name}",
+                daemon=True,
+            )
+            for target, q in zip(others, queues, strict=True)
+        ]
+        for thread in threads:
+            thread.start()
+
+        end = _ABORT
+        count = 0
+        try:
+            count = first.exporter.export_rows(
+                columns, self._fan_out(row_batches, queues, failed), first.path, self._compression
+            )
+            end = _END
+        except OperationCancelled:
+            # Stopped because a writer failed: its error is raised below instead
+            if not errors:
+                raise
+        finally:
+            for q in queues:
+                q.put(end)
+            for thread in threads:
+                thread.join()
+        if errors:
+            raise errors[0]
+        return count
+
+    def write_bytes(self, chunks: Iterable[bytes]) -> None:
+        """Write bytes already in the targets' format to every target as they are.
+
+        This is the path for output the database formatted itself, e.g.
+        CSV from PostgreSQL's COPY; every file is removed if it fails.
+        """
+        try:
+            with contextlib.ExitStack() as stack:
+                sinks = [
+                    stack.enter_context(open_output(target.path, self._compression))
+                    for target in self._targets
+                ]
+                for chunk in chunks:
+                    for sink in sinks:
+                        sink.write(chunk)
+        except BaseException:
+            for target in self._targets:
+                target.path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _fan_out(
+        row_batches: RowBatches, queues: "list[queue.Queue[object]]", failed: threading.Event
+    ) -> Iterator[Sequence[tuple[Any, ...]]]:
+        """Pass each batch on to the first target and the writer queues."""
+        for batch in row_batches:
+            if failed.is_set():
+                raise OperationCancelled("Export stopped: another target failed")
+            for q in queues:
+                q.put(batch)
+            yield batch
+
+    def _write(
+        self,
+        target: ExportTarget,
+        columns: list[str],
+        source: "queue.Queue[object]",
+        errors: list[BaseException],
+        failed: threading.Event,
+    ) -> None:
+        def batches() -> Iterator[Sequence[tuple[Any, ...]]]:
+            while (item := source.get()) is not _END:
+                if item is _ABORT:
+                    raise OperationCancelled("Export aborted")
+                yield item  # type: ignore[misc]
+
+        try:
+            target.exporter.export_rows(columns, batches(), target.path, self._compression)
+        except OperationCancelled:
+            pass
+        except BaseException as e:
+            errors.append(e)
+            failed.set()
+            # Keep draining so the producer never blocks on this queue
+            while (item := source.get()) is not _END and item is not _ABORT:
+                pass
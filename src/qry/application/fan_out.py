@@ -0,0 +1,150 @@
+"""Fan-out - run one query against several saved connections."""
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from qry.domains.connection.models import ConnectionConfig
+from qry.domains.database.base import DatabaseAdapter
+from qry.domains.database.factory import AdapterFactory
+from qry.shared.constants import DEFAULT_TIMEOUT_MS, PARALLEL_MAX_CONNECTIONS
+from qry.shared.models import QueryResult
+from qry.shared.types import QueryParams
+
+# Columns added around each row of a merged fan-out result
+FAN_OUT_CONNECTION_COLUMN = "connection"
+FAN_OUT_TIME_COLUMN = "fan_out_ms"
+FAN_OUT_ERROR_COLUMN = "fan_out_error"
+
+
+@dataclass
+class FanOutItem:
+    """Outcome of running the query on one connection."""
+
+    index: int
+    connection_name: str
+    result: QueryResult
+
+
+class FanOut:
+    """Runs a query on several connections, at most ``max_connections`` at once.
+
+    Every target gets its own adapter, connected and closed in a worker
+    thread. A target that has not answered ``timeout_ms`` after it started
+    is reported as timed out and its query is cancelled; its connection is
+    closed once the driver returns.
+    """
+
+    def __init__(
+        self,
+        open_adapter: Callable[[ConnectionConfig], DatabaseAdapter] = AdapterFactory.create,
+        max_connections: int = PARALLEL_MAX_CONNECTIONS,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+    ) -> None:
+        self._open_adapter = open_adapter
+        self._max_connections = max(1, max_connections)
+        self._timeout_seconds = timeout_ms / 1000
+
+    def stream(
+        self,
+        sql: str,
+        targets: list[ConnectionConfig],
+        params: QueryParams | None = None,
+    ) -> Iterator[FanOutItem]:
+        """Yield one item per target as each answers or times out."""
+        done: queue.SimpleQueue[tuple[int, QueryResult]] = queue.SimpleQueue()
+        adapters: dict[int, DatabaseAdapter] = {}
+        # index -> deadline of targets still running
+        running: dict[int, float] = {}
+        pending = iter(range(len(targets)))
+
+        def start_next() -> None:
+            index = next(pending, None)
+            if index is None:
+                return
+            running[index] = time.monotonic() + self._timeout_seconds
+            threading.Thread(
+                target=self._run_target,
+                args=(index, targets[index], sql, params, adapters, done),
+                name=f"qry-fan-out-{targets[index].name}",
+                daemon=True,
+            ).start()
+
+        for _ in range(self._max_connections):
+            start_next()
+
+        while running:
+            wait = max(0.0, min(running.values()) - time.monotonic())
+            try:
+                index, result = done.get(timeout=wait)
+            except queue.Empty:
+                index = min(running, key=running.__getitem__)
+                if (adapter := adapters.get(index)) is not None:
+                    adapter.cancel()
+                result = QueryResult(
+                    error=f"Timed out after {self._timeout_seconds:g}s",
+                    execution_time_ms=self._timeout_seconds * 1000,
+                )
+            if running.pop(index, None) is None:
+                continue  # late answer from a target already reported as timed out
+            start_next()
+            yield FanOutItem(index, targets[index].name, result)
+
+    def _run_target(
+        self,
+        index: int,
+        config: ConnectionConfig,
+        sql: str,
+        params: QueryParams | None,
+        adapters: dict[int, DatabaseAdapter],
+        done: "queue.SimpleQueue[tuple[int, QueryResult]]",
+    ) -> None:
+        start_time = time.perf_counter()
+        adapter: DatabaseAdapter | None = None
+        try:
+            adapter = self._open_adapter(config)
+            adapters[index] = adapter
+            adapter.connect()
+            result = adapter.execute(sql, params)
+        except Exception as e:
+            result = QueryResult(
+                error=str(e),
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+        finally:
+            if adapter is not None:
+                adapter.disconnect()
+        done.put((index, result))
+
+
+def merge_fan_out(items: list[FanOutItem]) -> QueryResult:
+    """Merge fan-out items into one result, in arrival order.
+
+    Each row starts with the connection name and ends with that target's
+    time and error. The column layout comes from the first target that
+    returned columns; targets that failed, returned nothing, or returned
+    a different layout get one row carrying their error.
+    """
+    columns = next((i.result.columns for i in items if i.result.columns), [])
+    padding = (None,) * len(columns)
+
+    rows: list[tuple[Any, ...]] = []
+    for item in items:
+        result = item.result
+        error = result.error
+        if error is None and result.columns and result.columns != columns:
+            error = f"Different columns: {', '.join(result.columns)}"
+        suffix = (round(result.execution_time_ms, 3), error)
+        if error is None and result.rows:
+            rows.extend((item.connection_name, *row, *suffix) for row in result.rows)
+        else:
+            rows.append((item.connection_name, *padding, *suffix))
+
+    return QueryResult(
+        columns=[FAN_OUT_CONNECTION_COLUMN, *columns, FAN_OUT_TIME_COLUMN, FAN_OUT_ERROR_COLUMN],
+        rows=rows,
+        row_count=len(rows),
+    )
@@ -0,0 +1,282 @@
+"""Import job - load a CSV or NDJSON file into a table, with progress and cancel."""
+
+import multiprocessing
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from qry.application.job import CancellableJob
+from qry.domains.connection.models import DatabaseType
+from qry.domains.data_import.rejects import RejectWriter
+from qry.domains.data_import.schema import (
+    ColumnType,
+    RowConverter,
+    column_names,
+    create_table_sql,
+    infer_types,
+    quote_identifier,
+)
+from qry.domains.data_import.sources import (
+    ByteRange,
+    DataSource,
+    RejectedRow,
+    SourceItem,
+    open_source,
+)
+from qry.shared.constants import (
+    EXPORT_PROGRESS_INTERVAL_SECONDS,
+    IMPORT_BATCH_SIZE,
+    IMPORT_CHUNK_BYTES,
+    IMPORT_SAMPLE_ROWS,
+)
+from qry.shared.exceptions import DataImportError, OperationCancelled
+
+if TYPE_CHECKING:
+    from qry.domains.database.base import DatabaseAdapter
+
+
+@dataclass
+class ImportProgress:
+    """Snapshot of a running import."""
+
+    rows: int = 0
+    rejected: int = 0
+    bytes_read: int = 0
+    total_bytes: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> float | None:
+        # Row counts are unknown up front; the file size is not
+        if not self.bytes_read or not self.elapsed_seconds:
+            return None
+        remaining = max(0, self.total_bytes - self.bytes_read)
+        return remaining / (self.bytes_read / self.elapsed_seconds)
+
+
+def default_reject_path(path: Path) -> Path:
+    """Where rows rejected from ``path`` go unless told otherwise."""
+    return path.with_name(f"{path.name}.rejects.csv")
+
+
+def default_workers() -> int:
+    """Processes to parse large files with: one per CPU."""
+    return os.cpu_count() or 1
+
+
+def _converted(
+    source: DataSource, items: Iterable[SourceItem], convert: RowConverter
+) -> Iterator[tuple[Any, ...] | RejectedRow]:
+    """Each row converted to its column types, or rejected."""
+    for item in items:
+        if isinstance(item, RejectedRow):
+            yield item
+            continue
+        line, values = item
+        try:
+            yield convert(values)
+        except ValueError as e:
+            yield RejectedRow(line, source.row_text(values), str(e))
+
+
+def _convert_range(
+    source: DataSource, byte_range: ByteRange, convert: RowConverter
+) -> tuple[list[tuple[Any, ...]], list[RejectedRow], int]:
+    """Worker process: parse and convert one slice of the file, and say where it ended."""
+    rows: list[tuple[Any, ...]] = []
+    rejected: list[RejectedRow] = []
+    for item in _converted(source, source.read_range(byte_range), convert):
+        if isinstance(item, RejectedRow):
+            rejected.append(item)
+        else:
+            rows.append(item)
+    return rows, rejected, byte_range.end
+
+
+class ImportJob(CancellableJob):
+    """One import of a data file into a table, observable and cancellable from another thread.
+
+    Column types are inferred from the first ``sample_rows`` rows. The
+    table is created with them unless it exists, in which case the file's
+    columns are inserted into the columns of the same name. Rows that do
+    not parse or convert are written to ``reject_path`` and skipped; the
+    rest go to the adapter's ``bulk_insert`` in batches, in a single
+    transaction. If the import fails or is cancelled nothing is kept: the
+    rows are rolled back, a table it created is dropped and the reject
+    file is removed.
+
+    With more than one of ``workers``, a CSV or NDJSON file larger than
+    ``chunk_bytes`` is parsed and converted by that many processes, each
+    taking slices of ``chunk_bytes``; the rows are still inserted in file
+    order. Processes are spawned rather than forked, as imports run on a
+    thread of the TUI.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        dialect: DatabaseType,
+        reject_path: Path | None = None,
+        on_progress: Callable[[ImportProgress], None] | None = None,
+        interval_seconds: float = EXPORT_PROGRESS_INTERVAL_SECONDS,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        sample_rows: int = IMPORT_SAMPLE_ROWS,
+        workers: int = 1,
+        chunk_bytes: int = IMPORT_CHUNK_BYTES,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.table = table
+        self.dialect = dialect
+        self.reject_path = reject_path
+        self._on_progress = on_progress
+        self._interval_seconds = interval_seconds
+        self._batch_size = max(1, batch_size)
+        self._sample_rows = sample_rows
+        self._workers = max(1, workers)
+        self._chunk_bytes = max(1, chunk_bytes)
+        self._bytes_read: Callable[[], int] = lambda: 0
+        self._progress = ImportProgress()
+
+    @property
+    def progress(self) -> ImportProgress:
+        return self._progress
+
+    def run(self, adapter: "DatabaseAdapter") -> int:
+        """Import the file through ``adapter``, returning how many rows went in."""
+        start_time = time.perf_counter()
+        with open_source(self.path, self._sample_rows) as source:
+            columns = column_names(source.columns)
+            types = infer_types(source.sample, len(columns))
+            self._progress.total_bytes = source.size
+            created = self._create_table(adapter, columns, types)
+            rejects = RejectWriter(self.reject_path)
+            try:
+                convert = RowConverter(
+                    columns, types, dates_as_text=self.dialect == DatabaseType.SQLITE
+                )
+                if self._workers > 1 and source.splittable and source.size > self._chunk_bytes:
+                    batches = self._parallel_batches(source, convert, rejects)
+                else:
+                    self._bytes_read = lambda: source.bytes_read
+                    batches = self._batches(source, convert, rejects)
+                count = adapter.bulk_insert(self.table, columns, self._track(batches, start_time))
+            except BaseException:
+                rejects.discard()
+                if created:
+                    adapter.execute(f"DROP TABLE {quote_identifier(self.table, self.dialect)}")
+                raise
+            rejects.close()
+            self._report(start_time)
+        return count
+
+    def _create_table(
+        self, adapter: "DatabaseAdapter", columns: list[str], types: list[ColumnType]
+    ) -> bool:
+        """Create the table unless it exists; whether it was created."""
+        if any(table.name == self.table for table in adapter.get_tables()):
+            return False
+        result = adapter.execute(create_table_sql(self.table, columns, types, self.dialect))
+        if not result.is_success:
+            raise DataImportError(f"Cannot create table {self.table}: {result.error}")
+        return True
+
+    def _batches(
+        self, source: DataSource, convert: RowConverter, rejects: RejectWriter
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        batch: list[tuple[Any, ...]] = []
+        for item in _converted(source, source.items(), convert):
+            if isinstance(item, RejectedRow):
+                self._reject(rejects, item)
+                continue
+            batch.append(item)
+            if len(batch) == self._batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _parallel_batches(
+        self, source: DataSource, convert: RowConverter, rejects: RejectWriter
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """Batches from slices converted in worker processes, in file order.
+
+        A few slices per worker are in flight, enough to keep the workers
+        busy while the rows of earlier slices are inserted without holding
+        the whole file in memory. A slice whose last row ran on past its
+        end means the slices after it started inside that row: they are
+        dropped and the rest of the file is split again from where it
+        really ended.
+        """
+        ranges = iter(source.ranges(self._chunk_bytes))
+        position = 0
+        self._bytes_read = lambda: position
+        context = multiprocessing.get_context("spawn")
+        executor = ProcessPoolExecutor(self._workers, mp_context=context)
+        pending: deque[tuple[ByteRange, Future[Any]]] = deque()
+
+        def fill() -> None:
+            for byte_range in islice(ranges, self._workers * 2 - len(pending)):
+                pending.append(
+                    (byte_range, executor.submit(_convert_range, source, byte_range, convert))
+                )
+
+        try:
+            fill()
+            while pending:
+                byte_range, future = pending.popleft()
+                try:
+                    rows, rejected, end = future.result()
+                except BrokenProcessPool as e:
+                    raise DataImportError(f"Import worker stopped: {e}") from e
+                if end != byte_range.end:
+                    byte_range.end = end
+                    for _, later in pending:
+                        later.cancel()
+                    pending.clear()
+                    ranges = iter(source.ranges(self._chunk_bytes, after=byte_range))
+                fill()
+                for row in rejected:
+                    self._reject(rejects, row)
+                position = byte_range.end
+                for start in range(0, len(rows), self._batch_size):
+                    yield rows[start : start + self._batch_size]
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _reject(self, rejects: RejectWriter, row: RejectedRow) -> None:
+        rejects.write(row)
+        self._progress.rejected = rejects.count
+
+    def _track(
+        self, batches: Iterator[list[tuple[Any, ...]]], start_time: float
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        last_report = start_time
+        for batch in batches:
+            if self.cancelled:
+                raise OperationCancelled("Import cancelled")
+            yield batch
+            self._progress.rows += len(batch)
+            if time.perf_counter() - last_report >= self._interval_seconds:
+                self._report(start_time)
+                last_report = time.perf_counter()
+        if self.cancelled:
+            raise OperationCancelled("Import cancelled")
+
+    def _report(self, start_time: float) -> None:
+        self._progress.elapsed_seconds = time.perf_counter() - start_time
+        self._progress.bytes_read = self._bytes_read()
+        if self._on_progress is not None:
+            self._on_progress(replace(self._progress))
@@ -0,0 +1,32 @@
+"""Background job base - cancellation shared by exports and imports."""
+
+import threading
+from collections.abc import Callable
+
+
+class CancellableJob:
+    """Work running on a worker thread that another thread can cancel.
+
+    ``cancel`` sets a flag the job checks between batches, and runs any
+    callbacks registered with ``on_cancel``, e.g. to interrupt a database
+    call that is blocking.
+    """
+
+    def __init__(self) -> None:
+        self._cancelled = threading.Event()
+        self._cancel_callbacks: list[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` when the job is cancelled, now if it already was."""
+        self._cancel_callbacks.append(callback)
+        if self.cancelled:
+            callback()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        for callback in self._cancel_callbacks:
+            callback()
@@ -0,0 +1,109 @@
+"""Parallel execution over a bounded set of extra connections."""
+
+import contextlib
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+from qry.shared.constants import PARALLEL_MAX_CONNECTIONS
+from qry.shared.models import QueryResult
+from qry.shared.types import QueryParams
+
+if TYPE_CHECKING:
+    from qry.domains.database.base import DatabaseAdapter
+
+Job = tuple[str, QueryParams | None]
+
+
+class ParallelExecutor:
+    """Runs statements concurrently on at most ``max_connections`` connections.
+
+    Each worker thread opens its own connection from ``open_adapter``
+    (adapters are never shared between threads) and closes it when done.
+    A failing statement, including a failed connect, becomes an error
+    result for that statement only.
+    """
+
+    def __init__(
+        self,
+        open_adapter: Callable[[], "DatabaseAdapter"],
+        max_connections: int = PARALLEL_MAX_CONNECTIONS,
+    ) -> None:
+        self._open_adapter = open_adapter
+        self._max_connections = max(1, max_connections)
+
+    def run(self, jobs: list[Job]) -> list[QueryResult]:
+        """Execute every job and return the results in job order."""
+        results: list[QueryResult | None] = [None] * len(jobs)
+        for index, result in self.stream(jobs):
+            results[index] = result
+        return results  # type: ignore[return-value]
+
+    def stream(self, jobs: list[Job]) -> Iterator[tuple[int, QueryResult]]:
+        """Yield ``(job index, result)`` pairs as they finish.
+
+        Closing the iterator early cancels the jobs not yet started.
+        """
+        tasks: queue.SimpleQueue[tuple[int, Job] | None] = queue.SimpleQueue()
+        done: queue.SimpleQueue[tuple[int, QueryResult]] = queue.SimpleQueue()
+        cancelled = threading.Event()
+
+        worker_count = min(self._max_connections, len(jobs))
+        for task in enumerate(jobs):
+            tasks.put(task)
+        for _ in range(worker_count):
+            tasks.put(None)
+
+        workers = [
+            threading.Thread(
+                target=self._work,
+                args=(tasks, done, cancelled),
+                name=f"qry-parallel-{i}",
+                daemon=True,
+            )
+            for i in range(worker_count)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for _ in jobs:
+                yield done.get()
+        finally:
+            cancelled.set()
+            for worker in workers:
+                worker.join()
+
+    def _work(
+        self,
+        tasks: "queue.SimpleQueue[tuple[int, Job] | None]",
+        done: "queue.SimpleQueue[tuple[int, QueryResult]]",
+        cancelled: threading.Event,
+    ) -> None:
+        adapter: DatabaseAdapter | None = None
+        try:
+            while (task := tasks.get()) is not None:
+                if cancelled.is_set():
+                    continue
+                index, (sql, params) = task
+                start_time = time.perf_counter()
+                try:
+                    if adapter is None:
+                        adapter = self._open_adapter()
+                        adapter.connect()
+                    result = adapter.execute(sql, params)
+                except Exception as e:
+                    # Drop a connection that failed; the next job opens a new one
+                    if adapter is not None:
+                        with contextlib.suppress(Exception):
+                            adapter.disconnect()
+                    adapter = None
+                    result = QueryResult(
+                        error=str(e),
+                        execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                    )
+                done.put((index, result))
+        finally:
+            if adapter is not None:
+                adapter.disconnect()
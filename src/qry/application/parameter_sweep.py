@@ -0,0 +1,84 @@
+"""Parameter sweep - run one statement for many sets of bind values."""
+
+import contextlib
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from qry.application.parallel_executor import ParallelExecutor
+from qry.shared.constants import PARALLEL_MAX_CONNECTIONS
+from qry.shared.models import QueryResult
+from qry.shared.types import QueryParams
+
+if TYPE_CHECKING:
+    from qry.domains.database.base import DatabaseAdapter
+
+# Extra columns added to each row of a combined sweep result
+SWEEP_TIME_COLUMN = "sweep_ms"
+SWEEP_ERROR_COLUMN = "sweep_error"
+
+
+@dataclass
+class SweepItem:
+    """Outcome of running the statement with one parameter set."""
+
+    index: int
+    params: QueryParams
+    result: QueryResult
+
+
+class ParameterSweep:
+    """Runs a parameterized statement once per parameter set.
+
+    The runs are spread over a ``ParallelExecutor``, so each uses one of at
+    most ``max_connections`` connections from ``open_adapter``.
+    """
+
+    def __init__(
+        self,
+        open_adapter: Callable[[], "DatabaseAdapter"],
+        max_connections: int = PARALLEL_MAX_CONNECTIONS,
+    ) -> None:
+        self._executor = ParallelExecutor(open_adapter, max_connections)
+
+    def stream(self, sql: str, param_sets: list[QueryParams]) -> Iterator[SweepItem]:
+        """Yield items as they finish, in completion order.
+
+        Closing the iterator early cancels the items not yet started.
+        """
+        jobs = [(sql, params) for params in param_sets]
+        with contextlib.closing(self._executor.stream(jobs)) as results:
+            for index, result in results:
+                yield SweepItem(index, param_sets[index], result)
+
+
+def combine_sweep(items: list[SweepItem], param_names: list[str]) -> QueryResult:
+    """Merge sweep items into one result, in parameter-set order.
+
+    Each row starts with the parameter values (columns named ``:name``)
+    and ends with the item's execution time and error. Items that returned
+    no rows, or failed, still get one row so every parameter set is shown.
+    """
+    ordered = sorted(items, key=lambda item: item.index)
+    result_columns = next((i.result.columns for i in ordered if i.result.columns), [])
+    padding = (None,) * len(result_columns)
+
+    rows: list[tuple[Any, ...]] = []
+    for item in ordered:
+        prefix = tuple(item.params.get(name) for name in param_names)
+        suffix = (round(item.result.execution_time_ms, 3), item.result.error)
+        if item.result.rows and item.result.columns == result_columns:
+            rows.extend(prefix + tuple(row) + suffix for row in item.result.rows)
+        else:
+            rows.append(prefix + padding + suffix)
+
+    return QueryResult(
+        columns=[
+            *(f":{name}" for name in param_names),
+            *result_columns,
+            SWEEP_TIME_COLUMN,
+            SWEEP_ERROR_COLUMN,
+        ],
+        rows=rows,
+        row_count=len(rows),
+    )
@@ -1,16 +1,34 @@
 """Query use case - application layer orchestration."""
 
+import contextlib
+import time
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from qry.application.parallel_executor import ParallelExecutor
+from qry.application.parameter_sweep import ParameterSweep, combine_sweep
+from qry.application.streaming_export import csv_copy, split_batches
 from qry.domains.query.completion import CompletionProvider
 from qry.domains.query.history import HistoryManager
-from qry.domains.query.models import CompletionItem, HistoryEntry
+from qry.domains.query.models import (
+    CompletionItem,
+    ErrorPolicy,
+    FingerprintStats,
+    HistoryEntry,
+)
+from qry.domains.query.parameters import find_parameters
 from qry.domains.query.splitter import QuerySplitter
+from qry.domains.query.statement import is_read_only
+from qry.domains.query.tokenizer import TokenCache
+from qry.shared.constants import PARALLEL_MAX_CONNECTIONS, SWEEP_REFRESH_INTERVAL_SECONDS
+from qry.shared.exceptions import DatabaseError, QueryError
 from qry.shared.models import QueryResult
-from qry.shared.types import ColumnInfo, TableInfo
+from qry.shared.types import ColumnInfo, QueryParams, TableInfo
 
 if TYPE_CHECKING:
+    from qry.application.export_job import ExportJob
+    from qry.application.import_job import ImportJob
     from qry.domains.database.base import DatabaseAdapter
 
 
@@ -20,39 +38,319 @@ class QueryUseCase:
 
     adapter: "DatabaseAdapter"
     history: HistoryManager = field(default_factory=HistoryManager)
+    token_cache: TokenCache = field(default_factory=TokenCache)
+    # Opens extra connections to the same database, used by parameter sweeps
+    adapter_factory: Callable[[], "DatabaseAdapter"] | None = None
+    parallel_connections: int = PARALLEL_MAX_CONNECTIONS
     _completion: CompletionProvider | None = field(default=None, init=False)
     _current_query: str | None = field(default=None, init=False)
 
     def __post_init__(self) -> None:
-        self._completion = CompletionProvider(self.adapter)
+        self._completion = CompletionProvider(self.adapter, self.token_cache)
+
+    def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
+        """Execute one statement, binding ``params`` to its ``:name`` placeholders."""
+        if missing := self._missing_parameters(sql, params):
+            return missing
 
-    def execute(self, sql: str) -> QueryResult:
         self._current_query = sql
         try:
-            result = self.adapter.execute(sql)
-            if result.is_success:
-                self.history.add(sql)
+            result = self.adapter.execute(sql, params)
+            self.history.add(sql, result)
             return result
         finally:
             self._current_query = None
 
-    def execute_multi(self, sql: str) -> list[QueryResult]:
-        """Execute multiple semicolon-separated statements."""
-        statements = QuerySplitter.split(sql)
+    def execute_multi(self, sql: str, params: QueryParams | None = None) -> list[QueryResult]:
+        """Execute multiple semicolon-separated statements.
+
+        ``params`` is shared by all statements; each binds the names it uses.
+        """
+        statements = QuerySplitter.split(sql, self.token_cache)
         if not statements:
             return [QueryResult(error="No statements to execute")]
 
         if len(statements) == 1:
-            return [self.execute(statements[0])]
+            return [self.execute(statements[0], self._params_for(statements[0], params))]
 
-        results: list[QueryResult] = []
+        # Statements up to the first one missing a value go to the adapter together
+        batch: list[tuple[str, QueryParams | None]] = []
+        missing: QueryResult | None = None
         for stmt in statements:
-            result = self.execute(stmt)
-            results.append(result)
-            if not result.is_success:
+            if missing := self._missing_parameters(stmt, params):
                 break
+            batch.append((stmt, self._params_for(stmt, params)))
+
+        results: list[QueryResult] = []
+        if batch:
+            self._current_query = sql
+            try:
+                results = self.adapter.execute_many(batch)
+            finally:
+                self._current_query = None
+            for (stmt, _), result in zip(batch, results, strict=False):
+                self.history.add(stmt, result)
+        if missing is not None and all(r.is_success for r in results):
+            results.append(missing)
+        return results
+
+    def execute_parallel(self, sql: str, params: QueryParams | None = None) -> list[QueryResult]:
+        """Execute a script of read-only statements concurrently.
+
+        Statements run on up to ``parallel_connections`` extra connections
+        and results come back in script order. Every statement runs even if
+        another fails. Scripts that are not entirely read-only, or that need
+        a missing parameter, fall back to ``execute_multi``.
+        """
+        if not self.runs_in_parallel(sql, params):
+            return self.execute_multi(sql, params)
+
+        statements = QuerySplitter.split(sql, self.token_cache)
+        jobs = [(stmt, self._params_for(stmt, params)) for stmt in statements]
+        self._current_query = sql
+        try:
+            executor = ParallelExecutor(self.adapter_factory, self.parallel_connections)
+            results = executor.run(jobs)
+        finally:
+            self._current_query = None
+        for stmt, result in zip(statements, results, strict=True):
+            self.history.add(stmt, result)
+        return results
+
+    def runs_in_parallel(self, sql: str, params: QueryParams | None = None) -> bool:
+        """Whether ``execute_parallel`` runs ``sql`` concurrently rather than falling back."""
+        statements = QuerySplitter.split(sql, self.token_cache)
+        return (
+            self.adapter_factory is not None
+            and len(statements) > 1
+            and all(is_read_only(stmt) for stmt in statements)
+            and not any(self._missing_parameters(stmt, params) for stmt in statements)
+        )
+
+    @staticmethod
+    def _missing_parameters(sql: str, params: QueryParams | None) -> QueryResult | None:
+        """An error result when ``params`` lacks a value used by ``sql``."""
+        if params is None:
+            return None
+        missing = [name for name in find_parameters(sql) if name not in params]
+        if missing:
+            return QueryResult(error=f"Missing value for parameter: {', '.join(missing)}")
+        return None
+
+    def execute_batch(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        savepoint_every: int = 0,
+        on_error: ErrorPolicy = ErrorPolicy.STOP,
+    ) -> list[QueryResult]:
+        """Execute a script as a single transaction.
+
+        With ``savepoint_every`` set, statements are grouped into chunks of
+        that size, each under its own savepoint. When a statement fails:
+
+        - ``STOP`` rolls back the whole transaction
+        - ``CONTINUE`` rolls back the failing chunk (or only the statement,
+          without savepoints) and carries on with the next one
+
+        The returned results cover the statements whose effects were kept,
+        plus one result per failure: after a ``STOP`` rollback, only the
+        failure.
+        """
+        statements = QuerySplitter.split(sql, self.token_cache)
+        if not statements:
+            return [QueryResult(error="No statements to execute")]
+        if (
+            on_error == ErrorPolicy.CONTINUE
+            and not savepoint_every
+            and self.adapter.aborts_transaction_on_error
+        ):
+            savepoint_every = 1
+
+        results: list[QueryResult] = []
+        self._current_query = sql
+        try:
+            self._run_batch(statements, params, savepoint_every, on_error, results)
+        except DatabaseError as e:
+            with contextlib.suppress(DatabaseError):
+                self.adapter.rollback()
+            results[:] = [QueryResult(error=str(e))]
+        finally:
+            self._current_query = None
+
+        # One entry for the script; per-statement entries would flood history
+        self.history.add(sql)
         return results
 
+    def _run_batch(
+        self,
+        statements: list[str],
+        params: QueryParams | None,
+        savepoint_every: int,
+        on_error: ErrorPolicy,
+        results: list[QueryResult],
+    ) -> None:
+        adapter = self.adapter
+        adapter.begin()
+        savepoint: str | None = None
+        chunk_start = 0
+        skip_chunk = False
+        for index, stmt in enumerate(statements):
+            if savepoint_every and index % savepoint_every == 0:
+                if savepoint is not None:
+                    adapter.release_savepoint(savepoint)
+                savepoint = f"qry_batch_{index // savepoint_every}"
+                adapter.savepoint(savepoint)
+                chunk_start = len(results)
+                skip_chunk = False
+            if skip_chunk:
+                continue
+
+            result = adapter.execute(stmt, self._params_for(stmt, params))
+            if result.is_success:
+                results.append(result)
+                continue
+
+            if on_error == ErrorPolicy.STOP:
+                # Nothing before it is kept either
+                results[:] = [result]
+                adapter.rollback()
+                return
+            if savepoint is not None:
+                adapter.rollback_to_savepoint(savepoint)
+                del results[chunk_start:]
+                skip_chunk = True
+            results.append(result)
+        adapter.commit()
+
+    def check_sweep(self, sql: str, param_sets: list[QueryParams]) -> str | None:
+        """Why ``sql`` cannot be swept over ``param_sets``, or None if it can."""
+        if self.adapter_factory is None:
+            return "Parameter sweeps are not available for this connection"
+        names = find_parameters(sql)
+        if not names:
+            return "Query has no :name parameters to sweep"
+        if not param_sets:
+            return "No parameter sets to run"
+        for params in param_sets:
+            missing = [name for name in names if name not in params]
+            if missing:
+                return f"Missing value for parameter: {', '.join(missing)}"
+        return None
+
+    def stream_sweep(
+        self,
+        sql: str,
+        param_sets: list[QueryParams],
+        interval: float = SWEEP_REFRESH_INTERVAL_SECONDS,
+    ) -> Iterator[QueryResult]:
+        """Execute one statement once per parameter set, over parallel connections.
+
+        Yields the combined result so far - a row per set (or per returned
+        row), each tagged with its parameter values, time and error - at most
+        every ``interval`` seconds, and once more when every set has run.
+        Nothing is recorded in history, since this usually runs on a worker
+        thread; the caller records the statement.
+        """
+        error = self.check_sweep(sql, param_sets)
+        if error or self.adapter_factory is None:
+            yield QueryResult(error=error)
+            return
+
+        names = find_parameters(sql)
+        self._current_query = sql
+        start_time = time.perf_counter()
+        shown_at = start_time
+        items = []
+        try:
+            sweep = ParameterSweep(self.adapter_factory, self.parallel_connections)
+            for item in sweep.stream(sql, param_sets):
+                items.append(item)
+                now = time.perf_counter()
+                if len(items) < len(param_sets) and now - shown_at >= interval:
+                    shown_at = now
+                    result = combine_sweep(items, names)
+                    result.execution_time_ms = (now - start_time) * 1000
+                    yield result
+            result = combine_sweep(items, names)
+            result.execution_time_ms = (time.perf_counter() - start_time) * 1000
+            yield result
+        finally:
+            self._current_query = None
+
+    def can_export(self, sql: str) -> bool:
+        """Whether ``sql`` can be re-run by ``export``: one read-only statement."""
+        statements = QuerySplitter.split(sql, self.token_cache)
+        return len(statements) == 1 and is_read_only(statements[0])
+
+    def export(self, sql: str, job: "ExportJob", params: QueryParams | None = None) -> int:
+        """Run ``sql`` and stream its rows into ``job``'s file without materializing them.
+
+        The query runs on an extra connection when ``adapter_factory`` is
+        set, so the main connection stays free while a large export runs
+        in the background. CSV-only exports take the database's own CSV
+        when the adapter offers it (``copy_csv``). Cancelling the job
+        cancels the query. Returns the number of rows written; raises
+        ``QueryError`` if the query fails, and a partially written file is
+        removed.
+
+        Nothing is recorded in history, since this usually runs on a worker
+        thread; the caller records the statement.
+        """
+        if missing := self._missing_parameters(sql, params):
+            raise QueryError(str(missing.error))
+
+        with self._job_adapter(sql) as adapter:
+            job.on_cancel(adapter.cancel)
+            exporters = [target.exporter for target in job.targets]
+            copy = csv_copy(adapter, sql, params, exporters)
+            if copy is not None:
+                try:
+                    count = job.run_copy(copy)
+                except DatabaseError as e:
+                    raise QueryError(str(e)) from e
+            else:
+                columns, row_batches = split_batches(adapter.stream(sql, params))
+                count = job.run(columns, row_batches)
+            return count
+
+    def import_file(self, job: "ImportJob") -> int:
+        """Load ``job``'s file into its table, returning the number of rows imported.
+
+        Like ``export``, the import runs on an extra connection when
+        ``adapter_factory`` is set; cancelling the job interrupts it.
+        Raises ``DataImportError`` or ``DatabaseError`` when it fails, with
+        nothing imported.
+        """
+        with self._job_adapter(f"-- import {job.path.name} into {job.table}") as adapter:
+            job.on_cancel(adapter.cancel)
+            return job.run(adapter)
+
+    @contextlib.contextmanager
+    def _job_adapter(self, description: str) -> Iterator["DatabaseAdapter"]:
+        """An extra connection for a long job, else the main adapter marked as running."""
+        own_connection = self.adapter_factory is not None
+        adapter = self.adapter_factory() if self.adapter_factory else self.adapter
+        try:
+            if own_connection:
+                adapter.connect()
+            else:
+                self._current_query = description
+            yield adapter
+        finally:
+            if own_connection:
+                adapter.disconnect()
+            else:
+                self._current_query = None
+
+    @staticmethod
+    def _params_for(sql: str, params: QueryParams | None) -> QueryParams | None:
+        """The subset of ``params`` used by ``sql``; None if it uses none."""
+        if params is None:
+            return None
+        names = find_parameters(sql)
+        return {name: params[name] for name in names if name in params} if names else None
+
     def cancel(self) -> None:
         self.adapter.cancel()
         self._current_query = None
@@ -64,20 +362,37 @@ class QueryUseCase:
     def get_history(self, count: int = 50) -> list[HistoryEntry]:
         return self.history.get_recent(count)
 
+    def get_history_page(
+        self, pattern: str, offset: int, limit: int, all_connections: bool = False
+    ) -> list[HistoryEntry]:
+        return self.history.get_page(pattern, offset, limit, all_connections)
+
     def search_history(self, pattern: str, limit: int = 50) -> list[HistoryEntry]:
         return self.history.search_reverse(pattern, limit=limit)
 
+    def get_query_stats(self) -> list[FingerprintStats]:
+        return self.history.fingerprint_stats()
+
     def clear_history(self) -> None:
         self.history.clear()
 
     def save_history(self) -> None:
         self.history.save()
 
+    def close_history(self) -> None:
+        self.history.close()
+
     def get_completions(self, text: str, cursor_pos: int) -> list[CompletionItem]:
         if self._completion:
             return self._completion.get_completions(text, cursor_pos)
         return []
 
+    def set_token_cache(self, token_cache: TokenCache) -> None:
+        """Share the editor buffer's token cache with splitting and completion."""
+        self.token_cache = token_cache
+        if self._completion:
+            self._completion.set_token_cache(token_cache)
+
     def invalidate_schema_cache(self) -> None:
         if self._completion:
             self._completion.invalidate_cache()
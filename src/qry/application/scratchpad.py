@@ -0,0 +1,152 @@
+"""Scratchpad - a local SQLite database to pin query results into as tables."""
+
+import datetime
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from qry.domains.connection.models import ConnectionConfig, DatabaseType
+from qry.domains.data_import.schema import (
+    ColumnType,
+    column_names,
+    create_table_sql,
+    quote_identifier,
+)
+from qry.domains.database.sqlite import SQLiteAdapter
+from qry.shared.constants import SCRATCHPAD_NAME
+from qry.shared.exceptions import DatabaseError, ScratchpadError
+from qry.shared.models import QueryResult
+
+# Declared type by Python value type; anything else is TEXT - decimals
+# included, which keeps their digits exact where REAL would round them
+_VALUE_TYPES: dict[type, ColumnType] = {
+    bool: ColumnType.BOOLEAN,
+    int: ColumnType.INTEGER,
+    float: ColumnType.FLOAT,
+    datetime.date: ColumnType.DATE,
+    datetime.datetime: ColumnType.TIMESTAMP,
+}
+
+
+def _column_type(values: Sequence[Any]) -> ColumnType:
+    """The type all of a column's non-NULL values fit: integers among floats are floats."""
+    types = {_VALUE_TYPES.get(type(value), ColumnType.TEXT) for value in values}
+    if types == {ColumnType.INTEGER, ColumnType.FLOAT}:
+        return ColumnType.FLOAT
+    return types.pop() if len(types) == 1 else ColumnType.TEXT
+
+
+@dataclass
+class PinnedTable:
+    """A result pinned into the scratchpad."""
+
+    name: str
+    rows: int
+    # Connection the result came from
+    source: str | None = None
+    pinned_at: datetime.datetime = field(default_factory=datetime.datetime.now)
+
+
+class Scratchpad:
+    """Local SQLite database holding pinned query results as tables.
+
+    Follow-up questions about a result are answered here instead of by
+    re-running the query against its database, and results pinned from
+    different connections can be joined. The database is a file in a
+    temporary directory, so other connections to it (e.g. for exports)
+    see the same tables; it is created on first use and removed by
+    ``close``.
+    """
+
+    def __init__(self) -> None:
+        self._directory: tempfile.TemporaryDirectory[str] | None = None
+        self._adapter: SQLiteAdapter | None = None
+        # By lowercased name, as SQLite table names ignore case
+        self._pinned: dict[str, PinnedTable] = {}
+
+    @property
+    def path(self) -> Path:
+        if self._directory is None:
+            self._directory = tempfile.TemporaryDirectory(prefix="qry-scratchpad-")
+        return Path(self._directory.name) / f"{SCRATCHPAD_NAME}.db"
+
+    @property
+    def config(self) -> ConnectionConfig:
+        return ConnectionConfig(
+            name=SCRATCHPAD_NAME, db_type=DatabaseType.SQLITE, path=str(self.path)
+        )
+
+    @property
+    def adapter(self) -> SQLiteAdapter:
+        """The scratchpad's own connection, opened on first use."""
+        if self._adapter is None:
+            adapter = SQLiteAdapter(self.path)
+            adapter.connect()
+            # Nothing here outlives the session, so skip the journal and syncs
+            adapter.execute("PRAGMA journal_mode = OFF")
+            adapter.execute("PRAGMA synchronous = OFF")
+            self._adapter = adapter
+        return self._adapter
+
+    @property
+    def pinned(self) -> list[PinnedTable]:
+        return list(self._pinned.values())
+
+    def next_name(self) -> str:
+        """An unused table name to suggest: ``result_1``, ``result_2``..."""
+        n = len(self._pinned) + 1
+        while f"result_{n}" in self._pinned:
+            n += 1
+        return f"result_{n}"
+
+    def pin(self, name: str, result: QueryResult, source: str | None = None) -> PinnedTable:
+        """Store ``result`` as table ``name``, replacing a table of that name.
+
+        Column types are declared from the values; repeated column names,
+        as a join gives, are numbered. The rows go in in one transaction.
+        """
+        name = name.strip()
+        if not name:
+            raise ScratchpadError("A pinned result needs a table name")
+        if not result.is_success or not result.columns:
+            raise ScratchpadError("Only results with columns can be pinned")
+
+        columns = column_names(result.columns)
+        types = [
+            _column_type([row[index] for row in result.rows if row[index] is not None])
+            for index in range(len(columns))
+        ]
+        adapter = self.adapter
+        table = quote_identifier(name, DatabaseType.SQLITE)
+        for sql in (
+            f"DROP TABLE IF EXISTS {table}",
+            create_table_sql(name, columns, types, DatabaseType.SQLITE),
+        ):
+            if (outcome := adapter.execute(sql)).error:
+                raise ScratchpadError(f"Cannot pin {name}: {outcome.error}")
+        self._pinned.pop(name.lower(), None)
+        try:
+            count = adapter.bulk_insert(name, columns, [result.rows])
+        except DatabaseError as e:
+            adapter.execute(f"DROP TABLE {table}")
+            raise ScratchpadError(str(e)) from e
+
+        pinned = PinnedTable(name, count, source)
+        self._pinned[name.lower()] = pinned
+        return pinned
+
+    def unpin(self, name: str) -> None:
+        if self._pinned.pop(name.lower(), None) is None:
+            raise ScratchpadError(f"No pinned result named {name}")
+        self.adapter.execute(f"DROP TABLE {quote_identifier(name, DatabaseType.SQLITE)}")
+
+    def close(self) -> None:
+        if self._adapter is not None:
+            self._adapter.disconnect()
+            self._adapter = None
+        if self._directory is not None:
+            self._directory.cleanup()
+            self._directory = None
+        self._pinned.clear()
@@ -0,0 +1,58 @@
+"""Streaming export - feed exporters straight from a database cursor."""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from qry.domains.export.base import Exporter
+from qry.shared.exceptions import ExportError, QueryError
+from qry.shared.models import QueryResult
+from qry.shared.types import QueryParams
+
+if TYPE_CHECKING:
+    from qry.domains.database.base import DatabaseAdapter
+
+
+def split_batches(
+    batches: Iterable[QueryResult],
+) -> tuple[list[str], Iterator[Sequence[tuple[Any, ...]]]]:
+    """Split an adapter's result stream into its columns and row batches.
+
+    The first batch is read eagerly so the columns are known before any
+    output is written. A failure reported later in the stream raises
+    ``QueryError`` from the row iterator, aborting the export.
+    """
+    stream = iter(batches)
+    first = next(stream, None)
+    if first is None:
+        raise ExportError("Query returned no result")
+    if first.error:
+        raise QueryError(first.error, first.error_position)
+    if not first.columns:
+        raise ExportError("Query returned no rows to export")
+
+    def rows() -> Iterator[Sequence[tuple[Any, ...]]]:
+        yield first.rows
+        for batch in stream:
+            if batch.error:
+                raise QueryError(batch.error, batch.error_position)
+            yield batch.rows
+
+    return first.columns, rows()
+
+
+def csv_copy(
+    adapter: "DatabaseAdapter",
+    sql: str,
+    params: QueryParams | None,
+    exporters: Iterable[Exporter],
+) -> Iterator[list[bytes]] | None:
+    """The database's own CSV of ``sql``, when every exporter writes CSV.
+
+    Server-side CSV (PostgreSQL's ``COPY ... TO STDOUT``) skips building
+    and re-serializing a Python tuple per row. None when the exporters
+    need rows or the adapter cannot copy ``sql``.
+    """
+    exporters = list(exporters)
+    if not exporters or any(exporter.copy_format != "csv" for exporter in exporters):
+        return None
+    return adapter.copy_csv(sql, params)
@@ -1,14 +1,22 @@
 """Application context - centralized dependency management."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import partial
 
+from qry.application.fan_out import FanOut, FanOutItem
 from qry.application.query_use_case import QueryUseCase
+from qry.application.scratchpad import Scratchpad
 from qry.domains.connection.models import ConnectionConfig
 from qry.domains.connection.service import ConnectionManager
+from qry.domains.database.async_base import AsyncDatabaseAdapter
 from qry.domains.database.base import DatabaseAdapter
 from qry.domains.database.factory import AdapterFactory
+from qry.domains.query.history import HistoryManager
+from qry.domains.query.repository import HistoryRepository
 from qry.domains.snippet.snippet_repository import SnippetRepository
 from qry.infrastructure.repositories.snippet_yaml import YamlSnippetRepository
+from qry.infrastructure.repositories.sqlite_history import SqliteHistoryRepository
 from qry.shared.settings import Settings
 
 
@@ -19,9 +27,15 @@ class AppContext:
     settings: Settings
     connection_manager: ConnectionManager
     snippet_repository: SnippetRepository = field(default_factory=YamlSnippetRepository)
+    # Shared by every connection so switching connections never reopens history
+    history_repository: HistoryRepository = field(default_factory=SqliteHistoryRepository)
+    # Pinned results, kept across connections until the app closes
+    scratchpad: Scratchpad = field(default_factory=Scratchpad)
     _adapter: DatabaseAdapter | None = field(default=None, init=False)
     _query_service: QueryUseCase | None = field(default=None, init=False)
     _current_connection: ConnectionConfig | None = field(default=None, init=False)
+    _scratchpad_service: QueryUseCase | None = field(default=None, init=False)
+    _use_scratchpad: bool = field(default=False, init=False)
 
     @classmethod
     def create(cls, settings: Settings | None = None) -> "AppContext":
@@ -41,8 +55,8 @@ class AppContext:
         try:
             self._adapter = adapter
             self._current_connection = config
-            self._query_service = QueryUseCase(adapter=adapter)
-            self._query_service.history.set_connection(config.name)
+            self._use_scratchpad = False
+            self._query_service = self._create_query_service(adapter, config)
         except Exception:
             adapter.disconnect()
             self._adapter = None
@@ -53,7 +67,7 @@ class AppContext:
     def disconnect(self) -> None:
         try:
             if self._query_service:
-                self._query_service.save_history()
+                self._query_service.close_history()
         finally:
             try:
                 if self._adapter:
@@ -63,22 +77,84 @@ class AppContext:
                 self._query_service = None
                 self._current_connection = None
 
+    def _create_query_service(
+        self, adapter: DatabaseAdapter, config: ConnectionConfig
+    ) -> QueryUseCase:
+        query_service = QueryUseCase(
+            adapter=adapter,
+            adapter_factory=partial(AdapterFactory.create, config),
+            parallel_connections=self.settings.execution.parallel_connections,
+            history=HistoryManager(
+                max_entries=self.settings.history.max_entries,
+                _repository=self.history_repository,
+            ),
+        )
+        query_service.history.set_connection(config.name)
+        return query_service
+
+    def close(self) -> None:
+        """Disconnect and drop the scratchpad, when the app exits."""
+        try:
+            self.disconnect()
+        finally:
+            try:
+                if self._scratchpad_service:
+                    self._scratchpad_service.close_history()
+            finally:
+                self._scratchpad_service = None
+                self._use_scratchpad = False
+                self.scratchpad.close()
+
+    @property
+    def using_scratchpad(self) -> bool:
+        return self._use_scratchpad
+
+    def use_scratchpad(self, enabled: bool) -> None:
+        """Point queries at the scratchpad, or back at the connection.
+
+        The connection stays open meanwhile, so results from it can still
+        be pinned after switching back. While the scratchpad is in use,
+        ``adapter``, ``query_service`` and ``current_connection`` are its.
+        """
+        if enabled and self._scratchpad_service is None:
+            self._scratchpad_service = self._create_query_service(
+                self.scratchpad.adapter, self.scratchpad.config
+            )
+        self._use_scratchpad = enabled
+
     @property
     def is_connected(self) -> bool:
-        return self._adapter is not None and self._adapter.is_connected()
+        adapter = self.adapter
+        return adapter is not None and adapter.is_connected()
 
     @property
     def adapter(self) -> DatabaseAdapter | None:
+        if self._use_scratchpad:
+            return self.scratchpad.adapter
         return self._adapter
 
     @property
     def query_service(self) -> QueryUseCase | None:
+        if self._use_scratchpad:
+            return self._scratchpad_service
         return self._query_service
 
     @property
     def current_connection(self) -> ConnectionConfig | None:
+        if self._use_scratchpad:
+            return self.scratchpad.config
         return self._current_connection
 
+    def create_async_adapter(self) -> AsyncDatabaseAdapter | None:
+        """A new asyncio adapter for the current connection, not yet connected.
+
+        It opens a connection of its own, so awaiting it on the UI loop
+        (e.g. for schema lookups) neither blocks nor waits on ``adapter``.
+        """
+        if not self.is_connected or self.current_connection is None:
+            return None
+        return AdapterFactory.create_async(self.current_connection)
+
     def test_connection(self, config: ConnectionConfig) -> tuple[bool, str]:
         """Test a connection without modifying current state."""
         try:
@@ -87,6 +163,20 @@ class AppContext:
         except Exception as e:
             return False, str(e)
 
+    def fan_out(self, sql: str, connection_names: list[str]) -> Iterator[FanOutItem]:
+        """Run ``sql`` on the named saved connections, yielding results as they arrive.
+
+        Nothing is recorded in history, since this usually runs on a worker
+        thread; the caller records the statement.
+        """
+        targets = [c for c in self.get_connections() if c.name in connection_names]
+        execution = self.settings.execution
+        fan_out = FanOut(
+            max_connections=execution.parallel_connections,
+            timeout_ms=execution.fan_out_timeout_ms,
+        )
+        return fan_out.stream(sql, targets)
+
     def get_connections(self) -> list[ConnectionConfig]:
         return self.connection_manager.list_all()
 
@@ -0,0 +1,55 @@
+"""Reject file - the rows an import set aside, with the reason for each."""
+
+import csv
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TextIO
+
+from qry.domains.data_import.sources import RejectedRow
+
+
+class RejectWriter:
+    """Writes rejected rows as CSV: ``line,error,data``.
+
+    ``data`` holds the row as it was in the source file, so the rows can
+    be fixed and imported again. The file is only created when a row is
+    rejected; without a path rejected rows are just counted.
+    """
+
+    def __init__(self, path: Path | None) -> None:
+        self.path = path
+        self.count = 0
+        self._file: TextIO | None = None
+        self._writer: Any = None
+
+    def __enter__(self) -> "RejectWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write(self, row: RejectedRow) -> None:
+        self.count += 1
+        if self.path is None:
+            return
+        if self._writer is None:
+            self._file = open(self.path, "w", encoding="utf-8", newline="")  # noqa: SIM115
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(["line", "error", "data"])
+        self._writer.writerow([row.line, row.reason, row.text])
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = self._writer = None
+
+    def discard(self) -> None:
+        """Close and remove the file, e.g. when the import was rolled back."""
+        self.close()
+        if self.path is not None and self.count:
+            self.path.unlink(missing_ok=True)
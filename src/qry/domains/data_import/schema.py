@@ -0,0 +1,233 @@
+"""Column types for imported data - inferred from a sample, declared per database."""
+
+import datetime
+import json
+import re
+from collections.abc import Callable, Sequence
+from enum import Enum
+from functools import partial
+from typing import Any
+
+from qry.domains.connection.models import DatabaseType
+
+
+class ColumnType(str, Enum):
+    BOOLEAN = "boolean"
+    INTEGER = "integer"
+    FLOAT = "float"
+    DATE = "date"
+    TIMESTAMP = "timestamp"
+    TEXT = "text"
+
+
+_BOOLEANS = {"true": True, "false": False}
+_INTEGER = re.compile(r"[+-]?\d+")
+# No NaN, infinities or digit separators: those read back as text
+_FLOAT = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_TIMESTAMP = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d{1,6})?)?(Z|[+-]\d{2}(:?\d{2})?)?"
+)
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and (flag := _BOOLEANS.get(value.strip().lower())) is not None:
+        return flag
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def _to_integer(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        number = value
+    elif isinstance(value, str) and _INTEGER.fullmatch(value.strip()):
+        number = int(value)
+    else:
+        raise ValueError(f"not an integer: {value!r}")
+    if not _INT64_MIN <= number <= _INT64_MAX:
+        raise ValueError(f"integer out of range: {value!r}")
+    return number
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str) and _FLOAT.fullmatch(value.strip()):
+        return float(value)
+    raise ValueError(f"not a number: {value!r}")
+
+
+def _to_date(value: Any) -> datetime.date:
+    if isinstance(value, str) and _DATE.fullmatch(value.strip()):
+        return datetime.date.fromisoformat(value.strip())
+    raise ValueError(f"not a date: {value!r}")
+
+
+def _to_timestamp(value: Any) -> datetime.datetime:
+    if isinstance(value, str) and _TIMESTAMP.fullmatch(value.strip()):
+        return datetime.datetime.fromisoformat(value.strip())
+    raise ValueError(f"not a timestamp: {value!r}")
+
+
+def _to_text(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict | list):
+        return json.dumps(value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+_CONVERTERS: dict[ColumnType, Callable[[Any], Any]] = {
+    ColumnType.BOOLEAN: _to_boolean,
+    ColumnType.INTEGER: _to_integer,
+    ColumnType.FLOAT: _to_float,
+    ColumnType.DATE: _to_date,
+    ColumnType.TIMESTAMP: _to_timestamp,
+    ColumnType.TEXT: _to_text,
+}
+
+# Narrowest first; TEXT takes anything
+_CANDIDATES = (
+    ColumnType.BOOLEAN,
+    ColumnType.INTEGER,
+    ColumnType.FLOAT,
+    ColumnType.DATE,
+    ColumnType.TIMESTAMP,
+)
+
+
+def _fits(column_type: ColumnType, values: list[Any]) -> bool:
+    convert = _CONVERTERS[column_type]
+    try:
+        for value in values:
+            convert(value)
+    except ValueError:
+        return False
+    return True
+
+
+def infer_types(sample: Sequence[Sequence[Any]], width: int) -> list[ColumnType]:
+    """The narrowest type each column's non-NULL sample values all convert to.
+
+    A column with no values in the sample is TEXT.
+    """
+    types: list[ColumnType] = []
+    for index in range(width):
+        values = [row[index] for row in sample if row[index] is not None]
+        fitting = (t for t in _CANDIDATES if values and _fits(t, values))
+        types.append(next(fitting, ColumnType.TEXT))
+    return types
+
+
+def _checked(parse: Callable[[Any], Any], value: Any) -> Any:
+    """``value`` validated with ``parse`` but kept as text."""
+    parse(value)
+    return value.strip() if isinstance(value, str) else value
+
+
+class RowConverter:
+    """Converts a row's values to its columns' types.
+
+    With ``dates_as_text`` dates and timestamps are checked but stay ISO
+    strings, for databases that store them as text anyway. Raises
+    ``ValueError`` naming the column when a value does not convert, e.g.
+    text further into the file than the sample reached.
+    """
+
+    def __init__(
+        self, columns: list[str], types: list[ColumnType], dates_as_text: bool = False
+    ) -> None:
+        self._columns = columns
+        converters = dict(_CONVERTERS)
+        if dates_as_text:
+            # Partials of module functions, so converters pickle for worker processes
+            converters[ColumnType.DATE] = partial(_checked, _to_date)
+            converters[ColumnType.TIMESTAMP] = partial(_checked, _to_timestamp)
+        self._converters = [converters[t] for t in types]
+
+    def __call__(self, values: list[Any]) -> tuple[Any, ...]:
+        try:
+            return tuple(
+                [
+                    None if value is None else convert(value)
+                    for convert, value in zip(self._converters, values, strict=True)
+                ]
+            )
+        except ValueError:
+            pass
+        # Convert again one value at a time to name the column at fault
+        for column, convert, value in zip(self._columns, self._converters, values, strict=True):
+            if value is not None:
+                try:
+                    convert(value)
+                except ValueError as e:
+                    raise ValueError(f"{column}: {e}") from e
+        raise AssertionError("unreachable")
+
+
+# Declared column types; SQLite stores dates and timestamps as ISO text
+_SQL_TYPES: dict[DatabaseType, dict[ColumnType, str]] = {
+    DatabaseType.POSTGRES: {
+        ColumnType.BOOLEAN: "boolean",
+        ColumnType.INTEGER: "bigint",
+        ColumnType.FLOAT: "double precision",
+        ColumnType.DATE: "date",
+        ColumnType.TIMESTAMP: "timestamp",
+        ColumnType.TEXT: "text",
+    },
+    DatabaseType.MYSQL: {
+        ColumnType.BOOLEAN: "BOOLEAN",
+        ColumnType.INTEGER: "BIGINT",
+        ColumnType.FLOAT: "DOUBLE",
+        ColumnType.DATE: "DATE",
+        ColumnType.TIMESTAMP: "DATETIME(6)",
+        ColumnType.TEXT: "LONGTEXT",
+    },
+    DatabaseType.SQLITE: {
+        ColumnType.BOOLEAN: "INTEGER",
+        ColumnType.INTEGER: "INTEGER",
+        ColumnType.FLOAT: "REAL",
+        ColumnType.DATE: "TEXT",
+        ColumnType.TIMESTAMP: "TEXT",
+        ColumnType.TEXT: "TEXT",
+    },
+}
+
+
+def quote_identifier(name: str, dialect: DatabaseType) -> str:
+    if dialect == DatabaseType.MYSQL:
+        return "`" + name.replace("`", "``") + "`"
+    return '"' + name.replace('"', '""') + '"'
+
+
+def column_names(header: list[str]) -> list[str]:
+    """Header names usable as columns: blanks named by position, duplicates numbered."""
+    seen: set[str] = set()
+    names: list[str] = []
+    for position, raw in enumerate(header, 1):
+        base = raw.strip() or f"column_{position}"
+        name, n = base, 1
+        while name.lower() in seen:
+            n += 1
+            name = f"{base}_{n}"
+        seen.add(name.lower())
+        names.append(name)
+    return names
+
+
+def create_table_sql(
+    table: str,
+    columns: list[str],
+    types: list[ColumnType],
+    dialect: DatabaseType,
+) -> str:
+    sql_types = _SQL_TYPES[dialect]
+    definitions = ", ".join(
+        f"{quote_identifier(column, dialect)} {sql_types[column_type]}"
+        for column, column_type in zip(columns, types, strict=True)
+    )
+    return f"CREATE TABLE {quote_identifier(table, dialect)} ({definitions})"
@@ -0,0 +1,418 @@
+"""Data file sources - CSV, TSV, NDJSON and JSON files read as rows for import."""
+
+import csv
+import io
+import json
+import mmap
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import chain, islice
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, ClassVar, TextIO
+
+from qry.shared.constants import IMPORT_SAMPLE_ROWS
+from qry.shared.exceptions import DataImportError
+
+
+@dataclass
+class RejectedRow:
+    """A row of the file that cannot be imported, and why."""
+
+    line: int
+    text: str
+    reason: str
+
+
+@dataclass
+class ByteRange:
+    """A slice of a data file holding whole rows, for parsing in another process."""
+
+    start: int
+    end: int
+    # Line number of the first row in the slice
+    first_line: int
+
+
+# A row's values with the line it starts on, or a row set aside
+SourceItem = tuple[int, list[Any]] | RejectedRow
+
+
+class DataSource(ABC):
+    """A data file read as a header and rows of values.
+
+    Opening reads the header and the first ``sample_rows`` rows, which
+    ``sample`` exposes for type inference; ``items`` then yields every
+    row from the start. Rows that cannot be parsed come out as
+    ``RejectedRow`` instead of ending the read.
+
+    When ``splittable``, the rows can instead be read in slices found by
+    ``ranges``, each with ``read_range`` - in other processes, as a
+    source pickles without its open file.
+    """
+
+    splittable: ClassVar[bool] = True
+    # Quote character whose fields can hold line ends, if the format has one
+    quote: ClassVar[bytes | None] = None
+
+    def __init__(self, path: Path, sample_rows: int = IMPORT_SAMPLE_ROWS) -> None:
+        self.path = path
+        self.columns: list[str] = []
+        self._sample_rows = sample_rows
+        self._file: BinaryIO | None = None
+        self._text: TextIO | None = None
+        self._sampled: list[SourceItem] = []
+        self._items: Iterator[SourceItem] = iter(())
+
+    def __enter__(self) -> "DataSource":
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        for name in ("_file", "_text", "_sampled", "_items"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._file = self._text = None
+        self._sampled = []
+        self._items = iter(())
+
+    def open(self) -> None:
+        try:
+            self._file = open(self.path, "rb")  # noqa: SIM115 - closed by close()
+        except OSError as e:
+            raise DataImportError(f"Cannot read {self.path}: {e}") from e
+        # utf-8-sig drops the byte order mark spreadsheet programs write
+        self._text = io.TextIOWrapper(self._file, encoding="utf-8-sig", newline="")
+        try:
+            self.columns, self._items = self._read(self._text)
+            self._sampled = list(islice(self._items, self._sample_rows))
+        except UnicodeDecodeError as e:
+            self.close()
+            raise self._encoding_error(e) from e
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._text is not None:
+            self._text.close()
+        self._file = self._text = None
+
+    @property
+    def size(self) -> int:
+        return os.stat(self.path).st_size
+
+    @property
+    def bytes_read(self) -> int:
+        """How far into the file reading has got, for progress."""
+        if self._file is None or self._file.closed:
+            return 0
+        return self._file.tell()
+
+    @property
+    def sample(self) -> list[list[Any]]:
+        return [item[1] for item in self._sampled if not isinstance(item, RejectedRow)]
+
+    def items(self) -> Iterator[SourceItem]:
+        sampled, self._sampled = self._sampled, []
+        try:
+            yield from chain(sampled, self._items)
+        except UnicodeDecodeError as e:
+            raise self._encoding_error(e) from e
+
+    def ranges(self, size: int, after: ByteRange | None = None) -> list[ByteRange]:
+        """The rows after the header, or after ``after``, in slices of about ``size`` bytes.
+
+        A slice ends at the first line end after ``size`` bytes that is
+        outside quotes: with quotes doubled inside quoted fields, that is
+        where an even number of quote characters precede it. A stray quote
+        in an unquoted field, as in ``5'11"``, throws the count off, which
+        ``read_range`` catches.
+        """
+        if not self.size:
+            return []
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if after is None:
+                start = self._header_end(data)
+                line = 1 + data[:start].count(b"\n")
+            else:
+                start = after.end
+                line = after.first_line + data[after.start : after.end].count(b"\n")
+            ranges: list[ByteRange] = []
+            while start < len(data):
+                end = self._row_end(data, start, start + max(1, size))
+                ranges.append(ByteRange(start, end, line))
+                line += data[start:end].count(b"\n")
+                start = end
+        return ranges
+
+    def read_range(self, byte_range: ByteRange) -> Iterator[SourceItem]:
+        """The rows in a slice from ``ranges``, which must come from an opened source.
+
+        If the slice ends inside a quoted field, its last row is read on
+        to where it closes and ``byte_range.end`` moves there, leaving the
+        slices after it to be found again with ``ranges``.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(byte_range.start)
+            lines = _SliceLines(f, byte_range.end - byte_range.start, self.quote is not None)
+            try:
+                yield from self._rows(lines, byte_range.first_line)
+            except UnicodeDecodeError as e:
+                raise self._encoding_error(e) from e
+        byte_range.end = byte_range.start + lines.size
+
+    def _header_end(self, data: mmap.mmap) -> int:
+        """Where the rows start."""
+        return 0
+
+    def _row_end(self, data: mmap.mmap, row_start: int, position: int) -> int:
+        """The end of the row that ``position`` falls in, given a row starting at ``row_start``."""
+        quotes = data[row_start:position].count(self.quote) if self.quote else 0
+        while (newline := data.find(b"\n", position)) != -1:
+            if self.quote:
+                quotes += data[position:newline].count(self.quote)
+            if quotes % 2 == 0:
+                return newline + 1
+            position = newline + 1
+        return len(data)
+
+    def _encoding_error(self, error: UnicodeDecodeError) -> DataImportError:
+        return DataImportError(f"{self.path.name} is not valid UTF-8: {error}")
+
+    @abstractmethod
+    def _read(self, text: TextIO) -> tuple[list[str], Iterator[SourceItem]]:
+        """The column names, and the rows that follow them."""
+        pass
+
+    @abstractmethod
+    def _rows(self, lines: "_SliceLines", first_line: int) -> Iterator[SourceItem]:
+        """Rows of a slice holding no header, numbered from ``first_line``."""
+        pass
+
+    @abstractmethod
+    def row_text(self, values: list[Any]) -> str:
+        """A row written back in the file's format, for the reject file."""
+        pass
+
+
+class CsvSource(DataSource):
+    """Comma- or tab-separated values with a header line.
+
+    Empty fields are NULL. A row with the wrong number of fields is
+    rejected; blank lines are skipped.
+    """
+
+    quote = b'"'
+
+    def __init__(
+        self,
+        path: Path,
+        delimiter: str = ",",
+        sample_rows: int = IMPORT_SAMPLE_ROWS,
+    ) -> None:
+        super().__init__(path, sample_rows)
+        self._delimiter = delimiter
+        # Lines the header spans, as a quoted column name can hold line ends
+        self._header_lines = 1
+
+    def _read(self, text: TextIO) -> tuple[list[str], Iterator[SourceItem]]:
+        reader = csv.reader(text, delimiter=self._delimiter)
+        header = next(reader, None)
+        if not header:
+            raise DataImportError(f"{self.path.name} has no header line")
+        self._header_lines = reader.line_num
+        return header, self._csv_rows(text, reader.line_num + 1, len(header))
+
+    def _rows(self, lines: "_SliceLines", first_line: int) -> Iterator[SourceItem]:
+        return self._csv_rows(lines, first_line, len(self.columns), lines.start_row)
+
+    def _csv_rows(
+        self,
+        lines: Iterable[str],
+        first_line: int,
+        width: int,
+        start_row: Callable[[], None] = lambda: None,
+    ) -> Iterator[SourceItem]:
+        reader = csv.reader(lines, delimiter=self._delimiter)
+        line = first_line
+        while True:
+            start_row()
+            try:
+                values: list[Any] = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield RejectedRow(line, "", str(e))
+            else:
+                if len(values) == width:
+                    yield line, [value or None for value in values]
+                elif values:
+                    reason = f"expected {width} fields, found {len(values)}"
+                    yield RejectedRow(line, self.row_text(values), reason)
+            line = first_line + reader.line_num
+
+    def _header_end(self, data: mmap.mmap) -> int:
+        end = 0
+        for _ in range(self._header_lines):
+            end = data.find(b"\n", end) + 1
+            if not end:
+                return len(data)
+        return end
+
+    def row_text(self, values: list[Any]) -> str:
+        output = io.StringIO()
+        csv.writer(output, delimiter=self._delimiter, lineterminator="").writerow(values)
+        return output.getvalue()
+
+
+class NdjsonSource(DataSource):
+    """One JSON object per line.
+
+    The columns are the keys of the sampled objects, in the order they
+    first appear; a missing key is NULL. A later object with a key the
+    sample did not have is rejected rather than silently cut down.
+    """
+
+    def _read(self, text: TextIO) -> tuple[list[str], Iterator[SourceItem]]:
+        objects = self._objects(text, 1)
+        sampled = list(islice(objects, self._sample_rows))
+        columns = list(
+            dict.fromkeys(
+                key for item in sampled if not isinstance(item, RejectedRow) for key in item[1]
+            )
+        )
+        if not columns:
+            raise DataImportError(f"{self.path.name} has no JSON objects to import")
+        return columns, self._values(chain(sampled, objects), columns)
+
+    def _rows(self, lines: "_SliceLines", first_line: int) -> Iterator[SourceItem]:
+        return self._values(self._objects(lines, first_line), self.columns)
+
+    @staticmethod
+    def _values(
+        objects: Iterable[tuple[int, dict[str, Any]] | RejectedRow], columns: list[str]
+    ) -> Iterator[SourceItem]:
+        known = set(columns)
+        for item in objects:
+            if isinstance(item, RejectedRow):
+                yield item
+                continue
+            line, obj = item
+            if unknown := obj.keys() - known:
+                reason = f"unknown key {sorted(unknown)[0]!r}"
+                yield RejectedRow(line, json.dumps(obj, default=str), reason)
+            else:
+                yield line, [obj.get(column) for column in columns]
+
+    def _objects(
+        self, text: Iterable[str], first_line: int
+    ) -> Iterator[tuple[int, dict[str, Any]] | RejectedRow]:
+        for line, raw in enumerate(text, first_line):
+            if not raw.strip():
+                continue
+            try:
+                obj = json.loads(raw)
+            except ValueError as e:
+                yield RejectedRow(line, raw.rstrip("\r\n"), f"invalid JSON: {e}")
+                continue
+            if isinstance(obj, dict):
+                yield line, obj
+            else:
+                yield RejectedRow(line, raw.rstrip("\r\n"), "not a JSON object")
+
+    def row_text(self, values: list[Any]) -> str:
+        return json.dumps(dict(zip(self.columns, values, strict=True)), default=str)
+
+
+class JsonSource(NdjsonSource):
+    """A JSON array of objects, or a single object; failing that, NDJSON.
+
+    The whole document is parsed at once, so it is not split for
+    parallel reading. Rows are numbered by their position in the array.
+    """
+
+    splittable = False
+
+    def _objects(
+        self, text: TextIO, first_line: int
+    ) -> Iterator[tuple[int, dict[str, Any]] | RejectedRow]:
+        try:
+            document = json.load(text)
+        except ValueError:
+            # Often line-delimited JSON under a .json name
+            text.seek(0)
+            yield from super()._objects(text, first_line)
+            return
+        records = document if isinstance(document, list) else [document]
+        for position, obj in enumerate(records, first_line):
+            if isinstance(obj, dict):
+                yield position, obj
+            else:
+                yield RejectedRow(position, json.dumps(obj, default=str), "not a JSON object")
+
+
+class _SliceLines:
+    """The lines of a slice of a file, read on past its end to finish a row.
+
+    A parser whose rows can span lines calls ``start_row`` before each
+    row; a line asked for once the slice is used up, after lines of the
+    current row, is taken from the file and counted into ``size``.
+    """
+
+    def __init__(self, file: BinaryIO, size: int, finish_rows: bool) -> None:
+        self.size = size
+        self._file = file
+        self._slice = io.TextIOWrapper(
+            io.BytesIO(file.read(size)), encoding="utf-8-sig", newline=""
+        )
+        self._finish_rows = finish_rows
+        self._row_lines = 0
+
+    def start_row(self) -> None:
+        self._row_lines = 0
+
+    def __iter__(self) -> Iterator[str]:
+        for line in self._slice:
+            self._row_lines += 1
+            yield line
+        while self._finish_rows and self._row_lines and (raw := self._file.readline()):
+            self.size += len(raw)
+            yield raw.decode("utf-8")
+
+
+# Source by file extension; CSV sources carry their delimiter
+_SOURCES: dict[str, tuple[type[DataSource], dict[str, str]]] = {
+    ".csv": (CsvSource, {"delimiter": ","}),
+    ".tsv": (CsvSource, {"delimiter": "\t"}),
+    ".tab": (CsvSource, {"delimiter": "\t"}),
+    ".ndjson": (NdjsonSource, {}),
+    ".jsonl": (NdjsonSource, {}),
+    ".json": (JsonSource, {}),
+}
+
+IMPORT_EXTENSIONS = frozenset(_SOURCES)
+
+
+def open_source(path: Path, sample_rows: int = IMPORT_SAMPLE_ROWS) -> DataSource:
+    """A source for ``path`` chosen by its extension; open it with ``with``."""
+    try:
+        source_type, options = _SOURCES[path.suffix.lower()]
+    except KeyError:
+        supported = ", ".join(sorted(_SOURCES))
+        raise DataImportError(f"Cannot import {path.name}: expected one of {supported}") from None
+    return source_type(path, sample_rows=sample_rows, **options)
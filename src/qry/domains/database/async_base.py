@@ -0,0 +1,65 @@
+"""Abstract base class for asyncio database adapters."""
+
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from qry.shared.constants import STREAM_BATCH_SIZE
+from qry.shared.models import QueryResult
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
+
+
+class AsyncDatabaseAdapter(ABC):
+    """Asyncio counterpart of ``DatabaseAdapter``.
+
+    Methods mirror the synchronous adapter and can be awaited from the
+    Textual event loop; several adapters can run queries concurrently
+    without a thread pool on the caller's side.
+    """
+
+    @abstractmethod
+    async def connect(self) -> None:
+        pass
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        pass
+
+    @abstractmethod
+    def is_connected(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
+        """Execute ``sql``, binding ``params`` to its ``:name`` placeholders."""
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[QueryResult]:
+        """Execute ``sql`` and yield its rows in batches, like ``DatabaseAdapter.stream``."""
+        pass
+
+    @abstractmethod
+    async def get_tables(self) -> list[TableInfo]:
+        pass
+
+    @abstractmethod
+    async def get_columns(self, table_name: str) -> list[ColumnInfo]:
+        pass
+
+    @abstractmethod
+    async def get_databases(self) -> list[str]:
+        pass
+
+    async def get_views(self) -> list[ViewInfo]:
+        return []
+
+    async def get_indexes(self) -> list[IndexInfo]:
+        return []
+
+    async def cancel(self) -> None:  # noqa: B027 - optional, not every driver can cancel
+        pass
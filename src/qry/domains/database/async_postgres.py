@@ -0,0 +1,194 @@
+"""Asyncio PostgreSQL adapter using psycopg v3's AsyncConnection."""
+
+import time
+from collections.abc import AsyncIterator
+
+import psycopg
+
+from qry.domains.database.async_base import AsyncDatabaseAdapter
+from qry.domains.database.postgres_catalog import (
+    COLUMNS_SQL,
+    DATABASES_SQL,
+    INDEXES_SQL,
+    PRIMARY_KEY_SQL,
+    TABLES_SQL,
+    VIEWS_SQL,
+    batch_result,
+    to_columns,
+)
+from qry.domains.query.parameters import to_pyformat
+from qry.shared.constants import PREPARED_STATEMENT_CACHE_SIZE, STREAM_BATCH_SIZE
+from qry.shared.exceptions import DatabaseError
+from qry.shared.models import QueryResult
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
+
+
+class AsyncPostgresAdapter(AsyncDatabaseAdapter):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 5432,
+        database: str = "",
+        user: str = "",
+        password: str = "",
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._database = database
+        self._user = user
+        self._password = password
+        self._conn: psycopg.AsyncConnection | None = None
+
+    async def connect(self) -> None:
+        try:
+            self._conn = await psycopg.AsyncConnection.connect(
+                host=self._host,
+                port=self._port,
+                dbname=self._database,
+                user=self._user,
+                password=self._password,
+                autocommit=True,
+            )
+            self._conn.prepared_max = PREPARED_STATEMENT_CACHE_SIZE
+        except psycopg.Error as e:
+            raise DatabaseError(
+                f"Failed to connect to {self._host}:{self._port}/{self._database}: {e}"
+            ) from e
+
+    async def disconnect(self) -> None:
+        if self._conn and not self._conn.closed:
+            await self._conn.close()
+        self._conn = None
+
+    def is_connected(self) -> bool:
+        return self._conn is not None and not self._conn.closed
+
+    async def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
+        if not self.is_connected():
+            return QueryResult(error="Not connected to database")
+
+        start_time = time.perf_counter()
+        try:
+            if params:
+                cursor = await self._conn.execute(  # type: ignore[union-attr]
+                    to_pyformat(sql), params, prepare=True
+                )
+            else:
+                cursor = await self._conn.execute(sql)  # type: ignore[union-attr]
+            execution_time_ms = (time.perf_counter() - start_time) * 1000
+
+            if cursor.description:
+                columns = [desc[0] for desc in cursor.description]
+                rows = await cursor.fetchall()
+                return QueryResult(
+                    columns=columns,
+                    rows=[tuple(row) for row in rows],
+                    row_count=len(rows),
+                    execution_time_ms=execution_time_ms,
+                )
+            return QueryResult(
+                row_count=cursor.rowcount if cursor.rowcount >= 0 else 0,
+                execution_time_ms=execution_time_ms,
+            )
+        except psycopg.Error as e:
+            return QueryResult(
+                error=str(e),
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    async def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[QueryResult]:
+        if not self.is_connected():
+            yield QueryResult(error="Not connected to database")
+            return
+
+        start_time = time.perf_counter()
+        try:
+            cursor = self._conn.cursor()  # type: ignore[union-attr]
+            rows = cursor.stream(to_pyformat(sql) if params else sql, params, size=batch_size)
+            columns: list[str] = []
+            batch: list[tuple] = []
+            sent = False
+            async for row in rows:
+                if not columns:
+                    columns = [desc[0] for desc in cursor.description or []]
+                batch.append(tuple(row))
+                if len(batch) == batch_size:
+                    yield batch_result(columns, batch, start_time)
+                    sent = True
+                    batch = []
+                    start_time = time.perf_counter()
+            if cursor.description is None:
+                yield QueryResult(
+                    row_count=cursor.rowcount if cursor.rowcount >= 0 else 0,
+                    execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                )
+            elif batch or not sent:
+                columns = columns or [desc[0] for desc in cursor.description]
+                yield batch_result(columns, batch, start_time)
+        except psycopg.Error as e:
+            yield QueryResult(
+                error=str(e),
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    async def _fetch(self, sql: str, params: tuple = ()) -> list[tuple]:
+        cursor = await self._conn.execute(sql, params)  # type: ignore[union-attr]
+        return await cursor.fetchall()
+
+    async def get_tables(self) -> list[TableInfo]:
+        if not self.is_connected():
+            return []
+        try:
+            rows = await self._fetch(TABLES_SQL)
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to fetch tables: {e}") from e
+        return [TableInfo(name=row[0], schema="public") for row in rows]
+
+    async def get_columns(self, table_name: str) -> list[ColumnInfo]:
+        if not self.is_connected():
+            return []
+        try:
+            rows = await self._fetch(COLUMNS_SQL, (table_name,))
+            pk_rows = await self._fetch(PRIMARY_KEY_SQL, (table_name,))
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to fetch columns: {e}") from e
+        return to_columns(rows, {row[0] for row in pk_rows})
+
+    async def get_views(self) -> list[ViewInfo]:
+        if not self.is_connected():
+            return []
+        try:
+            rows = await self._fetch(VIEWS_SQL)
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to fetch views: {e}") from e
+        return [ViewInfo(name=row[0], schema="public") for row in rows]
+
+    async def get_indexes(self) -> list[IndexInfo]:
+        if not self.is_connected():
+            return []
+        try:
+            rows = await self._fetch(INDEXES_SQL)
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to fetch indexes: {e}") from e
+        return [
+            IndexInfo(name=row[0], table_name=row[1], unique=bool(row[2]), schema="public")
+            for row in rows
+        ]
+
+    async def get_databases(self) -> list[str]:
+        if not self.is_connected():
+            return []
+        try:
+            rows = await self._fetch(DATABASES_SQL)
+        except psycopg.Error as e:
+            raise DatabaseError(f"Failed to fetch databases: {e}") from e
+        return [row[0] for row in rows]
+
+    async def cancel(self) -> None:
+        if self._conn and not self._conn.closed:
+            await self._conn.cancel_safe()
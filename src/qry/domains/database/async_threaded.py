@@ -0,0 +1,94 @@
+"""Async adapter running a synchronous adapter on a dedicated thread."""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from qry.domains.database.async_base import AsyncDatabaseAdapter
+from qry.domains.database.base import DatabaseAdapter
+from qry.shared.constants import STREAM_BATCH_SIZE
+from qry.shared.models import QueryResult
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
+
+T = TypeVar("T")
+
+
+class ThreadedAsyncAdapter(AsyncDatabaseAdapter):
+    """Wraps a ``DatabaseAdapter`` whose driver has no asyncio support.
+
+    Every call runs on one thread owned by this wrapper, started by
+    ``connect`` and stopped by ``disconnect``, so drivers whose connections
+    are bound to the thread that opened them (sqlite3) work, and calls on
+    one connection never overlap. ``cancel`` is the exception:
+    it runs immediately so it can interrupt a running query.
+    """
+
+    def __init__(self, adapter: DatabaseAdapter) -> None:
+        self._adapter = adapter
+        # The thread lives from connect to disconnect
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def adapter(self) -> DatabaseAdapter:
+        return self._adapter
+
+    async def _call(self, func: Callable[..., T], *args: object) -> T:
+        if self._executor is None:
+            # Not connected: the adapter answers without touching a connection
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def connect(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"qry-{type(self._adapter).__name__}"
+            )
+        await self._call(self._adapter.connect)
+
+    async def disconnect(self) -> None:
+        executor = self._executor
+        if executor is None:
+            return
+        try:
+            await self._call(self._adapter.disconnect)
+        finally:
+            self._executor = None
+            executor.shutdown(wait=False)
+
+    def is_connected(self) -> bool:
+        return self._adapter.is_connected()
+
+    async def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
+        return await self._call(self._adapter.execute, sql, params)
+
+    async def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> AsyncIterator[QueryResult]:
+        batches = self._adapter.stream(sql, params, batch_size)
+        try:
+            while (batch := await self._call(next, batches, None)) is not None:
+                yield batch
+        finally:
+            await self._call(batches.close)
+
+    async def get_tables(self) -> list[TableInfo]:
+        return await self._call(self._adapter.get_tables)
+
+    async def get_columns(self, table_name: str) -> list[ColumnInfo]:
+        return await self._call(self._adapter.get_columns, table_name)
+
+    async def get_databases(self) -> list[str]:
+        return await self._call(self._adapter.get_databases)
+
+    async def get_views(self) -> list[ViewInfo]:
+        return await self._call(self._adapter.get_views)
+
+    async def get_indexes(self) -> list[IndexInfo]:
+        return await self._call(self._adapter.get_indexes)
+
+    async def cancel(self) -> None:
+        self._adapter.cancel()
@@ -1,13 +1,14 @@
 """Abstract base class for database adapters."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
 
 from qry.domains.query.ports import SchemaProvider
-from qry.shared.types import ColumnInfo, IndexInfo, TableInfo, ViewInfo
-
-if TYPE_CHECKING:
-    from qry.shared.models import QueryResult
+from qry.shared.constants import STREAM_BATCH_SIZE
+from qry.shared.exceptions import DatabaseError
+from qry.shared.models import QueryResult
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
 
 
 class DatabaseAdapter(SchemaProvider, ABC):
@@ -17,6 +18,10 @@ class DatabaseAdapter(SchemaProvider, ABC):
     without direct dependency on database domain.
     """
 
+    # True when any failed statement poisons the open transaction (PostgreSQL),
+    # so it can only continue after rolling back to a savepoint
+    aborts_transaction_on_error: bool = False
+
     @abstractmethod
     def connect(self) -> None:
         pass
@@ -30,9 +35,83 @@ class DatabaseAdapter(SchemaProvider, ABC):
         pass
 
     @abstractmethod
-    def execute(self, sql: str) -> "QueryResult":
+    def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
+        """Execute ``sql``, binding ``params`` to its ``:name`` placeholders.
+
+        Parameterized statements go through the connection's prepared
+        statement cache where the driver has one.
+        """
         pass
 
+    def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[QueryResult]:
+        """Execute ``sql`` and yield its rows in batches of at most ``batch_size``.
+
+        Every batch carries the column names and the time spent fetching it.
+        A statement without rows yields one result; a failure ends the stream
+        with an error result. This default fetches everything first; adapters
+        override it to read incrementally from the server.
+        """
+        result = self.execute(sql, params)
+        if not result.rows:
+            yield result
+            return
+        for start in range(0, len(result.rows), batch_size):
+            rows = result.rows[start : start + batch_size]
+            yield QueryResult(
+                columns=result.columns,
+                rows=rows,
+                row_count=len(rows),
+                execution_time_ms=result.execution_time_ms if start == 0 else 0.0,
+            )
+
+    def copy_csv(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[list[bytes]] | None:
+        """Stream ``sql``'s rows as CSV written by the server, if the database can.
+
+        Yields UTF-8 lines in batches of at most ``batch_size``: first the
+        header on its own, then the rows. The bytes never pass through
+        Python row objects. Returns None when the adapter or statement has
+        no such path; iterating raises ``DatabaseError`` if the query fails.
+        """
+        return None
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: list[str],
+        row_batches: Iterable[Sequence[Sequence[Any]]],
+    ) -> int:
+        """Insert every row of ``row_batches`` into ``table``'s ``columns``.
+
+        Adapters use the database's fastest bulk path, in one transaction:
+        either every row goes in or, when the database or ``row_batches``
+        raises, none does. Database failures raise ``DatabaseError``.
+        Returns the number of rows inserted.
+        """
+        raise DatabaseError(f"{type(self).__name__} cannot bulk insert")
+
+    def execute_many(self, statements: list[tuple[str, QueryParams | None]]) -> list[QueryResult]:
+        """Execute statements in order, stopping after the first failure.
+
+        Adapters may override this to send the statements together.
+        """
+        results: list[QueryResult] = []
+        for sql, params in statements:
+            result = self.execute(sql, params)
+            results.append(result)
+            if not result.is_success:
+                break
+        return results
+
     @abstractmethod
     def get_tables(self) -> list[TableInfo]:
         pass
@@ -71,3 +150,27 @@ class DatabaseAdapter(SchemaProvider, ABC):
 
     def cancel(self) -> None:
         pass
+
+    def begin(self) -> None:
+        """Open a transaction; ``execute`` does not commit until ``commit``."""
+        self._run_control("BEGIN")
+
+    def commit(self) -> None:
+        self._run_control("COMMIT")
+
+    def rollback(self) -> None:
+        self._run_control("ROLLBACK")
+
+    def savepoint(self, name: str) -> None:
+        self._run_control(f"SAVEPOINT {name}")
+
+    def release_savepoint(self, name: str) -> None:
+        self._run_control(f"RELEASE SAVEPOINT {name}")
+
+    def rollback_to_savepoint(self, name: str) -> None:
+        self._run_control(f"ROLLBACK TO SAVEPOINT {name}")
+
+    def _run_control(self, sql: str) -> None:
+        result = self.execute(sql)
+        if not result.is_success:
+            raise DatabaseError(f"{sql} failed: {result.error}")
@@ -1,6 +1,7 @@
 """Database adapter factory."""
 
 from qry.domains.connection.models import ConnectionConfig, DatabaseType
+from qry.domains.database.async_base import AsyncDatabaseAdapter
 from qry.domains.database.base import DatabaseAdapter
 
 
@@ -20,6 +21,35 @@ class AdapterFactory:
             case _:
                 raise ValueError(f"Unsupported database type: {config.db_type}")
 
+    @classmethod
+    def create_async(cls, config: ConnectionConfig) -> AsyncDatabaseAdapter:
+        """Create an asyncio adapter for the given configuration.
+
+        PostgreSQL uses psycopg's native async connection; other drivers
+        run on a dedicated thread behind ``ThreadedAsyncAdapter``.
+        """
+        if config.db_type == DatabaseType.POSTGRES:
+            try:
+                from qry.domains.database.async_postgres import AsyncPostgresAdapter
+            except ImportError as e:
+                db_type = DatabaseType.POSTGRES
+                raise ImportError(
+                    f"PostgreSQL support requires '{db_type.required_module}'. "
+                    f"Install with: {db_type.install_hint}"
+                ) from e
+
+            return AsyncPostgresAdapter(
+                host=config.host or "localhost",
+                port=config.port or 5432,
+                database=config.database or "",
+                user=config.user or "",
+                password=config.password or "",
+            )
+
+        from qry.domains.database.async_threaded import ThreadedAsyncAdapter
+
+        return ThreadedAsyncAdapter(cls.create(config))
+
     @classmethod
     def _create_sqlite(cls, config: ConnectionConfig) -> DatabaseAdapter:
         from qry.domains.database.sqlite import SQLiteAdapter
@@ -2,13 +2,22 @@
 
 import contextlib
 import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
 
 import pymysql
+import pymysql.cursors
 
 from qry.domains.database.base import DatabaseAdapter
+from qry.domains.query.parameters import to_pyformat
+from qry.shared.constants import STREAM_BATCH_SIZE
 from qry.shared.exceptions import DatabaseError
 from qry.shared.models import QueryResult
-from qry.shared.types import ColumnInfo, IndexInfo, TableInfo, ViewInfo
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
+
+
+def _quote(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
 
 
 class MySQLAdapter(DatabaseAdapter):
@@ -50,7 +59,7 @@ class MySQLAdapter(DatabaseAdapter):
     def is_connected(self) -> bool:
         return self._conn is not None and self._conn.open
 
-    def execute(self, sql: str) -> QueryResult:
+    def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
         if not self.is_connected():
             return QueryResult(error="Not connected to database")
 
@@ -58,7 +67,11 @@ class MySQLAdapter(DatabaseAdapter):
 
         try:
             with self._conn.cursor() as cursor:  # type: ignore[union-attr]
-                cursor.execute(sql)
+                if params:
+                    # PyMySQL has no server-side prepare; values are escaped client-side
+                    cursor.execute(to_pyformat(sql), params)
+                else:
+                    cursor.execute(sql)
                 execution_time_ms = (time.perf_counter() - start_time) * 1000
 
                 if cursor.description:
@@ -84,6 +97,91 @@ class MySQLAdapter(DatabaseAdapter):
                 execution_time_ms=execution_time_ms,
             )
 
+    def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[QueryResult]:
+        if not self.is_connected():
+            yield QueryResult(error="Not connected to database")
+            return
+
+        start_time = time.perf_counter()
+        try:
+            # Unbuffered cursor: rows are read from the socket as they are fetched
+            with self._conn.cursor(pymysql.cursors.SSCursor) as cursor:  # type: ignore[union-attr]
+                if params:
+                    cursor.execute(to_pyformat(sql), params)
+                else:
+                    cursor.execute(sql)
+
+                if not cursor.description:
+                    yield QueryResult(
+                        row_count=cursor.rowcount if cursor.rowcount >= 0 else 0,
+                        execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                    )
+                    return
+
+                columns = [desc[0] for desc in cursor.description]
+                first = True
+                while (rows := cursor.fetchmany(batch_size)) or first:
+                    first = False
+                    yield QueryResult(
+                        columns=columns,
+                        rows=[tuple(row) for row in rows],
+                        row_count=len(rows),
+                        execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                    )
+                    start_time = time.perf_counter()
+        except pymysql.Error as e:
+            yield QueryResult(
+                error=str(e),
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: list[str],
+        row_batches: Iterable[Sequence[Sequence[Any]]],
+    ) -> int:
+        """Insert the rows with multi-row ``INSERT`` statements.
+
+        PyMySQL's ``executemany`` packs each batch into as few ``INSERT ...
+        VALUES (...), (...)`` statements as its statement size limit
+        allows. ``LOAD DATA LOCAL INFILE`` is not used: it needs
+        ``local_infile`` enabled on both client and server, which lets the
+        server ask the client for any file.
+        """
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        names = ", ".join(_quote(column) for column in columns)
+        placeholders = ", ".join(["%s"] * len(columns))
+        statement = f"INSERT INTO {_quote(table)} ({names}) VALUES ({placeholders})"
+        count = 0
+        try:
+            self._conn.begin()  # type: ignore[union-attr]
+            with self._conn.cursor() as cursor:  # type: ignore[union-attr]
+                for batch in row_batches:
+                    cursor.executemany(statement, batch)
+                    count += len(batch)
+            self._conn.commit()  # type: ignore[union-attr]
+        except pymysql.Error as e:
+            self._rollback_quietly()
+            raise DatabaseError(f"Import into {table} failed: {e}") from e
+        except BaseException:
+            self._rollback_quietly()
+            raise
+        return count
+
+    def _rollback_quietly(self) -> None:
+        # A cancel kills the connection, and the server rolls back with it
+        if self._conn and self._conn.open:
+            with contextlib.suppress(pymysql.Error):
+                self._conn.rollback()
+
     def get_tables(self) -> list[TableInfo]:
         if not self.is_connected():
             return []
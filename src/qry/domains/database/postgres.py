@@ -1,16 +1,44 @@
 """PostgreSQL database adapter using psycopg v3."""
 
 import time
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
 
 import psycopg
 
 from qry.domains.database.base import DatabaseAdapter
+from qry.domains.database.postgres_catalog import (
+    COLUMNS_SQL,
+    DATABASES_SQL,
+    INDEXES_SQL,
+    PRIMARY_KEY_SQL,
+    TABLES_SQL,
+    VIEWS_SQL,
+    batch_result,
+    to_columns,
+)
+from qry.domains.query.parameters import to_pyformat
+from qry.domains.query.splitter import QuerySplitter
+from qry.domains.query.statement import is_read_only, leading_keywords
+from qry.shared.constants import PREPARED_STATEMENT_CACHE_SIZE, STREAM_BATCH_SIZE
 from qry.shared.exceptions import DatabaseError
 from qry.shared.models import QueryResult
-from qry.shared.types import ColumnInfo, IndexInfo, TableInfo, ViewInfo
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
+
+# The newlines keep a trailing line comment from swallowing the parenthesis
+_COPY_CSV_SQL = "COPY (\n{query}\n) TO STDOUT WITH (FORMAT csv, HEADER true, ENCODING 'UTF8')"
+
+# Statements COPY accepts as its (query)
+_COPY_COMMANDS = frozenset({"select", "with", "values", "table"})
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
 
 
 class PostgresAdapter(DatabaseAdapter):
+    aborts_transaction_on_error = True
+
     def __init__(
         self,
         host: str = "localhost",
@@ -36,6 +64,8 @@ class PostgresAdapter(DatabaseAdapter):
                 password=self._password,
                 autocommit=True,
             )
+            # Size of psycopg's per-connection LRU of server-side prepared statements
+            self._conn.prepared_max = PREPARED_STATEMENT_CACHE_SIZE
         except psycopg.Error as e:
             raise DatabaseError(
                 f"Failed to connect to {self._host}:{self._port}/{self._database}: {e}"
@@ -49,32 +79,22 @@ class PostgresAdapter(DatabaseAdapter):
     def is_connected(self) -> bool:
         return self._conn is not None and not self._conn.closed
 
-    def execute(self, sql: str) -> QueryResult:
+    def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
         if not self.is_connected():
             return QueryResult(error="Not connected to database")
 
         start_time = time.perf_counter()
 
         try:
-            cursor = self._conn.execute(sql)  # type: ignore[union-attr]
-            execution_time_ms = (time.perf_counter() - start_time) * 1000
-
-            if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                return QueryResult(
-                    columns=columns,
-                    rows=[tuple(row) for row in rows],
-                    row_count=len(rows),
-                    execution_time_ms=execution_time_ms,
+            if params:
+                # Prepare immediately: parameterized statements are the ones re-run
+                cursor = self._conn.execute(  # type: ignore[union-attr]
+                    to_pyformat(sql), params, prepare=True
                 )
             else:
-                return QueryResult(
-                    columns=[],
-                    rows=[],
-                    row_count=cursor.rowcount if cursor.rowcount >= 0 else 0,
-                    execution_time_ms=execution_time_ms,
-                )
+                cursor = self._conn.execute(sql)  # type: ignore[union-attr]
+            execution_time_ms = (time.perf_counter() - start_time) * 1000
+            return self._to_result(cursor, execution_time_ms)
 
         except psycopg.Error as e:
             execution_time_ms = (time.perf_counter() - start_time) * 1000
@@ -83,15 +103,184 @@ class PostgresAdapter(DatabaseAdapter):
                 execution_time_ms=execution_time_ms,
             )
 
+    def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[QueryResult]:
+        if not self.is_connected():
+            yield QueryResult(error="Not connected to database")
+            return
+
+        start_time = time.perf_counter()
+        try:
+            cursor = self._conn.cursor()  # type: ignore[union-attr]
+            # Rows arrive from the server in chunks of batch_size
+            rows = cursor.stream(to_pyformat(sql) if params else sql, params, size=batch_size)
+            columns: list[str] = []
+            batch: list[tuple] = []
+            sent = False
+            for row in rows:
+                if not columns:
+                    columns = [desc[0] for desc in cursor.description or []]
+                batch.append(tuple(row))
+                if len(batch) == batch_size:
+                    yield batch_result(columns, batch, start_time)
+                    sent = True
+                    batch = []
+                    start_time = time.perf_counter()
+            if cursor.description is None:
+                yield QueryResult(
+                    row_count=cursor.rowcount if cursor.rowcount >= 0 else 0,
+                    execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                )
+            elif batch or not sent:
+                columns = columns or [desc[0] for desc in cursor.description]
+                yield batch_result(columns, batch, start_time)
+        except psycopg.Error as e:
+            yield QueryResult(
+                error=str(e),
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    def copy_csv(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[list[bytes]] | None:
+        """Stream the rows with ``COPY (query) TO STDOUT``, formatted by the server.
+
+        Parameters are bound client-side, as COPY cannot take them.
+        """
+        statements = QuerySplitter.split(sql)
+        words = leading_keywords(statements[0], 1) if len(statements) == 1 else []
+        if not words or words[0] not in _COPY_COMMANDS:
+            return None
+        query = _COPY_CSV_SQL.format(query=statements[0])
+        return self._copy_lines(to_pyformat(query) if params else query, params, batch_size)
+
+    def _copy_lines(
+        self, query: str, params: QueryParams | None, batch_size: int
+    ) -> Iterator[list[bytes]]:
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+        try:
+            cursor = self._conn.cursor()  # type: ignore[union-attr]
+            with cursor.copy(query, params) as copy:
+                # libpq hands over COPY data one line at a time, the header first
+                lines = iter(copy)
+                header = next(lines, None)
+                if header is None:
+                    return
+                yield [bytes(header)]
+                batch: list[bytes] = []
+                for line in lines:
+                    batch.append(bytes(line))
+                    if len(batch) == batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+        except psycopg.Error as e:
+            raise DatabaseError(f"COPY failed: {e}") from e
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: list[str],
+        row_batches: Iterable[Sequence[Sequence[Any]]],
+    ) -> int:
+        """Stream the rows to the server with ``COPY ... FROM STDIN``."""
+        if not self.is_connected():
+            raise DatabaseError("Not connected to database")
+
+        names = ", ".join(_quote(column) for column in columns)
+        statement = f"COPY {_quote(table)} ({names}) FROM STDIN"
+        count = 0
+        try:
+            with (
+                self._conn.transaction(),  # type: ignore[union-attr]
+                self._conn.cursor() as cursor,  # type: ignore[union-attr]
+                cursor.copy(statement) as copy,
+            ):
+                for batch in row_batches:
+                    for row in batch:
+                        copy.write_row(row)
+                    count += len(batch)
+        except psycopg.Error as e:
+            raise DatabaseError(f"Import into {table} failed: {e}") from e
+        return count
+
+    def execute_many(self, statements: list[tuple[str, QueryParams | None]]) -> list[QueryResult]:
+        """Send read-only scripts in one pipeline, waiting for results once.
+
+        A pipeline runs as a single implicit transaction, so a failure would
+        roll back the statements before it too. Only scripts that change
+        nothing are pipelined; any other script runs one statement at a
+        time, each committed on its own.
+        """
+        if (
+            len(statements) < 2
+            or not self.is_connected()
+            or not psycopg.Pipeline.is_supported()
+            or not all(is_read_only(sql) for sql, _ in statements)
+        ):
+            return super().execute_many(statements)
+
+        start_time = time.perf_counter()
+        cursors: list[psycopg.Cursor] = []
+        error: psycopg.Error | None = None
+        try:
+            with self._conn.pipeline():  # type: ignore[union-attr]
+                for sql, params in statements:
+                    cursor = self._conn.cursor()  # type: ignore[union-attr]
+                    if params:
+                        cursor.execute(to_pyformat(sql), params, prepare=True)
+                    else:
+                        cursor.execute(sql)
+                    cursors.append(cursor)
+        except psycopg.Error as e:
+            error = e
+        execution_time_ms = (time.perf_counter() - start_time) * 1000
+
+        # Statements overlap on the wire; spread the total time evenly
+        share_ms = execution_time_ms / len(statements)
+        results: list[QueryResult] = []
+        for cursor in cursors:
+            # The failed statement, and every one after it, has no result
+            if cursor.pgresult is None:
+                break
+            results.append(self._to_result(cursor, share_ms))
+        if error is not None:
+            results.append(QueryResult(error=str(error), execution_time_ms=share_ms))
+        return results
+
+    @staticmethod
+    def _to_result(cursor: psycopg.Cursor, execution_time_ms: float) -> QueryResult:
+        if cursor.description:
+            columns = [desc[0] for desc in cursor.description]
+            rows = cursor.fetchall()
+            return QueryResult(
+                columns=columns,
+                rows=[tuple(row) for row in rows],
+                row_count=len(rows),
+                execution_time_ms=execution_time_ms,
+            )
+        return QueryResult(
+            columns=[],
+            rows=[],
+            row_count=cursor.rowcount if cursor.rowcount >= 0 else 0,
+            execution_time_ms=execution_time_ms,
+        )
+
     def get_tables(self) -> list[TableInfo]:
         if not self.is_connected():
             return []
 
         try:
-            cursor = self._conn.execute(  # type: ignore[union-attr]
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'public' ORDER BY table_name"
-            )
+            cursor = self._conn.execute(TABLES_SQL)  # type: ignore[union-attr]
             return [TableInfo(name=row[0], schema="public") for row in cursor.fetchall()]
         except psycopg.Error as e:
             raise DatabaseError(f"Failed to fetch tables: {e}") from e
@@ -101,50 +290,22 @@ class PostgresAdapter(DatabaseAdapter):
             return []
 
         try:
-            cursor = self._conn.execute(  # type: ignore[union-attr]
-                "SELECT column_name, data_type, is_nullable, column_default, "
-                "character_maximum_length "
-                "FROM information_schema.columns "
-                "WHERE table_schema = 'public' AND table_name = %s "
-                "ORDER BY ordinal_position",
-                (table_name,),
-            )
-
+            cursor = self._conn.execute(COLUMNS_SQL, (table_name,))  # type: ignore[union-attr]
             pk_cursor = self._conn.execute(  # type: ignore[union-attr]
-                "SELECT a.attname "
-                "FROM pg_index i "
-                "JOIN pg_attribute a ON a.attrelid = i.indrelid "
-                "AND a.attnum = ANY(i.indkey) "
-                "WHERE i.indrelid = %s::regclass AND i.indisprimary",
-                (table_name,),
+                PRIMARY_KEY_SQL, (table_name,)
             )
             pk_columns = {row[0] for row in pk_cursor.fetchall()}
         except psycopg.Error as e:
             raise DatabaseError(f"Failed to fetch columns: {e}") from e
 
-        columns = []
-        for row in cursor.fetchall():
-            columns.append(
-                ColumnInfo(
-                    name=row[0],
-                    data_type=row[1],
-                    nullable=row[2] == "YES",
-                    primary_key=row[0] in pk_columns,
-                    default=row[3],
-                    length=row[4],
-                )
-            )
-        return columns
+        return to_columns(cursor.fetchall(), pk_columns)
 
     def get_views(self) -> list[ViewInfo]:
         if not self.is_connected():
             return []
 
         try:
-            cursor = self._conn.execute(  # type: ignore[union-attr]
-                "SELECT table_name FROM information_schema.views "
-                "WHERE table_schema = 'public' ORDER BY table_name"
-            )
+            cursor = self._conn.execute(VIEWS_SQL)  # type: ignore[union-attr]
             return [ViewInfo(name=row[0], schema="public") for row in cursor.fetchall()]
         except psycopg.Error as e:
             raise DatabaseError(f"Failed to fetch views: {e}") from e
@@ -154,14 +315,7 @@ class PostgresAdapter(DatabaseAdapter):
             return []
 
         try:
-            cursor = self._conn.execute(  # type: ignore[union-attr]
-                "SELECT indexname, tablename, indisunique "
-                "FROM pg_indexes i "
-                "JOIN pg_class c ON c.relname = i.indexname "
-                "JOIN pg_index ix ON ix.indexrelid = c.oid "
-                "WHERE i.schemaname = 'public' "
-                "ORDER BY indexname"
-            )
+            cursor = self._conn.execute(INDEXES_SQL)  # type: ignore[union-attr]
             return [
                 IndexInfo(name=row[0], table_name=row[1], unique=bool(row[2]), schema="public")
                 for row in cursor.fetchall()
@@ -174,9 +328,7 @@ class PostgresAdapter(DatabaseAdapter):
             return []
 
         try:
-            cursor = self._conn.execute(  # type: ignore[union-attr]
-                "SELECT datname FROM pg_database WHERE datistemplate = false ORDER BY datname"
-            )
+            cursor = self._conn.execute(DATABASES_SQL)  # type: ignore[union-attr]
             return [row[0] for row in cursor.fetchall()]
         except psycopg.Error as e:
             raise DatabaseError(f"Failed to fetch databases: {e}") from e
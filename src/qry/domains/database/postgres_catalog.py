@@ -0,0 +1,68 @@
+"""PostgreSQL schema queries and result helpers shared by the sync and async adapters."""
+
+import time
+
+from qry.shared.models import QueryResult
+from qry.shared.types import ColumnInfo
+
+TABLES_SQL = (
+    "SELECT table_name FROM information_schema.tables "
+    "WHERE table_schema = 'public' ORDER BY table_name"
+)
+
+COLUMNS_SQL = (
+    "SELECT column_name, data_type, is_nullable, column_default, "
+    "character_maximum_length "
+    "FROM information_schema.columns "
+    "WHERE table_schema = 'public' AND table_name = %s "
+    "ORDER BY ordinal_position"
+)
+
+PRIMARY_KEY_SQL = (
+    "SELECT a.attname "
+    "FROM pg_index i "
+    "JOIN pg_attribute a ON a.attrelid = i.indrelid "
+    "AND a.attnum = ANY(i.indkey) "
+    "WHERE i.indrelid = %s::regclass AND i.indisprimary"
+)
+
+VIEWS_SQL = (
+    "SELECT table_name FROM information_schema.views "
+    "WHERE table_schema = 'public' ORDER BY table_name"
+)
+
+INDEXES_SQL = (
+    "SELECT indexname, tablename, indisunique "
+    "FROM pg_indexes i "
+    "JOIN pg_class c ON c.relname = i.indexname "
+    "JOIN pg_index ix ON ix.indexrelid = c.oid "
+    "WHERE i.schemaname = 'public' "
+    "ORDER BY indexname"
+)
+
+DATABASES_SQL = "SELECT datname FROM pg_database WHERE datistemplate = false ORDER BY datname"
+
+
+def to_columns(rows: list[tuple], pk_columns: set[str]) -> list[ColumnInfo]:
+    """Columns from the rows of ``COLUMNS_SQL``, marking those in ``pk_columns``."""
+    return [
+        ColumnInfo(
+            name=row[0],
+            data_type=row[1],
+            nullable=row[2] == "YES",
+            primary_key=row[0] in pk_columns,
+            default=row[3],
+            length=row[4],
+        )
+        for row in rows
+    ]
+
+
+def batch_result(columns: list[str], rows: list[tuple], start_time: float) -> QueryResult:
+    """One streamed batch of rows, timed from ``start_time``."""
+    return QueryResult(
+        columns=columns,
+        rows=rows,
+        row_count=len(rows),
+        execution_time_ms=(time.perf_counter() - start_time) * 1000,
+    )
@@ -1,14 +1,54 @@
 """SQLite database adapter."""
 
+import datetime
+import json
 import re
 import sqlite3
 import time
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
+from typing import Any
 
 from qry.domains.database.base import DatabaseAdapter
+from qry.shared.constants import (
+    PREPARED_STATEMENT_CACHE_SIZE,
+    SQLITE_IMPORT_CACHE_KIB,
+    STREAM_BATCH_SIZE,
+)
 from qry.shared.exceptions import DatabaseError
 from qry.shared.models import QueryResult
-from qry.shared.types import ColumnInfo, IndexInfo, TableInfo, ViewInfo
+from qry.shared.types import ColumnInfo, IndexInfo, QueryParams, TableInfo, ViewInfo
+
+# bool binds as an integer
+_NATIVE_TYPES = frozenset({type(None), bool, int, float, str, bytes})
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def to_sqlite(value: object) -> object:
+    """``value`` as a type SQLite stores: dates as ISO text, JSON as text."""
+    if type(value) in _NATIVE_TYPES:
+        return value
+    if isinstance(value, bytearray | memoryview):
+        return bytes(value)
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def to_sqlite_rows(rows: Iterable[Sequence[Any]]) -> Iterator[Sequence[Any]]:
+    """``rows`` with every value ``to_sqlite`` converted; native rows pass as they are."""
+    for row in rows:
+        if _NATIVE_TYPES.issuperset(map(type, row)):
+            yield row
+        else:
+            yield tuple(to_sqlite(v) for v in row)
 
 
 class SQLiteAdapter(DatabaseAdapter):
@@ -17,10 +57,14 @@ class SQLiteAdapter(DatabaseAdapter):
     def __init__(self, path: str | Path) -> None:
         self._path = Path(path).expanduser()
         self._conn: sqlite3.Connection | None = None
+        self._in_transaction = False
 
     def connect(self) -> None:
         try:
-            self._conn = sqlite3.connect(str(self._path))
+            # sqlite3 keeps an LRU of compiled statements per connection
+            self._conn = sqlite3.connect(
+                str(self._path), cached_statements=PREPARED_STATEMENT_CACHE_SIZE
+            )
             self._conn.row_factory = sqlite3.Row
         except sqlite3.Error as e:
             raise DatabaseError(f"Failed to connect to {self._path}: {e}") from e
@@ -29,18 +73,20 @@ class SQLiteAdapter(DatabaseAdapter):
         if self._conn:
             self._conn.close()
             self._conn = None
+        self._in_transaction = False
 
     def is_connected(self) -> bool:
         return self._conn is not None
 
-    def execute(self, sql: str) -> QueryResult:
+    def execute(self, sql: str, params: QueryParams | None = None) -> QueryResult:
         if not self._conn:
             return QueryResult(error="Not connected to database")
 
         start_time = time.perf_counter()
 
         try:
-            cursor = self._conn.execute(sql)
+            # sqlite3 understands :name placeholders natively
+            cursor = self._conn.execute(sql, params) if params else self._conn.execute(sql)
             rows = cursor.fetchall()
             execution_time_ms = (time.perf_counter() - start_time) * 1000
 
@@ -53,7 +99,8 @@ class SQLiteAdapter(DatabaseAdapter):
                     execution_time_ms=execution_time_ms,
                 )
             else:
-                self._conn.commit()
+                if not self._in_transaction:
+                    self._conn.commit()
                 return QueryResult(
                     columns=[],
                     rows=[],
@@ -68,6 +115,84 @@ class SQLiteAdapter(DatabaseAdapter):
                 execution_time_ms=execution_time_ms,
             )
 
+    def stream(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+    ) -> Iterator[QueryResult]:
+        if not self._conn:
+            yield QueryResult(error="Not connected to database")
+            return
+
+        start_time = time.perf_counter()
+        try:
+            cursor = self._conn.execute(sql, params) if params else self._conn.execute(sql)
+            if not cursor.description:
+                if not self._in_transaction:
+                    self._conn.commit()
+                yield QueryResult(
+                    row_count=cursor.rowcount,
+                    execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                )
+                return
+
+            columns = [desc[0] for desc in cursor.description]
+            first = True
+            while (rows := cursor.fetchmany(batch_size)) or first:
+                first = False
+                yield QueryResult(
+                    columns=columns,
+                    rows=[tuple(row) for row in rows],
+                    row_count=len(rows),
+                    execution_time_ms=(time.perf_counter() - start_time) * 1000,
+                )
+                start_time = time.perf_counter()
+        except sqlite3.Error as e:
+            yield QueryResult(
+                error=str(e),
+                execution_time_ms=(time.perf_counter() - start_time) * 1000,
+            )
+
+    def bulk_insert(
+        self,
+        table: str,
+        columns: list[str],
+        row_batches: Iterable[Sequence[Sequence[Any]]],
+    ) -> int:
+        """Insert the rows with ``executemany`` in a single transaction.
+
+        One commit means one sync to disk however many rows go in. The
+        page cache is enlarged meanwhile, so the pages of the growing
+        table and its indexes stay in memory instead of being re-read.
+        """
+        if not self._conn:
+            raise DatabaseError("Not connected to database")
+        if self._in_transaction:
+            raise DatabaseError("Commit or roll back the open transaction before importing")
+
+        names = ", ".join(_quote(column) for column in columns)
+        placeholders = ", ".join("?" * len(columns))
+        statement = f"INSERT INTO {_quote(table)} ({names}) VALUES ({placeholders})"
+        count = 0
+        cache_size = self._conn.execute("PRAGMA cache_size").fetchone()[0]
+        self._conn.execute(f"PRAGMA cache_size = -{SQLITE_IMPORT_CACHE_KIB}")
+        try:
+            self._conn.execute("BEGIN")
+            for batch in row_batches:
+                self._conn.executemany(statement, to_sqlite_rows(batch))
+                count += len(batch)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            raise DatabaseError(f"Import into {table} failed: {e}") from e
+        except BaseException:
+            self._conn.rollback()
+            raise
+        finally:
+            self._conn.execute(f"PRAGMA cache_size = {cache_size}")
+        return count
+
     def get_tables(self) -> list[TableInfo]:
         if not self._conn:
             return []
@@ -161,3 +286,29 @@ class SQLiteAdapter(DatabaseAdapter):
     def cancel(self) -> None:
         if self._conn:
             self._conn.interrupt()
+
+    def begin(self) -> None:
+        if not self._conn:
+            raise DatabaseError("Not connected to database")
+        try:
+            if not self._conn.in_transaction:
+                self._conn.execute("BEGIN")
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Failed to begin transaction: {e}") from e
+        self._in_transaction = True
+
+    def commit(self) -> None:
+        self._in_transaction = False
+        if self._conn:
+            try:
+                self._conn.commit()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to commit: {e}") from e
+
+    def rollback(self) -> None:
+        self._in_transaction = False
+        if self._conn:
+            try:
+                self._conn.rollback()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Failed to roll back: {e}") from e
@@ -0,0 +1,216 @@
+"""Parquet and Arrow IPC exporters (requires pyarrow)."""
+
+import json
+import os
+from abc import abstractmethod
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.ipc
+import pyarrow.parquet as pq
+
+from qry.domains.export.base import FileExporter, RowBatches
+from qry.shared.exceptions import ExportError
+
+_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError)
+
+# Widest decimal precision of each Arrow decimal type
+_DECIMAL128_DIGITS = 38
+_DECIMAL256_DIGITS = 76
+# Decimal shape that holds any int64
+_INT64_DIGITS = 19
+
+
+def _text(value: Any) -> str:
+    """A value as text: nested ones (JSON columns) as JSON, anything else by ``str``."""
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _as_strings(values: Sequence[Any]) -> pa.Array:
+    return pa.array([None if v is None else _text(v) for v in values], type=pa.string())
+
+
+def _infer_array(values: Sequence[Any]) -> pa.Array:
+    """Arrow array of ``values`` with an inferred type; strings when none fits.
+
+    The type is NULL when every value is; callers decide what that means.
+    """
+    try:
+        return pa.array(values)
+    except _CONVERSION_ERRORS:
+        return _as_strings(values)
+
+
+def _decimal_shape(data_type: pa.DataType) -> tuple[int, int] | None:
+    """(integer digits, scale) of a decimal or integer type, else None."""
+    if pa.types.is_decimal(data_type):
+        return data_type.precision - data_type.scale, data_type.scale
+    if pa.types.is_integer(data_type):
+        return _INT64_DIGITS, 0
+    return None
+
+
+def _common_type(a: pa.DataType, b: pa.DataType) -> pa.DataType:
+    """The narrowest type holding every value of ``a`` and ``b`` without truncating.
+
+    Integers mixed with floats are doubles; decimals grow to the larger
+    scale and integer part; anything else that differs becomes strings.
+    """
+    if a == b or pa.types.is_null(b):
+        return a
+    if pa.types.is_null(a):
+        return b
+    if pa.types.is_integer(a) and pa.types.is_integer(b):
+        return pa.int64()
+    numbers = (pa.types.is_integer, pa.types.is_floating)
+    if any(f(a) for f in numbers) and any(f(b) for f in numbers):
+        return pa.float64()
+    shape_a, shape_b = _decimal_shape(a), _decimal_shape(b)
+    if shape_a and shape_b:
+        scale = max(shape_a[1], shape_b[1])
+        precision = max(shape_a[0], shape_b[0]) + scale
+        if precision <= _DECIMAL128_DIGITS:
+            return pa.decimal128(precision, scale)
+        if precision <= _DECIMAL256_DIGITS:
+            return pa.decimal256(precision, scale)
+    return pa.string()
+
+
+def _cast(array: pa.Array, data_type: pa.DataType, values: Sequence[Any] | None = None) -> pa.Array:
+    """``array`` (converted from ``values``, if given) as ``data_type``, one it is known to fit."""
+    if array.type == data_type:
+        return array
+    if pa.types.is_string(data_type):
+        # From the Python values, so strings read the same whichever batch
+        # they came in; Arrow cannot cast nested types to strings at all
+        return _as_strings(array.to_pylist() if values is None else values)
+    # Only widening casts get here; int64 to double may round above 2**53
+    return array.cast(data_type, safe=False)
+
+
+class ArrowFileExporter(FileExporter):
+    """Writes row batches as Arrow record batches, column by column.
+
+    The schema is inferred from the first non-empty batch: each row batch
+    is transposed into columns and converted to typed Arrow arrays.
+    Columns whose values do not fit one Arrow type, or that are all NULL
+    in the first batch, are written as strings. When a later batch does
+    not fit, the column is widened (integers to doubles, decimals to a
+    larger precision or scale, otherwise strings) and the rows already
+    written are rewritten with the wider schema; values are never cast
+    into a narrower type. String columns hold each value's ``str``, or
+    JSON for dicts and lists, however the column became strings.
+    """
+
+    @abstractmethod
+    def _open_writer(self, path: Path, schema: pa.Schema) -> Any:
+        """A writer with ``write_table`` and ``close``."""
+        pass
+
+    @abstractmethod
+    def _read_batches(self, path: Path) -> Iterator[pa.RecordBatch]:
+        """The record batches of a file this exporter wrote."""
+        pass
+
+    def write_file(self, columns: list[str], row_batches: RowBatches, path: Path) -> int:
+        schema: pa.Schema | None = None
+        writer = None
+        count = 0
+        try:
+            for batch in row_batches:
+                if not batch:
+                    continue
+                values = list(zip(*batch, strict=True))
+                if schema is None:
+                    arrays = [_infer_array(column) for column in values]
+                    # An all-NULL first batch says nothing about later values
+                    arrays = [
+                        _as_strings(column) if pa.types.is_null(array.type) else array
+                        for column, array in zip(values, arrays, strict=True)
+                    ]
+                    schema = pa.schema(
+                        pa.field(name, array.type)
+                        for name, array in zip(columns, arrays, strict=True)
+                    )
+                    writer = self._open_writer(path, schema)
+                else:
+                    arrays = [
+                        _as_strings(column)
+                        if pa.types.is_string(field.type)
+                        else _infer_array(column)
+                        for column, field in zip(values, schema, strict=True)
+                    ]
+                    widened = pa.schema(
+                        field.with_type(_common_type(field.type, array.type))
+                        for field, array in zip(schema, arrays, strict=True)
+                    )
+                    if not widened.equals(schema):
+                        writer.close()
+                        writer = None  # closed; a failed rewrite must not close it again
+                        writer = self._rewrite(path, widened)
+                        schema = widened
+                    arrays = [
+                        _cast(array, field.type, column)
+                        for array, column, field in zip(arrays, values, schema, strict=True)
+                    ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+                count += len(batch)
+            if writer is None:
+                # No rows: still write the columns, as strings
+                schema = pa.schema(pa.field(name, pa.string()) for name in columns)
+                writer = self._open_writer(path, schema)
+        finally:
+            if writer is not None:
+                writer.close()
+        return count
+
+    def _rewrite(self, path: Path, schema: pa.Schema) -> Any:
+        """Rewrite the file at ``path`` with the wider ``schema``; returns a writer to continue it."""
+        narrow = path.with_name(f"{path.name}.narrow")
+        os.replace(path, narrow)
+        try:
+            writer = self._open_writer(path, schema)
+            try:
+                for record_batch in self._read_batches(narrow):
+                    arrays = [
+                        _cast(array, field.type)
+                        for array, field in zip(record_batch.columns, schema, strict=True)
+                    ]
+                    writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            except BaseException:
+                writer.close()
+                raise
+        except _CONVERSION_ERRORS as e:
+            raise ExportError(f"Cannot widen {path.name} to {schema}: {e}") from e
+        finally:
+            narrow.unlink(missing_ok=True)
+        return writer
+
+
+class ParquetExporter(ArrowFileExporter):
+    def __init__(self, compression: str = "zstd") -> None:
+        self._compression = compression
+
+    def _open_writer(self, path: Path, schema: pa.Schema) -> Any:
+        return pq.ParquetWriter(str(path), schema, compression=self._compression)
+
+    def _read_batches(self, path: Path) -> Iterator[pa.RecordBatch]:
+        with pq.ParquetFile(path) as parquet_file:
+            yield from parquet_file.iter_batches()
+
+
+class ArrowIpcExporter(ArrowFileExporter):
+    """Writes the Arrow IPC file format (Feather v2)."""
+
+    def _open_writer(self, path: Path, schema: pa.Schema) -> Any:
+        return pa.ipc.new_file(str(path), schema)
+
+    def _read_batches(self, path: Path) -> Iterator[pa.RecordBatch]:
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            for index in range(reader.num_record_batches):
+                yield reader.get_batch(index)
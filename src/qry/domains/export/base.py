@@ -1,18 +1,107 @@
 """Base exporter interface."""
 
+import io
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
 from pathlib import Path
+from typing import Any, TextIO
 
+from qry.domains.export.compression import (
+    CompressionOptions,
+    compression_for_path,
+    open_output,
+)
+from qry.shared.exceptions import ExportError
 from qry.shared.models import QueryResult
 
+# Rows arrive in batches, e.g. one per fetchmany() from a live cursor
+RowBatches = Iterable[Sequence[tuple[Any, ...]]]
+
 
 class Exporter(ABC):
-    """Abstract base class for exporters."""
+    """Abstract base class for exporters.
+
+    Subclasses implement ``export_stream``, which writes rows batch by
+    batch so a result never has to be held in memory; ``export`` and
+    ``export_string`` feed it a materialized result.
+    """
+
+    # Newline translation of file output; CSV sets "" and writes its own line endings
+    newline: str | None = None
+    # Set when a database's own export in this format can be written as-is
+    copy_format: str | None = None
 
     @abstractmethod
-    def export(self, result: QueryResult, path: Path) -> None:
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        """Write ``columns`` and every row of ``row_batches`` to ``sink``.
+
+        Returns the number of rows written.
+        """
         pass
 
-    @abstractmethod
+    def export(self, result: QueryResult, path: Path) -> None:
+        self.export_rows(result.columns, [result.rows], path)
+
     def export_string(self, result: QueryResult) -> str:
+        output = io.StringIO()
+        self.export_stream(result.columns, [result.rows], output)
+        return output.getvalue()
+
+    def export_rows(
+        self,
+        columns: list[str],
+        row_batches: RowBatches,
+        path: Path,
+        compression: CompressionOptions | None = None,
+    ) -> int:
+        """Stream rows into the file at ``path``, removing it if the export fails.
+
+        A ``.gz``, ``.bz2`` or ``.xz`` extension compresses the output.
+        """
+        try:
+            with self.open_sink(path, compression) as sink:
+                return self.export_stream(columns, row_batches, sink)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+    def open_sink(self, path: Path, compression: CompressionOptions | None = None) -> TextIO:
+        return io.TextIOWrapper(
+            open_output(path, compression), encoding="utf-8", newline=self.newline
+        )
+
+
+class FileExporter(Exporter):
+    """Base class for exporters that write a binary file format themselves.
+
+    Their output has no text form, so it can only go to a file through
+    ``export`` or ``export_rows``; the format handles its own compression.
+    """
+
+    @abstractmethod
+    def write_file(self, columns: list[str], row_batches: RowBatches, path: Path) -> int:
+        """Create ``path`` holding every row of ``row_batches``; return the row count."""
         pass
+
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        raise ExportError(f"{type(self).__name__} can only write to a file")
+
+    def export_string(self, result: QueryResult) -> str:
+        raise ExportError(f"{type(self).__name__} can only write to a file")
+
+    def export_rows(
+        self,
+        columns: list[str],
+        row_batches: RowBatches,
+        path: Path,
+        compression: CompressionOptions | None = None,
+    ) -> int:
+        if compression_for_path(path):
+            raise ExportError(f"{path.name}: this format cannot be compressed")
+        # Always start from an empty file; a database file would otherwise be appended to
+        path.unlink(missing_ok=True)
+        try:
+            return self.write_file(columns, row_batches, path)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
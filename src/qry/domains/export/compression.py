@@ -0,0 +1,164 @@
+"""Compressed export output, chosen by file extension."""
+
+import bz2
+import gzip
+import io
+import lzma
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from qry.shared.constants import COMPRESSION_BLOCK_SIZE, DEFAULT_COMPRESSION_LEVEL
+
+
+@dataclass(frozen=True)
+class Compression:
+    name: str
+    suffix: str
+    # Whole-stream writer: open_stream(path, level) -> binary file
+    open_stream: Callable[[Path, int], BinaryIO]
+    # One self-contained block: compress(data, level) -> bytes
+    compress: Callable[[bytes, int], bytes]
+
+
+def _gzip_level(level: int) -> int:
+    # The gzip tool's default; GzipFile's 9 is much slower for little gain
+    return 6 if level == DEFAULT_COMPRESSION_LEVEL else level
+
+
+def _bz2_level(level: int) -> int:
+    return 9 if level == DEFAULT_COMPRESSION_LEVEL else level
+
+
+def _xz_preset(level: int) -> int:
+    return lzma.PRESET_DEFAULT if level == DEFAULT_COMPRESSION_LEVEL else level
+
+
+def _open_gzip(path: Path, level: int) -> BinaryIO:
+    return gzip.GzipFile(path, "wb", compresslevel=_gzip_level(level))  # type: ignore[return-value]
+
+
+def _open_bz2(path: Path, level: int) -> BinaryIO:
+    return bz2.BZ2File(path, "wb", compresslevel=_bz2_level(level))  # type: ignore[return-value]
+
+
+def _open_xz(path: Path, level: int) -> BinaryIO:
+    return lzma.LZMAFile(path, "wb", preset=_xz_preset(level))  # type: ignore[return-value]
+
+
+COMPRESSIONS: dict[str, Compression] = {
+    c.suffix: c
+    for c in (
+        Compression(
+            "gzip",
+            ".gz",
+            _open_gzip,
+            lambda data, level: gzip.compress(data, compresslevel=_gzip_level(level), mtime=0),
+        ),
+        Compression(
+            "bzip2",
+            ".bz2",
+            _open_bz2,
+            lambda data, level: bz2.compress(data, compresslevel=_bz2_level(level)),
+        ),
+        Compression(
+            "xz",
+            ".xz",
+            _open_xz,
+            lambda data, level: lzma.compress(data, preset=_xz_preset(level)),
+        ),
+    )
+}
+
+
+def compression_for_path(path: Path) -> Compression | None:
+    """The compression named by ``path``'s last extension, if any."""
+    return COMPRESSIONS.get(path.suffix.lower())
+
+
+def strip_compression(path: Path) -> Path:
+    """``path`` without its compression extension: ``out.csv.gz`` -> ``out.csv``."""
+    return path.with_suffix("") if compression_for_path(path) else path
+
+
+@dataclass
+class CompressionOptions:
+    level: int = DEFAULT_COMPRESSION_LEVEL
+    # More than one compresses blocks in parallel, see BlockCompressedWriter
+    threads: int = 1
+
+
+def open_output(path: Path, options: CompressionOptions | None = None) -> BinaryIO:
+    """Open ``path`` for binary writing, compressed if its extension names a format."""
+    options = options or CompressionOptions()
+    compression = compression_for_path(path)
+    if compression is None:
+        return open(path, "wb")
+    if options.threads > 1:
+        return BlockCompressedWriter(  # type: ignore[return-value]
+            open(path, "wb"),
+            lambda data: compression.compress(data, options.level),
+            options.threads,
+        )
+    return compression.open_stream(path, options.level)
+
+
+class BlockCompressedWriter(io.RawIOBase):
+    """Compresses fixed-size blocks on a thread pool and writes them in order.
+
+    Each block becomes a complete gzip member, bzip2 stream or xz stream.
+    Concatenated streams are valid files for every format (``gzip -d``,
+    ``bzip2 -d``, ``xz -d`` and Python's readers all accept them), and
+    the block boundaries let a reader split the file for parallel
+    decompression. zlib, bz2 and lzma release the GIL while compressing,
+    so the blocks compress on separate cores. At most two blocks per
+    thread are held in memory.
+    """
+
+    def __init__(
+        self,
+        raw: BinaryIO,
+        compress: Callable[[bytes], bytes],
+        threads: int,
+        block_size: int = COMPRESSION_BLOCK_SIZE,
+    ) -> None:
+        super().__init__()
+        self._raw = raw
+        self._compress = compress
+        self._block_size = block_size
+        self._block = bytearray()
+        self._pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="qry-compress")
+        self._pending: deque[Future[bytes]] = deque()
+        self._max_pending = threads * 2
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self._block += data
+        while len(self._block) >= self._block_size:
+            self._submit(bytes(self._block[: self._block_size]))
+            del self._block[: self._block_size]
+        return len(data)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._pool.submit(self._compress, block))
+        while len(self._pending) > self._max_pending:
+            self._raw.write(self._pending.popleft().result())
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._block:
+                self._submit(bytes(self._block))
+                self._block.clear()
+            while self._pending:
+                self._raw.write(self._pending.popleft().result())
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+            self._raw.close()
+            super().close()
@@ -1,24 +1,20 @@
 """CSV exporter."""
 
 import csv
-import io
-from pathlib import Path
+from typing import TextIO
 
-from qry.domains.export.base import Exporter
-from qry.shared.models import QueryResult
+from qry.domains.export.base import Exporter, RowBatches
 
 
 class CsvExporter(Exporter):
-    def export(self, result: QueryResult, path: Path) -> None:
-        with open(path, "w", newline="") as f:
-            self._write_csv(result, f)
+    newline = ""
+    copy_format = "csv"
 
-    def export_string(self, result: QueryResult) -> str:
-        output = io.StringIO()
-        self._write_csv(result, output)
-        return output.getvalue()
-
-    def _write_csv(self, result: QueryResult, file) -> None:
-        writer = csv.writer(file)
-        writer.writerow(result.columns)
-        writer.writerows(result.rows)
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        writer = csv.writer(sink)
+        writer.writerow(columns)
+        count = 0
+        for batch in row_batches:
+            writer.writerows(batch)
+            count += len(batch)
+        return count
@@ -0,0 +1,58 @@
+"""Export formats by name and file extension."""
+
+from pathlib import Path
+
+from qry.domains.connection.models import DatabaseType
+from qry.domains.export.base import Exporter
+from qry.domains.export.compression import strip_compression
+from qry.domains.export.csv import CsvExporter
+from qry.domains.export.json import JsonExporter
+from qry.domains.export.markdown import MarkdownExporter
+from qry.domains.export.ndjson import NdjsonExporter
+from qry.domains.export.sql import DEFAULT_TABLE_NAME, SqlInsertExporter
+from qry.domains.export.sqlite import SQLiteExporter
+from qry.shared.constants import DEFAULT_SQL_INSERT_BATCH_SIZE
+
+# Keys double as file extensions
+EXPORTERS: dict[str, type[Exporter]] = {
+    "csv": CsvExporter,
+    "json": JsonExporter,
+    "ndjson": NdjsonExporter,
+    "md": MarkdownExporter,
+    "sql": SqlInsertExporter,
+    "sqlite": SQLiteExporter,
+}
+
+try:
+    from qry.domains.export.arrow import ArrowIpcExporter, ParquetExporter
+except ImportError:  # pyarrow is optional: pip install 'qry[arrow]'
+    pass
+else:
+    EXPORTERS["parquet"] = ParquetExporter
+    EXPORTERS["arrow"] = ArrowIpcExporter
+
+# Formats that write rows into a named table
+TABLE_FORMATS = frozenset({"sql", "sqlite"})
+
+
+def create_exporter(
+    fmt: str,
+    table: str = DEFAULT_TABLE_NAME,
+    dialect: DatabaseType = DatabaseType.POSTGRES,
+    sql_batch_size: int = DEFAULT_SQL_INSERT_BATCH_SIZE,
+) -> Exporter:
+    """An exporter for ``fmt``; the table options apply to ``TABLE_FORMATS``."""
+    if fmt == "sql":
+        return SqlInsertExporter(table, dialect, sql_batch_size)
+    if fmt == "sqlite":
+        return SQLiteExporter(table)
+    return EXPORTERS[fmt]()
+
+
+def format_for_path(path: Path) -> str | None:
+    """The export format named by ``path``'s extension, if any.
+
+    A compression extension is skipped: ``out.csv.gz`` is CSV.
+    """
+    fmt = strip_compression(path).suffix.lstrip(".").lower()
+    return fmt if fmt in EXPORTERS else None
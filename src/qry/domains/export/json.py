@@ -1,20 +1,29 @@
 """JSON exporter."""
 
 import json
-from pathlib import Path
-from typing import Any
+from typing import TextIO
 
-from qry.domains.export.base import Exporter
-from qry.shared.models import QueryResult
+from qry.domains.export.base import Exporter, RowBatches
+
+_INDENT = "  "
 
 
 class JsonExporter(Exporter):
-    def export(self, result: QueryResult, path: Path) -> None:
-        with open(path, "w") as f:
-            json.dump(self._to_dict(result), f, indent=2, default=str)
+    """Writes a JSON array of row objects, one object at a time.
 
-    def export_string(self, result: QueryResult) -> str:
-        return json.dumps(self._to_dict(result), indent=2, default=str)
+    The output is identical to ``json.dump(rows, indent=2)`` without
+    building the document in memory.
+    """
 
-    def _to_dict(self, result: QueryResult) -> list[dict[str, Any]]:
-        return [dict(zip(result.columns, row, strict=True)) for row in result.rows]
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        encoder = json.JSONEncoder(indent=len(_INDENT), default=str)
+        count = 0
+        sink.write("[")
+        for batch in row_batches:
+            for row in batch:
+                text = encoder.encode(dict(zip(columns, row, strict=True)))
+                sink.write(",\n" if count else "\n")
+                sink.write(_INDENT + text.replace("\n", "\n" + _INDENT))
+                count += 1
+        sink.write("\n]" if count else "]")
+        return count
@@ -1,60 +1,59 @@
 """Markdown table exporter."""
 
-from pathlib import Path
+import json
+import tempfile
+from collections.abc import Iterable
+from typing import TextIO
 
-from qry.domains.export.base import Exporter
-from qry.shared.models import QueryResult
+from qry.domains.export.base import Exporter, RowBatches
 
 NULL_DISPLAY = "NULL"
 
+# Formatted rows stay in memory up to this size before spilling to disk
+SPILL_MAX_BYTES = 8 * 1024 * 1024
+
 
 class MarkdownExporter(Exporter):
+    """Writes a padded Markdown table.
+
+    Column widths depend on every row, so rows are formatted in a first
+    pass into a spill file (in memory until it grows past
+    ``SPILL_MAX_BYTES``) while the widths are measured, then copied out
+    padded in a second pass.
+    """
+
     def __init__(self, null_display: str = NULL_DISPLAY) -> None:
         self._null_display = null_display
 
-    def export(self, result: QueryResult, path: Path) -> None:
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(self.export_string(result))
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        if not columns:
+            return 0
 
-    def export_string(self, result: QueryResult) -> str:
-        if not result.columns:
-            return ""
-
-        columns = result.columns
-        str_rows = [
-            [self._escape(self._format_value(v)) for v in row]
-            for row in result.rows
-        ]
         escaped_headers = [self._escape(col) for col in columns]
-
         # Calculate column widths (minimum 3 for separator dashes)
         widths = [max(3, len(h)) for h in escaped_headers]
-        for row in str_rows:
-            for i, val in enumerate(row):
-                widths[i] = max(widths[i], len(val))
 
-        # Build header
-        header = (
-            "| "
-            + " | ".join(
-                h.ljust(w) for h, w in zip(escaped_headers, widths, strict=True)
-            )
-            + " |"
-        )
-        separator = "|" + "|".join("-" * (w + 2) for w in widths) + "|"
+        with tempfile.SpooledTemporaryFile(
+            max_size=SPILL_MAX_BYTES, mode="w+", encoding="utf-8"
+        ) as spill:
+            count = 0
+            for batch in row_batches:
+                for row in batch:
+                    cells = [self._escape(self._format_value(v)) for v in row]
+                    for i, val in enumerate(cells):
+                        widths[i] = max(widths[i], len(val))
+                    spill.write(json.dumps(cells) + "\n")
+                    count += 1
 
-        lines = [header, separator]
-        for row in str_rows:
-            line = (
-                "| "
-                + " | ".join(
-                    v.ljust(w) for v, w in zip(row, widths, strict=True)
-                )
-                + " |"
-            )
-            lines.append(line)
+            sink.write(self._line(escaped_headers, widths))
+            sink.write("|" + "|".join("-" * (w + 2) for w in widths) + "|\n")
+            spill.seek(0)
+            for text in spill:
+                sink.write(self._line(json.loads(text), widths))
+        return count
 
-        return "\n".join(lines) + "\n"
+    def _line(self, cells: Iterable[str], widths: list[int]) -> str:
+        return "| " + " | ".join(v.ljust(w) for v, w in zip(cells, widths, strict=True)) + " |\n"
 
     def _format_value(self, value: object) -> str:
         if value is None:
@@ -0,0 +1,22 @@
+"""Newline-delimited JSON exporter."""
+
+import json
+from typing import TextIO
+
+from qry.domains.export.base import Exporter, RowBatches
+
+
+class NdjsonExporter(Exporter):
+    """Writes one compact JSON object per line.
+
+    Unlike a JSON array, the output can be appended to, read line by line
+    and split at any newline.
+    """
+
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+        count = 0
+        for batch in row_batches:
+            sink.writelines(encode(dict(zip(columns, row, strict=True))) + "\n" for row in batch)
+            count += len(batch)
+        return count
@@ -0,0 +1,94 @@
+"""SQL INSERT exporter."""
+
+import datetime
+import json
+import math
+from decimal import Decimal
+from typing import TextIO
+
+from qry.domains.connection.models import DatabaseType
+from qry.domains.export.base import Exporter, RowBatches
+from qry.shared.constants import DEFAULT_SQL_INSERT_BATCH_SIZE
+
+DEFAULT_TABLE_NAME = "query_result"
+
+
+class SqlInsertExporter(Exporter):
+    """Writes multi-row ``INSERT ... VALUES (...), (...);`` statements.
+
+    Each statement carries up to ``batch_size`` rows, regardless of how
+    the rows arrive. Identifiers and literals are quoted for ``dialect``.
+    """
+
+    def __init__(
+        self,
+        table: str = DEFAULT_TABLE_NAME,
+        dialect: DatabaseType = DatabaseType.POSTGRES,
+        batch_size: int = DEFAULT_SQL_INSERT_BATCH_SIZE,
+    ) -> None:
+        self._table = table
+        self._dialect = dialect
+        self._batch_size = max(1, batch_size)
+
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        header = (
+            f"INSERT INTO {self.quote_identifier(self._table)} "
+            f"({', '.join(self.quote_identifier(c) for c in columns)}) VALUES\n"
+        )
+        count = 0
+        in_statement = 0
+        for batch in row_batches:
+            for row in batch:
+                values = "(" + ", ".join(self.literal(v) for v in row) + ")"
+                sink.write((",\n" if in_statement else header) + values)
+                count += 1
+                in_statement += 1
+                if in_statement == self._batch_size:
+                    sink.write(";\n")
+                    in_statement = 0
+        if in_statement:
+            sink.write(";\n")
+        return count
+
+    def quote_identifier(self, name: str) -> str:
+        if self._dialect == DatabaseType.MYSQL:
+            return "`" + name.replace("`", "``") + "`"
+        return '"' + name.replace('"', '""') + '"'
+
+    def quote_string(self, text: str) -> str:
+        if self._dialect == DatabaseType.MYSQL:
+            # MySQL treats backslash as an escape unless NO_BACKSLASH_ESCAPES is set
+            text = text.replace("\\", "\\\\")
+        return "'" + text.replace("'", "''") + "'"
+
+    def literal(self, value: object) -> str:
+        """``value`` as a SQL literal for this dialect."""
+        if value is None:
+            return "NULL"
+        if isinstance(value, bool):
+            if self._dialect == DatabaseType.SQLITE:
+                return "1" if value else "0"
+            return "TRUE" if value else "FALSE"
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, float | Decimal):
+            if math.isfinite(value):
+                return str(value)
+            # Only PostgreSQL has NaN and infinities
+            if self._dialect != DatabaseType.POSTGRES:
+                return "NULL"
+            if math.isnan(value):
+                return "'NaN'"
+            return "'Infinity'" if value > 0 else "'-Infinity'"
+        if isinstance(value, bytes | bytearray | memoryview):
+            hex_digits = bytes(value).hex()
+            if self._dialect == DatabaseType.POSTGRES:
+                return f"'\\x{hex_digits}'"
+            return f"X'{hex_digits}'"
+        if isinstance(value, datetime.datetime):
+            return self.quote_string(value.isoformat(sep=" "))
+        if isinstance(value, datetime.date | datetime.time):
+            return self.quote_string(value.isoformat())
+        if isinstance(value, dict | list):
+            return self.quote_string(json.dumps(value, default=str))
+        return self.quote_string(str(value))
@@ -0,0 +1,102 @@
+"""SQLite database file exporter."""
+
+import sqlite3
+from collections.abc import Sequence
+from decimal import Decimal
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+from qry.domains.database.sqlite import to_sqlite_rows
+from qry.domains.export.base import FileExporter, RowBatches
+from qry.domains.export.sql import DEFAULT_TABLE_NAME
+from qry.shared.constants import SQLITE_EXPORT_TRANSACTION_ROWS
+from qry.shared.exceptions import ExportError
+
+# Declared column type by the Python type of the first value seen
+_DECLARED_TYPES: dict[type, str] = {
+    bool: "INTEGER",
+    int: "INTEGER",
+    float: "REAL",
+    Decimal: "NUMERIC",
+    str: "TEXT",
+    bytes: "BLOB",
+    bytearray: "BLOB",
+    memoryview: "BLOB",
+}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _unique_names(columns: list[str]) -> list[str]:
+    """Column names made unique for CREATE TABLE: ``id, id`` -> ``id, id_2``."""
+    seen: set[str] = set()
+    names: list[str] = []
+    for column in columns:
+        name, n = column or "column", 1
+        while name.lower() in seen:
+            n += 1
+            name = f"{column}_{n}"
+        seen.add(name.lower())
+        names.append(name)
+    return names
+
+
+class SQLiteExporter(FileExporter):
+    """Writes the rows into a table of a new SQLite database file.
+
+    Column types are declared from the first batch. Rows go in with
+    ``executemany``, committing every ``transaction_rows`` rows, with
+    journaling and syncing off: the file is new and is deleted if the
+    export fails, so there is nothing to protect.
+    """
+
+    def __init__(
+        self,
+        table: str = DEFAULT_TABLE_NAME,
+        transaction_rows: int = SQLITE_EXPORT_TRANSACTION_ROWS,
+    ) -> None:
+        self._table = table
+        self._transaction_rows = max(1, transaction_rows)
+
+    def write_file(self, columns: list[str], row_batches: RowBatches, path: Path) -> int:
+        batches = iter(row_batches)
+        first = next(batches, [])
+        table = _quote(self._table)
+        definitions = ", ".join(
+            f"{_quote(name)} {self._declared_type(first, i)}".rstrip()
+            for i, name in enumerate(_unique_names(columns))
+        )
+        insert_sql = f"INSERT INTO {table} VALUES ({', '.join('?' * len(columns))})"
+
+        count = 0
+        conn = sqlite3.connect(path, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=OFF")
+            conn.execute("PRAGMA synchronous=OFF")
+            conn.execute(f"CREATE TABLE {table} ({definitions})")
+            conn.execute("BEGIN")
+            uncommitted = 0
+            for batch in chain([first], batches):
+                conn.executemany(insert_sql, to_sqlite_rows(batch))
+                count += len(batch)
+                uncommitted += len(batch)
+                if uncommitted >= self._transaction_rows:
+                    conn.execute("COMMIT")
+                    conn.execute("BEGIN")
+                    uncommitted = 0
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            raise ExportError(f"SQLite export failed: {e}") from e
+        finally:
+            conn.close()
+        return count
+
+    @staticmethod
+    def _declared_type(rows: Sequence[tuple[Any, ...]], index: int) -> str:
+        value = next((row[index] for row in rows if row[index] is not None), None)
+        if value is None:
+            return ""
+        return _DECLARED_TYPES.get(type(value), "TEXT")
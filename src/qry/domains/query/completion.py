@@ -2,6 +2,7 @@
 
 from qry.domains.query.models import CompletionItem
 from qry.domains.query.ports import SchemaProvider
+from qry.domains.query.tokenizer import Token, TokenCache
 from qry.shared.constants import SQL_TABLE_CONTEXT_KEYWORDS
 from qry.shared.types import ColumnInfo, TableInfo
 
@@ -13,8 +14,11 @@ class CompletionProvider:
     this domain independent of the database domain.
     """
 
-    def __init__(self, schema_provider: SchemaProvider) -> None:
+    def __init__(
+        self, schema_provider: SchemaProvider, token_cache: TokenCache | None = None
+    ) -> None:
         self._schema = schema_provider
+        self._tokens = token_cache or TokenCache()
         self._tables_cache: list[TableInfo] | None = None
         self._columns_cache: dict[str, list[ColumnInfo]] = {}
 
@@ -64,18 +68,41 @@ class CompletionProvider:
         return text[start:position]
 
     def _find_table_context(self, text: str, position: int) -> str | None:
-        text_before = text[:position].upper()
+        # Tokens before the cursor, the one under the cursor cut at the cursor
+        before: list[Token] = []
+        offset = 0
+        for ttype, value in self._tokens.tokenize(text):
+            if offset >= position:
+                break
+            before.append((ttype, value[: position - offset]))
+            offset += len(value)
 
         for keyword in SQL_TABLE_CONTEXT_KEYWORDS:
-            idx = text_before.rfind(keyword)
-            if idx != -1:
-                after_keyword = text[idx + len(keyword) : position].strip()
-                parts = after_keyword.split()
-                if parts:
-                    return parts[0].strip(",;")
+            keyword = keyword.strip()
+            for idx in range(len(before) - 1, -1, -1):
+                ttype, value = before[idx]
+                if ttype == "word" and value.upper() == keyword:
+                    table = self._next_word(before, idx + 1)
+                    if table:
+                        return table
+                    break
 
         return None
 
+    @staticmethod
+    def _next_word(tokens: list[Token], start: int) -> str | None:
+        """Return the first word after whitespace following ``start``, if any."""
+        if start >= len(tokens) or tokens[start][0] != "whitespace":
+            return None
+        for ttype, value in tokens[start:]:
+            if ttype in ("whitespace", "comment"):
+                continue
+            return value if ttype == "word" else None
+        return None
+
+    def set_token_cache(self, token_cache: TokenCache) -> None:
+        self._tokens = token_cache
+
     def _get_tables(self) -> list[TableInfo]:
         if self._tables_cache is None:
             self._tables_cache = self._schema.get_tables()
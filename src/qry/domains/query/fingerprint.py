@@ -0,0 +1,46 @@
+"""Query fingerprinting - groups queries that differ only in literals."""
+
+import hashlib
+
+from qry.domains.query.tokenizer import tokenize
+
+_PLACEHOLDER = "?"
+
+
+def _is_literal(ttype: str, value: str) -> bool:
+    if ttype == "string":
+        return value.startswith("'")
+    return ttype == "other" and (value[0].isdigit() or (value[0] == "." and len(value) > 1))
+
+
+def normalize_query(sql: str) -> str:
+    """Normalize a query for grouping.
+
+    - Replaces string and numeric literals with ``?``
+    - Collapses lists of literals such as ``IN (1, 2, 3)`` to a single ``?``
+    - Drops comments, normalizes whitespace and lowercases words
+    - Keeps double-quoted identifiers as written
+    """
+    parts: list[str] = []
+    for ttype, value in tokenize(sql):
+        if ttype in ("whitespace", "comment"):
+            continue
+        if _is_literal(ttype, value):
+            value = _PLACEHOLDER
+        elif ttype == "word":
+            value = value.lower()
+
+        # "?, ?" -> "?" so literal lists of any length share a fingerprint
+        if value == _PLACEHOLDER and parts[-2:] == [_PLACEHOLDER, ","]:
+            parts.pop()
+            continue
+        parts.append(value)
+
+    while parts and parts[-1] == ";":
+        parts.pop()
+    return " ".join(parts)
+
+
+def fingerprint(sql: str) -> str:
+    """Return a short stable hash of the normalized query."""
+    return hashlib.sha1(normalize_query(sql).encode("utf-8")).hexdigest()[:16]
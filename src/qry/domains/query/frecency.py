@@ -0,0 +1,27 @@
+"""Frecency ranking for query history.
+
+Each use of a query contributes ``2 ** ((t - t0) / HALF_LIFE)``, so a use a
+week ago weighs half as much as one now. Scores are stored in log space
+(``rank``); because every use decays at the same rate, ordering by rank at
+any point in time gives the same result as ordering by the decayed score,
+which lets the rank be kept in a plain database index instead of being
+recomputed on every read.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+HALF_LIFE = timedelta(days=7)
+
+_DECAY_RATE = math.log(2) / HALF_LIFE.total_seconds()
+
+
+def visit_rank(when: datetime) -> float:
+    """Rank contributed by a single use at ``when``."""
+    return when.timestamp() * _DECAY_RATE
+
+
+def combine_ranks(a: float, b: float) -> float:
+    """Rank of the combined uses behind ranks ``a`` and ``b`` (log-add-exp)."""
+    high, low = (a, b) if a >= b else (b, a)
+    return high + math.log1p(math.exp(low - high))
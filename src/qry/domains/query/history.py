@@ -3,9 +3,13 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from qry.domains.query.models import HistoryEntry
+from qry.domains.query.fingerprint import fingerprint
+from qry.domains.query.models import ExecutionStatus, FingerprintStats, HistoryEntry
 from qry.domains.query.repository import HistoryRepository
-from qry.infrastructure.repositories.json_history import JsonHistoryRepository
+from qry.domains.query.stats import aggregate_fingerprints
+from qry.infrastructure.repositories.sqlite_history import SqliteHistoryRepository
+from qry.shared.constants import DEFAULT_HISTORY_SIZE
+from qry.shared.models import QueryResult
 
 
 @dataclass
@@ -13,54 +17,97 @@ class HistoryManager:
     """Manages query history with persistence.
 
     Uses repository pattern for storage, allowing different
-    backends (JSON, database, etc.)
+    backends (JSON, database, etc.). Entries are written through to the
+    repository as they are added, and reads are delegated to it so the
+    full history never has to be held in memory. Once a connection is set,
+    recent history and reverse search only cover that connection.
     """
 
-    max_entries: int = 1000
-    _repository: HistoryRepository = field(default_factory=JsonHistoryRepository)
-    _entries: list[HistoryEntry] = field(default_factory=list)
+    max_entries: int = DEFAULT_HISTORY_SIZE
+    _repository: HistoryRepository = field(default_factory=SqliteHistoryRepository)
     _connection_name: str | None = None
+    # Last search whose matches were complete: (lowercased pattern, matches)
+    _last_search: tuple[str, list[HistoryEntry]] | None = field(
+        default=None, init=False, repr=False
+    )
 
-    def __post_init__(self) -> None:
-        self._load()
+    def save(self) -> None:
+        self._repository.flush()
 
-    def _load(self) -> None:
-        self._entries = self._repository.load()
+    def close(self) -> None:
+        """Write out pending entries and release the repository."""
+        self._repository.close()
 
-    def save(self) -> None:
-        self._repository.save(self._entries)
+    def add(self, query: str, result: QueryResult | None = None) -> None:
+        """Record an execution of ``query``.
 
-    def add(self, query: str) -> None:
+        When ``result`` is given its timing, row count and outcome are stored
+        too. Failed executions only feed the statistics; they are not shown
+        in recent history or search.
+        """
+        query = query.strip()
         entry = HistoryEntry(
-            query=query.strip(),
+            query=query,
             timestamp=datetime.now(),
             connection_name=self._connection_name,
+            fingerprint=fingerprint(query),
         )
-        self._entries.append(entry)
-
-        if len(self._entries) > self.max_entries:
-            self._entries = self._entries[-self.max_entries :]
+        if result is not None:
+            entry.duration_ms = result.execution_time_ms
+            entry.row_count = result.row_count
+            if not result.is_success:
+                entry.status = ExecutionStatus.ERROR
+        self._repository.append(entry, self.max_entries)
+        self._last_search = None
 
     def search(self, pattern: str) -> list[HistoryEntry]:
-        pattern_lower = pattern.lower()
-        return [e for e in self._entries if pattern_lower in e.query.lower()]
+        """Search the history of every connection, oldest match first."""
+        return list(reversed(self._repository.search(pattern)))
 
     def search_reverse(self, pattern: str, limit: int = 50) -> list[HistoryEntry]:
-        """Search history returning newest matches first."""
+        """Search history returning newest matches first.
+
+        When the pattern extends the previous one and that search found all
+        of its matches, the previous matches are filtered instead of
+        querying the repository again.
+        """
         pattern_lower = pattern.lower()
-        results: list[HistoryEntry] = []
-        for entry in reversed(self._entries):
-            if pattern_lower in entry.query.lower():
-                results.append(entry)
-                if len(results) >= limit:
-                    break
-        return results
+        last = self._last_search
+        if last is not None and last[0] in pattern_lower:
+            matches = [e for e in last[1] if pattern_lower in e.search_text]
+        else:
+            matches = self._repository.search(pattern, limit, connection_name=self._connection_name)
+            if len(matches) >= limit:
+                self._last_search = None
+                return matches
+        self._last_search = (pattern_lower, matches)
+        return matches[:limit]
 
     def get_recent(self, count: int = 50) -> list[HistoryEntry]:
-        return list(reversed(self._entries[-count:]))
+        return self._repository.recent(count, connection_name=self._connection_name)
+
+    def get_page(
+        self, pattern: str, offset: int, limit: int, all_connections: bool = False
+    ) -> list[HistoryEntry]:
+        """Return one page of entries, highest frecency first.
+
+        Browsing and searching both stay within the current connection
+        unless ``all_connections`` is set.
+        """
+        connection_name = None if all_connections else self._connection_name
+        if pattern:
+            return self._repository.search(pattern, limit, offset, connection_name=connection_name)
+        return self._repository.recent(limit, offset, connection_name=connection_name)
+
+    def fingerprint_stats(self) -> list[FingerprintStats]:
+        """Latency statistics per query fingerprint, highest total time first."""
+        return aggregate_fingerprints(self._repository.executions())
 
     def clear(self) -> None:
-        self._entries = []
+        self._repository.clear()
+        self._last_search = None
 
     def set_connection(self, connection_name: str) -> None:
+        """Scope recent history and reverse search to ``connection_name``."""
         self._connection_name = connection_name
+        self._last_search = None
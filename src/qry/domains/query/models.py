@@ -2,11 +2,32 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+from functools import cached_property
 
 # Re-export QueryResult from shared for backward compatibility
 from qry.shared.models import QueryResult
 
-__all__ = ["QueryResult", "HistoryEntry", "CompletionItem"]
+__all__ = [
+    "QueryResult",
+    "ExecutionStatus",
+    "ErrorPolicy",
+    "HistoryEntry",
+    "FingerprintStats",
+    "CompletionItem",
+]
+
+
+class ExecutionStatus(str, Enum):
+    OK = "ok"
+    ERROR = "error"
+
+
+class ErrorPolicy(str, Enum):
+    """What a transactional batch does when a statement fails."""
+
+    STOP = "stop"
+    CONTINUE = "continue"
 
 
 @dataclass
@@ -14,6 +35,33 @@ class HistoryEntry:
     query: str
     timestamp: datetime
     connection_name: str | None = None
+    fingerprint: str | None = None
+    duration_ms: float | None = None
+    row_count: int | None = None
+    status: ExecutionStatus = ExecutionStatus.OK
+    use_count: int = 1
+    rank: float = 0.0  # frecency rank, see qry.domains.query.frecency
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased query, computed once and reused by every search."""
+        return self.query.lower()
+
+
+@dataclass
+class FingerprintStats:
+    """Latency statistics for all executions sharing a fingerprint."""
+
+    fingerprint: str
+    query: str  # most recent query text with this fingerprint
+    count: int
+    error_count: int
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+    total_ms: float
+    last_run: datetime
+    trend: float | None = None  # recent/older median latency ratio
 
 
 @dataclass
@@ -0,0 +1,71 @@
+"""Named query parameters (``:name`` placeholders)."""
+
+import csv
+from functools import lru_cache
+
+from qry.domains.query.tokenizer import tokenize
+from qry.shared.constants import PREPARED_STATEMENT_CACHE_SIZE
+
+
+def _placeholders(sql: str) -> list[tuple[int, str]]:
+    """Return ``(token_index, name)`` for each ``:name`` placeholder.
+
+    ``::`` casts, and colons inside strings or comments, are not placeholders.
+    """
+    tokens = tokenize(sql)
+    found: list[tuple[int, str]] = []
+    for i, (ttype, value) in enumerate(tokens):
+        if (ttype, value) != ("other", ":") or i + 1 >= len(tokens):
+            continue
+        if tokens[i + 1][0] != "word" or (i > 0 and tokens[i - 1][1] == ":"):
+            continue
+        found.append((i, tokens[i + 1][1]))
+    return found
+
+
+def find_parameters(sql: str) -> list[str]:
+    """Names of the parameters used in ``sql``, in order of first use."""
+    return list(dict.fromkeys(name for _, name in _placeholders(sql)))
+
+
+@lru_cache(maxsize=PREPARED_STATEMENT_CACHE_SIZE)
+def to_pyformat(sql: str) -> str:
+    """Rewrite ``:name`` placeholders as ``%(name)s`` for psycopg and PyMySQL.
+
+    Literal ``%`` characters are doubled, as those drivers require when
+    parameters are passed. Results are cached so hot statements are only
+    tokenized once.
+    """
+    tokens = tokenize(sql)
+    placeholders = dict(_placeholders(sql))
+    parts: list[str] = []
+    skip_next = False
+    for i, (_, value) in enumerate(tokens):
+        if skip_next:
+            skip_next = False
+            continue
+        if i in placeholders:
+            parts.append(f"%({placeholders[i]})s")
+            skip_next = True
+        else:
+            parts.append(value.replace("%", "%%"))
+    return "".join(parts)
+
+
+def parse_parameter_sets(text: str, names: list[str]) -> list[dict[str, str]]:
+    """Parse parameter sets for ``names``, one set per line.
+
+    The text is CSV (or TSV when the first line contains a tab). A header
+    line naming the parameters is optional; without one, columns are taken
+    in the order the parameters appear in the query. Blank lines are skipped.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines or not names:
+        return []
+    delimiter = "\t" if "\t" in lines[0] else ","
+    rows = [[field.strip() for field in row] for row in csv.reader(lines, delimiter=delimiter)]
+
+    header = names
+    if set(rows[0]) == set(names):
+        header, rows = rows[0], rows[1:]
+    return [dict(zip(header, row, strict=False)) for row in rows]
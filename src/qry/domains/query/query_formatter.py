@@ -2,6 +2,8 @@
 
 import re
 
+from qry.domains.query.tokenizer import Token, TokenCache
+from qry.domains.query.tokenizer import tokenize as _tokenize
 from qry.shared.constants import SQL_KEYWORDS
 
 # Clauses that should start on a new line (at top level)
@@ -56,127 +58,9 @@ _MULTI_WORD_KEYWORDS = [
 _MULTI_WORD_KEYWORDS_SET = frozenset(_MULTI_WORD_KEYWORDS)
 
 
-def _tokenize(sql: str) -> list[tuple[str, str]]:
-    """Split SQL into tokens preserving strings, comments, and parentheses.
-
-    Returns list of (token_type, value) tuples.
-    Token types: 'word', 'string', 'comment', 'paren_open', 'paren_close',
-                 'comma', 'semicolon', 'operator', 'whitespace', 'other'.
-    """
-    tokens: list[tuple[str, str]] = []
-    i = 0
-    n = len(sql)
-
-    while i < n:
-        ch = sql[i]
-
-        # Whitespace
-        if ch in " \t\r\n":
-            start = i
-            while i < n and sql[i] in " \t\r\n":
-                i += 1
-            tokens.append(("whitespace", sql[start:i]))
-            continue
-
-        # Single-line comment
-        if ch == "-" and i + 1 < n and sql[i + 1] == "-":
-            start = i
-            while i < n and sql[i] != "\n":
-                i += 1
-            tokens.append(("comment", sql[start:i]))
-            continue
-
-        # Block comment
-        if ch == "/" and i + 1 < n and sql[i + 1] == "*":
-            start = i
-            i += 2
-            while i + 1 < n and not (sql[i] == "*" and sql[i + 1] == "/"):
-                i += 1
-            i = min(i, n)
-            i += 2  # skip */
-            tokens.append(("comment", sql[start:i]))
-            continue
-
-        # Single-quoted string
-        if ch == "'":
-            start = i
-            i += 1
-            while i < n:
-                if sql[i] == "'" and i + 1 < n and sql[i + 1] == "'":
-                    i += 2  # escaped quote
-                elif sql[i] == "'":
-                    i += 1
-                    break
-                else:
-                    i += 1
-            tokens.append(("string", sql[start:i]))
-            continue
-
-        # Double-quoted identifier
-        if ch == '"':
-            start = i
-            i += 1
-            while i < n:
-                if sql[i] == '"' and i + 1 < n and sql[i + 1] == '"':
-                    i += 2  # escaped quote
-                elif sql[i] == '"':
-                    i += 1
-                    break
-                else:
-                    i += 1
-            tokens.append(("string", sql[start:i]))
-            continue
-
-        # Parentheses
-        if ch == "(":
-            tokens.append(("paren_open", "("))
-            i += 1
-            continue
-        if ch == ")":
-            tokens.append(("paren_close", ")"))
-            i += 1
-            continue
-
-        # Comma
-        if ch == ",":
-            tokens.append(("comma", ","))
-            i += 1
-            continue
-
-        # Semicolon
-        if ch == ";":
-            tokens.append(("semicolon", ";"))
-            i += 1
-            continue
-
-        # Word (identifier or keyword)
-        if ch.isalpha() or ch == "_":
-            start = i
-            while i < n and (sql[i].isalnum() or sql[i] in "_.$"):
-                i += 1
-            tokens.append(("word", sql[start:i]))
-            continue
-
-        # Number
-        if ch.isdigit() or (ch == "." and i + 1 < n and sql[i + 1].isdigit()):
-            start = i
-            while i < n and (sql[i].isdigit() or sql[i] == "."):
-                i += 1
-            tokens.append(("other", sql[start:i]))
-            continue
-
-        # Operators and other characters
-        tokens.append(("other", ch))
-        i += 1
-
-    return tokens
-
-
-def _merge_multi_word_keywords(
-    tokens: list[tuple[str, str]],
-) -> list[tuple[str, str]]:
+def _merge_multi_word_keywords(tokens: list[Token]) -> list[Token]:
     """Merge multi-word SQL keywords into single tokens."""
-    result: list[tuple[str, str]] = []
+    result: list[Token] = []
     i = 0
 
     while i < len(tokens):
@@ -210,19 +94,21 @@ def _merge_multi_word_keywords(
     return result
 
 
-def format_sql(sql: str) -> str:
+def format_sql(sql: str, cache: TokenCache | None = None) -> str:
     """Format a SQL query string.
 
     - Uppercases SQL keywords
     - Adds newlines before major clauses
     - Normalizes whitespace
     - Handles nested parentheses with indentation
+
+    When ``cache`` is given, tokens are taken from the editor buffer cache
+    instead of re-lexing the whole text.
     """
-    sql = sql.strip()
-    if not sql:
-        return sql
+    if not sql.strip():
+        return sql.strip()
 
-    tokens = _tokenize(sql)
+    tokens = cache.tokenize(sql) if cache else _tokenize(sql)
     tokens = [t for t in tokens if t[0] != "whitespace"]
     tokens = _merge_multi_word_keywords(tokens)
 
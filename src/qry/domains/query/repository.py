@@ -1,8 +1,19 @@
 """Query history repository abstraction."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
-from qry.domains.query.models import HistoryEntry
+from qry.domains.query.frecency import combine_ranks, visit_rank
+from qry.domains.query.models import ExecutionStatus, HistoryEntry
+
+
+def _is_same_query(a: HistoryEntry, b: HistoryEntry) -> bool:
+    return (
+        a.fingerprint is not None
+        and a.fingerprint == b.fingerprint
+        and a.connection_name == b.connection_name
+        and a.status == b.status == ExecutionStatus.OK
+    )
 
 
 class HistoryRepository(ABC):
@@ -10,6 +21,9 @@ class HistoryRepository(ABC):
 
     Implementations handle the actual persistence mechanism
     (JSON files, database, etc.)
+
+    The query methods have load/save based defaults; indexed backends
+    override them to avoid materializing the whole history.
     """
 
     @abstractmethod
@@ -21,3 +35,74 @@ class HistoryRepository(ABC):
     def save(self, entries: list[HistoryEntry]) -> None:
         """Save all history entries."""
         pass
+
+    def append(self, entry: HistoryEntry, max_entries: int | None = None) -> None:
+        """Record one execution, keeping at most ``max_entries`` entries.
+
+        A successful run of a query already in history (same fingerprint and
+        connection) is merged into the existing entry, bumping its use count
+        and frecency rank. The lowest ranked entries are dropped first.
+        """
+        entries = self.load()
+        entry.rank = visit_rank(entry.timestamp)
+        for existing in entries:
+            if _is_same_query(existing, entry):
+                entries.remove(existing)
+                entry.use_count = existing.use_count + 1
+                entry.rank = combine_ranks(existing.rank, entry.rank)
+                break
+        entries.append(entry)
+        if max_entries is not None and len(entries) > max_entries:
+            entries = sorted(entries, key=lambda e: e.rank)[-max_entries:]
+        self.save(entries)
+
+    def _ranked(self, connection_name: str | None) -> list[HistoryEntry]:
+        entries = [
+            e
+            for e in reversed(self.load())
+            if e.status == ExecutionStatus.OK
+            and (connection_name is None or e.connection_name == connection_name)
+        ]
+        entries.sort(key=lambda e: e.rank, reverse=True)
+        return entries
+
+    def recent(
+        self, count: int, offset: int = 0, connection_name: str | None = None
+    ) -> list[HistoryEntry]:
+        """Return up to ``count`` successful entries after skipping ``offset``, by frecency.
+
+        With ``connection_name`` only that connection's entries are returned.
+        """
+        return self._ranked(connection_name)[offset : offset + count]
+
+    def search(
+        self,
+        pattern: str,
+        limit: int | None = None,
+        offset: int = 0,
+        connection_name: str | None = None,
+    ) -> list[HistoryEntry]:
+        """Return successful entries containing ``pattern`` (case-insensitive), by frecency.
+
+        With ``connection_name`` only that connection's entries are searched.
+        """
+        pattern_lower = pattern.lower()
+        matches = [e for e in self._ranked(connection_name) if pattern_lower in e.search_text]
+        end = None if limit is None else offset + limit
+        return matches[offset:end]
+
+    def executions(self) -> Iterator[HistoryEntry]:
+        """Yield fingerprinted executions, oldest first."""
+        return (e for e in self.load() if e.fingerprint)
+
+    def clear(self) -> None:
+        """Delete all history entries."""
+        self.save([])
+
+    def flush(self) -> None:
+        """Write out any buffered changes. Unbuffered repositories have none."""
+        return None
+
+    def close(self) -> None:
+        """Release resources held by the repository."""
+        return None
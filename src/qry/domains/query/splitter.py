@@ -1,5 +1,7 @@
 """SQL query splitter - splits multiple statements by semicolons."""
 
+from qry.domains.query.tokenizer import Token, TokenCache, tokenize
+
 
 class QuerySplitter:
     """Splits SQL text into individual statements.
@@ -13,83 +15,30 @@ class QuerySplitter:
     """
 
     @staticmethod
-    def split(sql: str) -> list[str]:
+    def split(sql: str, cache: TokenCache | None = None) -> list[str]:
         """Split SQL text into individual statements."""
-        statements: list[str] = []
-        current: list[str] = []
-        i = 0
-        length = len(sql)
-
-        while i < length:
-            ch = sql[i]
-
-            # Single-quoted string
-            if ch == "'":
-                current.append(ch)
-                i += 1
-                while i < length:
-                    if sql[i] == "'" and i + 1 < length and sql[i + 1] == "'":
-                        current.append("''")
-                        i += 2
-                    elif sql[i] == "'":
-                        current.append("'")
-                        i += 1
-                        break
-                    else:
-                        current.append(sql[i])
-                        i += 1
-                continue
-
-            # Double-quoted identifier
-            if ch == '"':
-                current.append(ch)
-                i += 1
-                while i < length and sql[i] != '"':
-                    current.append(sql[i])
-                    i += 1
-                if i < length:
-                    current.append('"')
-                    i += 1
-                continue
+        tokens = cache.tokenize(sql) if cache else tokenize(sql)
+        return [
+            "".join(value for _, value in stmt).strip()
+            for stmt in QuerySplitter.split_tokens(tokens)
+        ]
 
-            # Line comment
-            if ch == "-" and i + 1 < length and sql[i + 1] == "-":
-                while i < length and sql[i] != "\n":
-                    current.append(sql[i])
-                    i += 1
-                continue
-
-            # Block comment
-            if ch == "/" and i + 1 < length and sql[i + 1] == "*":
-                current.append("/")
-                current.append("*")
-                i += 2
-                while i < length:
-                    if sql[i] == "*" and i + 1 < length and sql[i + 1] == "/":
-                        current.append("*")
-                        current.append("/")
-                        i += 2
-                        break
-                    else:
-                        current.append(sql[i])
-                        i += 1
-                continue
-
-            # Semicolon - statement separator
-            if ch == ";":
-                stmt = "".join(current).strip()
-                if stmt:
-                    statements.append(stmt)
+    @staticmethod
+    def split_tokens(tokens: list[Token]) -> list[list[Token]]:
+        """Group tokens into statements, dropping separators and empty statements."""
+        statements: list[list[Token]] = []
+        current: list[Token] = []
+
+        for token in tokens:
+            if token[0] == "semicolon":
+                if any(ttype != "whitespace" for ttype, _ in current):
+                    statements.append(current)
                 current = []
-                i += 1
-                continue
-
-            current.append(ch)
-            i += 1
+            else:
+                current.append(token)
 
         # Last statement (no trailing semicolon)
-        stmt = "".join(current).strip()
-        if stmt:
-            statements.append(stmt)
+        if any(ttype != "whitespace" for ttype, _ in current):
+            statements.append(current)
 
         return statements
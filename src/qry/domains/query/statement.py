@@ -0,0 +1,43 @@
+"""Statement classification by leading keywords."""
+
+from qry.domains.query.tokenizer import tokenize
+
+
+def leading_keywords(sql: str, count: int = 2) -> list[str]:
+    """The first ``count`` words of a statement, lowercased.
+
+    Whitespace and comments are skipped; collection stops at the first
+    token that is not a word, such as ``(`` or a literal.
+    """
+    words: list[str] = []
+    for ttype, value in tokenize(sql):
+        if ttype in ("whitespace", "comment"):
+            continue
+        if ttype != "word" or len(words) == count:
+            break
+        words.append(value.lower())
+    return words
+
+
+# Commands that only read, as long as no write keyword appears later
+_READ_COMMANDS = frozenset({"select", "with", "values", "table", "show", "explain", "describe"})
+# Words that make a statement write or lock, wherever they appear (e.g. a
+# data-modifying CTE, SELECT ... INTO, SELECT ... FOR UPDATE, EXPLAIN ANALYZE DELETE)
+_WRITE_WORDS = frozenset(
+    {"insert", "update", "delete", "merge", "upsert", "replace", "into", "lock", "share"}
+    | {"create", "drop", "alter", "truncate", "grant", "revoke", "call", "do", "copy", "set"}
+    | {"nextval", "setval"}
+)
+
+
+def is_read_only(sql: str) -> bool:
+    """Whether ``sql`` is a query that cannot change data or take row locks.
+
+    Classification is conservative: a statement counts as read-only only
+    when it starts with a read command and contains no write keyword
+    outside strings, quoted identifiers and comments.
+    """
+    words = [value.lower() for ttype, value in tokenize(sql) if ttype == "word"]
+    if not words or words[0] not in _READ_COMMANDS:
+        return False
+    return _WRITE_WORDS.isdisjoint(words)
@@ -0,0 +1,84 @@
+"""Per-fingerprint latency statistics over query history."""
+
+import math
+import statistics
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from qry.domains.query.models import ExecutionStatus, FingerprintStats, HistoryEntry
+
+# Successful runs needed before a trend is reported
+MIN_TREND_SAMPLES = 4
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def latency_trend(durations: list[float]) -> float | None:
+    """Median latency of the newer half of runs divided by the older half.
+
+    Values above 1.0 mean the query is getting slower.
+    """
+    if len(durations) < MIN_TREND_SAMPLES:
+        return None
+    half = len(durations) // 2
+    older = statistics.median(durations[:half])
+    newer = statistics.median(durations[half:])
+    if older <= 0:
+        return None
+    return newer / older
+
+
+@dataclass
+class _Group:
+    query: str
+    last_run: datetime
+    durations: list[float] = field(default_factory=list)
+    error_count: int = 0
+
+
+def aggregate_fingerprints(entries: Iterable[HistoryEntry]) -> list[FingerprintStats]:
+    """Group executions by fingerprint, highest total time first.
+
+    ``entries`` must be in execution order (oldest first). Fingerprints
+    without a successful timed run are left out.
+    """
+    groups: dict[str, _Group] = {}
+    for entry in entries:
+        if not entry.fingerprint:
+            continue
+        group = groups.get(entry.fingerprint)
+        if group is None:
+            group = groups[entry.fingerprint] = _Group(entry.query, entry.timestamp)
+        group.query = entry.query
+        group.last_run = entry.timestamp
+        if entry.status == ExecutionStatus.ERROR:
+            group.error_count += 1
+        elif entry.duration_ms is not None:
+            group.durations.append(entry.duration_ms)
+
+    stats: list[FingerprintStats] = []
+    for fingerprint, group in groups.items():
+        if not group.durations:
+            continue
+        ordered = sorted(group.durations)
+        stats.append(
+            FingerprintStats(
+                fingerprint=fingerprint,
+                query=group.query,
+                count=len(ordered),
+                error_count=group.error_count,
+                p50_ms=percentile(ordered, 50),
+                p95_ms=percentile(ordered, 95),
+                max_ms=ordered[-1],
+                total_ms=sum(ordered),
+                last_run=group.last_run,
+                trend=latency_trend(group.durations),
+            )
+        )
+    stats.sort(key=lambda s: s.total_ms, reverse=True)
+    return stats
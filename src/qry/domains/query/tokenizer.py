@@ -0,0 +1,229 @@
+"""SQL tokenizer shared by the formatter, splitter and completion.
+
+Provides a one-shot ``tokenize`` function and a ``TokenCache`` that keeps
+the token stream of a single editor buffer and re-lexes only the lines
+that changed since the previous call.
+"""
+
+Token = tuple[str, str]
+
+# Lexer states carried across line boundaries
+_STATE_NONE = ""
+_STATE_BLOCK_COMMENT = "block_comment"
+_STATE_SINGLE_QUOTE = "single_quote"
+_STATE_DOUBLE_QUOTE = "double_quote"
+
+_QUOTE_STATES = {"'": _STATE_SINGLE_QUOTE, '"': _STATE_DOUBLE_QUOTE}
+_STATE_QUOTES = {state: quote for quote, state in _QUOTE_STATES.items()}
+
+
+def tokenize(sql: str) -> list[Token]:
+    """Split SQL into tokens preserving strings, comments, and parentheses.
+
+    Returns list of (token_type, value) tuples.
+    Token types: 'word', 'string', 'comment', 'paren_open', 'paren_close',
+                 'comma', 'semicolon', 'operator', 'whitespace', 'other'.
+    """
+    tokens, _ = _lex(sql, _STATE_NONE)
+    return tokens
+
+
+def _scan_quoted(sql: str, i: int, quote: str) -> tuple[int, bool]:
+    """Scan to the closing quote. Returns (end index, terminated)."""
+    n = len(sql)
+    while i < n:
+        if sql[i] == quote:
+            if i + 1 < n and sql[i + 1] == quote:
+                i += 2  # escaped quote
+                continue
+            return i + 1, True
+        i += 1
+    return n, False
+
+
+def _scan_block_comment(sql: str, i: int) -> tuple[int, bool]:
+    """Scan to the end of a block comment. Returns (end index, terminated)."""
+    end = sql.find("*/", i)
+    if end == -1:
+        return len(sql), False
+    return end + 2, True
+
+
+def _lex(sql: str, state: str) -> tuple[list[Token], str]:
+    """Tokenize ``sql`` starting in ``state``. Returns (tokens, end state)."""
+    tokens: list[Token] = []
+    i = 0
+    n = len(sql)
+
+    # Continue a string or block comment left open by the previous line
+    if state == _STATE_BLOCK_COMMENT:
+        i, closed = _scan_block_comment(sql, 0)
+        if i:
+            tokens.append(("comment", sql[:i]))
+        if not closed:
+            return tokens, state
+    elif state in _STATE_QUOTES:
+        i, closed = _scan_quoted(sql, 0, _STATE_QUOTES[state])
+        if i:
+            tokens.append(("string", sql[:i]))
+        if not closed:
+            return tokens, state
+
+    while i < n:
+        ch = sql[i]
+
+        # Whitespace
+        if ch in " \t\r\n":
+            start = i
+            while i < n and sql[i] in " \t\r\n":
+                i += 1
+            tokens.append(("whitespace", sql[start:i]))
+            continue
+
+        # Single-line comment
+        if ch == "-" and i + 1 < n and sql[i + 1] == "-":
+            start = i
+            while i < n and sql[i] != "\n":
+                i += 1
+            tokens.append(("comment", sql[start:i]))
+            continue
+
+        # Block comment
+        if ch == "/" and i + 1 < n and sql[i + 1] == "*":
+            start = i
+            i, closed = _scan_block_comment(sql, i + 2)
+            tokens.append(("comment", sql[start:i]))
+            if not closed:
+                return tokens, _STATE_BLOCK_COMMENT
+            continue
+
+        # Single-quoted string or double-quoted identifier
+        if ch in _QUOTE_STATES:
+            start = i
+            i, closed = _scan_quoted(sql, i + 1, ch)
+            tokens.append(("string", sql[start:i]))
+            if not closed:
+                return tokens, _QUOTE_STATES[ch]
+            continue
+
+        # Parentheses
+        if ch == "(":
+            tokens.append(("paren_open", "("))
+            i += 1
+            continue
+        if ch == ")":
+            tokens.append(("paren_close", ")"))
+            i += 1
+            continue
+
+        # Comma
+        if ch == ",":
+            tokens.append(("comma", ","))
+            i += 1
+            continue
+
+        # Semicolon
+        if ch == ";":
+            tokens.append(("semicolon", ";"))
+            i += 1
+            continue
+
+        # Word (identifier or keyword)
+        if ch.isalpha() or ch == "_":
+            start = i
+            while i < n and (sql[i].isalnum() or sql[i] in "_.$"):
+                i += 1
+            tokens.append(("word", sql[start:i]))
+            continue
+
+        # Number
+        if ch.isdigit() or (ch == "." and i + 1 < n and sql[i + 1].isdigit()):
+            start = i
+            while i < n and (sql[i].isdigit() or sql[i] == "."):
+                i += 1
+            tokens.append(("other", sql[start:i]))
+            continue
+
+        # Operators and other characters
+        tokens.append(("other", ch))
+        i += 1
+
+    return tokens, _STATE_NONE
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split text into lines, keeping the newline on every line but the last."""
+    lines = text.split("\n")
+    return [line + "\n" for line in lines[:-1]] + [lines[-1]]
+
+
+class TokenCache:
+    """Token stream of one editor buffer, re-lexed incrementally.
+
+    Each line is lexed separately together with the lexer state it starts
+    in, so an edit only re-lexes from the first changed line until the
+    lexer state lines up with the unchanged tail of the previous text.
+    """
+
+    def __init__(self) -> None:
+        self._text: str | None = None
+        self._tokens: list[Token] = []
+        self._lines: list[str] = []
+        self._line_tokens: list[list[Token]] = []
+        # _states[k] is the lexer state at the start of line k
+        self._states: list[str] = [_STATE_NONE]
+        self._relexed_lines = 0
+
+    def tokenize(self, text: str) -> list[Token]:
+        """Return the token stream for ``text``, reusing unchanged lines."""
+        if text == self._text:
+            return self._tokens
+
+        lines = _split_lines(text)
+        old_lines = self._lines
+        limit = min(len(lines), len(old_lines))
+
+        prefix = 0
+        while prefix < limit and lines[prefix] == old_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and lines[-1 - suffix] == old_lines[-1 - suffix]:
+            suffix += 1
+
+        line_tokens = self._line_tokens[:prefix]
+        states = self._states[: prefix + 1]
+        shift = len(old_lines) - len(lines)
+        relexed = 0
+
+        for k in range(prefix, len(lines)):
+            old_k = k + shift
+            if k >= len(lines) - suffix and states[k] == self._states[old_k]:
+                # Unchanged tail lexed from the same state: reuse it as is
+                line_tokens.extend(self._line_tokens[old_k:])
+                states.extend(self._states[old_k + 1 :])
+                break
+            tokens, state = _lex(lines[k], states[k])
+            line_tokens.append(tokens)
+            states.append(state)
+            relexed += 1
+
+        self._text = text
+        self._lines = lines
+        self._line_tokens = line_tokens
+        self._states = states
+        self._relexed_lines = relexed
+        self._tokens = self._join(line_tokens, states)
+        return self._tokens
+
+    @staticmethod
+    def _join(line_tokens: list[list[Token]], states: list[str]) -> list[Token]:
+        """Flatten per-line tokens, merging tokens that span line breaks."""
+        tokens: list[Token] = []
+        for k, line in enumerate(line_tokens):
+            for j, (ttype, value) in enumerate(line):
+                continues = j == 0 and states[k] != _STATE_NONE
+                if tokens and (continues or ttype == "whitespace" == tokens[-1][0]):
+                    tokens[-1] = (tokens[-1][0], tokens[-1][1] + value)
+                else:
+                    tokens.append((ttype, value))
+        return tokens
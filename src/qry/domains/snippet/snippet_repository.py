@@ -23,3 +23,22 @@ class SnippetRepository(ABC):
     @abstractmethod
     def delete(self, name: str) -> bool:
         """Delete a snippet by name. Returns True if deleted."""
+
+    def search(self, pattern: str, category: str | None = None) -> list[Snippet]:
+        """Find snippets whose name, description, category or query contain ``pattern``.
+
+        Matching is case-insensitive. ``category`` restricts results to one
+        category. Indexed implementations override this.
+        """
+        pattern_lower = pattern.lower()
+        return [
+            s
+            for s in self.list_all()
+            if (category is None or s.category == category)
+            and (
+                pattern_lower in s.name.lower()
+                or pattern_lower in s.description.lower()
+                or pattern_lower in s.category.lower()
+                or pattern_lower in s.query.lower()
+            )
+        ]
@@ -4,7 +4,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
-from qry.domains.query.models import HistoryEntry
+from qry.domains.query.frecency import visit_rank
+from qry.domains.query.models import ExecutionStatus, HistoryEntry
 from qry.domains.query.repository import HistoryRepository
 from qry.shared.paths import get_data_dir
 
@@ -22,14 +23,23 @@ class JsonHistoryRepository(HistoryRepository):
         try:
             with open(self._path, encoding="utf-8") as f:
                 data = json.load(f)
-            return [
-                HistoryEntry(
-                    query=entry["query"],
-                    timestamp=datetime.fromisoformat(entry["timestamp"]),
-                    connection_name=entry.get("connection_name"),
+            entries = []
+            for entry in data.get("entries", []):
+                timestamp = datetime.fromisoformat(entry["timestamp"])
+                entries.append(
+                    HistoryEntry(
+                        query=entry["query"],
+                        timestamp=timestamp,
+                        connection_name=entry.get("connection_name"),
+                        fingerprint=entry.get("fingerprint"),
+                        duration_ms=entry.get("duration_ms"),
+                        row_count=entry.get("row_count"),
+                        status=ExecutionStatus(entry.get("status", ExecutionStatus.OK)),
+                        use_count=entry.get("use_count", 1),
+                        rank=entry.get("rank", visit_rank(timestamp)),
+                    )
                 )
-                for entry in data.get("entries", [])
-            ]
+            return entries
         except (OSError, json.JSONDecodeError, KeyError, ValueError):
             return []
 
@@ -41,6 +51,12 @@ class JsonHistoryRepository(HistoryRepository):
                     "query": entry.query,
                     "timestamp": entry.timestamp.isoformat(),
                     "connection_name": entry.connection_name,
+                    "fingerprint": entry.fingerprint,
+                    "duration_ms": entry.duration_ms,
+                    "row_count": entry.row_count,
+                    "status": entry.status.value,
+                    "use_count": entry.use_count,
+                    "rank": entry.rank,
                 }
                 for entry in entries
             ]
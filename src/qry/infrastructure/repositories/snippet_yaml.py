@@ -1,5 +1,6 @@
 """YAML-based snippet repository implementation."""
 
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -9,20 +10,59 @@ from qry.domains.snippet.snippet_models import Snippet
 from qry.domains.snippet.snippet_repository import SnippetRepository
 from qry.shared.paths import get_config_dir
 
+# libyaml bindings are much faster; fall back to pure Python when not built
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+def _search_text(snippet: Snippet) -> str:
+    return "\0".join((snippet.name, snippet.description, snippet.category, snippet.query)).lower()
+
 
 class YamlSnippetRepository(SnippetRepository):
-    """Persists SQL snippets to YAML file."""
+    """Persists SQL snippets to YAML file.
+
+    Snippets are kept in memory, indexed by name and category, and the file
+    is parsed again only when its modification time or size changes.
+    """
 
     def __init__(self, path: Path | None = None) -> None:
         self._path = path or (get_config_dir() / "snippets.yaml")
+        self._snippets: dict[str, Snippet] = {}
+        self._search_texts: dict[str, str] = {}
+        self._by_category: dict[str, list[str]] = {}
+        # (mtime_ns, size) of the file the cache was built from
+        self._signature: tuple[int, int] | None = None
 
-    def list_all(self) -> list[Snippet]:
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            stat = self._path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _index(self) -> dict[str, Snippet]:
+        """Return the name index, reloading it if the file changed on disk."""
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._rebuild(self._read())
+            self._signature = signature
+        return self._snippets
+
+    def _rebuild(self, snippets: list[Snippet]) -> None:
+        self._snippets = {s.name: s for s in snippets}
+        self._search_texts = {s.name: _search_text(s) for s in self._snippets.values()}
+        self._by_category = {}
+        for snippet in self._snippets.values():
+            self._by_category.setdefault(snippet.category, []).append(snippet.name)
+
+    def _read(self) -> list[Snippet]:
         if not self._path.exists():
             return []
 
         try:
             with open(self._path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_Loader)
         except (OSError, yaml.YAMLError):
             return []
 
@@ -52,27 +92,28 @@ class YamlSnippetRepository(SnippetRepository):
                 continue
         return snippets
 
+    def list_all(self) -> list[Snippet]:
+        return list(self._index().values())
+
     def get(self, name: str) -> Snippet | None:
-        for snippet in self.list_all():
-            if snippet.name == name:
-                return snippet
-        return None
+        return self._index().get(name)
+
+    def search(self, pattern: str, category: str | None = None) -> list[Snippet]:
+        snippets = self._index()
+        names = self._by_category.get(category, []) if category is not None else snippets
+        pattern_lower = pattern.lower()
+        return [snippets[n] for n in names if pattern_lower in self._search_texts[n]]
 
     def save(self, snippet: Snippet) -> None:
-        snippets = self.list_all()
-        existing = next((i for i, s in enumerate(snippets) if s.name == snippet.name), None)
-        if existing is not None:
-            snippets[existing] = snippet
-        else:
-            snippets.append(snippet)
-        self._write(snippets)
+        snippets = dict(self._index())
+        snippets[snippet.name] = snippet
+        self._write(list(snippets.values()))
 
     def delete(self, name: str) -> bool:
-        snippets = self.list_all()
-        filtered = [s for s in snippets if s.name != name]
-        if len(filtered) == len(snippets):
+        snippets = dict(self._index())
+        if snippets.pop(name, None) is None:
             return False
-        self._write(filtered)
+        self._write(list(snippets.values()))
         return True
 
     def _write(self, snippets: list[Snippet]) -> None:
@@ -89,5 +130,10 @@ class YamlSnippetRepository(SnippetRepository):
                 for s in snippets
             ]
         }
-        with open(self._path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Write to a temporary file and rename so a crash never leaves a partial file
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+        os.replace(tmp_path, self._path)
+        self._rebuild(snippets)
+        self._signature = self._file_signature()
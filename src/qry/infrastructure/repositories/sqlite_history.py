@@ -0,0 +1,478 @@
+"""SQLite-based history repository implementation."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+from qry.domains.query.fingerprint import fingerprint
+from qry.domains.query.frecency import combine_ranks, visit_rank
+from qry.domains.query.models import ExecutionStatus, HistoryEntry
+from qry.domains.query.repository import HistoryRepository
+from qry.infrastructure.repositories.json_history import JsonHistoryRepository
+from qry.shared.constants import HISTORY_FLUSH_INTERVAL_SECONDS
+from qry.shared.paths import get_data_dir
+
+# Execution log: one row per run, used for latency statistics
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    query TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    connection_name TEXT
+);
+"""
+
+# Columns added after the first release of the table: (name, definition)
+_ADDED_COLUMNS = (
+    ("fingerprint", "TEXT"),
+    ("duration_ms", "REAL"),
+    ("row_count", "INTEGER"),
+    ("status", "TEXT NOT NULL DEFAULT 'ok'"),
+)
+
+# Deduplicated history: one row per query fingerprint and connection
+_QUERIES_SCHEMA = """
+CREATE TABLE history_queries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    connection_name TEXT NOT NULL DEFAULT '',
+    fingerprint TEXT NOT NULL,
+    query TEXT NOT NULL,
+    last_used TEXT NOT NULL,
+    use_count INTEGER NOT NULL DEFAULT 1,
+    frecency REAL NOT NULL,
+    UNIQUE (connection_name, fingerprint)
+);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS history_fingerprint ON history (fingerprint, id);
+CREATE INDEX IF NOT EXISTS history_queries_frecency ON history_queries (frecency);
+CREATE INDEX IF NOT EXISTS history_queries_connection
+    ON history_queries (connection_name, frecency);
+"""
+
+# The search index used to cover every execution; it now covers history_queries
+_DROP_EXECUTION_FTS = """
+DROP TRIGGER IF EXISTS history_fts_insert;
+DROP TRIGGER IF EXISTS history_fts_delete;
+DROP TABLE IF EXISTS history_fts;
+DROP INDEX IF EXISTS history_status;
+"""
+
+_FTS_TABLE = """
+CREATE VIRTUAL TABLE history_queries_fts USING fts5(
+    query, content='history_queries', content_rowid='id', tokenize='trigram'
+);
+"""
+
+_FTS_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS history_queries_fts_insert AFTER INSERT ON history_queries BEGIN
+    INSERT INTO history_queries_fts(rowid, query) VALUES (new.id, new.query);
+END;
+CREATE TRIGGER IF NOT EXISTS history_queries_fts_delete AFTER DELETE ON history_queries BEGIN
+    INSERT INTO history_queries_fts(history_queries_fts, rowid, query)
+    VALUES ('delete', old.id, old.query);
+END;
+CREATE TRIGGER IF NOT EXISTS history_queries_fts_update
+AFTER UPDATE OF query ON history_queries BEGIN
+    INSERT INTO history_queries_fts(history_queries_fts, rowid, query)
+    VALUES ('delete', old.id, old.query);
+    INSERT INTO history_queries_fts(rowid, query) VALUES (new.id, new.query);
+END;
+"""
+
+# Trigram index cannot answer patterns shorter than one trigram
+_MIN_FTS_PATTERN = 3
+
+# How long a writer waits for another qry instance to release the database
+_BUSY_TIMEOUT_SECONDS = 5.0
+
+# Runs kept per fingerprint (and per history entry overall) for statistics
+_EXECUTIONS_PER_QUERY = 50
+
+_EXECUTION_COLUMNS = (
+    "id, query, timestamp, connection_name, fingerprint, duration_ms, row_count, status"
+)
+
+_QUERY_COLUMNS = "id, query, last_used, connection_name, fingerprint, use_count, frecency"
+
+_INSERT_EXECUTION = (
+    "INSERT INTO history (query, timestamp, connection_name, fingerprint, "
+    "duration_ms, row_count, status) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+
+_UPSERT_QUERY = """
+INSERT INTO history_queries (connection_name, fingerprint, query, last_used, use_count, frecency)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (connection_name, fingerprint) DO UPDATE SET
+    query = excluded.query,
+    last_used = excluded.last_used,
+    use_count = use_count + excluded.use_count,
+    frecency = combine_ranks(frecency, excluded.frecency)
+"""
+
+
+class SqliteHistoryRepository(HistoryRepository):
+    """Persists query history to an append-only SQLite database.
+
+    Every execution is logged as it is added. Successful runs are also
+    merged into one entry per query fingerprint and connection, ranked by
+    frecency through an index, so reads never sort the history in Python.
+    Substring search goes through an FTS5 trigram index when the SQLite
+    build provides one.
+
+    Entries are sharded by connection through an index on
+    ``(connection_name, frecency)``: reads scoped to one connection only
+    touch that connection's rows, and cross-connection search goes through
+    the shared search index.
+
+    Appends are queued and written by a background thread in batches, one
+    fsynced transaction per batch, so executing a query never waits on the
+    disk. Reads flush the queue first. Several qry processes can share the
+    database: SQLite serializes their writers and entries for the same
+    query are merged rather than overwritten.
+    """
+
+    def __init__(
+        self, path: Path | None = None, flush_interval: float = HISTORY_FLUSH_INTERVAL_SECONDS
+    ) -> None:
+        self._path = path or (get_data_dir() / "history.db")
+        self._flush_interval = flush_interval
+        self._conn: sqlite3.Connection | None = None
+        self._fts = False
+        self._cond = threading.Condition()
+        self._pending: list[tuple[HistoryEntry, int | None]] = []
+        self._writer: threading.Thread | None = None
+        self._in_flight = False
+        self._flush_requested = False
+        self._write_error: Exception | None = None
+        self._open_lock = threading.Lock()
+
+    def _open(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self._path), timeout=_BUSY_TIMEOUT_SECONDS, check_same_thread=check_same_thread
+        )
+        conn.create_function("combine_ranks", 2, combine_ranks, deterministic=True)
+        # fsync every commit, WAL mode otherwise only syncs at checkpoints
+        conn.execute("PRAGMA synchronous=FULL")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        with self._open_lock:
+            if self._conn is None:
+                self._conn = self._create_connection()
+            return self._conn
+
+    def _create_connection(self) -> sqlite3.Connection:
+        """Open the shared connection, creating or migrating the schema.
+
+        The first append may come from a worker thread (an export, say), so
+        the connection is not tied to the thread that happens to open it.
+        """
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._open(check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        is_new = not self._has_table(conn, "history")
+        conn.executescript(_SCHEMA)
+        self._migrate(conn)
+        has_queries = self._has_table(conn, "history_queries")
+        if not has_queries:
+            conn.executescript(_DROP_EXECUTION_FTS + _QUERIES_SCHEMA)
+        conn.executescript(_INDEXES)
+        self._fts = self._ensure_fts(conn)
+        if is_new:
+            self._import_legacy(conn)
+        elif not has_queries:
+            self._backfill_queries(conn)
+        return conn
+
+    @staticmethod
+    def _has_table(conn: sqlite3.Connection, name: str) -> bool:
+        return bool(conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (name,)).fetchone())
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(history)")}
+        for name, definition in _ADDED_COLUMNS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE history ADD COLUMN {name} {definition}")
+
+    def _ensure_fts(self, conn: sqlite3.Connection) -> bool:
+        created = False
+        if not self._has_table(conn, "history_queries_fts"):
+            try:
+                conn.executescript(_FTS_TABLE)
+            except sqlite3.OperationalError:
+                # SQLite built without FTS5 or the trigram tokenizer
+                return False
+            created = True
+        conn.executescript(_FTS_TRIGGERS)
+        if created:
+            with conn:
+                conn.execute(
+                    "INSERT INTO history_queries_fts(rowid, query) "
+                    "SELECT id, query FROM history_queries"
+                )
+        return True
+
+    def _backfill_queries(self, conn: sqlite3.Connection) -> None:
+        """Build deduplicated entries from an execution log written by earlier versions."""
+        rows = conn.execute(
+            f"SELECT {_EXECUTION_COLUMNS} FROM history WHERE status = 'ok' ORDER BY id"
+        ).fetchall()
+        with conn:
+            for row in rows:
+                entry = self._to_execution(row)
+                if entry.fingerprint is None:
+                    entry.fingerprint = fingerprint(entry.query)
+                    conn.execute(
+                        "UPDATE history SET fingerprint = ? WHERE id = ?",
+                        (entry.fingerprint, row[0]),
+                    )
+                self._upsert_query(conn, entry, 1, visit_rank(entry.timestamp))
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """Import entries from the JSON history file used by earlier versions."""
+        legacy_path = self._path.with_name("history.json")
+        if legacy_path.exists():
+            self._replace(conn, JsonHistoryRepository(legacy_path).load())
+
+    @staticmethod
+    def _to_execution(row: tuple) -> HistoryEntry:
+        return HistoryEntry(
+            query=row[1],
+            timestamp=datetime.fromisoformat(row[2]),
+            connection_name=row[3],
+            fingerprint=row[4],
+            duration_ms=row[5],
+            row_count=row[6],
+            status=ExecutionStatus(row[7]),
+        )
+
+    @staticmethod
+    def _to_entry(row: tuple) -> HistoryEntry:
+        return HistoryEntry(
+            query=row[1],
+            timestamp=datetime.fromisoformat(row[2]),
+            connection_name=row[3] or None,
+            fingerprint=row[4],
+            use_count=row[5],
+            rank=row[6],
+        )
+
+    @staticmethod
+    def _upsert_query(
+        conn: sqlite3.Connection, entry: HistoryEntry, use_count: int, rank: float
+    ) -> None:
+        conn.execute(
+            _UPSERT_QUERY,
+            (
+                entry.connection_name or "",
+                entry.fingerprint,
+                entry.query,
+                entry.timestamp.isoformat(),
+                use_count,
+                rank,
+            ),
+        )
+
+    def _record(
+        self, conn: sqlite3.Connection, entry: HistoryEntry, use_count: int, rank: float
+    ) -> int | None:
+        """Log one execution and merge it into history; returns the log row id."""
+        if entry.fingerprint is None:
+            entry.fingerprint = fingerprint(entry.query)
+        cursor = conn.execute(
+            _INSERT_EXECUTION,
+            (
+                entry.query,
+                entry.timestamp.isoformat(),
+                entry.connection_name,
+                entry.fingerprint,
+                entry.duration_ms,
+                entry.row_count,
+                entry.status.value,
+            ),
+        )
+        if entry.status == ExecutionStatus.OK:
+            self._upsert_query(conn, entry, use_count, rank)
+        return cursor.lastrowid
+
+    def load(self) -> list[HistoryEntry]:
+        """Load all history entries, lowest frecency first."""
+        cursor = self._reader().execute(
+            f"SELECT {_QUERY_COLUMNS} FROM history_queries ORDER BY frecency, id"
+        )
+        return [self._to_entry(row) for row in cursor]
+
+    def save(self, entries: list[HistoryEntry]) -> None:
+        self._replace(self._reader(), entries)
+
+    def _replace(self, conn: sqlite3.Connection, entries: list[HistoryEntry]) -> None:
+        with conn:
+            conn.execute("DELETE FROM history")
+            conn.execute("DELETE FROM history_queries")
+            for entry in entries:
+                rank = entry.rank or visit_rank(entry.timestamp)
+                self._record(conn, entry, entry.use_count, rank)
+
+    def _append_one(
+        self, conn: sqlite3.Connection, entry: HistoryEntry, max_entries: int | None
+    ) -> None:
+        log_id = self._record(conn, entry, 1, visit_rank(entry.timestamp))
+        conn.execute(
+            "DELETE FROM history WHERE fingerprint = ? AND id <= ("
+            "SELECT id FROM history WHERE fingerprint = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+            (entry.fingerprint, entry.fingerprint, _EXECUTIONS_PER_QUERY),
+        )
+        if max_entries is not None:
+            conn.execute(
+                "DELETE FROM history_queries WHERE id IN (SELECT id FROM history_queries "
+                "ORDER BY frecency DESC, id DESC LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            )
+            if log_id is not None:
+                conn.execute(
+                    "DELETE FROM history WHERE id <= ?",
+                    (log_id - max_entries * _EXECUTIONS_PER_QUERY,),
+                )
+
+    def append(self, entry: HistoryEntry, max_entries: int | None = None) -> None:
+        """Queue an execution for the background writer."""
+        self._connection()
+        with self._cond:
+            self._pending.append((entry, max_entries))
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name="qry-history-writer"
+                )
+                self._writer.start()
+
+    def _write_pending(self) -> None:
+        """Writer thread: commit queued entries in batches until the queue is empty."""
+        conn: sqlite3.Connection | None = None
+        try:
+            while True:
+                with self._cond:
+                    if not self._flush_requested:
+                        # Let a burst of executions coalesce into one transaction
+                        self._cond.wait(self._flush_interval)
+                    batch, self._pending = self._pending, []
+                    if not batch:
+                        self._writer = None
+                        self._flush_requested = False
+                        self._cond.notify_all()
+                        return
+                    self._in_flight = True
+                try:
+                    if conn is None:
+                        conn = self._open()
+                    with conn:
+                        for entry, max_entries in batch:
+                            self._append_one(conn, entry, max_entries)
+                except Exception as e:
+                    # Surface the error from the next flush instead of losing the thread
+                    with self._cond:
+                        self._write_error = e
+                finally:
+                    with self._cond:
+                        self._in_flight = False
+                        self._cond.notify_all()
+        finally:
+            if conn is not None:
+                conn.close()
+
+    def flush(self) -> None:
+        """Block until queued entries are committed.
+
+        Raises the last write error, if any, so failed writes are not lost
+        silently. Reads wait for the writer too but leave the error here.
+        """
+        with self._cond:
+            self._wait_for_writer()
+            error, self._write_error = self._write_error, None
+        if error is not None:
+            raise error
+
+    def _wait_for_writer(self) -> None:
+        """Wait, holding ``_cond``, until the queue has been written."""
+        if self._writer is not None:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                self._cond.wait()
+
+    def _reader(self) -> sqlite3.Connection:
+        # A failed background write belongs to flush() and close(), not to this read
+        with self._cond:
+            self._wait_for_writer()
+        return self._connection()
+
+    @staticmethod
+    def _scope(connection_name: str | None) -> tuple[str, tuple]:
+        """SQL condition restricting history_queries to one connection's shard."""
+        if connection_name is None:
+            return "1", ()
+        return "connection_name = ?", (connection_name,)
+
+    def recent(
+        self, count: int, offset: int = 0, connection_name: str | None = None
+    ) -> list[HistoryEntry]:
+        scope, scope_params = self._scope(connection_name)
+        cursor = self._reader().execute(
+            f"SELECT {_QUERY_COLUMNS} FROM history_queries WHERE {scope} "
+            "ORDER BY frecency DESC, id DESC LIMIT ? OFFSET ?",
+            (*scope_params, count, offset),
+        )
+        return [self._to_entry(row) for row in cursor]
+
+    def search(
+        self,
+        pattern: str,
+        limit: int | None = None,
+        offset: int = 0,
+        connection_name: str | None = None,
+    ) -> list[HistoryEntry]:
+        conn = self._reader()
+        sql_limit = -1 if limit is None else limit
+        scope, scope_params = self._scope(connection_name)
+        if self._fts and len(pattern) >= _MIN_FTS_PATTERN:
+            phrase = '"' + pattern.replace('"', '""') + '"'
+            cursor = conn.execute(
+                f"SELECT {_QUERY_COLUMNS} FROM history_queries WHERE id IN ("
+                "SELECT rowid FROM history_queries_fts WHERE history_queries_fts MATCH ?) "
+                f"AND {scope} ORDER BY frecency DESC, id DESC LIMIT ? OFFSET ?",
+                (phrase, *scope_params, sql_limit, offset),
+            )
+        else:
+            cursor = conn.execute(
+                f"SELECT {_QUERY_COLUMNS} FROM history_queries "
+                f"WHERE {scope} AND instr(lower(query), ?) > 0 "
+                "ORDER BY frecency DESC, id DESC LIMIT ? OFFSET ?",
+                (*scope_params, pattern.lower(), sql_limit, offset),
+            )
+        return [self._to_entry(row) for row in cursor]
+
+    def executions(self) -> Iterator[HistoryEntry]:
+        cursor = self._reader().execute(
+            f"SELECT {_EXECUTION_COLUMNS} FROM history WHERE fingerprint IS NOT NULL ORDER BY id"
+        )
+        for row in cursor:
+            yield self._to_execution(row)
+
+    def clear(self) -> None:
+        conn = self._reader()
+        with conn:
+            conn.execute("DELETE FROM history")
+            conn.execute("DELETE FROM history_queries")
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._open_lock:
+                if self._conn:
+                    self._conn.close()
+                    self._conn = None
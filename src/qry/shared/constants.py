@@ -12,6 +12,27 @@ DEFAULT_PAGE_SIZE = 100
 DEFAULT_MAX_COLUMN_WIDTH = 50
 DEFAULT_HISTORY_SIZE = 1000
 DEFAULT_TIMEOUT_MS = 30000
+HISTORY_PAGE_SIZE = 100
+SEARCH_DEBOUNCE_SECONDS = 0.1
+HISTORY_FLUSH_INTERVAL_SECONDS = 1.0
+PREPARED_STATEMENT_CACHE_SIZE = 128
+PARALLEL_MAX_CONNECTIONS = 4
+# How often a running parameter sweep shows its results so far
+SWEEP_REFRESH_INTERVAL_SECONDS = 0.25
+STREAM_BATCH_SIZE = 1000
+EXPORT_PROGRESS_INTERVAL_SECONDS = 0.25
+COMPRESSION_BLOCK_SIZE = 4 * 1024 * 1024
+# Compression level meaning "the format's own default"
+DEFAULT_COMPRESSION_LEVEL = -1
+DEFAULT_SQL_INSERT_BATCH_SIZE = 500
+SQLITE_EXPORT_TRANSACTION_ROWS = 100_000
+EXPORT_TEE_BUFFER_BATCHES = 8
+IMPORT_SAMPLE_ROWS = 1000
+IMPORT_BATCH_SIZE = 5000
+SQLITE_IMPORT_CACHE_KIB = 64 * 1024
+# Bytes of a data file each import worker process parses at a time
+IMPORT_CHUNK_BYTES = 16 * 1024 * 1024
+SCRATCHPAD_NAME = "scratchpad"
 
 # --- Display ---
 NULL_DISPLAY = "NULL"
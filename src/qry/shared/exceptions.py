@@ -27,6 +27,18 @@ class ExportError(QryError):
     pass
 
 
+class DataImportError(QryError):
+    """Import operation error."""
+
+    pass
+
+
+class ScratchpadError(QryError):
+    """Scratchpad operation error."""
+
+    pass
+
+
 class OperationCancelled(QryError):
     """User cancelled operation - not an error, normal flow control."""
 
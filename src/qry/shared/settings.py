@@ -5,12 +5,16 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from qry.shared.constants import (
+    DEFAULT_COMPRESSION_LEVEL,
     DEFAULT_HISTORY_SIZE,
     DEFAULT_MAX_COLUMN_WIDTH,
     DEFAULT_PAGE_SIZE,
+    DEFAULT_SQL_INSERT_BATCH_SIZE,
     DEFAULT_TAB_SIZE,
     DEFAULT_THEME,
+    DEFAULT_TIMEOUT_MS,
     NULL_DISPLAY,
+    PARALLEL_MAX_CONNECTIONS,
 )
 from qry.shared.paths import get_config_dir
 
@@ -37,6 +41,28 @@ class HistorySettings:
     save_on_exit: bool = True
 
 
+@dataclass
+class ExecutionSettings:
+    # Statements per savepoint when running a script as a transaction; 0 disables
+    batch_savepoint_every: int = 0
+    batch_continue_on_error: bool = False
+    # Run scripts made only of read-only statements on several connections at once
+    parallel_read_only: bool = False
+    parallel_connections: int = PARALLEL_MAX_CONNECTIONS
+    # Per-connection limit when running a query on several connections
+    fan_out_timeout_ms: int = DEFAULT_TIMEOUT_MS
+
+
+@dataclass
+class ExportSettings:
+    # For .gz/.bz2/.xz exports; -1 uses the format's default
+    compression_level: int = DEFAULT_COMPRESSION_LEVEL
+    # More than one compresses independent blocks in parallel
+    compression_threads: int = 1
+    # Rows per INSERT statement in SQL exports
+    sql_insert_batch_size: int = DEFAULT_SQL_INSERT_BATCH_SIZE
+
+
 @dataclass
 class Settings:
     theme: str = DEFAULT_THEME
@@ -44,6 +70,8 @@ class Settings:
     editor: EditorSettings = field(default_factory=EditorSettings)
     results: ResultsSettings = field(default_factory=ResultsSettings)
     history: HistorySettings = field(default_factory=HistorySettings)
+    execution: ExecutionSettings = field(default_factory=ExecutionSettings)
+    export: ExportSettings = field(default_factory=ExportSettings)
 
     @classmethod
     def load(cls, path: Path | None = None) -> "Settings":
@@ -64,6 +92,8 @@ class Settings:
         editor_data = data.get("editor", {})
         results_data = data.get("results", {})
         history_data = data.get("history", {})
+        execution_data = data.get("execution", {})
+        export_data = data.get("export", {})
 
         return cls(
             theme=general.get("theme", DEFAULT_THEME),
@@ -84,6 +114,22 @@ class Settings:
                 max_entries=history_data.get("max_entries", DEFAULT_HISTORY_SIZE),
                 save_on_exit=history_data.get("save_on_exit", True),
             ),
+            execution=ExecutionSettings(
+                batch_savepoint_every=execution_data.get("batch_savepoint_every", 0),
+                batch_continue_on_error=execution_data.get("batch_continue_on_error", False),
+                parallel_read_only=execution_data.get("parallel_read_only", False),
+                parallel_connections=execution_data.get(
+                    "parallel_connections", PARALLEL_MAX_CONNECTIONS
+                ),
+                fan_out_timeout_ms=execution_data.get("fan_out_timeout_ms", DEFAULT_TIMEOUT_MS),
+            ),
+            export=ExportSettings(
+                compression_level=export_data.get("compression_level", DEFAULT_COMPRESSION_LEVEL),
+                compression_threads=export_data.get("compression_threads", 1),
+                sql_insert_batch_size=export_data.get(
+                    "sql_insert_batch_size", DEFAULT_SQL_INSERT_BATCH_SIZE
+                ),
+            ),
         )
 
     def save(self, path: Path | None = None) -> None:
@@ -113,5 +159,17 @@ page_size = {self.results.page_size}
 [history]
 max_entries = {self.history.max_entries}
 save_on_exit = {str(self.history.save_on_exit).lower()}
+
+[execution]
+batch_savepoint_every = {self.execution.batch_savepoint_every}
+batch_continue_on_error = {str(self.execution.batch_continue_on_error).lower()}
+parallel_read_only = {str(self.execution.parallel_read_only).lower()}
+parallel_connections = {self.execution.parallel_connections}
+fan_out_timeout_ms = {self.execution.fan_out_timeout_ms}
+
+[export]
+compression_level = {self.export.compression_level}
+compression_threads = {self.export.compression_threads}
+sql_insert_batch_size = {self.export.sql_insert_batch_size}
 '''
         path.write_text(content)
@@ -1,6 +1,11 @@
 """Shared data types."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from typing import Any
+
+# Bind values for named query parameters (":name" placeholders)
+QueryParams = Mapping[str, Any]
 
 
 @dataclass(frozen=True)
@@ -1,5 +1,6 @@
 """Export modal screen."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import ClassVar
@@ -7,17 +8,40 @@ from typing import ClassVar
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Button, Input, Label, RadioButton, RadioSet
-
-from qry.domains.export.base import Exporter
-from qry.domains.export.csv import CsvExporter
-from qry.domains.export.json import JsonExporter
-from qry.domains.export.markdown import MarkdownExporter
-from qry.shared.models import QueryResult
-
-
-class ExportScreen(ModalScreen[str | None]):
-    """Modal screen for exporting query results."""
+from textual.widgets import Button, Checkbox, Input, Label, RadioButton, RadioSet
+
+from qry.application.export_tee import ExportTarget
+from qry.domains.connection.models import DatabaseType
+from qry.domains.export.compression import compression_for_path, strip_compression
+from qry.domains.export.formats import (
+    EXPORTERS,
+    TABLE_FORMATS,
+    create_exporter,
+    format_for_path,
+)
+from qry.domains.export.sql import DEFAULT_TABLE_NAME
+from qry.shared.constants import DEFAULT_SQL_INSERT_BATCH_SIZE
+
+
+@dataclass
+class ExportRequest:
+    """What the user chose to export; the caller runs it in the background."""
+
+    # The chosen format and path first, then any extra files
+    targets: list[ExportTarget]
+    # Re-run the query and stream its rows instead of writing the shown result
+    stream: bool = False
+
+
+class ExportScreen(ModalScreen[ExportRequest | None]):
+    """Modal screen for choosing how and where to export query results.
+
+    With ``can_stream``, the query can be re-run and its rows streamed from
+    the database cursor into the file, so results larger than the table
+    holds are exported in constant memory. Extra paths, comma-separated,
+    get the same rows in the format their extension names, from the same
+    pass over the rows.
+    """
 
     DEFAULT_CSS = """
     ExportScreen {
@@ -27,7 +51,7 @@ class ExportScreen(ModalScreen[str | None]):
     #export-dialog {
         width: 60;
         height: auto;
-        max-height: 20;
+        max-height: 30;
         border: thick $primary;
         background: $surface;
         padding: 1 2;
@@ -46,6 +70,23 @@ class ExportScreen(ModalScreen[str | None]):
         margin-bottom: 1;
     }
 
+    #extra-paths {
+        margin-bottom: 1;
+    }
+
+    #stream-source {
+        margin-bottom: 1;
+    }
+
+    #sql-table {
+        margin-bottom: 1;
+        display: none;
+    }
+
+    #sql-table.visible {
+        display: block;
+    }
+
     #button-row {
         height: 3;
         align: right middle;
@@ -60,15 +101,16 @@ class ExportScreen(ModalScreen[str | None]):
         ("escape", "cancel", "Cancel"),
     ]
 
-    _EXPORTERS: ClassVar[dict[str, type[Exporter]]] = {
-        "csv": CsvExporter,
-        "json": JsonExporter,
-        "md": MarkdownExporter,
-    }
-
-    def __init__(self, result: QueryResult) -> None:
+    def __init__(
+        self,
+        can_stream: bool = False,
+        dialect: DatabaseType = DatabaseType.POSTGRES,
+        sql_batch_size: int = DEFAULT_SQL_INSERT_BATCH_SIZE,
+    ) -> None:
         super().__init__()
-        self._result = result
+        self._can_stream = can_stream
+        self._dialect = dialect
+        self._sql_batch_size = sql_batch_size
         self._format = "csv"
 
     def compose(self) -> ComposeResult:
@@ -78,32 +120,54 @@ class ExportScreen(ModalScreen[str | None]):
         with Vertical(id="export-dialog"):
             yield Label("Export Results")
             with RadioSet(id="format-group"):
-                yield RadioButton("CSV", value=True, id="fmt-csv")
-                yield RadioButton("JSON", id="fmt-json")
-                yield RadioButton("Markdown", id="fmt-md")
-            yield Input(value=default_path, placeholder="File path", id="file-path")
+                for fmt in EXPORTERS:
+                    label = self._FORMAT_LABELS.get(fmt, fmt.upper())
+                    yield RadioButton(label, value=fmt == "csv", id=f"fmt-{fmt}")
+            yield Input(
+                value=default_path,
+                placeholder="File path (add .gz, .bz2 or .xz to compress)",
+                id="file-path",
+            )
+            yield Input(
+                placeholder="Also write to (comma-separated, format from extension)",
+                id="extra-paths",
+            )
+            yield Input(value=DEFAULT_TABLE_NAME, placeholder="Table name", id="sql-table")
+            if self._can_stream:
+                yield Checkbox("Re-run query and stream all rows", id="stream-source")
             with Horizontal(id="button-row"):
                 yield Button("Cancel", variant="default", id="btn-cancel")
                 yield Button("Export", variant="primary", id="btn-export")
 
-    _FORMAT_MAP: ClassVar[dict[str, str]] = {
-        "fmt-csv": "csv",
-        "fmt-json": "json",
-        "fmt-md": "md",
+    _FORMAT_LABELS: ClassVar[dict[str, str]] = {
+        "csv": "CSV",
+        "json": "JSON",
+        "ndjson": "NDJSON",
+        "md": "Markdown",
+        "sql": "SQL INSERT",
+        "sqlite": "SQLite database",
+        "parquet": "Parquet",
+        "arrow": "Arrow IPC",
     }
 
     def on_radio_set_changed(self, event: RadioSet.Changed) -> None:
         pressed = event.radio_set.pressed_button
         if not pressed:
             return
-        fmt = self._FORMAT_MAP.get(pressed.id or "", "csv")
+        fmt = (pressed.id or "").removeprefix("fmt-")
+        if fmt not in EXPORTERS:
+            return
         self._format = fmt
+        self.query_one("#sql-table", Input).set_class(fmt in TABLE_FORMATS, "visible")
 
         path_input = self.query_one("#file-path", Input)
         current_path = Path(path_input.value)
-        known_exts = {".csv", ".json", ".md"}
-        if current_path.suffix in known_exts:
-            path_input.value = str(current_path.with_suffix(f".{fmt}"))
+        # Keep a compression extension: out.csv.gz -> out.json.gz
+        compression = compression_for_path(current_path)
+        base = strip_compression(current_path)
+        if format_for_path(base):
+            suffix = compression.suffix if compression else ""
+            path_input.value = str(base.with_suffix(f".{fmt}{suffix}"))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-cancel":
@@ -118,14 +182,37 @@ class ExportScreen(ModalScreen[str | None]):
             self.app.notify("Please enter a file path", severity="error")
             return
 
-        path = Path(path_str).expanduser()
+        paths = [(Path(path_str).expanduser(), self._format)]
+        extra = self.query_one("#extra-paths", Input).value
+        for extra_str in filter(None, (p.strip() for p in extra.split(","))):
+            extra_path = Path(extra_str).expanduser()
+            fmt = format_for_path(extra_path)
+            if fmt is None:
+                self.app.notify(f"Unknown export format for {extra_str}", severity="error")
+                return
+            paths.append((extra_path, fmt))
+        if len({path.resolve() for path, _ in paths}) < len(paths):
+            self.app.notify("Each export needs its own file", severity="error")
+            return
+
+        table = self.query_one("#sql-table", Input).value.strip()
+        if not table and any(fmt in TABLE_FORMATS for _, fmt in paths):
+            self.app.notify("Please enter a table name", severity="error")
+            return
+
         try:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            exporter = self._EXPORTERS[self._format]()
-            exporter.export(self._result, path)
-            self.dismiss(str(path))
+            for path, _ in paths:
+                path.parent.mkdir(parents=True, exist_ok=True)
         except OSError as e:
             self.app.notify(f"Export failed: {e}", severity="error")
+            return
+
+        targets = [
+            ExportTarget(create_exporter(fmt, table, self._dialect, self._sql_batch_size), path)
+            for path, fmt in paths
+        ]
+        stream = self._can_stream and self.query_one("#stream-source", Checkbox).value
+        self.dismiss(ExportRequest(targets, stream))
 
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -0,0 +1,85 @@
+"""Fan-out target selection screen."""
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Label, SelectionList, Static
+
+from qry.domains.connection.models import ConnectionConfig
+
+
+class FanOutScreen(ModalScreen[list[str] | None]):
+    """Modal screen for choosing the connections to run a query on.
+
+    Space toggles a connection, A toggles all, Enter dismisses with the
+    selected connection names.
+    """
+
+    DEFAULT_CSS = """
+    FanOutScreen {
+        align: center middle;
+    }
+
+    #fan-out-dialog {
+        width: 60;
+        height: auto;
+        max-height: 80%;
+        border: thick $accent;
+        background: $surface;
+        padding: 1 2;
+    }
+
+    #fan-out-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #fan-out-list {
+        height: auto;
+        max-height: 20;
+    }
+
+    #fan-out-hint {
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("enter", "run", "Run", priority=True),
+        Binding("a", "toggle_all", "Toggle All"),
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, connections: list[ConnectionConfig]) -> None:
+        super().__init__()
+        self._connections = connections
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="fan-out-dialog"):
+            yield Label("Run on Connections", id="fan-out-title")
+            yield SelectionList[str](
+                *((f"{c.name} ({c.db_type.value})", c.name) for c in self._connections),
+                id="fan-out-list",
+            )
+            yield Static("Space: Select | A: All | Enter: Run | Escape: Cancel", id="fan-out-hint")
+
+    def on_mount(self) -> None:
+        self.query_one("#fan-out-list", SelectionList).focus()
+
+    def action_toggle_all(self) -> None:
+        selection = self.query_one("#fan-out-list", SelectionList)
+        if len(selection.selected) == len(self._connections):
+            selection.deselect_all()
+        else:
+            selection.select_all()
+
+    def action_run(self) -> None:
+        selected = self.query_one("#fan-out-list", SelectionList).selected
+        self.dismiss(list(selected) if selected else None)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
@@ -1,17 +1,30 @@
 """History screen for query re-execution."""
 
+from collections.abc import Callable
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Input, Label, OptionList, Static
 from textual.widgets.option_list import Option
 
 from qry.domains.query.models import HistoryEntry
+from qry.shared.constants import HISTORY_PAGE_SIZE, SEARCH_DEBOUNCE_SECONDS
+
+# Load the next page when the highlight gets this close to the end
+_PREFETCH_MARGIN = 10
 
 
 class HistoryScreen(ModalScreen[str | None]):
-    """Modal screen showing query history for re-execution."""
+    """Modal screen showing query history for re-execution.
+
+    With a ``loader(pattern, offset, limit, all_connections)`` only the first
+    page is held up front; later pages and searches are fetched as the list
+    is scrolled. The loader scopes entries to the current connection until
+    Ctrl+O widens them to every connection.
+    """
 
     DEFAULT_CSS = """
     HistoryScreen {
@@ -51,51 +64,95 @@ class HistoryScreen(ModalScreen[str | None]):
 
     BINDINGS = [
         Binding("escape", "cancel", "Cancel"),
+        Binding("ctrl+o", "toggle_all_connections", "All Connections"),
     ]
 
-    def __init__(self, entries: list[HistoryEntry]) -> None:
+    def __init__(
+        self,
+        entries: list[HistoryEntry],
+        loader: Callable[[str, int, int, bool], list[HistoryEntry]] | None = None,
+        page_size: int = HISTORY_PAGE_SIZE,
+    ) -> None:
         super().__init__()
         self._entries = entries
         self._filtered: list[HistoryEntry] = list(entries)
+        self._loader = loader
+        self._page_size = page_size
+        self._pattern = ""
+        self._all_connections = False
+        self._exhausted = loader is None or len(entries) < page_size
+        self._search_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with Vertical(id="history-dialog"):
             yield Label("Query History", id="history-title")
             yield Input(placeholder="Search queries...", id="history-search")
             yield OptionList(id="history-list")
-            yield Static("Enter: Execute | Escape: Cancel", id="history-hint")
+            yield Static(
+                "Enter: Execute | Ctrl+O: All connections | Escape: Cancel", id="history-hint"
+            )
 
     def on_mount(self) -> None:
         self._refresh_list()
         self.query_one("#history-search", Input).focus()
 
+    @staticmethod
+    def _format_entry_label(entry: HistoryEntry) -> str:
+        ts = entry.timestamp.strftime("%m/%d %H:%M")
+        conn = f" [{entry.connection_name}]" if entry.connection_name else ""
+        uses = f" x{entry.use_count}" if entry.use_count > 1 else ""
+        query_preview = entry.query[:60].replace("\n", " ")
+        if len(entry.query) > 60:
+            query_preview += "..."
+        return f"{ts}{conn}{uses}  {query_preview}"
+
     def _refresh_list(self) -> None:
         option_list = self.query_one("#history-list", OptionList)
         option_list.clear_options()
-        for entry in self._filtered:
-            ts = entry.timestamp.strftime("%m/%d %H:%M")
-            conn = f" [{entry.connection_name}]" if entry.connection_name else ""
-            query_preview = entry.query[:60].replace("\n", " ")
-            if len(entry.query) > 60:
-                query_preview += "..."
-            label = f"{ts}{conn}  {query_preview}"
-            option_list.add_option(Option(label))
+        option_list.add_options([Option(self._format_entry_label(e)) for e in self._filtered])
         if self._filtered:
             option_list.highlighted = 0
         else:
             option_list.add_option(Option("No matching queries", disabled=True))
 
-    def on_input_changed(self, event: Input.Changed) -> None:
-        pattern = event.value.strip()
-        if pattern:
+    def _load_next_page(self) -> None:
+        """Append the next page from the loader to the list."""
+        if self._exhausted or not self._loader:
+            return
+        page = self._loader(
+            self._pattern, len(self._filtered), self._page_size, self._all_connections
+        )
+        self._exhausted = len(page) < self._page_size
+        if not page:
+            return
+        self._filtered.extend(page)
+        option_list = self.query_one("#history-list", OptionList)
+        option_list.add_options([Option(self._format_entry_label(e)) for e in page])
+
+    def _apply_filter(self, pattern: str) -> None:
+        self._pattern = pattern
+        if self._loader:
+            self._filtered = self._loader(pattern, 0, self._page_size, self._all_connections)
+            self._exhausted = len(self._filtered) < self._page_size
+        elif pattern:
             pattern_lower = pattern.lower()
-            self._filtered = [
-                e for e in self._entries if pattern_lower in e.query.lower()
-            ]
+            self._filtered = [e for e in self._entries if pattern_lower in e.search_text]
         else:
             self._filtered = list(self._entries)
         self._refresh_list()
 
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if self._search_timer:
+            self._search_timer.stop()
+        pattern = event.value.strip()
+        self._search_timer = self.set_timer(
+            SEARCH_DEBOUNCE_SECONDS, lambda: self._apply_filter(pattern)
+        )
+
+    def on_option_list_option_highlighted(self, event: OptionList.OptionHighlighted) -> None:
+        if event.option_index >= len(self._filtered) - _PREFETCH_MARGIN:
+            self._load_next_page()
+
     def on_input_submitted(self, event: Input.Submitted) -> None:
         option_list = self.query_one("#history-list", OptionList)
         highlighted = option_list.highlighted
@@ -107,5 +164,14 @@ class HistoryScreen(ModalScreen[str | None]):
         if 0 <= idx < len(self._filtered):
             self.dismiss(self._filtered[idx].query)
 
+    def action_toggle_all_connections(self) -> None:
+        """Switch between this connection's history and every connection's."""
+        if not self._loader:
+            return
+        self._all_connections = not self._all_connections
+        title = "Query History (all connections)" if self._all_connections else "Query History"
+        self.query_one("#history-title", Label).update(title)
+        self._apply_filter(self._pattern)
+
     def action_cancel(self) -> None:
         self.dismiss(None)
@@ -0,0 +1,109 @@
+"""Import modal screen."""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Input, Label
+
+from qry.application.import_job import default_reject_path
+from qry.domains.data_import.sources import IMPORT_EXTENSIONS
+
+
+@dataclass
+class ImportRequest:
+    """What the user chose to import; the caller runs it in the background."""
+
+    path: Path
+    table: str
+    reject_path: Path
+
+
+class ImportScreen(ModalScreen[ImportRequest | None]):
+    """Modal screen for choosing a CSV, TSV or NDJSON file to load into a table.
+
+    The table defaults to the file name without its extension and is
+    created from the file's columns unless it exists. Rows that cannot be
+    imported go to the reject file, next to the data file by default.
+    """
+
+    DEFAULT_CSS = """
+    ImportScreen {
+        align: center middle;
+    }
+
+    #import-dialog {
+        width: 60;
+        height: auto;
+        max-height: 20;
+        border: thick $primary;
+        background: $surface;
+        padding: 1 2;
+    }
+
+    #import-dialog Label {
+        margin-bottom: 1;
+    }
+
+    #import-dialog Input {
+        margin-bottom: 1;
+    }
+
+    #button-row {
+        height: 3;
+        align: right middle;
+    }
+
+    #button-row Button {
+        margin-left: 1;
+    }
+    """
+
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        extensions = ", ".join(sorted(IMPORT_EXTENSIONS))
+        with Vertical(id="import-dialog"):
+            yield Label("Import File")
+            yield Input(placeholder=f"File path ({extensions})", id="import-path")
+            yield Input(placeholder="Table name (default: file name)", id="import-table")
+            yield Input(
+                placeholder="Reject file (default: <file>.rejects.csv)", id="import-rejects"
+            )
+            with Horizontal(id="button-row"):
+                yield Button("Cancel", variant="default", id="btn-cancel")
+                yield Button("Import", variant="primary", id="btn-import")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "btn-cancel":
+            self.dismiss(None)
+        elif event.button.id == "btn-import":
+            self._do_import()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        self._do_import()
+
+    def _do_import(self) -> None:
+        path_str = self.query_one("#import-path", Input).value.strip()
+        if not path_str:
+            self.app.notify("Please enter a file path", severity="error")
+            return
+        path = Path(path_str).expanduser()
+        if path.suffix.lower() not in IMPORT_EXTENSIONS:
+            self.app.notify(f"Cannot import {path.name}: unknown file type", severity="error")
+            return
+        if not path.is_file():
+            self.app.notify(f"File not found: {path}", severity="error")
+            return
+
+        table = self.query_one("#import-table", Input).value.strip() or path.stem
+        rejects = self.query_one("#import-rejects", Input).value.strip()
+        reject_path = Path(rejects).expanduser() if rejects else default_reject_path(path)
+        self.dismiss(ImportRequest(path, table, reject_path))
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
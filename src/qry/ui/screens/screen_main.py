@@ -1,16 +1,37 @@
 """Main screen."""
 
+import time
+from functools import partial
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.widget import Widget
 
+from qry.application.export_job import ExportJob
+from qry.application.fan_out import FanOutItem, merge_fan_out
+from qry.application.import_job import ImportJob, default_workers
+from qry.application.query_use_case import QueryUseCase
 from qry.context import AppContext
+from qry.domains.connection.models import DatabaseType
+from qry.domains.export.compression import CompressionOptions
+from qry.domains.query.models import ErrorPolicy
+from qry.domains.query.parameters import find_parameters, parse_parameter_sets
+from qry.shared.constants import HISTORY_PAGE_SIZE
+from qry.shared.exceptions import QryError
 from qry.shared.models import QueryResult
-from qry.ui.screens.screen_export import ExportScreen
+from qry.shared.types import QueryParams
+from qry.ui.screens.screen_export import ExportRequest, ExportScreen
+from qry.ui.screens.screen_fan_out import FanOutScreen
 from qry.ui.screens.screen_history import HistoryScreen
+from qry.ui.screens.screen_import import ImportRequest, ImportScreen
+from qry.ui.screens.screen_parameters import ParametersScreen
+from qry.ui.screens.screen_pin import PinScreen
+from qry.ui.screens.screen_query_stats import QueryStatsScreen
 from qry.ui.screens.screen_snippet import SnippetScreen
+from qry.ui.screens.screen_sweep import SweepScreen
 from qry.ui.widgets.widget_editor import SqlEditor
+from qry.ui.widgets.widget_export_progress import ExportProgressPanel
 from qry.ui.widgets.widget_results import ResultsTable
 from qry.ui.widgets.widget_sidebar import DatabaseSidebar
 from qry.ui.widgets.widget_statusbar import StatusBar
@@ -42,12 +63,22 @@ class MainScreen(Widget):
         Binding("ctrl+b", "toggle_sidebar", "Toggle Sidebar"),
         Binding("ctrl+p", "show_snippets", "Snippets"),
         Binding("ctrl+t", "test_connection", "Test Connection"),
+        Binding("f3", "show_query_stats", "Query Stats"),
+        Binding("f4", "sweep", "Parameter Sweep"),
+        Binding("f5", "run_batch", "Run as Transaction"),
+        Binding("f6", "fan_out", "Run on Connections"),
+        Binding("f7", "import_file", "Import File"),
+        Binding("f8", "toggle_scratchpad", "Scratchpad"),
         Binding("f1", "help", "Help"),
     ]
 
     def __init__(self, ctx: AppContext) -> None:
         super().__init__()
         self._ctx = ctx
+        # Query and values behind the results shown, when it can be re-run for export
+        self._last_query: tuple[str, dict[str, str] | None] | None = None
+        self._export_job: ExportJob | None = None
+        self._import_job: ImportJob | None = None
 
     def compose(self) -> ComposeResult:
         with Horizontal(id="main-container"):
@@ -55,6 +86,7 @@ class MainScreen(Widget):
             with Vertical(id="content"):
                 yield SqlEditor(settings=self._ctx.settings.editor, id="editor")
                 yield ResultsTable(id="results")
+                yield ExportProgressPanel(id="export-progress")
         yield StatusBar(id="statusbar")
 
     def on_mount(self) -> None:
@@ -65,6 +97,7 @@ class MainScreen(Widget):
     def _setup_completion(self) -> None:
         editor = self.query_one("#editor", SqlEditor)
         if self._ctx.query_service:
+            self._ctx.query_service.set_token_cache(editor.token_cache)
             editor.set_completion_callback(self._ctx.query_service.get_completions)
             editor.set_search_callback(self._ctx.query_service.search_history)
         else:
@@ -73,8 +106,9 @@ class MainScreen(Widget):
 
     def _update_sidebar(self) -> None:
         sidebar = self.query_one("#sidebar", DatabaseSidebar)
-        if self._ctx.is_connected and self._ctx.adapter:
-            sidebar.set_adapter(self._ctx.adapter)
+        adapter = self._ctx.create_async_adapter()
+        if adapter:
+            sidebar.set_adapter(adapter)
         else:
             sidebar.clear_adapter()
 
@@ -97,7 +131,33 @@ class MainScreen(Widget):
             self.app.notify("No database connection", severity="error")
             return
 
-        results = self._ctx.query_service.execute_multi(message.query)
+        names = find_parameters(message.query)
+        if names:
+            self._run_with_parameters(message.query, names)
+            return
+
+        self._run_script(message.query)
+
+    def _run_script(self, query: str, values: dict[str, str] | None = None) -> None:
+        """Run ``query``, in parallel when enabled and the script allows it."""
+        if not self._ctx.query_service:
+            return
+        query_service = self._ctx.query_service
+        if not (
+            self._ctx.settings.execution.parallel_read_only
+            and query_service.runs_in_parallel(query, values)
+        ):
+            self._show_results(query_service.execute_multi(query, values))
+        else:
+            # Wall time only means something next to the total when the run overlapped
+            start_time = time.perf_counter()
+            results = query_service.execute_parallel(query, values)
+            self._show_results(results, elapsed_ms=(time.perf_counter() - start_time) * 1000)
+        if query_service.can_export(query):
+            self._last_query = (query, values)
+
+    def _show_results(self, results: list[QueryResult], elapsed_ms: float | None = None) -> None:
+        self._last_query = None
         results_table = self.query_one("#results", ResultsTable)
 
         if len(results) == 1:
@@ -107,7 +167,7 @@ class MainScreen(Widget):
                 editor = self.query_one("#editor", SqlEditor)
                 editor.show_error(results[0].error, results[0].error_position)
         else:
-            results_table.set_results(results)
+            results_table.set_results(results, elapsed_ms)
             last = results[-1]
             self._update_query_result(last)
             if last.error:
@@ -126,12 +186,228 @@ class MainScreen(Widget):
         self,
         message: ResultsTable.ExportRequested,
     ) -> None:
-        def _on_export_dismiss(result: str | None) -> None:
-            if result:
-                statusbar = self.query_one("#statusbar", StatusBar)
-                statusbar.set_message(f"Exported to {result}")
+        if self._job_running():
+            return
+
+        result = message.result
+        last_query = self._last_query
+
+        def _on_export_dismiss(request: ExportRequest | None) -> None:
+            if request:
+                self._start_export(request, result, last_query if request.stream else None)
+
+        connection = self._ctx.current_connection
+        screen = ExportScreen(
+            can_stream=last_query is not None,
+            dialect=connection.db_type if connection else DatabaseType.POSTGRES,
+            sql_batch_size=self._ctx.settings.export.sql_insert_batch_size,
+        )
+        self.app.push_screen(screen, callback=_on_export_dismiss)
+
+    def _start_export(
+        self,
+        request: ExportRequest,
+        result: QueryResult,
+        query: tuple[str, dict[str, str] | None] | None,
+    ) -> None:
+        """Run the export in a worker thread, showing its progress below the results."""
+        panel = self.query_one("#export-progress", ExportProgressPanel)
+        job = ExportJob(
+            request.targets,
+            total_rows=None if query else len(result.rows),
+            on_progress=lambda progress: self.app.call_from_thread(panel.set_progress, progress),
+            compression=CompressionOptions(
+                level=self._ctx.settings.export.compression_level,
+                threads=self._ctx.settings.export.compression_threads,
+            ),
+        )
+        self._export_job = job
+        panel.start(f"Exporting {self._export_description(job)}", job.progress.total_rows)
+        self.run_worker(
+            partial(self._run_export, job, result, query, self._ctx.query_service),
+            name="export",
+            group="export",
+            thread=True,
+        )
+
+    def _run_export(
+        self,
+        job: ExportJob,
+        result: QueryResult,
+        query: tuple[str, dict[str, str] | None] | None,
+        query_service: QueryUseCase | None,
+    ) -> None:
+        """Worker thread: write the file, then report back on the UI thread."""
+        count = 0
+        error: Exception | None = None
+        start_time = time.perf_counter()
+        try:
+            if query is not None and query_service is not None:
+                count = query_service.export(query[0], job, query[1])
+            else:
+                count = job.run_result(result)
+        except Exception as e:
+            error = e
+        else:
+            if query is not None and query_service is not None:
+                history = QueryResult(
+                    row_count=count, execution_time_ms=(time.perf_counter() - start_time) * 1000
+                )
+                # Recorded on the UI thread, which the history database belongs to
+                self.app.call_from_thread(query_service.history.add, query[0], history)
+        self.app.call_from_thread(self._finish_export, job, count, error)
+
+    def _finish_export(self, job: ExportJob, count: int, error: Exception | None) -> None:
+        self._export_job = None
+        self.query_one("#export-progress", ExportProgressPanel).finish()
+        statusbar = self.query_one("#statusbar", StatusBar)
+        if job.cancelled:
+            statusbar.set_message("Export cancelled")
+            self.app.notify("Export cancelled")
+        elif error is not None:
+            self.app.notify(f"Export failed: {error}", severity="error")
+        else:
+            description = self._export_description(job)
+            statusbar.set_message(f"Exported to {description}")
+            self.app.notify(f"Exported {count:,} rows to {description}")
+
+    @staticmethod
+    def _export_description(job: ExportJob) -> str:
+        first, *others = job.paths
+        return f"{first} (+{len(others)} more)" if others else str(first)
+
+    def on_export_progress_panel_cancel_requested(
+        self,
+        message: ExportProgressPanel.CancelRequested,
+    ) -> None:
+        if self._export_job is not None:
+            self._export_job.cancel()
+        if self._import_job is not None:
+            self._import_job.cancel()
+
+    def _job_running(self) -> bool:
+        """Whether an export or import is using the progress panel, telling the user so."""
+        if self._export_job is not None:
+            self.app.notify("An export is already running", severity="warning")
+        elif self._import_job is not None:
+            self.app.notify("An import is already running", severity="warning")
+        else:
+            return False
+        return True
+
+    def action_import_file(self) -> None:
+        connection = self._ctx.current_connection
+        if not self._ctx.query_service or connection is None:
+            self.app.notify("No database connection", severity="error")
+            return
+        if self._job_running():
+            return
+
+        def _on_import_dismiss(request: ImportRequest | None) -> None:
+            if request:
+                self._start_import(request, connection.db_type)
+
+        self.app.push_screen(ImportScreen(), callback=_on_import_dismiss)
+
+    def _start_import(self, request: ImportRequest, dialect: DatabaseType) -> None:
+        """Run the import in a worker thread, showing its progress below the results."""
+        panel = self.query_one("#export-progress", ExportProgressPanel)
+        job = ImportJob(
+            request.path,
+            request.table,
+            dialect,
+            reject_path=request.reject_path,
+            on_progress=lambda progress: self.app.call_from_thread(
+                panel.set_import_progress, progress
+            ),
+            workers=default_workers(),
+        )
+        self._import_job = job
+        panel.start(f"Importing {request.path.name}", request.path.stat().st_size)
+        self.run_worker(
+            partial(self._run_import, job, self._ctx.query_service),
+            name="import",
+            group="import",
+            thread=True,
+        )
+
+    def _run_import(self, job: ImportJob, query_service: QueryUseCase | None) -> None:
+        """Worker thread: load the file, then report back on the UI thread."""
+        count = 0
+        error: Exception | None = None
+        try:
+            if query_service is not None:
+                count = query_service.import_file(job)
+        except Exception as e:
+            error = e
+        self.app.call_from_thread(self._finish_import, job, count, error)
+
+    def _finish_import(self, job: ImportJob, count: int, error: Exception | None) -> None:
+        self._import_job = None
+        self.query_one("#export-progress", ExportProgressPanel).finish()
+        statusbar = self.query_one("#statusbar", StatusBar)
+        if job.cancelled:
+            statusbar.set_message("Import cancelled")
+            self.app.notify("Import cancelled")
+        elif error is not None:
+            self.app.notify(f"Import failed: {error}", severity="error")
+        else:
+            statusbar.set_message(f"Imported into {job.table}")
+            self.app.notify(f"Imported {count:,} rows into {job.table}")
+            if rejected := job.progress.rejected:
+                self.app.notify(
+                    f"Rejected {rejected:,} rows, see {job.reject_path}", severity="warning"
+                )
+            self._refresh_schema()
+
+    def on_results_table_pin_requested(self, message: ResultsTable.PinRequested) -> None:
+        result = message.result
+        if not result.is_success or not result.columns:
+            self.app.notify("Only results with columns can be pinned", severity="warning")
+            return
+        # The source is the connection the result came from, before any switch
+        connection = self._ctx.current_connection
+        source = connection.name if connection else None
+        scratchpad = self._ctx.scratchpad
+
+        def _on_pin_dismiss(name: str | None) -> None:
+            if name:
+                self._pin_result(name, result, source)
+
+        screen = PinScreen(scratchpad.next_name(), scratchpad.pinned)
+        self.app.push_screen(screen, callback=_on_pin_dismiss)
+
+    def _pin_result(self, name: str, result: QueryResult, source: str | None) -> None:
+        try:
+            pinned = self._ctx.scratchpad.pin(name, result, source)
+        except QryError as e:
+            self.app.notify(f"Pin failed: {e}", severity="error")
+            return
+        self.app.notify(f"Pinned {pinned.rows:,} rows as {pinned.name} - F8 to query them")
+        if self._ctx.using_scratchpad:
+            self._refresh_schema()
+
+    def action_toggle_scratchpad(self) -> None:
+        """Switch queries between the connection and the scratchpad of pinned results."""
+        try:
+            self._ctx.use_scratchpad(not self._ctx.using_scratchpad)
+        except QryError as e:
+            self.app.notify(f"Scratchpad unavailable: {e}", severity="error")
+            return
+        self._last_query = None
+        self.refresh_connection()
+        if self._ctx.using_scratchpad:
+            self.app.notify("Querying the scratchpad - F8 to switch back")
+        elif self._ctx.current_connection:
+            self.app.notify(f"Querying {self._ctx.current_connection.name}")
+        else:
+            self.app.notify("Left the scratchpad")
 
-        self.app.push_screen(ExportScreen(message.result), callback=_on_export_dismiss)
+    def _refresh_schema(self) -> None:
+        """Show tables created behind the editor's back, e.g. by an import or a pin."""
+        if self._ctx.query_service:
+            self._ctx.query_service.invalidate_schema_cache()
+        self.query_one("#sidebar", DatabaseSidebar).refresh_tree()
 
     def on_sql_editor_history_requested(
         self, message: SqlEditor.HistoryRequested
@@ -143,7 +419,8 @@ class MainScreen(Widget):
             self.app.notify("No database connection", severity="error")
             return
 
-        entries = self._ctx.query_service.get_history(count=100)
+        query_service = self._ctx.query_service
+        entries = query_service.get_history(count=HISTORY_PAGE_SIZE)
         if not entries:
             self.app.notify("No history entries")
             return
@@ -153,7 +430,10 @@ class MainScreen(Widget):
                 editor = self.query_one("#editor", SqlEditor)
                 editor.set_query(query)
 
-        self.app.push_screen(HistoryScreen(entries), callback=_on_history_dismiss)
+        self.app.push_screen(
+            HistoryScreen(entries, loader=query_service.get_history_page),
+            callback=_on_history_dismiss,
+        )
 
     def action_toggle_sidebar(self) -> None:
         sidebar = self.query_one("#sidebar", DatabaseSidebar)
@@ -168,7 +448,8 @@ class MainScreen(Widget):
             self.app.notify("No active connection", severity="warning")
 
     def action_show_snippets(self) -> None:
-        snippets = self._ctx.snippet_repository.list_all()
+        repository = self._ctx.snippet_repository
+        snippets = repository.list_all()
         if not snippets:
             self.app.notify("No snippets saved")
             return
@@ -178,7 +459,142 @@ class MainScreen(Widget):
                 editor = self.query_one("#editor", SqlEditor)
                 editor.set_query(query)
 
-        self.app.push_screen(SnippetScreen(snippets), callback=_on_snippet_dismiss)
+        self.app.push_screen(
+            SnippetScreen(snippets, search=repository.search), callback=_on_snippet_dismiss
+        )
+
+    def _run_with_parameters(self, query: str, names: list[str], batch: bool = False) -> None:
+        """Ask for parameter values, then run ``query`` with them bound."""
+
+        def _on_parameters_dismiss(values: dict[str, str] | None) -> None:
+            if values is None or not self._ctx.query_service:
+                return
+            if batch:
+                self._run_batch(query, values)
+            else:
+                self._run_script(query, values)
+
+        self.app.push_screen(ParametersScreen(names), callback=_on_parameters_dismiss)
+
+    def action_show_query_stats(self) -> None:
+        if not self._ctx.query_service:
+            self.app.notify("No database connection", severity="error")
+            return
+
+        stats = self._ctx.query_service.get_query_stats()
+        if not stats:
+            self.app.notify("No query statistics yet")
+            return
+
+        def _on_stats_dismiss(query: str | None) -> None:
+            if query:
+                editor = self.query_one("#editor", SqlEditor)
+                editor.set_query(query)
+
+        self.app.push_screen(QueryStatsScreen(stats), callback=_on_stats_dismiss)
+
+    def action_run_batch(self) -> None:
+        if not self._ctx.query_service:
+            self.app.notify("No database connection", severity="error")
+            return
+
+        query = self.query_one("#editor", SqlEditor).get_query().strip()
+        if not query:
+            return
+        names = find_parameters(query)
+        if names:
+            self._run_with_parameters(query, names, batch=True)
+            return
+        self._run_batch(query)
+
+    def _run_batch(self, query: str, values: dict[str, str] | None = None) -> None:
+        """Run ``query`` as one transaction, using the execution settings."""
+        if not self._ctx.query_service:
+            return
+        execution = self._ctx.settings.execution
+        results = self._ctx.query_service.execute_batch(
+            query,
+            values,
+            savepoint_every=execution.batch_savepoint_every,
+            on_error=(
+                ErrorPolicy.CONTINUE if execution.batch_continue_on_error else ErrorPolicy.STOP
+            ),
+        )
+        self._show_results(results)
+
+    def action_fan_out(self) -> None:
+        query = self.query_one("#editor", SqlEditor).get_query().strip()
+        if not query:
+            return
+        connections = self._ctx.get_connections()
+        if not connections:
+            self.app.notify("No saved connections")
+            return
+
+        def _on_fan_out_dismiss(names: list[str] | None) -> None:
+            if names:
+                # Recorded here: the history database belongs to the UI thread
+                if self._ctx.query_service:
+                    self._ctx.query_service.history.add(query)
+                self.run_worker(
+                    lambda: self._stream_fan_out(query, names),
+                    name="fan-out",
+                    group="fan-out",
+                    thread=True,
+                    exclusive=True,
+                )
+
+        self.app.push_screen(FanOutScreen(connections), callback=_on_fan_out_dismiss)
+
+    def _stream_fan_out(self, query: str, names: list[str]) -> None:
+        """Worker thread: show the merged result again as each connection answers."""
+        items: list[FanOutItem] = []
+        start_time = time.perf_counter()
+        for item in self._ctx.fan_out(query, names):
+            items.append(item)
+            result = merge_fan_out(items)
+            result.execution_time_ms = (time.perf_counter() - start_time) * 1000
+            self.app.call_from_thread(self._show_results, [result])
+        if not items:
+            self.app.call_from_thread(self.app.notify, "No matching connections")
+
+    def action_sweep(self) -> None:
+        if not self._ctx.query_service:
+            self.app.notify("No database connection", severity="error")
+            return
+
+        query = self.query_one("#editor", SqlEditor).get_query().strip()
+        names = find_parameters(query)
+        if not names:
+            self.app.notify("Query has no :name parameters", severity="warning")
+            return
+
+        def _on_sweep_dismiss(text: str | None) -> None:
+            query_service = self._ctx.query_service
+            if text is None or not query_service:
+                return
+            param_sets = parse_parameter_sets(text, names)
+            if error := query_service.check_sweep(query, param_sets):
+                self.app.notify(error, severity="error")
+                return
+            # Recorded here: the history database belongs to the UI thread
+            query_service.history.add(query)
+            self.run_worker(
+                lambda: self._stream_sweep(query_service, query, param_sets),
+                name="sweep",
+                group="sweep",
+                thread=True,
+                exclusive=True,
+            )
+
+        self.app.push_screen(SweepScreen(names), callback=_on_sweep_dismiss)
+
+    def _stream_sweep(
+        self, query_service: QueryUseCase, query: str, param_sets: list[QueryParams]
+    ) -> None:
+        """Worker thread: show the combined result again as parameter sets finish."""
+        for result in query_service.stream_sweep(query, param_sets):
+            self.app.call_from_thread(self._show_results, [result])
 
     def action_help(self) -> None:
         self.app.notify("Press Ctrl+Enter to run query, Ctrl+B for sidebar")
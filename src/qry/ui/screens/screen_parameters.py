@@ -0,0 +1,81 @@
+"""Parameter entry screen for parameterized queries."""
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Input, Label, Static
+
+
+class ParametersScreen(ModalScreen[dict[str, str] | None]):
+    """Modal screen asking for a value for each ``:name`` parameter.
+
+    Enter moves to the next field; Enter on the last field dismisses with
+    the collected values.
+    """
+
+    DEFAULT_CSS = """
+    ParametersScreen {
+        align: center middle;
+    }
+
+    #params-dialog {
+        width: 60;
+        height: auto;
+        max-height: 80%;
+        border: thick $accent;
+        background: $surface;
+        padding: 1 2;
+    }
+
+    #params-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    .param-label {
+        margin-top: 1;
+    }
+
+    #params-hint {
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, names: list[str], title: str = "Query Parameters") -> None:
+        super().__init__()
+        self._names = names
+        self._title = title
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="params-dialog"):
+            yield Label(self._title, id="params-title")
+            for name in self._names:
+                yield Label(f":{name}", classes="param-label")
+                yield Input(id=f"param-{name}")
+            yield Static("Enter: Next / Run | Escape: Cancel", id="params-hint")
+
+    def on_mount(self) -> None:
+        if self._names:
+            self.query_one(f"#param-{self._names[0]}", Input).focus()
+
+    def _values(self) -> dict[str, str]:
+        return {name: self.query_one(f"#param-{name}", Input).value for name in self._names}
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        ids = [f"param-{name}" for name in self._names]
+        position = ids.index(event.input.id) if event.input.id in ids else len(ids) - 1
+        if position + 1 < len(ids):
+            self.query_one(f"#{ids[position + 1]}", Input).focus()
+        else:
+            self.dismiss(self._values())
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
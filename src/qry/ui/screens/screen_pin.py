@@ -0,0 +1,89 @@
+"""Pin screen - name a result to keep in the scratchpad."""
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Input, Label, Static
+
+from qry.application.scratchpad import PinnedTable
+
+
+def format_pinned(pinned: list[PinnedTable]) -> str:
+    """The tables already pinned, with where each came from."""
+    if not pinned:
+        return "Nothing pinned yet"
+    tables = ", ".join(
+        f"{table.name} ({table.rows:,} rows from {table.source})"
+        if table.source
+        else f"{table.name} ({table.rows:,} rows)"
+        for table in pinned
+    )
+    return f"Pinned: {tables}"
+
+
+class PinScreen(ModalScreen[str | None]):
+    """Modal screen asking for the scratchpad table to pin a result as.
+
+    Enter dismisses with the name; a name already pinned is replaced.
+    """
+
+    DEFAULT_CSS = """
+    PinScreen {
+        align: center middle;
+    }
+
+    #pin-dialog {
+        width: 60;
+        height: auto;
+        border: thick $accent;
+        background: $surface;
+        padding: 1 2;
+    }
+
+    #pin-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #pin-tables {
+        color: $text-muted;
+        margin-bottom: 1;
+    }
+
+    #pin-hint {
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, default_name: str, pinned: list[PinnedTable]) -> None:
+        super().__init__()
+        self._default_name = default_name
+        self._pinned = pinned
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="pin-dialog"):
+            yield Label("Pin to Scratchpad", id="pin-title")
+            yield Static(format_pinned(self._pinned), id="pin-tables")
+            yield Input(value=self._default_name, placeholder="Table name", id="pin-name")
+            yield Static("Enter: Pin | Escape: Cancel | F8: Query the scratchpad", id="pin-hint")
+
+    def on_mount(self) -> None:
+        self.query_one("#pin-name", Input).focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        name = event.value.strip()
+        if not name:
+            self.app.notify("Please enter a table name", severity="error")
+            return
+        self.dismiss(name)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
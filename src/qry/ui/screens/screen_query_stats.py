@@ -0,0 +1,105 @@
+"""Query statistics screen."""
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import DataTable, Label, Static
+
+from qry.domains.query.models import FingerprintStats
+
+_QUERY_PREVIEW_LENGTH = 50
+
+
+def _format_ms(value: float) -> str:
+    if value >= 1000:
+        return f"{value / 1000:.2f}s"
+    return f"{value:.1f}ms"
+
+
+def _format_trend(trend: float | None) -> str:
+    if trend is None:
+        return "-"
+    return f"{(trend - 1) * 100:+.0f}%"
+
+
+class QueryStatsScreen(ModalScreen[str | None]):
+    """Modal screen showing latency statistics per query fingerprint.
+
+    Selecting a row dismisses with the most recent query of that fingerprint.
+    """
+
+    DEFAULT_CSS = """
+    QueryStatsScreen {
+        align: center middle;
+    }
+
+    #stats-dialog {
+        width: 110;
+        max-height: 30;
+        border: thick $accent;
+        background: $surface;
+        padding: 1 2;
+    }
+
+    #stats-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #stats-table {
+        height: 1fr;
+        min-height: 10;
+        max-height: 20;
+    }
+
+    #stats-hint {
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, stats: list[FingerprintStats]) -> None:
+        super().__init__()
+        self._stats = stats
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="stats-dialog"):
+            yield Label("Query Statistics", id="stats-title")
+            yield DataTable(id="stats-table", cursor_type="row", zebra_stripes=True)
+            yield Static("Enter to load query, Esc to close", id="stats-hint")
+
+    def on_mount(self) -> None:
+        table = self.query_one("#stats-table", DataTable)
+        table.add_columns("Query", "Count", "Errors", "p50", "p95", "Max", "Total", "Trend")
+        for stat in self._stats:
+            query = " ".join(stat.query.split())
+            if len(query) > _QUERY_PREVIEW_LENGTH:
+                query = query[: _QUERY_PREVIEW_LENGTH - 3] + "..."
+            table.add_row(
+                query,
+                str(stat.count),
+                str(stat.error_count),
+                _format_ms(stat.p50_ms),
+                _format_ms(stat.p95_ms),
+                _format_ms(stat.max_ms),
+                _format_ms(stat.total_ms),
+                _format_trend(stat.trend),
+                key=stat.fingerprint,
+            )
+        table.focus()
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        for stat in self._stats:
+            if stat.fingerprint == event.row_key.value:
+                self.dismiss(stat.query)
+                return
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
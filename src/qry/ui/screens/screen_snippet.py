@@ -1,5 +1,7 @@
 """Snippet picker screen for selecting SQL snippets."""
 
+from collections.abc import Callable
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
@@ -11,7 +13,11 @@ from qry.domains.snippet.snippet_models import Snippet
 
 
 class SnippetScreen(ModalScreen[str | None]):
-    """Modal screen listing snippets for selection."""
+    """Modal screen listing snippets for selection.
+
+    When a ``search(pattern)`` callable is given (usually the repository's
+    indexed search) filtering is delegated to it.
+    """
 
     DEFAULT_CSS = """
     SnippetScreen {
@@ -53,10 +59,15 @@ class SnippetScreen(ModalScreen[str | None]):
         Binding("escape", "cancel", "Cancel"),
     ]
 
-    def __init__(self, snippets: list[Snippet]) -> None:
+    def __init__(
+        self,
+        snippets: list[Snippet],
+        search: Callable[[str], list[Snippet]] | None = None,
+    ) -> None:
         super().__init__()
         self._snippets = snippets
         self._filtered: list[Snippet] = list(snippets)
+        self._search = search
 
     def compose(self) -> ComposeResult:
         with Vertical(id="snippet-dialog"):
@@ -89,7 +100,9 @@ class SnippetScreen(ModalScreen[str | None]):
 
     def on_input_changed(self, event: Input.Changed) -> None:
         pattern = event.value.strip().lower()
-        if pattern:
+        if pattern and self._search is not None:
+            self._filtered = self._search(pattern)
+        elif pattern:
             self._filtered = [
                 s
                 for s in self._snippets
@@ -0,0 +1,88 @@
+"""Parameter sweep screen - enter many parameter sets at once."""
+
+from pathlib import Path
+
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Input, Label, Static, TextArea
+
+
+class SweepScreen(ModalScreen[str | None]):
+    """Modal screen collecting parameter sets as CSV or TSV text.
+
+    Values can be typed or pasted, one set per line, or loaded from a file.
+    Ctrl+Enter dismisses with the text.
+    """
+
+    DEFAULT_CSS = """
+    SweepScreen {
+        align: center middle;
+    }
+
+    #sweep-dialog {
+        width: 80;
+        height: auto;
+        max-height: 90%;
+        border: thick $accent;
+        background: $surface;
+        padding: 1 2;
+    }
+
+    #sweep-title {
+        text-align: center;
+        text-style: bold;
+        margin-bottom: 1;
+    }
+
+    #sweep-values {
+        height: 12;
+    }
+
+    #sweep-file {
+        margin-top: 1;
+    }
+
+    #sweep-hint {
+        text-align: center;
+        color: $text-muted;
+        margin-top: 1;
+    }
+    """
+
+    BINDINGS = [
+        Binding("ctrl+enter", "run", "Run", priority=True),
+        Binding("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, names: list[str]) -> None:
+        super().__init__()
+        self._names = names
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="sweep-dialog"):
+            yield Label("Parameter Sweep", id="sweep-title")
+            yield Label(", ".join(self._names), id="sweep-columns")
+            yield TextArea(id="sweep-values")
+            yield Input(placeholder="Load from CSV/TSV file (Enter)", id="sweep-file")
+            yield Static("Ctrl+Enter: Run | Escape: Cancel", id="sweep-hint")
+
+    def on_mount(self) -> None:
+        self.query_one("#sweep-values", TextArea).focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        path = Path(event.value).expanduser()
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError as e:
+            self.app.notify(f"Cannot read file: {e}", severity="error")
+            return
+        self.query_one("#sweep-values", TextArea).text = text
+
+    def action_run(self) -> None:
+        text = self.query_one("#sweep-values", TextArea).text
+        self.dismiss(text if text.strip() else None)
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
@@ -10,6 +10,7 @@ from textual.widgets.text_area import Selection
 
 from qry.domains.query.query_formatter import format_sql
 from qry.domains.query.models import CompletionItem, HistoryEntry
+from qry.domains.query.tokenizer import TokenCache
 from qry.shared.settings import EditorSettings
 from qry.ui.widgets.widget_completion import CompletionDropdown
 from qry.ui.widgets.widget_error_bar import ErrorBar
@@ -63,6 +64,12 @@ class SqlEditor(Static):
             None
         )
         self._search_callback: Callable[[str, int], list[HistoryEntry]] | None = None
+        self._token_cache = TokenCache()
+
+    @property
+    def token_cache(self) -> TokenCache:
+        """Token stream of this editor's buffer, shared with query services."""
+        return self._token_cache
 
     def compose(self) -> ComposeResult:
         yield TextArea(
@@ -182,9 +189,9 @@ class SqlEditor(Static):
 
     def action_format(self) -> None:
         if self._text_area:
-            raw = self._text_area.text.strip()
-            if raw:
-                self._text_area.text = format_sql(raw)
+            raw = self._text_area.text
+            if raw.strip():
+                self._text_area.text = format_sql(raw, self._token_cache)
                 self._text_area.cursor_location = (0, 0)
 
     def set_query(self, query: str) -> None:
@@ -0,0 +1,114 @@
+"""Progress panel for background exports and imports."""
+
+from textual.app import ComposeResult
+from textual.containers import Horizontal
+from textual.message import Message
+from textual.widgets import Button, Label, ProgressBar
+
+from qry.application.export_job import ExportProgress
+from qry.application.import_job import ImportProgress
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def format_bytes(size: float) -> str:
+    for unit in _UNITS[:-1]:
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} {_UNITS[-1]}"
+
+
+def format_progress(progress: ExportProgress) -> str:
+    """One-line summary: rows written, bytes, throughput and ETA when known."""
+    parts = [
+        f"{progress.rows:,} rows",
+        format_bytes(progress.bytes_written),
+        f"{progress.rows_per_second:,.0f} rows/s",
+    ]
+    if (eta := progress.eta_seconds) is not None:
+        parts.append(f"ETA {eta:.0f}s")
+    return " | ".join(parts)
+
+
+def format_import_progress(progress: ImportProgress) -> str:
+    """One-line summary: rows imported and rejected, throughput and ETA when known."""
+    parts = [f"{progress.rows:,} rows"]
+    if progress.rejected:
+        parts.append(f"{progress.rejected:,} rejected")
+    parts.append(f"{progress.rows_per_second:,.0f} rows/s")
+    if (eta := progress.eta_seconds) is not None:
+        parts.append(f"ETA {eta:.0f}s")
+    return " | ".join(parts)
+
+
+class ExportProgressPanel(Horizontal):
+    """Shows the running export or import below the results, with a Cancel button.
+
+    An export's bar counts rows, an import's counts bytes of the file read.
+    """
+
+    DEFAULT_CSS = """
+    ExportProgressPanel {
+        height: 1;
+        padding: 0 1;
+        background: $primary 15%;
+        display: none;
+    }
+
+    ExportProgressPanel.visible {
+        display: block;
+    }
+
+    ExportProgressPanel #export-progress-path {
+        width: auto;
+        max-width: 40;
+        margin-right: 1;
+    }
+
+    ExportProgressPanel ProgressBar {
+        width: auto;
+        margin-right: 1;
+    }
+
+    ExportProgressPanel #export-progress-stats {
+        width: 1fr;
+    }
+
+    ExportProgressPanel Button {
+        height: 1;
+        min-width: 10;
+        border: none;
+    }
+    """
+
+    class CancelRequested(Message):
+        pass
+
+    def compose(self) -> ComposeResult:
+        yield Label(id="export-progress-path")
+        yield ProgressBar(show_eta=False, id="export-progress-bar")
+        yield Label(id="export-progress-stats")
+        yield Button("Cancel", variant="error", id="export-progress-cancel")
+
+    def start(self, description: str, total: int | None) -> None:
+        self.query_one("#export-progress-path", Label).update(description)
+        self.query_one("#export-progress-bar", ProgressBar).update(total=total, progress=0)
+        self.query_one("#export-progress-stats", Label).update("")
+        self.add_class("visible")
+
+    def set_progress(self, progress: ExportProgress) -> None:
+        self.query_one("#export-progress-bar", ProgressBar).update(progress=progress.rows)
+        self.query_one("#export-progress-stats", Label).update(format_progress(progress))
+
+    def set_import_progress(self, progress: ImportProgress) -> None:
+        self.query_one("#export-progress-bar", ProgressBar).update(progress=progress.bytes_read)
+        self.query_one("#export-progress-stats", Label).update(format_import_progress(progress))
+
+    def finish(self) -> None:
+        self.remove_class("visible")
+
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "export-progress-cancel":
+            event.stop()
+            self.post_message(self.CancelRequested())
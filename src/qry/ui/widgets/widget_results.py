@@ -49,6 +49,7 @@ class ResultsTable(Static):
 
     BINDINGS = [
         Binding("ctrl+e", "export", "Export"),
+        Binding("p", "pin", "Pin to Scratchpad"),
         Binding("ctrl+c", "copy", "Copy"),
         Binding("enter", "copy_cell", "Copy Cell"),
         Binding("s", "toggle_sort", "Sort"),
@@ -60,6 +61,11 @@ class ResultsTable(Static):
             super().__init__()
             self.result = result
 
+    class PinRequested(Message):
+        def __init__(self, result: QueryResult) -> None:
+            super().__init__()
+            self.result = result
+
     def __init__(self, id: str | None = None) -> None:
         super().__init__(id=id)
         self._result: QueryResult | None = None
@@ -202,8 +208,12 @@ class ResultsTable(Static):
             rows.sort(key=safe_sort_key, reverse=reverse)
         return rows
 
-    def set_results(self, results: list[QueryResult]) -> None:
-        """Display multiple query results (shows last successful result with summary)."""
+    def set_results(self, results: list[QueryResult], elapsed_ms: float | None = None) -> None:
+        """Display multiple query results (shows last successful result with summary).
+
+        ``elapsed_ms`` is the wall-clock time when the queries ran in
+        parallel; the summary then shows it next to their summed time.
+        """
         if not results:
             return
 
@@ -219,22 +229,29 @@ class ResultsTable(Static):
         success = sum(1 for r in results if r.is_success)
         if total > 1:
             total_time = sum(r.execution_time_ms for r in results)
-            last_result = results[-1]
-            if last_result.error:
-                error_msg = f"Error in query {success + 1}"
+            timing = f"{total_time:.1f}ms"
+            if elapsed_ms is not None:
+                timing = f"{elapsed_ms:.1f}ms wall, {timing} total"
+            first_error = next((i for i, r in enumerate(results) if r.error), None)
+            if first_error is not None:
+                error_msg = f"Error in query {first_error + 1}"
                 self.border_title = (
                     f"Results - {success}/{total} queries"
-                    f" ({total_time:.1f}ms) - {error_msg}"
+                    f" ({timing}) - {error_msg}"
                 )
             else:
                 self.border_title = (
-                    f"Results - {total} queries ({total_time:.1f}ms)"
+                    f"Results - {total} queries ({timing})"
                 )
 
     def action_export(self) -> None:
         if self._result:
             self.post_message(self.ExportRequested(self._result))
 
+    def action_pin(self) -> None:
+        if self._result:
+            self.post_message(self.PinRequested(self._result))
+
     def action_toggle_sort(self) -> None:
         """Toggle sort on the current column: NONE -> ASC -> DESC -> NONE."""
         if not self._result or not self._table or not self._result.columns:
@@ -5,9 +5,11 @@ from collections.abc import Callable
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from textual.widgets import Input, Static
 
 from qry.domains.query.models import HistoryEntry
+from qry.shared.constants import SEARCH_DEBOUNCE_SECONDS
 
 
 class ReverseSearchBar(Static):
@@ -64,6 +66,7 @@ class ReverseSearchBar(Static):
         self._match_index: int = 0
         self._input: Input | None = None
         self._preview: Static | None = None
+        self._search_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("", id="search-preview")
@@ -92,6 +95,7 @@ class ReverseSearchBar(Static):
 
     def close(self) -> None:
         """Hide the search bar."""
+        self._cancel_pending_search()
         self.remove_class("visible")
         self._matches = []
         self._match_index = 0
@@ -137,12 +141,25 @@ class ReverseSearchBar(Static):
         else:
             self._preview.update("")
 
+    def _cancel_pending_search(self) -> None:
+        if self._search_timer:
+            self._search_timer.stop()
+            self._search_timer = None
+
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "search-input":
-            self._do_search(event.value)
+            # Debounce: only search once typing pauses
+            self._cancel_pending_search()
+            pattern = event.value
+            self._search_timer = self.set_timer(
+                SEARCH_DEBOUNCE_SECONDS, lambda: self._do_search(pattern)
+            )
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "search-input":
+            if self._search_timer:
+                self._cancel_pending_search()
+                self._do_search(event.value)
             self._accept()
 
     def _accept(self) -> None:
@@ -1,16 +1,24 @@
 """Database sidebar widget."""
 
+import asyncio
+
 from textual.app import ComposeResult
 from textual.message import Message
 from textual.widgets import Static, Tree
+from textual.widgets.tree import TreeNode
 
-from qry.domains.database.base import DatabaseAdapter
+from qry.domains.database.async_base import AsyncDatabaseAdapter
 from qry.shared.exceptions import DatabaseError
 from qry.shared.types import TableInfo
 
 
 class DatabaseSidebar(Static):
-    """Sidebar showing database structure."""
+    """Sidebar showing database structure.
+
+    The schema is read through an asyncio adapter on a connection of the
+    sidebar's own, awaited in workers, so a slow catalog never blocks the
+    UI or waits behind a running query.
+    """
 
     DEFAULT_CSS = """
     DatabaseSidebar {
@@ -36,14 +44,17 @@ class DatabaseSidebar(Static):
 
     def __init__(self, id: str | None = None) -> None:
         super().__init__(id=id)
-        self._adapter: DatabaseAdapter | None = None
+        self._adapter: AsyncDatabaseAdapter | None = None
+        self._connect_lock = asyncio.Lock()
         self._tree: Tree | None = None
         self._columns_loaded: set[str] = set()
 
     def compose(self) -> ComposeResult:
         yield Tree("Database", id="db-tree")
 
-    def set_adapter(self, adapter: DatabaseAdapter) -> None:
+    def set_adapter(self, adapter: AsyncDatabaseAdapter) -> None:
+        """Show the schema behind ``adapter``, which the sidebar connects and closes."""
+        self._close_adapter()
         self._adapter = adapter
         self._columns_loaded.clear()
         if self._tree:
@@ -56,26 +67,55 @@ class DatabaseSidebar(Static):
         if self._adapter:
             self.refresh_tree()
 
+    async def on_unmount(self) -> None:
+        if self._adapter:
+            await self._adapter.disconnect()
+            self._adapter = None
+
     def clear_adapter(self) -> None:
-        self._adapter = None
+        self._close_adapter()
         self._columns_loaded.clear()
         if self._tree:
             self._tree.clear()
 
+    def _close_adapter(self) -> None:
+        if self._adapter:
+            self.run_worker(self._adapter.disconnect(), group="schema-close")
+            self._adapter = None
+
+    async def _connected(self, adapter: AsyncDatabaseAdapter) -> bool:
+        """Connect ``adapter`` on first use; False once it has been replaced."""
+        async with self._connect_lock:
+            if adapter is not self._adapter:
+                return False
+            if not adapter.is_connected():
+                await adapter.connect()
+        return True
+
     def refresh_tree(self) -> None:
         if not self._tree or not self._adapter:
             return
+        self.run_worker(self._load_tree(self._adapter), group="schema")
 
-        self._tree.clear()
-        self._columns_loaded.clear()
-
+    async def _load_tree(self, adapter: AsyncDatabaseAdapter) -> None:
+        if not self._tree:
+            return
         try:
-            tables = self._adapter.get_tables()
-            views = self._adapter.get_views()
-            indexes = self._adapter.get_indexes()
+            if not await self._connected(adapter):
+                return
+            tables = await adapter.get_tables()
+            views = await adapter.get_views()
+            indexes = await adapter.get_indexes()
         except DatabaseError as e:
-            self._tree.root.add_leaf(f"⚠ {e}")
+            if adapter is self._adapter:
+                self._tree.clear()
+                self._tree.root.add_leaf(f"⚠ {e}")
             return
+        if adapter is not self._adapter:
+            return
+
+        self._tree.clear()
+        self._columns_loaded.clear()
 
         # Tables
         tables_node = self._tree.root.add(f"Tables ({len(tables)})", expand=True)
@@ -107,14 +147,21 @@ class DatabaseSidebar(Static):
         table_name = node.data.name
         if table_name in self._columns_loaded:
             return
+        self._columns_loaded.add(table_name)
+        self.run_worker(self._load_columns(self._adapter, node, table_name), group="schema")
 
+    async def _load_columns(
+        self, adapter: AsyncDatabaseAdapter, node: TreeNode, table_name: str
+    ) -> None:
         try:
-            columns = self._adapter.get_columns(table_name)
+            if not await self._connected(adapter):
+                return
+            columns = await adapter.get_columns(table_name)
         except DatabaseError as e:
+            self._columns_loaded.discard(table_name)
             node.add_leaf(f"⚠ {e}")
             return
 
-        self._columns_loaded.add(table_name)
         for col in columns:
             prefix = "🔑 " if col.primary_key else ""
             type_str = col.data_type
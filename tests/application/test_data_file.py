@@ -0,0 +1,50 @@
+"""Tests for loading data files into a scratch database."""
+
+from pathlib import Path
+
+import pytest
+
+from qry.application.data_file import is_data_file, load_data_file, table_name_for
+from qry.domains.database.sqlite import SQLiteAdapter
+from qry.shared.exceptions import DataImportError
+
+
+class TestDataFileNames:
+    def test_is_data_file(self):
+        assert is_data_file(Path("logs/Access.CSV"))
+        assert is_data_file(Path("events.json"))
+        assert not is_data_file(Path("app.db"))
+
+    @pytest.mark.parametrize(
+        ("name", "table"),
+        [
+            ("orders.csv", "orders"),
+            ("access-log 2024.tsv", "access_log_2024"),
+            ("2024.csv", "_2024"),
+        ],
+    )
+    def test_table_name_for(self, name: str, table: str):
+        assert table_name_for(Path(name)) == table
+
+
+class TestLoadDataFile:
+    def test_load_data_file(self, tmp_path: Path):
+        path = tmp_path / "events.ndjson"
+        path.write_text('{"kind": "click", "n": 2}\n{"kind": "view", "n": 5}\nnot json\n')
+        database = tmp_path / "scratch.db"
+
+        job = load_data_file(path, database, "events", workers=1)
+
+        assert job.progress.rows == 2
+        assert job.progress.rejected == 1
+        adapter = SQLiteAdapter(database)
+        adapter.connect()
+        assert adapter.execute("SELECT sum(n) FROM events").rows == [(7,)]
+        adapter.disconnect()
+
+    def test_load_data_file_error(self, tmp_path: Path):
+        path = tmp_path / "empty.csv"
+        path.write_text("")
+
+        with pytest.raises(DataImportError):
+            load_data_file(path, tmp_path / "scratch.db", "empty")
@@ -0,0 +1,92 @@
+"""Tests for ExportJob."""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from qry.application.export_job import ExportJob, ExportProgress
+from qry.application.export_tee import ExportTarget
+from qry.domains.export.csv import CsvExporter
+from qry.domains.export.ndjson import NdjsonExporter
+from qry.shared.exceptions import OperationCancelled
+from qry.shared.models import QueryResult
+
+
+class TestExportJob:
+    def test_run_result_reports_progress(self, tmp_path: Path):
+        reports: list[ExportProgress] = []
+        result = QueryResult(columns=["id"], rows=[(i,) for i in range(5)])
+        job = ExportJob(
+            [ExportTarget(CsvExporter(), tmp_path / "out.csv")],
+            total_rows=5,
+            on_progress=reports.append,
+            interval_seconds=0,
+        )
+
+        count = job.run_result(result, batch_size=2)
+
+        assert count == 5
+        assert [r.rows for r in reports] == [2, 4, 5, 5]
+        assert reports[-1].bytes_written == (tmp_path / "out.csv").stat().st_size
+        assert reports[-1].eta_seconds == 0
+
+    def test_cancel_stops_before_next_batch_and_removes_file(self, tmp_path: Path):
+        path = tmp_path / "out.csv"
+        job = ExportJob([ExportTarget(CsvExporter(), path)])
+
+        def batches():
+            yield [(1,)]
+            job.cancel()
+            yield [(2,)]
+
+        with pytest.raises(OperationCancelled):
+            job.run(["id"], batches())
+
+        assert job.cancelled
+        assert job.progress.rows == 1
+        assert not path.exists()
+
+    def test_on_cancel_callbacks(self, tmp_path: Path):
+        calls: list[str] = []
+        job = ExportJob([ExportTarget(CsvExporter(), tmp_path / "out.csv")])
+        job.on_cancel(lambda: calls.append("first"))
+
+        job.cancel()
+        job.on_cancel(lambda: calls.append("late"))
+
+        assert calls == ["first", "late"]
+
+    def test_progress_sums_bytes_over_targets(self, tmp_path: Path):
+        reports: list[ExportProgress] = []
+        targets = [
+            ExportTarget(CsvExporter(), tmp_path / "out.csv"),
+            ExportTarget(NdjsonExporter(), tmp_path / "out.ndjson"),
+        ]
+        job = ExportJob(targets, on_progress=reports.append)
+
+        count = job.run_result(QueryResult(columns=["id"], rows=[(1,), (2,)]))
+
+        assert count == 2
+        assert job.paths == [t.path for t in targets]
+        assert reports[-1].bytes_written == sum(p.stat().st_size for p in job.paths)
+
+    def test_run_copy_writes_bytes_unchanged(self, tmp_path: Path):
+        path = tmp_path / "out.csv.gz"
+        job = ExportJob([ExportTarget(CsvExporter(), path)])
+
+        count = job.run_copy([[b"id\n"], [b"1\n", b"2\n"], [b"3\n"]])
+
+        assert count == 3
+        assert gzip.decompress(path.read_bytes()) == b"id\n1\n2\n3\n"
+
+
+class TestExportProgress:
+    def test_progress_rates(self):
+        progress = ExportProgress(rows=500, elapsed_seconds=2.0, total_rows=1500)
+
+        assert progress.rows_per_second == 250
+        assert progress.eta_seconds == 4
+
+    def test_progress_without_total_has_no_eta(self):
+        assert ExportProgress(rows=10, elapsed_seconds=1.0).eta_seconds is None
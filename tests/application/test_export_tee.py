@@ -0,0 +1,106 @@
+"""Tests for ExportTee."""
+
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, TextIO
+
+import pytest
+
+from qry.application.export_tee import ExportTarget, ExportTee
+from qry.domains.export.base import Exporter, RowBatches
+from qry.domains.export.csv import CsvExporter
+from qry.domains.export.ndjson import NdjsonExporter
+from qry.domains.export.sqlite import SQLiteExporter
+from qry.shared.exceptions import ExportError
+
+
+class FailingExporter(Exporter):
+    def export_stream(self, columns: list[str], row_batches: RowBatches, sink: TextIO) -> int:
+        for _ in row_batches:
+            raise ExportError("disk full")
+        return 0
+
+
+def _batches(reads: list[int], n: int = 10, size: int = 3) -> Iterator[Sequence[tuple[Any, ...]]]:
+    for start in range(0, n, size):
+        reads.append(start)
+        yield [(i, f"row {i}") for i in range(start, min(n, start + size))]
+
+
+class TestExportTee:
+    def test_writes_every_format_from_one_pass(self, tmp_path: Path):
+        reads: list[int] = []
+        targets = [
+            ExportTarget(CsvExporter(), tmp_path / "out.csv"),
+            ExportTarget(NdjsonExporter(), tmp_path / "out.ndjson"),
+            ExportTarget(SQLiteExporter(), tmp_path / "out.db"),
+        ]
+
+        count = ExportTee(targets, buffer_batches=1).run(["id", "name"], _batches(reads))
+
+        assert count == 10
+        assert reads == [0, 3, 6, 9]
+        assert len((tmp_path / "out.csv").read_text().splitlines()) == 11
+        lines = (tmp_path / "out.ndjson").read_text().splitlines()
+        assert json.loads(lines[-1]) == {"id": 9, "name": "row 9"}
+        assert (tmp_path / "out.db").stat().st_size > 0
+
+    def test_failing_target_stops_all_and_removes_files(self, tmp_path: Path):
+        targets = [
+            ExportTarget(CsvExporter(), tmp_path / "out.csv"),
+            ExportTarget(FailingExporter(), tmp_path / "bad.csv"),
+            ExportTarget(NdjsonExporter(), tmp_path / "out.ndjson"),
+        ]
+
+        with pytest.raises(ExportError, match="disk full"):
+            ExportTee(targets, buffer_batches=1).run(["id", "name"], _batches([], n=1000))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_source_error_removes_every_file(self, tmp_path: Path):
+        def batches():
+            yield [(1,)]
+            raise ExportError("connection lost")
+
+        targets = [
+            ExportTarget(CsvExporter(), tmp_path / "out.csv"),
+            ExportTarget(NdjsonExporter(), tmp_path / "out.ndjson"),
+        ]
+
+        with pytest.raises(ExportError, match="connection lost"):
+            ExportTee(targets).run(["id"], batches())
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_single_target(self, tmp_path: Path):
+        path = tmp_path / "out.csv"
+
+        count = ExportTee([ExportTarget(CsvExporter(), path)]).run(["id"], [[(1,), (2,)]])
+
+        assert count == 2
+        assert path.read_text().splitlines() == ["id", "1", "2"]
+
+    def test_needs_a_target(self):
+        with pytest.raises(ValueError):
+            ExportTee([])
+
+    def test_write_bytes_to_every_target(self, tmp_path: Path):
+        targets = [
+            ExportTarget(CsvExporter(), tmp_path / "a.csv"),
+            ExportTarget(CsvExporter(), tmp_path / "b.csv"),
+        ]
+
+        ExportTee(targets).write_bytes([b"id\n", b"1\n"])
+
+        assert (tmp_path / "a.csv").read_bytes() == (tmp_path / "b.csv").read_bytes() == b"id\n1\n"
+
+    def test_write_bytes_failure_removes_files(self, tmp_path: Path):
+        def chunks():
+            yield b"id\n"
+            raise ExportError("connection lost")
+
+        with pytest.raises(ExportError):
+            ExportTee([ExportTarget(CsvExporter(), tmp_path / "a.csv")]).write_bytes(chunks())
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,86 @@
+"""Tests for multi-connection fan-out."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from qry.application.fan_out import FanOut, FanOutItem, merge_fan_out
+from qry.domains.connection.models import ConnectionConfig, DatabaseType
+from qry.domains.database.sqlite import SQLiteAdapter
+from qry.shared.models import QueryResult
+
+
+@pytest.fixture
+def shards(tmp_path: Path) -> list[ConnectionConfig]:
+    configs = []
+    for i in range(3):
+        path = tmp_path / f"shard{i}.db"
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE t (v INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(i,)] * (i + 1))
+        conn.commit()
+        conn.close()
+        configs.append(ConnectionConfig(f"shard{i}", DatabaseType.SQLITE, path=str(path)))
+    return configs
+
+
+class TestFanOut:
+    def test_one_item_per_target(self, shards: list[ConnectionConfig]):
+        items = list(FanOut(max_connections=2).stream("SELECT COUNT(*) FROM t", shards))
+
+        counts = {item.connection_name: item.result.rows for item in items}
+        assert counts == {"shard0": [(1,)], "shard1": [(2,)], "shard2": [(3,)]}
+
+    def test_failed_target_is_isolated(self, shards: list[ConnectionConfig], tmp_path: Path):
+        broken = ConnectionConfig("broken", DatabaseType.SQLITE, path=str(tmp_path / "x" / "y.db"))
+
+        items = list(FanOut().stream("SELECT COUNT(*) FROM t", [broken, *shards]))
+
+        errors = {item.connection_name: item.result.error for item in items}
+        assert errors["broken"] is not None
+        assert errors["shard0"] is None
+
+    def test_slow_target_times_out(self, shards: list[ConnectionConfig]):
+        release = threading.Event()
+
+        class SlowAdapter(SQLiteAdapter):
+            def execute(self, sql, params=None):
+                release.wait(5)
+                return super().execute(sql, params)
+
+        def open_adapter(config: ConnectionConfig) -> SQLiteAdapter:
+            if config.name == "shard1":
+                return SlowAdapter(config.path)
+            return SQLiteAdapter(config.path)
+
+        fan_out = FanOut(open_adapter, max_connections=3, timeout_ms=100)
+        try:
+            items = list(fan_out.stream("SELECT 1", shards))
+        finally:
+            release.set()
+
+        by_name = {item.connection_name: item.result for item in items}
+        assert len(items) == 3
+        assert by_name["shard1"].error.startswith("Timed out")
+        assert by_name["shard0"].is_success and by_name["shard2"].is_success
+
+
+class TestMergeFanOut:
+    def test_prefixes_connection(self):
+        items = [
+            FanOutItem(0, "a", QueryResult(columns=["v"], rows=[(1,), (2,)])),
+            FanOutItem(1, "b", QueryResult(error="down")),
+            FanOutItem(2, "c", QueryResult(columns=["w"], rows=[(3,)])),
+        ]
+
+        result = merge_fan_out(items)
+
+        assert result.columns == ["connection", "v", "fan_out_ms", "fan_out_error"]
+        assert [(row[0], row[1], row[3]) for row in result.rows] == [
+            ("a", 1, None),
+            ("a", 2, None),
+            ("b", None, "down"),
+            ("c", None, "Different columns: w"),
+        ]
@@ -0,0 +1,165 @@
+"""Tests for ImportJob."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from qry.application.import_job import ImportJob, ImportProgress, default_reject_path
+from qry.domains.connection.models import DatabaseType
+from qry.domains.database.sqlite import SQLiteAdapter
+from qry.shared.exceptions import DatabaseError, DataImportError, OperationCancelled
+
+
+@pytest.fixture
+def adapter(tmp_path: Path):
+    adapter = SQLiteAdapter(tmp_path / "target.db")
+    adapter.connect()
+    yield adapter
+    adapter.disconnect()
+
+
+def _rows(adapter: SQLiteAdapter, sql: str) -> list[tuple]:
+    result = adapter.execute(sql)
+    assert result.is_success, result.error
+    return result.rows
+
+
+class TestImportJob:
+    def test_creates_table_with_inferred_types(self, tmp_path: Path, adapter: SQLiteAdapter):
+        path = tmp_path / "orders.csv"
+        path.write_text("id,total,placed\n1,9.5,2024-01-02\n2,,2024-01-03\n")
+        reports: list[ImportProgress] = []
+        job = ImportJob(
+            path, "orders", DatabaseType.SQLITE, on_progress=reports.append, interval_seconds=0
+        )
+
+        count = job.run(adapter)
+
+        assert count == 2
+        assert _rows(adapter, "SELECT * FROM orders ORDER BY id") == [
+            (1, 9.5, "2024-01-02"),
+            (2, None, "2024-01-03"),
+        ]
+        assert [c.data_type for c in adapter.get_columns("orders")] == ["INTEGER", "REAL", "TEXT"]
+        assert reports[-1].rows == 2
+        assert reports[-1].bytes_read == reports[-1].total_bytes == path.stat().st_size
+
+    def test_bad_rows_go_to_reject_file(self, tmp_path: Path, adapter: SQLiteAdapter):
+        path = tmp_path / "data.csv"
+        path.write_text("id,name\n1,a\n2\nx,b\n3,c\n")
+        reject_path = default_reject_path(path)
+        job = ImportJob(
+            path, "data", DatabaseType.SQLITE, reject_path=reject_path, sample_rows=1, batch_size=1
+        )
+
+        count = job.run(adapter)
+
+        assert count == 2
+        assert job.progress.rejected == 2
+        assert _rows(adapter, "SELECT id FROM data ORDER BY id") == [(1,), (3,)]
+        assert reject_path.name == "data.csv.rejects.csv"
+        assert reject_path.read_text().splitlines()[1:] == [
+            '3,"expected 2 fields, found 1",2',
+            "4,id: not an integer: 'x',\"x,b\"",
+        ]
+
+    def test_appends_to_existing_table(self, tmp_path: Path, adapter: SQLiteAdapter):
+        adapter.execute("CREATE TABLE people (name TEXT, id INTEGER, note TEXT)")
+        path = tmp_path / "people.ndjson"
+        path.write_text('{"id": 1, "name": "Ann"}\n')
+
+        ImportJob(path, "people", DatabaseType.SQLITE).run(adapter)
+
+        assert _rows(adapter, "SELECT * FROM people") == [("Ann", 1, None)]
+
+    def test_parallel_workers_keep_file_order(self, tmp_path: Path, adapter: SQLiteAdapter):
+        path = tmp_path / "data.csv"
+        lines = [f'{i},"note\n{i}"' if i % 7 == 0 else f"{i},x" for i in range(200)]
+        path.write_text("id,note\n" + "\n".join(lines) + "\nbad\n")
+        reject_path = default_reject_path(path)
+        job = ImportJob(
+            path,
+            "data",
+            DatabaseType.SQLITE,
+            reject_path=reject_path,
+            batch_size=16,
+            workers=2,
+            chunk_bytes=256,
+        )
+
+        count = job.run(adapter)
+
+        assert count == 200
+        assert _rows(adapter, "SELECT id FROM data") == [(i,) for i in range(200)]
+        assert _rows(adapter, "SELECT note FROM data WHERE id = 14") == [("note\n14",)]
+        assert job.progress.bytes_read == path.stat().st_size
+        line = len(path.read_text().splitlines())
+        assert reject_path.read_text().splitlines()[1] == f'{line},"expected 2 fields, found 1",bad'
+
+    def test_parallel_workers_read_past_a_stray_quote(self, tmp_path: Path, adapter: SQLiteAdapter):
+        path = tmp_path / "data.csv"
+        lines = [f'{i},"note\n{i}"' if i % 6 == 0 else f"{i},5'11\"" for i in range(200)]
+        path.write_text("id,note\n" + "\n".join(lines) + "\n")
+        reject_path = default_reject_path(path)
+        job = ImportJob(
+            path, "data", DatabaseType.SQLITE, reject_path=reject_path, workers=2, chunk_bytes=64
+        )
+
+        count = job.run(adapter)
+
+        assert count == 200
+        assert _rows(adapter, "SELECT id FROM data") == [(i,) for i in range(200)]
+        assert _rows(adapter, "SELECT note FROM data WHERE id IN (11, 12)") == [
+            ("5'11\"",),
+            ("note\n12",),
+        ]
+        assert job.progress.rejected == 0
+        assert not reject_path.exists()
+
+    def test_cancel_rolls_back_and_drops_created_table(
+        self, tmp_path: Path, adapter: SQLiteAdapter
+    ):
+        path = tmp_path / "data.csv"
+        path.write_text("id\n" + "".join(f"{i}\n" for i in range(10)) + "x\n")
+        job = ImportJob(
+            path,
+            "data",
+            DatabaseType.SQLITE,
+            on_progress=lambda progress: job.cancel(),
+            interval_seconds=0,
+            batch_size=3,
+        )
+
+        with pytest.raises(OperationCancelled):
+            job.run(adapter)
+
+        assert all(table.name != "data" for table in adapter.get_tables())
+        assert not default_reject_path(path).exists()
+
+    def test_failure_keeps_existing_table(self, tmp_path: Path, adapter: SQLiteAdapter):
+        adapter.execute("CREATE TABLE data (id INTEGER NOT NULL)")
+        adapter.execute("INSERT INTO data VALUES (1)")
+        path = tmp_path / "data.csv"
+        path.write_text('id\n2\n""\n')
+
+        with pytest.raises(DatabaseError, match="Import into data failed"):
+            ImportJob(path, "data", DatabaseType.SQLITE).run(adapter)
+
+        assert _rows(adapter, "SELECT id FROM data") == [(1,)]
+
+    def test_unknown_file_type(self, tmp_path: Path, adapter: SQLiteAdapter):
+        with pytest.raises(DataImportError):
+            ImportJob(tmp_path / "data.xlsx", "data", DatabaseType.SQLITE).run(adapter)
+
+    def test_imported_file_is_readable_by_sqlite(self, tmp_path: Path, adapter: SQLiteAdapter):
+        path = tmp_path / "flags.tsv"
+        path.write_text("flag\tat\ntrue\t2024-01-02 03:04:05\n")
+
+        ImportJob(path, "flags", DatabaseType.SQLITE).run(adapter)
+        adapter.disconnect()
+
+        with sqlite3.connect(tmp_path / "target.db") as conn:
+            assert conn.execute("SELECT flag, at FROM flags").fetchall() == [
+                (1, "2024-01-02 03:04:05")
+            ]
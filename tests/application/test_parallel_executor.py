@@ -0,0 +1,73 @@
+"""Tests for the parallel executor."""
+
+import threading
+from pathlib import Path
+
+from qry.application.parallel_executor import ParallelExecutor
+from qry.domains.database.sqlite import SQLiteAdapter
+
+
+class TestParallelExecutor:
+    def test_results_in_job_order(self, sample_sqlite_db: Path):
+        executor = ParallelExecutor(lambda: SQLiteAdapter(sample_sqlite_db), max_connections=3)
+        jobs = [(f"SELECT {i}", None) for i in range(8)]
+
+        results = executor.run(jobs)
+
+        assert [r.rows for r in results] == [[(i,)] for i in range(8)]
+
+    def test_failure_is_isolated(self, sample_sqlite_db: Path):
+        executor = ParallelExecutor(lambda: SQLiteAdapter(sample_sqlite_db))
+
+        results = executor.run([("SELECT 1", None), ("SELECT * FROM missing", None)])
+
+        assert results[0].is_success
+        assert not results[1].is_success
+
+    def test_runs_concurrently_within_connection_limit(self, sample_sqlite_db: Path):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        class CountingAdapter(SQLiteAdapter):
+            def execute(self, sql, params=None):
+                nonlocal active, peak
+                with lock:
+                    active += 1
+                    peak = max(peak, active)
+                barrier.wait()
+                try:
+                    return super().execute(sql, params)
+                finally:
+                    with lock:
+                        active -= 1
+
+        executor = ParallelExecutor(lambda: CountingAdapter(sample_sqlite_db), max_connections=2)
+
+        results = executor.run([(f"SELECT {i}", None) for i in range(4)])
+
+        assert all(r.is_success for r in results)
+        assert peak == 2
+
+    def test_failed_connection_is_closed(self, sample_sqlite_db: Path):
+        opened: list[SQLiteAdapter] = []
+
+        class FailingAdapter(SQLiteAdapter):
+            def execute(self, sql, params=None):
+                if sql == "boom":
+                    raise RuntimeError("connection lost")
+                return super().execute(sql, params)
+
+        def open_adapter() -> SQLiteAdapter:
+            opened.append(FailingAdapter(sample_sqlite_db))
+            return opened[-1]
+
+        executor = ParallelExecutor(open_adapter, max_connections=1)
+
+        results = executor.run([("boom", None), ("SELECT 1", None)])
+
+        assert results[0].error == "connection lost"
+        assert results[1].rows == [(1,)]
+        assert len(opened) == 2
+        assert not any(adapter.is_connected() for adapter in opened)
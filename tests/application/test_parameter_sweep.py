@@ -0,0 +1,81 @@
+"""Tests for the parameter sweep executor."""
+
+import threading
+from pathlib import Path
+
+from qry.application.parameter_sweep import ParameterSweep, SweepItem, combine_sweep
+from qry.domains.database.sqlite import SQLiteAdapter
+from qry.shared.models import QueryResult
+
+
+class TestParameterSweep:
+    def test_runs_every_parameter_set(self, sample_sqlite_db: Path):
+        sweep = ParameterSweep(lambda: SQLiteAdapter(sample_sqlite_db), max_connections=2)
+        param_sets = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+        items = list(sweep.stream("SELECT name FROM users WHERE id = :id", param_sets))
+
+        by_index = {item.index: item.result.rows for item in items}
+        assert by_index == {0: [("Alice",)], 1: [("Bob",)], 2: []}
+
+    def test_failure_is_isolated(self, sample_sqlite_db: Path):
+        sweep = ParameterSweep(lambda: SQLiteAdapter(sample_sqlite_db))
+        sql = "SELECT name FROM users WHERE id = :id"
+
+        items = list(sweep.stream(sql, [{"id": 1}, {"id": [2]}, {"id": 2}]))
+
+        errors = {item.index: item.result.error for item in items}
+        assert errors[0] is None and errors[2] is None
+        assert errors[1] is not None
+
+    def test_connection_limit(self, sample_sqlite_db: Path):
+        opened: list[SQLiteAdapter] = []
+        lock = threading.Lock()
+
+        def open_adapter() -> SQLiteAdapter:
+            with lock:
+                opened.append(SQLiteAdapter(sample_sqlite_db))
+                return opened[-1]
+
+        sweep = ParameterSweep(open_adapter, max_connections=2)
+        items = list(sweep.stream("SELECT :n", [{"n": i} for i in range(10)]))
+
+        assert len(items) == 10
+        assert 1 <= len(opened) <= 2
+        assert not any(adapter.is_connected() for adapter in opened)
+
+    def test_failed_connect_is_reported_per_item(self, tmp_path: Path):
+        missing = tmp_path / "missing" / "db.sqlite"
+        sweep = ParameterSweep(lambda: SQLiteAdapter(missing), max_connections=1)
+
+        items = list(sweep.stream("SELECT :n", [{"n": 1}, {"n": 2}]))
+
+        assert len(items) == 2
+        assert all(item.result.error for item in items)
+
+
+class TestCombineSweep:
+    def test_rows_in_parameter_order(self):
+        items = [
+            SweepItem(1, {"id": 2}, QueryResult(columns=["name"], rows=[("Bob",)])),
+            SweepItem(0, {"id": 1}, QueryResult(columns=["name"], rows=[("Alice",)])),
+        ]
+
+        result = combine_sweep(items, ["id"])
+
+        assert result.columns == [":id", "name", "sweep_ms", "sweep_error"]
+        assert [row[:2] for row in result.rows] == [(1, "Alice"), (2, "Bob")]
+        assert result.row_count == 2
+
+    def test_failed_and_empty_items_keep_a_row(self):
+        items = [
+            SweepItem(0, {"id": 1}, QueryResult(columns=["name"], rows=[])),
+            SweepItem(1, {"id": 2}, QueryResult(error="boom")),
+        ]
+
+        result = combine_sweep(items, ["id"])
+
+        assert [(row[0], row[1], row[3]) for row in result.rows] == [
+            (1, None, None),
+            (2, None, "boom"),
+        ]
@@ -1,11 +1,21 @@
 """Tests for QueryUseCase."""
 
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from qry.application.export_job import ExportJob
+from qry.application.export_tee import ExportTarget
+from qry.application.import_job import ImportJob
 from qry.application.query_use_case import QueryUseCase
+from qry.domains.connection.models import DatabaseType
 from qry.domains.database.sqlite import SQLiteAdapter
+from qry.domains.export.csv import CsvExporter
+from qry.domains.export.json import JsonExporter
+from qry.domains.query.models import ErrorPolicy
+from qry.shared.exceptions import DatabaseError, QueryError
+from qry.shared.models import QueryResult
 
 
 class TestQueryUseCase:
@@ -51,6 +61,34 @@ class TestQueryUseCase:
 
         assert "SELECT * FROM nonexistent" not in queries
 
+    def test_execute_with_params(self, use_case: QueryUseCase):
+        result = use_case.execute("SELECT name FROM users WHERE id = :id", {"id": 1})
+
+        assert result.rows == [("Alice",)]
+        assert use_case.get_history()[0].query == "SELECT name FROM users WHERE id = :id"
+
+    def test_execute_missing_param(self, use_case: QueryUseCase):
+        result = use_case.execute("SELECT * FROM users WHERE id = :id AND name = :name", {"id": 1})
+
+        assert result.error == "Missing value for parameter: name"
+
+    def test_execute_multi_shares_params(self, use_case: QueryUseCase):
+        results = use_case.execute_multi(
+            "SELECT name FROM users WHERE id = :id; SELECT 1; SELECT :id", {"id": 2}
+        )
+
+        assert [r.rows for r in results] == [[("Bob",)], [(1,)], [(2,)]]
+
+    def test_get_query_stats(self, use_case: QueryUseCase):
+        use_case.execute("SELECT * FROM users WHERE id = 1")
+        use_case.execute("SELECT * FROM users WHERE id = 2")
+        use_case.execute("SELECT * FROM nonexistent WHERE id = 3")
+
+        stats = use_case.get_query_stats()
+
+        assert [s.count for s in stats] == [2]
+        assert stats[0].query == "SELECT * FROM users WHERE id = 2"
+
     def test_is_running_during_query(self, use_case: QueryUseCase):
         # Note: Can't easily test this without threading
         assert not use_case.is_running
@@ -98,12 +136,12 @@ class TestQueryUseCase:
 
     def test_search_history_with_limit(self, use_case: QueryUseCase):
         for i in range(10):
-            use_case.execute(f"SELECT {i} FROM users")
+            use_case.execute(f"SELECT {i} AS c{i} FROM users")
 
         results = use_case.search_history("users", limit=3)
 
         assert len(results) == 3
-        assert results[0].query == "SELECT 9 FROM users"
+        assert results[0].query == "SELECT 9 AS c9 FROM users"
 
     def test_clear_history(self, use_case: QueryUseCase):
         use_case.execute("SELECT * FROM users")
@@ -162,3 +200,244 @@ class TestQueryUseCase:
         # Should still work after invalidation
         completions = use_case.get_completions("u", 1)
         assert len(completions) > 0
+
+    def test_execute_multi_sends_statements_together(self, tmp_config_dir: Path):
+        adapter = MagicMock()
+        adapter.execute_many.return_value = [QueryResult(), QueryResult()]
+        use_case = QueryUseCase(adapter=adapter)
+
+        results = use_case.execute_multi("SELECT 1; SELECT 2")
+
+        adapter.execute_many.assert_called_once_with([("SELECT 1", None), ("SELECT 2", None)])
+        assert len(results) == 2
+
+    def test_execute_multi_stops_at_missing_param(self, use_case: QueryUseCase):
+        results = use_case.execute_multi("SELECT :a; SELECT :b; SELECT 3", {"a": 1})
+
+        assert results[0].rows == [(1,)]
+        assert results[1].error == "Missing value for parameter: b"
+        assert len(results) == 2
+
+    def test_execute_parallel_keeps_order(self, use_case: QueryUseCase, sample_sqlite_db: Path):
+        use_case.adapter_factory = lambda: SQLiteAdapter(sample_sqlite_db)
+
+        results = use_case.execute_parallel(
+            "SELECT COUNT(*) FROM users; SELECT * FROM missing; SELECT title FROM posts"
+        )
+
+        assert results[0].rows == [(2,)]
+        assert not results[1].is_success
+        assert results[2].rows == [("Hello World",)]
+
+    def test_execute_parallel_falls_back_for_writes(
+        self, use_case: QueryUseCase, adapter: SQLiteAdapter
+    ):
+        use_case.adapter_factory = MagicMock()
+
+        results = use_case.execute_parallel("DELETE FROM posts; SELECT COUNT(*) FROM posts")
+
+        use_case.adapter_factory.assert_not_called()
+        assert results[1].rows == [(0,)]
+
+    def test_runs_in_parallel(self, use_case: QueryUseCase, sample_sqlite_db: Path):
+        assert not use_case.runs_in_parallel("SELECT 1; SELECT 2")
+
+        use_case.adapter_factory = lambda: SQLiteAdapter(sample_sqlite_db)
+
+        assert use_case.runs_in_parallel("SELECT 1; SELECT 2")
+        assert not use_case.runs_in_parallel("SELECT 1")
+        assert not use_case.runs_in_parallel("DELETE FROM posts; SELECT 1")
+        assert not use_case.runs_in_parallel("SELECT :a; SELECT 2", {"b": 1})
+
+    def test_sweep_combines_results(self, use_case: QueryUseCase, sample_sqlite_db: Path):
+        use_case.adapter_factory = lambda: SQLiteAdapter(sample_sqlite_db)
+
+        *_, result = use_case.stream_sweep(
+            "SELECT name FROM users WHERE id = :id", [{"id": "2"}, {"id": "1"}]
+        )
+
+        assert result.is_success
+        assert result.columns[:2] == [":id", "name"]
+        assert [row[:2] for row in result.rows] == [("2", "Bob"), ("1", "Alice")]
+
+    def test_stream_sweep_yields_partial_results(
+        self, use_case: QueryUseCase, sample_sqlite_db: Path
+    ):
+        use_case.adapter_factory = lambda: SQLiteAdapter(sample_sqlite_db)
+        param_sets = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+
+        results = list(
+            use_case.stream_sweep("SELECT name FROM users WHERE id = :id", param_sets, interval=0)
+        )
+
+        assert [r.row_count for r in results] == [1, 2, 3]
+        assert [row[:2] for row in results[-1].rows] == [("1", "Alice"), ("2", "Bob"), ("3", None)]
+        assert use_case.get_history() == []
+
+    def test_check_sweep(self, use_case: QueryUseCase, sample_sqlite_db: Path):
+        use_case.adapter_factory = lambda: SQLiteAdapter(sample_sqlite_db)
+
+        assert use_case.check_sweep("SELECT :a", [{"a": "1"}]) is None
+        assert use_case.check_sweep("SELECT :a", []) == "No parameter sets to run"
+
+    def test_sweep_missing_param(self, use_case: QueryUseCase, sample_sqlite_db: Path):
+        use_case.adapter_factory = lambda: SQLiteAdapter(sample_sqlite_db)
+
+        results = list(use_case.stream_sweep("SELECT :a, :b", [{"a": "1", "b": "2"}, {"a": "1"}]))
+
+        assert [r.error for r in results] == ["Missing value for parameter: b"]
+
+    def test_sweep_without_factory(self, use_case: QueryUseCase):
+        results = list(use_case.stream_sweep("SELECT :a", [{"a": "1"}]))
+
+        assert [r.is_success for r in results] == [False]
+
+    def test_export_streams_rows(self, use_case: QueryUseCase, tmp_path: Path):
+        path = tmp_path / "users.csv"
+
+        sql = "SELECT name FROM users WHERE id >= :id ORDER BY id"
+
+        count = use_case.export(sql, ExportJob([ExportTarget(CsvExporter(), path)]), {"id": 1})
+
+        assert count == 2
+        assert path.read_text().splitlines() == ["name", "Alice", "Bob"]
+        # The caller records it, on the thread the history belongs to
+        assert use_case.get_history() == []
+
+    def test_export_error_leaves_no_file(self, use_case: QueryUseCase, tmp_path: Path):
+        path = tmp_path / "out.csv"
+
+        job = ExportJob([ExportTarget(CsvExporter(), path)])
+
+        with pytest.raises(QueryError):
+            use_case.export("SELECT * FROM nonexistent", job)
+
+        assert not path.exists()
+        assert not use_case.is_running
+
+    def test_export_uses_extra_connection(
+        self, use_case: QueryUseCase, sample_sqlite_db: Path, tmp_path: Path
+    ):
+        opened: list[SQLiteAdapter] = []
+
+        def open_adapter() -> SQLiteAdapter:
+            opened.append(SQLiteAdapter(sample_sqlite_db))
+            return opened[-1]
+
+        use_case.adapter_factory = open_adapter
+
+        job = ExportJob([ExportTarget(CsvExporter(), tmp_path / "u.csv")])
+        count = use_case.export("SELECT * FROM users", job)
+
+        assert count == 2
+        assert len(opened) == 1
+        assert not opened[0].is_connected()
+
+    def test_export_csv_uses_database_copy(self, use_case: QueryUseCase, tmp_path: Path):
+        copy_csv = MagicMock(return_value=iter([[b"name\n"], [b"Alice\n", b"Bob\n"]]))
+        use_case.adapter.copy_csv = copy_csv  # type: ignore[method-assign]
+        path = tmp_path / "users.csv"
+        job = ExportJob([ExportTarget(CsvExporter(), path)])
+
+        count = use_case.export("SELECT name FROM users", job)
+
+        assert count == 2
+        assert path.read_bytes() == b"name\nAlice\nBob\n"
+        copy_csv.assert_called_once_with("SELECT name FROM users", None)
+
+    def test_export_other_formats_skip_copy(self, use_case: QueryUseCase, tmp_path: Path):
+        use_case.adapter.copy_csv = MagicMock()  # type: ignore[method-assign]
+        targets = [
+            ExportTarget(CsvExporter(), tmp_path / "users.csv"),
+            ExportTarget(JsonExporter(), tmp_path / "users.json"),
+        ]
+
+        count = use_case.export("SELECT name FROM users", ExportJob(targets))
+
+        assert count == 2
+        use_case.adapter.copy_csv.assert_not_called()
+
+    def test_import_file(self, use_case: QueryUseCase, tmp_path: Path):
+        path = tmp_path / "users.csv"
+        path.write_text("id,name,email\n3,Carol,\n")
+        job = ImportJob(path, "users", DatabaseType.SQLITE)
+
+        count = use_case.import_file(job)
+
+        assert count == 1
+        assert use_case.execute("SELECT name FROM users WHERE id = 3").rows == [("Carol",)]
+        assert not use_case.is_running
+
+    def test_can_export(self, use_case: QueryUseCase):
+        assert use_case.can_export("SELECT * FROM users;")
+        assert not use_case.can_export("SELECT 1; SELECT 2")
+        assert not use_case.can_export("DELETE FROM users")
+
+    def test_execute_batch_commits_once(self, use_case: QueryUseCase, adapter: SQLiteAdapter):
+        script = ";\n".join(
+            f"INSERT INTO posts (user_id, title) VALUES ({i}, 't')" for i in range(3, 8)
+        )
+
+        results = use_case.execute_batch(script)
+
+        assert len(results) == 5
+        assert all(r.is_success for r in results)
+        assert adapter.execute("SELECT COUNT(*) FROM posts").rows == [(6,)]
+        assert use_case.get_history()[0].query == script
+
+    def test_execute_batch_stop_rolls_back(self, use_case: QueryUseCase, adapter: SQLiteAdapter):
+        script = "DELETE FROM posts; INSERT INTO missing VALUES (1); DELETE FROM users"
+
+        results = use_case.execute_batch(script)
+
+        # The DELETE ran but was rolled back, so only the failure is reported
+        assert [r.is_success for r in results] == [False]
+        assert "missing" in str(results[0].error)
+        assert adapter.execute("SELECT COUNT(*) FROM posts").rows == [(1,)]
+        assert adapter.execute("SELECT COUNT(*) FROM users").rows == [(2,)]
+
+    def test_execute_batch_failed_commit_reports_only_the_error(
+        self, use_case: QueryUseCase, adapter: SQLiteAdapter
+    ):
+        with patch.object(adapter, "commit", side_effect=DatabaseError("disk full")):
+            results = use_case.execute_batch("DELETE FROM posts", on_error=ErrorPolicy.CONTINUE)
+
+        assert [r.error for r in results] == ["disk full"]
+        assert adapter.execute("SELECT COUNT(*) FROM posts").rows == [(1,)]
+
+    def test_execute_batch_continue_skips_failed_statement(
+        self, use_case: QueryUseCase, adapter: SQLiteAdapter
+    ):
+        script = "DELETE FROM posts; INSERT INTO missing VALUES (1); DELETE FROM users"
+
+        results = use_case.execute_batch(script, on_error=ErrorPolicy.CONTINUE)
+
+        assert [r.is_success for r in results] == [True, False, True]
+        assert adapter.execute("SELECT COUNT(*) FROM posts").rows == [(0,)]
+        assert adapter.execute("SELECT COUNT(*) FROM users").rows == [(0,)]
+
+    def test_execute_batch_continue_rolls_back_chunk(
+        self, use_case: QueryUseCase, adapter: SQLiteAdapter
+    ):
+        script = (
+            "DELETE FROM posts; INSERT INTO missing VALUES (1);"
+            "DELETE FROM users WHERE id = 1; DELETE FROM users WHERE id = 2"
+        )
+
+        results = use_case.execute_batch(script, savepoint_every=2, on_error=ErrorPolicy.CONTINUE)
+
+        assert [r.is_success for r in results] == [False, True, True]
+        assert adapter.execute("SELECT COUNT(*) FROM posts").rows == [(1,)]
+        assert adapter.execute("SELECT COUNT(*) FROM users").rows == [(0,)]
+
+    def test_execute_batch_continue_uses_savepoints_when_errors_abort(self, tmp_config_dir: Path):
+        adapter = MagicMock()
+        adapter.aborts_transaction_on_error = True
+        adapter.execute.side_effect = [QueryResult(error="boom"), QueryResult()]
+        use_case = QueryUseCase(adapter=adapter)
+
+        results = use_case.execute_batch("SELECT 1; SELECT 2", on_error=ErrorPolicy.CONTINUE)
+
+        assert [r.is_success for r in results] == [False, True]
+        adapter.rollback_to_savepoint.assert_called_once_with("qry_batch_0")
+        adapter.commit.assert_called_once()
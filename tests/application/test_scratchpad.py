@@ -0,0 +1,137 @@
+"""Tests for the scratchpad of pinned results."""
+
+import datetime
+from decimal import Decimal
+
+import pytest
+
+from qry.application.scratchpad import Scratchpad
+from qry.shared.exceptions import DatabaseError, ScratchpadError
+from qry.shared.models import QueryResult
+
+
+def _result(columns: list[str], rows: list[tuple]) -> QueryResult:
+    return QueryResult(columns=columns, rows=rows, row_count=len(rows))
+
+
+@pytest.fixture
+def scratchpad():
+    pad = Scratchpad()
+    yield pad
+    pad.close()
+
+
+class TestScratchpad:
+    def test_pin_declares_types_from_values(self, scratchpad: Scratchpad):
+        result = _result(
+            ["id", "price", "total", "day", "name", "mixed"],
+            [
+                (1, 1.5, Decimal("2.50"), datetime.date(2024, 1, 2), "a", 1),
+                (2, 2, None, None, None, "x"),
+            ],
+        )
+
+        pinned = scratchpad.pin("orders", result, source="prod")
+
+        assert (pinned.name, pinned.rows, pinned.source) == ("orders", 2, "prod")
+        types = scratchpad.adapter.execute("SELECT name, type FROM pragma_table_info('orders')")
+        assert types.rows == [
+            ("id", "INTEGER"),
+            ("price", "REAL"),
+            ("total", "TEXT"),
+            ("day", "TEXT"),
+            ("name", "TEXT"),
+            ("mixed", "TEXT"),
+        ]
+        rows = scratchpad.adapter.execute("SELECT id, price, total, name FROM orders ORDER BY id")
+        assert rows.rows == [(1, 1.5, "2.50", "a"), (2, 2.0, None, None)]
+
+    def test_repeated_column_names_are_numbered(self, scratchpad: Scratchpad):
+        scratchpad.pin("joined", _result(["id", "id"], [(1, 2)]))
+
+        result = scratchpad.adapter.execute("SELECT * FROM joined")
+
+        assert len(set(result.columns)) == 2
+        assert result.rows == [(1, 2)]
+
+    def test_pin_replaces_table_of_same_name(self, scratchpad: Scratchpad):
+        scratchpad.pin("t", _result(["a"], [(1,), (2,)]))
+        scratchpad.pin("t", _result(["b"], [("x",)]))
+
+        assert scratchpad.adapter.execute("SELECT * FROM t").rows == [("x",)]
+        assert [(table.name, table.rows) for table in scratchpad.pinned] == [("t", 1)]
+
+    def test_pin_replaces_table_whose_name_differs_in_case(self, scratchpad: Scratchpad):
+        scratchpad.pin("A", _result(["a"], [(1,)]))
+        scratchpad.pin("a", _result(["b"], [("x",)]))
+
+        assert [table.name for table in scratchpad.pinned] == ["a"]
+        scratchpad.unpin("A")
+        assert scratchpad.pinned == []
+
+    def test_join_results_pinned_from_different_connections(self, scratchpad: Scratchpad):
+        scratchpad.pin("users", _result(["id", "name"], [(1, "Alice"), (2, "Bob")]), "crm")
+        scratchpad.pin("orders", _result(["user_id", "total"], [(1, 10), (1, 5), (2, 7)]), "shop")
+
+        result = scratchpad.adapter.execute(
+            "SELECT name, sum(total) FROM users JOIN orders ON orders.user_id = users.id "
+            "GROUP BY name ORDER BY name"
+        )
+
+        assert result.rows == [("Alice", 15), ("Bob", 7)]
+
+    def test_next_name_skips_pinned_names(self, scratchpad: Scratchpad):
+        assert scratchpad.next_name() == "result_1"
+
+        scratchpad.pin("result_2", _result(["a"], []))
+
+        assert scratchpad.next_name() == "result_3"
+
+    def test_unpin(self, scratchpad: Scratchpad):
+        scratchpad.pin("t", _result(["a"], [(1,)]))
+
+        scratchpad.unpin("t")
+
+        assert scratchpad.pinned == []
+        assert scratchpad.adapter.execute("SELECT * FROM t").error
+        with pytest.raises(ScratchpadError, match="No pinned result"):
+            scratchpad.unpin("t")
+
+    @pytest.mark.parametrize(
+        ("name", "result", "message"),
+        [
+            (" ", _result(["a"], [(1,)]), "needs a table name"),
+            ("t", QueryResult(error="syntax error"), "Only results with columns"),
+            ("t", QueryResult(), "Only results with columns"),
+        ],
+    )
+    def test_pin_rejects(self, scratchpad: Scratchpad, name: str, result: QueryResult, message):
+        with pytest.raises(ScratchpadError, match=message):
+            scratchpad.pin(name, result)
+
+        assert scratchpad.pinned == []
+
+    def test_failed_insert_leaves_no_table(
+        self, scratchpad: Scratchpad, monkeypatch: pytest.MonkeyPatch
+    ):
+        def fail(*args):
+            raise DatabaseError("disk full")
+
+        monkeypatch.setattr(scratchpad.adapter, "bulk_insert", fail)
+
+        with pytest.raises(ScratchpadError, match="disk full"):
+            scratchpad.pin("t", _result(["a"], [(1,)]))
+
+        assert scratchpad.pinned == []
+        assert scratchpad.adapter.execute("SELECT * FROM t").error
+
+    def test_close_removes_the_database(self):
+        scratchpad = Scratchpad()
+        scratchpad.pin("t", _result(["a"], [(1,)]))
+        path = scratchpad.path
+        assert path.exists()
+
+        scratchpad.close()
+
+        assert not path.parent.exists()
+        assert scratchpad.pinned == []
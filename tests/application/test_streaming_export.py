@@ -0,0 +1,37 @@
+"""Tests for streaming export helpers."""
+
+import pytest
+
+from qry.application.streaming_export import split_batches
+from qry.shared.exceptions import ExportError, QueryError
+from qry.shared.models import QueryResult
+
+
+class TestSplitBatches:
+    def test_split_batches_yields_columns_and_rows(self):
+        batches = [
+            QueryResult(columns=["id"], rows=[(1,), (2,)]),
+            QueryResult(columns=["id"], rows=[(3,)]),
+        ]
+
+        columns, rows = split_batches(batches)
+
+        assert columns == ["id"]
+        assert list(rows) == [[(1,), (2,)], [(3,)]]
+
+    def test_split_batches_raises_on_query_error(self):
+        with pytest.raises(QueryError, match="no such table"):
+            split_batches([QueryResult(error="no such table: t")])
+
+    def test_split_batches_raises_on_error_mid_stream(self):
+        columns, rows = split_batches(
+            [QueryResult(columns=["id"], rows=[(1,)]), QueryResult(error="connection lost")]
+        )
+
+        assert next(rows) == [(1,)]
+        with pytest.raises(QueryError, match="connection lost"):
+            next(rows)
+
+    def test_split_batches_rejects_statement_without_rows(self):
+        with pytest.raises(ExportError):
+            split_batches([QueryResult(row_count=3)])
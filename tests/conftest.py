@@ -26,6 +26,9 @@ def tmp_config_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     monkeypatch.setattr(
         "qry.infrastructure.repositories.json_history.get_data_dir", lambda: data_dir
     )
+    monkeypatch.setattr(
+        "qry.infrastructure.repositories.sqlite_history.get_data_dir", lambda: data_dir
+    )
 
     return config_dir
 
@@ -0,0 +1,44 @@
+"""Tests for the reject file writer."""
+
+from pathlib import Path
+
+from qry.domains.data_import.rejects import RejectWriter
+from qry.domains.data_import.sources import RejectedRow
+
+
+class TestRejectWriter:
+    def test_writes_rows_with_reason(self, tmp_path: Path):
+        path = tmp_path / "rejects.csv"
+
+        with RejectWriter(path) as rejects:
+            rejects.write(RejectedRow(3, "a,b", "expected 1 fields, found 2"))
+
+        assert rejects.count == 1
+        assert path.read_text().splitlines() == [
+            "line,error,data",
+            '3,"expected 1 fields, found 2","a,b"',
+        ]
+
+    def test_no_file_without_rejects(self, tmp_path: Path):
+        path = tmp_path / "rejects.csv"
+
+        with RejectWriter(path):
+            pass
+
+        assert not path.exists()
+
+    def test_without_path_only_counts(self):
+        rejects = RejectWriter(None)
+
+        rejects.write(RejectedRow(1, "x", "bad"))
+
+        assert rejects.count == 1
+
+    def test_discard_removes_file(self, tmp_path: Path):
+        path = tmp_path / "rejects.csv"
+        rejects = RejectWriter(path)
+        rejects.write(RejectedRow(1, "x", "bad"))
+
+        rejects.discard()
+
+        assert not path.exists()
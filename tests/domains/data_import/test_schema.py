@@ -0,0 +1,110 @@
+"""Tests for import column types."""
+
+import datetime
+
+import pytest
+
+from qry.domains.connection.models import DatabaseType
+from qry.domains.data_import.schema import (
+    ColumnType,
+    RowConverter,
+    column_names,
+    create_table_sql,
+    infer_types,
+)
+
+
+class TestInferTypes:
+    def test_narrowest_type_per_column(self):
+        sample = [
+            ["1", "1.5", "true", "2024-01-02", "2024-01-02 03:04:05", "x"],
+            ["-2", "3", "FALSE", "2024-12-31", "2024-01-02T03:04:05+01:00", "1"],
+        ]
+
+        assert infer_types(sample, 6) == [
+            ColumnType.INTEGER,
+            ColumnType.FLOAT,
+            ColumnType.BOOLEAN,
+            ColumnType.DATE,
+            ColumnType.TIMESTAMP,
+            ColumnType.TEXT,
+        ]
+
+    def test_nulls_are_ignored_and_empty_columns_are_text(self):
+        assert infer_types([["1", None], [None, None]], 2) == [
+            ColumnType.INTEGER,
+            ColumnType.TEXT,
+        ]
+
+    @pytest.mark.parametrize("value", ["nan", "inf", "1_000", "0x10"])
+    def test_special_numbers_are_text(self, value: str):
+        assert infer_types([[value]], 1) == [ColumnType.TEXT]
+
+    def test_integer_beyond_64_bits_is_float(self):
+        assert infer_types([[str(2**63)]], 1) == [ColumnType.FLOAT]
+
+    def test_json_values(self):
+        sample = [[1, 1.5, True, {"a": 1}]]
+
+        assert infer_types(sample, 4) == [
+            ColumnType.INTEGER,
+            ColumnType.FLOAT,
+            ColumnType.BOOLEAN,
+            ColumnType.TEXT,
+        ]
+
+
+class TestRowConverter:
+    def test_converts_values(self):
+        types = [ColumnType.INTEGER, ColumnType.DATE, ColumnType.TEXT, ColumnType.BOOLEAN]
+        convert = RowConverter(["a", "b", "c", "d"], types)
+
+        assert convert(["7", "2024-01-02", ["x"], None]) == (
+            7,
+            datetime.date(2024, 1, 2),
+            '["x"]',
+            None,
+        )
+
+    def test_dates_as_text(self):
+        types = [ColumnType.DATE, ColumnType.TIMESTAMP]
+        convert = RowConverter(["a", "b"], types, dates_as_text=True)
+
+        assert convert([" 2024-01-02", "2024-01-02T03:04"]) == ("2024-01-02", "2024-01-02T03:04")
+        with pytest.raises(ValueError, match="a: not a date"):
+            convert(["2024-02-30x", None])
+
+    def test_error_names_the_column(self):
+        convert = RowConverter(["id", "price"], [ColumnType.INTEGER, ColumnType.FLOAT])
+
+        with pytest.raises(ValueError, match="price: not a number: 'abc'"):
+            convert(["1", "abc"])
+
+
+class TestColumnNames:
+    def test_blank_and_duplicate_names(self):
+        assert column_names(["id", "", "ID", " name "]) == ["id", "column_2", "ID_2", "name"]
+
+
+class TestCreateTableSql:
+    def test_postgres(self):
+        sql = create_table_sql(
+            "my table",
+            ["id", 'say "hi"'],
+            [ColumnType.INTEGER, ColumnType.TEXT],
+            DatabaseType.POSTGRES,
+        )
+
+        assert sql == 'CREATE TABLE "my table" ("id" bigint, "say ""hi""" text)'
+
+    def test_mysql(self):
+        sql = create_table_sql("t", ["at"], [ColumnType.TIMESTAMP], DatabaseType.MYSQL)
+
+        assert sql == "CREATE TABLE `t` (`at` DATETIME(6))"
+
+    def test_sqlite(self):
+        sql = create_table_sql(
+            "t", ["ok", "day"], [ColumnType.BOOLEAN, ColumnType.DATE], DatabaseType.SQLITE
+        )
+
+        assert sql == 'CREATE TABLE "t" ("ok" INTEGER, "day" TEXT)'
@@ -0,0 +1,184 @@
+"""Tests for data file sources."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from qry.domains.data_import.sources import (
+    CsvSource,
+    JsonSource,
+    NdjsonSource,
+    RejectedRow,
+    open_source,
+)
+from qry.shared.exceptions import DataImportError
+
+
+def _write(path: Path, text: str) -> Path:
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+class TestCsvSource:
+    def test_header_sample_and_items(self, tmp_path: Path):
+        path = _write(tmp_path / "data.csv", "id,name\n1,Alice\n2,\n")
+
+        with CsvSource(path, sample_rows=1) as source:
+            assert source.columns == ["id", "name"]
+            assert source.sample == [["1", "Alice"]]
+            items = list(source.items())
+
+        assert items == [(2, ["1", "Alice"]), (3, ["2", None])]
+
+    def test_wrong_field_count_is_rejected(self, tmp_path: Path):
+        path = _write(tmp_path / "data.csv", "a,b\n1,2\n\n3\n4,5\n")
+
+        with CsvSource(path) as source:
+            items = list(source.items())
+
+        assert items[0] == (2, ["1", "2"])
+        assert items[1] == RejectedRow(4, "3", "expected 2 fields, found 1")
+        assert items[2] == (5, ["4", "5"])
+
+    def test_quoted_newline_keeps_line_numbers(self, tmp_path: Path):
+        path = _write(tmp_path / "data.csv", 'a,b\n"x\ny",1\n2,3\n')
+
+        with CsvSource(path) as source:
+            items = list(source.items())
+
+        assert items == [(2, ["x\ny", "1"]), (4, ["2", "3"])]
+
+    def test_byte_order_mark_is_dropped(self, tmp_path: Path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"\xef\xbb\xbfid\n1\n")
+
+        with CsvSource(path) as source:
+            assert source.columns == ["id"]
+
+    def test_empty_file(self, tmp_path: Path):
+        path = _write(tmp_path / "data.csv", "")
+
+        with pytest.raises(DataImportError, match="no header"):
+            CsvSource(path).open()
+
+    def test_invalid_utf8(self, tmp_path: Path):
+        path = tmp_path / "data.csv"
+        path.write_bytes(b"name\n\xff\n")
+
+        with pytest.raises(DataImportError, match="not valid UTF-8"):
+            CsvSource(path).open()
+
+    def test_tab_delimited_row_text(self, tmp_path: Path):
+        path = _write(tmp_path / "data.tsv", "a\tb\n1\t2\n")
+
+        with open_source(path) as source:
+            assert source.row_text(["1", "x\ty"]) == '1\t"x\ty"'
+
+    def test_bytes_read(self, tmp_path: Path):
+        path = _write(tmp_path / "data.csv", "id\n" + "1\n" * 100)
+
+        with CsvSource(path) as source:
+            list(source.items())
+            assert source.bytes_read == source.size
+
+
+class TestRanges:
+    def test_csv_ranges_keep_quoted_line_ends_whole(self, tmp_path: Path):
+        path = _write(tmp_path / "data.csv", 'id,note\n1,"a\nb"\n2,x\n3,"c\n""d"""\n4,y\n')
+
+        with CsvSource(path) as source:
+            expected = list(source.items())
+            ranges = source.ranges(1)
+            # Unpickled, as in a worker process
+            worker_source = pickle.loads(pickle.dumps(source))
+
+        assert [r.first_line for r in ranges] == [2, 4, 5, 7]
+        assert ranges[-1].end == path.stat().st_size
+        items = [item for r in ranges for item in worker_source.read_range(r)]
+        assert items == expected
+
+    def test_stray_quote_row_is_read_to_its_end(self, tmp_path: Path):
+        # The inch mark makes the quote count odd, so the first slice
+        # seems to end after "a" inside the quoted note
+        text = 'id,height,note\n1,5\'11",x\n2,6,"a\nb"\n3,7,y\n'
+        path = _write(tmp_path / "data.csv", text)
+
+        with CsvSource(path) as source:
+            expected = list(source.items())
+            first = source.ranges(1)[0]
+            items = list(source.read_range(first))
+            following = source.ranges(1, after=first)
+            items += [item for r in following for item in source.read_range(r)]
+
+        assert first.end == text.index("3,7")
+        assert [r.first_line for r in following] == [5]
+        assert items == expected
+        assert expected[1] == (3, ["2", "6", "a\nb"])
+
+    def test_ndjson_ranges(self, tmp_path: Path):
+        path = _write(tmp_path / "data.ndjson", '{"id": 1}\n\n{"id": 2}\n{"id": 3}\n')
+
+        with NdjsonSource(path) as source:
+            ranges = source.ranges(12)
+            items = [item for r in ranges for item in source.read_range(r)]
+
+        assert len(ranges) == 2
+        assert items == [(1, [1]), (3, [2]), (4, [3])]
+
+
+class TestNdjsonSource:
+    def test_columns_from_sampled_keys(self, tmp_path: Path):
+        path = _write(tmp_path / "data.ndjson", '{"id": 1}\n{"id": 2, "tags": ["a"]}\n')
+
+        with NdjsonSource(path) as source:
+            assert source.columns == ["id", "tags"]
+            items = list(source.items())
+
+        assert items == [(1, [1, None]), (2, [2, ["a"]])]
+
+    def test_bad_lines_are_rejected(self, tmp_path: Path):
+        text = '{"id": 1}\nnot json\n[1]\n\n{"id": 2, "extra": 3}\n'
+        path = _write(tmp_path / "data.jsonl", text)
+
+        with NdjsonSource(path, sample_rows=1) as source:
+            items = list(source.items())
+
+        assert items[0] == (1, [1])
+        assert isinstance(items[1], RejectedRow)
+        assert items[1].reason.startswith("invalid JSON")
+        assert items[2] == RejectedRow(3, "[1]", "not a JSON object")
+        assert items[3] == RejectedRow(5, '{"id": 2, "extra": 3}', "unknown key 'extra'")
+
+    def test_no_objects(self, tmp_path: Path):
+        path = _write(tmp_path / "data.ndjson", "[1]\n")
+
+        with pytest.raises(DataImportError, match="no JSON objects"):
+            NdjsonSource(path).open()
+
+
+class TestJsonSource:
+    def test_array_of_objects(self, tmp_path: Path):
+        path = _write(tmp_path / "data.json", '[{"id": 1}, 2, {"id": 3, "name": "c"}]')
+
+        with JsonSource(path) as source:
+            assert source.columns == ["id", "name"]
+            items = list(source.items())
+
+        assert items == [(1, [1, None]), RejectedRow(2, "2", "not a JSON object"), (3, [3, "c"])]
+
+    def test_line_delimited_content(self, tmp_path: Path):
+        path = _write(tmp_path / "data.json", '{"id": 1}\n{"id": 2}\n')
+
+        with open_source(path) as source:
+            assert list(source.items()) == [(1, [1]), (2, [2])]
+
+
+class TestOpenSource:
+    def test_unknown_extension(self, tmp_path: Path):
+        with pytest.raises(DataImportError, match="expected one of"):
+            open_source(tmp_path / "data.xlsx")
+
+    def test_missing_file(self, tmp_path: Path):
+        with pytest.raises(DataImportError, match="Cannot read"):
+            open_source(tmp_path / "missing.csv").open()
@@ -0,0 +1,77 @@
+"""Tests for the async PostgreSQL adapter (mock-based, no real DB required)."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from qry.shared.exceptions import DatabaseError
+
+
+@pytest.fixture
+def mock_connection():
+    conn = AsyncMock()
+    conn.closed = False
+    conn.cursor = MagicMock()
+    return conn
+
+
+@pytest.fixture
+def adapter():
+    from qry.domains.database.async_postgres import AsyncPostgresAdapter
+
+    return AsyncPostgresAdapter(database="testdb", user="testuser", password="testpass")
+
+
+class TestAsyncPostgresAdapter:
+    @patch("qry.domains.database.async_postgres.psycopg")
+    async def test_execute_with_params_is_prepared(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.AsyncConnection.connect = AsyncMock(return_value=mock_connection)
+        cursor = MagicMock()
+        cursor.description = [("id",)]
+        cursor.fetchall = AsyncMock(return_value=[(7,)])
+        mock_connection.execute.return_value = cursor
+
+        await adapter.connect()
+        result = await adapter.execute("SELECT id FROM t WHERE id = :id", {"id": 7})
+
+        assert result.rows == [(7,)]
+        mock_connection.execute.assert_awaited_once_with(
+            "SELECT id FROM t WHERE id = %(id)s", {"id": 7}, prepare=True
+        )
+
+    @patch("qry.domains.database.async_postgres.psycopg")
+    async def test_stream_batches(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.AsyncConnection.connect = AsyncMock(return_value=mock_connection)
+
+        async def rows(*args, **kwargs):
+            for i in range(3):
+                yield (i,)
+
+        cursor = MagicMock()
+        cursor.description = [("n",)]
+        cursor.stream = rows
+        mock_connection.cursor.return_value = cursor
+
+        await adapter.connect()
+        batches = [b async for b in adapter.stream("SELECT n FROM t", batch_size=2)]
+
+        assert [b.rows for b in batches] == [[(0,), (1,)], [(2,)]]
+        assert batches[0].columns == ["n"]
+
+    @patch("qry.domains.database.async_postgres.psycopg")
+    async def test_get_tables_error(self, mock_psycopg, adapter, mock_connection):
+        import psycopg
+
+        mock_psycopg.AsyncConnection.connect = AsyncMock(return_value=mock_connection)
+        mock_psycopg.Error = psycopg.Error
+        mock_connection.execute.side_effect = psycopg.Error("boom")
+
+        await adapter.connect()
+
+        with pytest.raises(DatabaseError, match="Failed to fetch tables"):
+            await adapter.get_tables()
+
+    async def test_execute_not_connected(self, adapter):
+        result = await adapter.execute("SELECT 1")
+
+        assert result.error == "Not connected to database"
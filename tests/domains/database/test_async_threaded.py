@@ -0,0 +1,71 @@
+"""Tests for the thread-backed async adapter."""
+
+import asyncio
+from pathlib import Path
+
+from qry.domains.connection.models import ConnectionConfig, DatabaseType
+from qry.domains.database.async_threaded import ThreadedAsyncAdapter
+from qry.domains.database.factory import AdapterFactory
+from qry.domains.database.sqlite import SQLiteAdapter
+
+
+class TestThreadedAsyncAdapter:
+    async def test_execute_and_schema(self, sample_sqlite_db: Path):
+        adapter = ThreadedAsyncAdapter(SQLiteAdapter(sample_sqlite_db))
+        await adapter.connect()
+
+        result = await adapter.execute("SELECT name FROM users WHERE id = :id", {"id": 2})
+        tables = await adapter.get_tables()
+        columns = await adapter.get_columns("users")
+
+        assert result.rows == [("Bob",)]
+        assert [t.name for t in tables] == ["posts", "users"]
+        assert [c.name for c in columns] == ["id", "name", "email"]
+
+        await adapter.disconnect()
+        assert not adapter.is_connected()
+
+    async def test_stream(self, sample_sqlite_db: Path):
+        adapter = ThreadedAsyncAdapter(SQLiteAdapter(sample_sqlite_db))
+        await adapter.connect()
+
+        batches = [b async for b in adapter.stream("SELECT id FROM users", batch_size=1)]
+
+        assert [b.rows for b in batches] == [[(1,)], [(2,)]]
+
+        await adapter.disconnect()
+
+    async def test_adapters_run_concurrently(self, sample_sqlite_db: Path):
+        adapters = [ThreadedAsyncAdapter(SQLiteAdapter(sample_sqlite_db)) for _ in range(3)]
+        await asyncio.gather(*(a.connect() for a in adapters))
+
+        results = await asyncio.gather(*(a.execute("SELECT COUNT(*) FROM users") for a in adapters))
+
+        assert [r.rows for r in results] == [[(2,)]] * 3
+        await asyncio.gather(*(a.disconnect() for a in adapters))
+
+    def test_factory_wraps_sync_adapters(self, sample_sqlite_db: Path):
+        config = ConnectionConfig("t", DatabaseType.SQLITE, path=str(sample_sqlite_db))
+
+        adapter = AdapterFactory.create_async(config)
+
+        assert isinstance(adapter, ThreadedAsyncAdapter)
+        assert isinstance(adapter.adapter, SQLiteAdapter)
+
+    async def test_reconnect_after_disconnect(self, sample_sqlite_db: Path):
+        adapter = ThreadedAsyncAdapter(SQLiteAdapter(sample_sqlite_db))
+        await adapter.connect()
+        await adapter.disconnect()
+
+        await adapter.connect()
+        result = await adapter.execute("SELECT COUNT(*) FROM users")
+
+        assert result.rows == [(2,)]
+        await adapter.disconnect()
+
+    async def test_not_connected(self, sample_sqlite_db: Path):
+        adapter = ThreadedAsyncAdapter(SQLiteAdapter(sample_sqlite_db))
+
+        assert (await adapter.execute("SELECT 1")).error == "Not connected to database"
+        assert await adapter.get_tables() == []
+        await adapter.disconnect()
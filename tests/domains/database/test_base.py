@@ -94,3 +94,15 @@ class TestTestConnection:
         adapter.test_connection()
 
         assert not adapter.is_connected()
+
+
+class TestStream:
+    class RowsAdapter(ConcreteAdapter):
+        def execute(self, sql: str, params=None) -> QueryResult:
+            return QueryResult(columns=["n"], rows=[(i,) for i in range(5)], row_count=5)
+
+    def test_default_stream_batches_buffered_result(self):
+        batches = list(self.RowsAdapter().stream("SELECT n", batch_size=2))
+
+        assert [b.rows for b in batches] == [[(0,), (1,)], [(2,), (3,)], [(4,)]]
+        assert all(b.columns == ["n"] for b in batches)
@@ -127,6 +127,22 @@ class TestMySQLExecute:
         assert result.columns == []
         assert result.row_count == 1
 
+    @patch("qry.domains.database.mysql.pymysql")
+    def test_execute_with_params(self, mock_pymysql, adapter, mock_connection):
+        mock_pymysql.connect.return_value = mock_connection
+
+        mock_cursor = MagicMock()
+        mock_cursor.description = None
+        mock_cursor.rowcount = 1
+        mock_connection.cursor.return_value = _make_cursor_ctx(mock_cursor)
+
+        adapter.connect()
+        adapter.execute("DELETE FROM users WHERE name LIKE '%x' AND id = :id", {"id": 3})
+
+        mock_cursor.execute.assert_called_once_with(
+            "DELETE FROM users WHERE name LIKE '%%x' AND id = %(id)s", {"id": 3}
+        )
+
     @patch("qry.domains.database.mysql.pymysql")
     def test_execute_error(self, mock_pymysql, adapter, mock_connection):
         import pymysql
@@ -246,6 +262,39 @@ class TestMySQLCancel:
         adapter.cancel()
 
 
+class TestMySQLBulkInsert:
+
+    @patch("qry.domains.database.mysql.pymysql")
+    def test_inserts_batches_in_one_transaction(self, mock_pymysql, adapter, mock_connection):
+        mock_pymysql.connect.return_value = mock_connection
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+
+        adapter.connect()
+        count = adapter.bulk_insert("t", ["id", "na`me"], [[(1, "a"), (2, "b")], [(3, "c")]])
+
+        assert count == 3
+        statement = "INSERT INTO `t` (`id`, `na``me`) VALUES (%s, %s)"
+        assert cursor.executemany.call_args_list[0].args == (statement, [(1, "a"), (2, "b")])
+        mock_connection.begin.assert_called_once()
+        mock_connection.commit.assert_called_once()
+
+    @patch("qry.domains.database.mysql.pymysql")
+    def test_error_rolls_back(self, mock_pymysql, adapter, mock_connection):
+        import pymysql
+
+        mock_pymysql.connect.return_value = mock_connection
+        mock_pymysql.Error = pymysql.Error
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+        cursor.executemany.side_effect = pymysql.Error("bad value")
+
+        adapter.connect()
+        with pytest.raises(DatabaseError, match="Import into t failed"):
+            adapter.bulk_insert("t", ["id"], [[(1,)]])
+
+        mock_connection.rollback.assert_called_once()
+        mock_connection.commit.assert_not_called()
+
+
 class TestMySQLIsConnected:
 
     def test_not_connected_initially(self, adapter):
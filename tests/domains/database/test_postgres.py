@@ -117,6 +117,23 @@ class TestPostgresExecute:
         assert result.columns == []
         assert result.row_count == 1
 
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_execute_with_params_is_prepared(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.connect.return_value = mock_connection
+
+        mock_cursor = MagicMock()
+        mock_cursor.description = [("id",)]
+        mock_cursor.fetchall.return_value = [(7,)]
+        mock_connection.execute.return_value = mock_cursor
+
+        adapter.connect()
+        result = adapter.execute("SELECT id FROM users WHERE id = :id", {"id": 7})
+
+        assert result.rows == [(7,)]
+        mock_connection.execute.assert_called_once_with(
+            "SELECT id FROM users WHERE id = %(id)s", {"id": 7}, prepare=True
+        )
+
     @patch("qry.domains.database.postgres.psycopg")
     def test_execute_error(self, mock_psycopg, adapter, mock_connection):
         import psycopg
@@ -139,6 +156,155 @@ class TestPostgresExecute:
         assert result.error == "Not connected to database"
 
 
+class TestPostgresExecuteMany:
+
+    @staticmethod
+    def _cursor(description=None, rows=(), rowcount=-1, pgresult=True):
+        cursor = MagicMock()
+        cursor.description = description
+        cursor.fetchall.return_value = list(rows)
+        cursor.rowcount = rowcount
+        cursor.pgresult = MagicMock() if pgresult else None
+        return cursor
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_pipelines_statements(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.connect.return_value = mock_connection
+        mock_psycopg.Pipeline.is_supported.return_value = True
+        cursors = [self._cursor([("count",)], [(1,)]), self._cursor([("id",)], [(1,)])]
+        mock_connection.cursor.side_effect = cursors
+
+        adapter.connect()
+        results = adapter.execute_many(
+            [("SELECT count(*) FROM t", None), ("SELECT id FROM t WHERE id = :id", {"id": 1})]
+        )
+
+        mock_connection.pipeline.assert_called_once()
+        cursors[1].execute.assert_called_once_with(
+            "SELECT id FROM t WHERE id = %(id)s", {"id": 1}, prepare=True
+        )
+        assert [r.row_count for r in results] == [1, 1]
+        assert results[1].rows == [(1,)]
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_pipeline_error_is_attributed(self, mock_psycopg, adapter, mock_connection):
+        import psycopg
+
+        mock_psycopg.connect.return_value = mock_connection
+        mock_psycopg.Pipeline.is_supported.return_value = True
+        mock_psycopg.Error = psycopg.Error
+        mock_connection.cursor.side_effect = [
+            self._cursor([("id",)], [(1,)]),
+            self._cursor(pgresult=False),
+            self._cursor(pgresult=False),
+        ]
+        mock_connection.pipeline.return_value.__exit__.side_effect = psycopg.Error("boom")
+
+        adapter.connect()
+        results = adapter.execute_many([("SELECT id FROM a", None)] * 3)
+
+        assert [r.is_success for r in results] == [True, False]
+        assert results[1].error == "boom"
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_transaction_control_is_not_pipelined(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.connect.return_value = mock_connection
+        mock_psycopg.Pipeline.is_supported.return_value = True
+        mock_connection.execute.return_value = self._cursor(rowcount=0)
+
+        adapter.connect()
+        results = adapter.execute_many([("BEGIN", None), ("DELETE FROM a", None)])
+
+        mock_connection.pipeline.assert_not_called()
+        assert len(results) == 2
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_writes_are_not_pipelined(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.connect.return_value = mock_connection
+        mock_psycopg.Pipeline.is_supported.return_value = True
+        mock_connection.execute.return_value = self._cursor(rowcount=1)
+
+        adapter.connect()
+        results = adapter.execute_many([("SELECT 1", None), ("DELETE FROM a", None)])
+
+        # One at a time, so a later failure cannot roll back an earlier write
+        mock_connection.pipeline.assert_not_called()
+        assert [r.row_count for r in results] == [1, 1]
+
+
+class TestPostgresCopyCsv:
+
+    @staticmethod
+    def _copy(mock_connection, lines):
+        copy = MagicMock()
+        copy.__iter__.return_value = iter(lines)
+        cursor = mock_connection.cursor.return_value
+        cursor.copy.return_value.__enter__.return_value = copy
+        return cursor
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_batches_lines_after_header(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.connect.return_value = mock_connection
+        cursor = self._copy(mock_connection, [b"id\n", b"1\n", b"2\n", b"3\n"])
+
+        adapter.connect()
+        batches = list(adapter.copy_csv("SELECT id FROM t WHERE id > :id;", {"id": 0}, 2))
+
+        assert batches == [[b"id\n"], [b"1\n", b"2\n"], [b"3\n"]]
+        statement, params = cursor.copy.call_args.args
+        assert statement.startswith("COPY (\nSELECT id FROM t WHERE id > %(id)s\n) TO STDOUT")
+        assert params == {"id": 0}
+
+    def test_only_single_queries(self, adapter):
+        assert adapter.copy_csv("SHOW search_path") is None
+        assert adapter.copy_csv("SELECT 1; SELECT 2") is None
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_error(self, mock_psycopg, adapter, mock_connection):
+        import psycopg
+
+        mock_psycopg.connect.return_value = mock_connection
+        mock_psycopg.Error = psycopg.Error
+        mock_connection.cursor.return_value.copy.side_effect = psycopg.Error("boom")
+
+        adapter.connect()
+        with pytest.raises(DatabaseError, match="COPY failed: boom"):
+            list(adapter.copy_csv("SELECT 1"))
+
+
+class TestPostgresBulkInsert:
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_copies_rows_from_stdin(self, mock_psycopg, adapter, mock_connection):
+        mock_psycopg.connect.return_value = mock_connection
+        cursor = mock_connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+
+        adapter.connect()
+        count = adapter.bulk_insert("my table", ["id", "name"], [[(1, "a"), (2, "b")], [(3, None)]])
+
+        assert count == 3
+        cursor.copy.assert_called_once_with('COPY "my table" ("id", "name") FROM STDIN')
+        assert [c.args[0] for c in copy.write_row.call_args_list] == [(1, "a"), (2, "b"), (3, None)]
+        mock_connection.transaction.assert_called_once()
+
+    @patch("qry.domains.database.postgres.psycopg")
+    def test_error(self, mock_psycopg, adapter, mock_connection):
+        import psycopg
+
+        mock_psycopg.connect.return_value = mock_connection
+        mock_psycopg.Error = psycopg.Error
+        mock_connection.cursor.side_effect = psycopg.Error("bad value")
+
+        adapter.connect()
+        with pytest.raises(DatabaseError, match="Import into t failed: bad value"):
+            adapter.bulk_insert("t", ["id"], [[(1,)]])
+
+    def test_not_connected(self, adapter):
+        with pytest.raises(DatabaseError, match="Not connected"):
+            adapter.bulk_insert("t", ["id"], [])
+
+
 class TestPostgresGetTables:
 
     @patch("qry.domains.database.postgres.psycopg")
@@ -1,5 +1,6 @@
 """Tests for SQLite adapter."""
 
+import datetime
 from pathlib import Path
 
 import pytest
@@ -40,6 +41,15 @@ class TestSQLiteAdapter:
 
         adapter.disconnect()  # Should not raise
 
+    def test_execute_with_named_params(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        result = adapter.execute("SELECT name FROM users WHERE id = :id", {"id": 2})
+
+        assert result.rows == [("Bob",)]
+        adapter.disconnect()
+
     def test_execute_select(self, sample_sqlite_db: Path):
         adapter = SQLiteAdapter(sample_sqlite_db)
         adapter.connect()
@@ -246,3 +256,98 @@ class TestSQLiteAdapter:
         adapter.cancel()  # Should not raise
 
         adapter.disconnect()
+
+    def test_transaction_defers_commit(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        adapter.begin()
+        adapter.execute("INSERT INTO users VALUES (3, 'Carol', 'carol@example.com')")
+        adapter.savepoint("sp")
+        adapter.execute("DELETE FROM users WHERE id = 1")
+        adapter.rollback_to_savepoint("sp")
+        adapter.rollback()
+
+        result = adapter.execute("SELECT id FROM users ORDER BY id")
+        assert result.rows == [(1,), (2,)]
+
+        adapter.disconnect()
+
+    def test_transaction_commit(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        adapter.begin()
+        adapter.execute("DELETE FROM users WHERE id = 2")
+        adapter.commit()
+        adapter.disconnect()
+
+        adapter.connect()
+        assert adapter.execute("SELECT id FROM users").rows == [(1,)]
+
+        adapter.disconnect()
+
+    def test_stream_batches(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        batches = list(adapter.stream("SELECT id FROM users ORDER BY id", batch_size=1))
+
+        assert [b.rows for b in batches] == [[(1,)], [(2,)]]
+        assert all(b.columns == ["id"] for b in batches)
+
+        adapter.disconnect()
+
+    def test_stream_empty_and_error(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        empty = list(adapter.stream("SELECT id FROM users WHERE id > 5"))
+        error = list(adapter.stream("SELECT * FROM missing"))
+
+        assert [(b.columns, b.rows) for b in empty] == [(["id"], [])]
+        assert len(error) == 1 and error[0].error is not None
+
+        adapter.disconnect()
+
+    def test_bulk_insert(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        batches = [[(3, "Carol", None), (4, "Dan", "dan@example.com")], [(5, "Eve", None)]]
+        count = adapter.bulk_insert("users", ["id", "name", "email"], batches)
+
+        assert count == 3
+        assert adapter.execute("SELECT COUNT(*) FROM users").rows == [(5,)]
+        assert adapter.execute("PRAGMA cache_size").rows == [(-2000,)]
+        adapter.disconnect()
+
+    def test_bulk_insert_converts_values(self, empty_sqlite_db: Path):
+        adapter = SQLiteAdapter(empty_sqlite_db)
+        adapter.connect()
+        adapter.execute("CREATE TABLE t (at TEXT, ok INTEGER)")
+
+        adapter.bulk_insert("t", ["at", "ok"], [[(datetime.datetime(2024, 1, 2, 3, 4), True)]])
+
+        assert adapter.execute("SELECT at, ok FROM t").rows == [("2024-01-02 03:04:00", 1)]
+        adapter.disconnect()
+
+    def test_bulk_insert_failure_inserts_nothing(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+
+        batches = [[(3, "Carol", None)], [(1, "Duplicate", None)]]
+        with pytest.raises(DatabaseError, match="Import into users failed"):
+            adapter.bulk_insert("users", ["id", "name", "email"], batches)
+
+        assert adapter.execute("SELECT COUNT(*) FROM users").rows == [(2,)]
+        adapter.disconnect()
+
+    def test_bulk_insert_refused_in_transaction(self, sample_sqlite_db: Path):
+        adapter = SQLiteAdapter(sample_sqlite_db)
+        adapter.connect()
+        adapter.begin()
+
+        with pytest.raises(DatabaseError, match="open transaction"):
+            adapter.bulk_insert("users", ["id"], [])
+        adapter.disconnect()
@@ -0,0 +1,87 @@
+"""Tests for compressed export output."""
+
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+
+import pytest
+
+from qry.domains.export.compression import (
+    BlockCompressedWriter,
+    CompressionOptions,
+    compression_for_path,
+    open_output,
+    strip_compression,
+)
+from qry.domains.export.csv import CsvExporter
+from qry.domains.export.formats import format_for_path
+
+ROWS = [(i, f"name {i}") for i in range(2000)]
+
+
+def _expected_csv() -> str:
+    return "id,name\r\n" + "".join(f"{i},name {i}\r\n" for i, _ in ROWS)
+
+
+class TestCompressedExport:
+    @pytest.mark.parametrize(
+        ("name", "reader"),
+        [("out.csv.gz", gzip.open), ("out.csv.bz2", bz2.open), ("out.csv.xz", lzma.open)],
+    )
+    @pytest.mark.parametrize("threads", [1, 3])
+    def test_export_rows_compresses_by_extension(self, tmp_path: Path, name, reader, threads):
+        path = tmp_path / name
+
+        count = CsvExporter().export_rows(
+            ["id", "name"], [ROWS[:700], ROWS[700:]], path, CompressionOptions(threads=threads)
+        )
+
+        assert count == len(ROWS)
+        with reader(path, "rt", newline="") as f:
+            assert f.read() == _expected_csv()
+
+    def test_uncompressed_path_is_plain(self, tmp_path: Path):
+        path = tmp_path / "out.csv"
+
+        CsvExporter().export_rows(["id", "name"], [ROWS], path)
+
+        assert path.read_bytes().startswith(b"id,name")
+
+    def test_level_is_applied(self, tmp_path: Path):
+        fast, small = tmp_path / "fast.csv.gz", tmp_path / "small.csv.gz"
+
+        CsvExporter().export_rows(["id", "name"], [ROWS], fast, CompressionOptions(level=0))
+        CsvExporter().export_rows(["id", "name"], [ROWS], small, CompressionOptions(level=9))
+
+        assert small.stat().st_size < fast.stat().st_size
+
+
+class TestBlockWriter:
+    def test_block_writer_writes_one_member_per_block(self, tmp_path: Path):
+        path = tmp_path / "out.gz"
+        data = bytes(range(256)) * 40
+
+        with BlockCompressedWriter(
+            open(path, "wb"), gzip.compress, threads=2, block_size=1000
+        ) as f:
+            f.write(data)
+
+        compressed = path.read_bytes()
+        assert gzip.decompress(compressed) == data
+        # One gzip header per block
+        assert compressed.count(b"\x1f\x8b\x08") >= len(data) // 1000
+
+
+class TestCompressionPaths:
+    def test_open_output_without_compression(self, tmp_path: Path):
+        with open_output(tmp_path / "out.txt") as f:
+            f.write(b"plain")
+
+        assert (tmp_path / "out.txt").read_bytes() == b"plain"
+
+    def test_paths(self):
+        assert compression_for_path(Path("out.csv.GZ")).name == "gzip"
+        assert compression_for_path(Path("out.csv")) is None
+        assert strip_compression(Path("out.json.xz")) == Path("out.json")
+        assert format_for_path(Path("out.json.bz2")) == "json"
@@ -1,13 +1,18 @@
 """Tests for exporters."""
 
+import io
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+from qry.domains.export.base import Exporter
 from qry.domains.export.csv import CsvExporter
+from qry.domains.export.formats import EXPORTERS, format_for_path
 from qry.domains.export.json import JsonExporter
 from qry.domains.export.markdown import MarkdownExporter
+from qry.domains.export.ndjson import NdjsonExporter
 from qry.domains.query.models import QueryResult
 
 
@@ -256,3 +261,78 @@ class TestMarkdownExporter:
 
         # Pipe inside cell should be escaped
         assert "val\\|ue" in output
+
+
+class TestExportStream:
+    BATCHES = [[(1, "Alice"), (2, None)], [], [(3, "Carol | C")]]
+
+    @pytest.fixture
+    def result(self) -> QueryResult:
+        rows = [row for batch in self.BATCHES for row in batch]
+        return QueryResult(columns=["id", "name"], rows=rows, row_count=len(rows))
+
+    @pytest.mark.parametrize("exporter_cls", [CsvExporter, JsonExporter, MarkdownExporter])
+    def test_batches_match_materialized_export(self, exporter_cls, result: QueryResult):
+        exporter = exporter_cls()
+        sink = io.StringIO()
+
+        count = exporter.export_stream(["id", "name"], iter(self.BATCHES), sink)
+
+        assert count == 3
+        assert sink.getvalue() == exporter.export_string(result)
+
+    def test_json_matches_json_dump(self, result: QueryResult):
+        output = JsonExporter().export_string(result)
+
+        expected = [dict(zip(result.columns, row, strict=True)) for row in result.rows]
+        assert output == json.dumps(expected, indent=2)
+
+    def test_json_empty(self):
+        assert JsonExporter().export_string(QueryResult(columns=["id"])) == "[]"
+
+    def test_markdown_widths_span_batches(self):
+        sink = io.StringIO()
+
+        MarkdownExporter().export_stream(["v"], [[("a",)], [("abcdef",)]], sink)
+
+        lines = sink.getvalue().splitlines()
+        assert lines[2] == "| a      |"
+        assert lines[3] == "| abcdef |"
+
+    def test_export_rows_removes_partial_file(self, tmp_path: Path):
+        path = tmp_path / "out.csv"
+
+        def batches():
+            yield [(1,)]
+            raise RuntimeError("cursor lost")
+
+        with pytest.raises(RuntimeError):
+            CsvExporter().export_rows(["id"], batches(), path)
+
+        assert not path.exists()
+
+
+class TestNdjsonExporter:
+    def test_one_object_per_line(self):
+        sink = io.StringIO()
+
+        count = NdjsonExporter().export_stream(
+            ["id", "when"], [[(1, datetime(2024, 1, 2))], [(2, None)]], sink
+        )
+
+        assert count == 2
+        assert sink.getvalue() == '{"id":1,"when":"2024-01-02 00:00:00"}\n{"id":2,"when":null}\n'
+
+    def test_empty_result(self):
+        assert NdjsonExporter().export_string(QueryResult(columns=["id"])) == ""
+
+
+class TestFormats:
+    def test_format_for_path(self):
+        assert format_for_path(Path("out.CSV")) == "csv"
+        assert format_for_path(Path("out.md")) == "md"
+        assert format_for_path(Path("out.ndjson")) == "ndjson"
+        assert format_for_path(Path("out.txt")) is None
+
+    def test_every_format_has_an_exporter(self):
+        assert all(issubclass(cls, Exporter) for cls in EXPORTERS.values())
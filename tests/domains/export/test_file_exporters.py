@@ -0,0 +1,205 @@
+"""Tests for exporters writing binary file formats."""
+
+import datetime
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from qry.domains.export.sqlite import SQLiteExporter
+from qry.shared.exceptions import ExportError
+from qry.shared.models import QueryResult
+
+
+class TestSQLiteExporter:
+    def test_writes_typed_table_in_transactions(self, tmp_path: Path):
+        path = tmp_path / "out.sqlite"
+        batches = [[(i, f"n{i}", i / 2) for i in range(j, j + 3)] for j in range(0, 9, 3)]
+
+        count = SQLiteExporter("rows", transaction_rows=4).export_rows(
+            ["id", "name", "half"], batches, path
+        )
+
+        assert count == 9
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT count(*), sum(id) FROM rows").fetchone() == (9, 36)
+        types = [row[2] for row in conn.execute("PRAGMA table_info(rows)")]
+        assert types == ["INTEGER", "TEXT", "REAL"]
+        conn.close()
+
+    def test_converts_values_sqlite_cannot_store(self, tmp_path: Path):
+        path = tmp_path / "out.sqlite"
+        row = (True, Decimal("1.5"), datetime.date(2024, 1, 2), {"a": 1}, bytearray(b"x"), None)
+
+        SQLiteExporter().export_rows(["b", "d", "day", "doc", "raw", "n"], [[row]], path)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT * FROM query_result").fetchone() == (
+            1,
+            1.5,
+            "2024-01-02",
+            '{"a": 1}',
+            b"x",
+            None,
+        )
+        conn.close()
+
+    def test_duplicate_column_names(self, tmp_path: Path):
+        path = tmp_path / "out.sqlite"
+
+        SQLiteExporter().export_rows(["id", "id"], [[(1, 2)]], path)
+
+        conn = sqlite3.connect(path)
+        assert [row[1] for row in conn.execute("PRAGMA table_info(query_result)")] == [
+            "id",
+            "id_2",
+        ]
+        conn.close()
+
+    def test_replaces_existing_file(self, tmp_path: Path):
+        path = tmp_path / "out.sqlite"
+        SQLiteExporter().export_rows(["id"], [[(1,)]], path)
+
+        SQLiteExporter().export_rows(["id"], [[(2,)]], path)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT id FROM query_result").fetchall() == [(2,)]
+        conn.close()
+
+    def test_has_no_text_form(self):
+        with pytest.raises(ExportError):
+            SQLiteExporter().export_string(QueryResult(columns=["id"], rows=[(1,)]))
+
+    def test_rejects_compression(self, tmp_path: Path):
+        with pytest.raises(ExportError):
+            SQLiteExporter().export_rows(["id"], [[(1,)]], tmp_path / "out.sqlite.gz")
+
+
+class TestArrowExporters:
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_parquet_round_trip(self, tmp_path: Path):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+        batches = [[(1, None, b"a")], [], [(2, "x", b"b"), (3, "y", None)]]
+
+        count = ParquetExporter().export_rows(["id", "name", "raw"], batches, path)
+
+        table = pq.read_table(path)
+        assert count == 3
+        assert table.column_names == ["id", "name", "raw"]
+        assert table.column("id").to_pylist() == [1, 2, 3]
+        # All NULL in the first batch: written as strings
+        assert table.column("name").to_pylist() == [None, "x", "y"]
+        assert str(table.schema.field("id").type) == "int64"
+
+    def test_arrow_ipc_round_trip(self, tmp_path: Path, pyarrow):
+        from qry.domains.export.arrow import ArrowIpcExporter
+
+        path = tmp_path / "out.arrow"
+
+        ArrowIpcExporter().export_rows(["when"], [[(datetime.date(2024, 1, 2),)]], path)
+
+        table = pyarrow.ipc.open_file(path).read_all()
+        assert table.column("when").to_pylist() == [datetime.date(2024, 1, 2)]
+
+    def test_mixed_types_fall_back_to_strings(self, tmp_path: Path):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        ParquetExporter().export_rows(["v"], [[(1,), ("a",)]], path)
+
+        assert pq.read_table(path).column("v").to_pylist() == ["1", "a"]
+
+    def test_later_strings_widen_column(self, tmp_path: Path):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        ParquetExporter().export_rows(["v"], [[(1,)], [("a",)]], path)
+
+        assert pq.read_table(path).column("v").to_pylist() == ["1", "a"]
+
+    def test_nested_values_of_changing_shape_widen_to_json(self, tmp_path: Path):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        ParquetExporter().export_rows(
+            ["doc", "tags"], [[({"a": 1}, [1, 2])], [({"b": "x"}, ["y"])]], path
+        )
+
+        table = pq.read_table(path)
+        assert table.column("doc").to_pylist() == ['{"a": 1}', '{"b": "x"}']
+        assert table.column("tags").to_pylist() == ["[1, 2]", '["y"]']
+
+    def test_widened_timestamps_read_like_later_rows(self, tmp_path: Path):
+        from qry.domains.export.arrow import ArrowIpcExporter
+
+        ipc = pytest.importorskip("pyarrow.ipc")
+        path = tmp_path / "out.arrow"
+        moment = datetime.datetime(2020, 1, 1)
+
+        ArrowIpcExporter().export_rows(["at"], [[(moment,)], [("soon",), (moment,)]], path)
+
+        with ipc.open_file(path) as reader:
+            values = reader.read_all().column("at").to_pylist()
+        assert values == [str(moment), "soon", str(moment)]
+
+    def test_later_floats_widen_integers(self, tmp_path: Path, pyarrow):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        ParquetExporter().export_rows(["v", "n"], [[(1, 1)], [(2.5, 2)], [(3, None)]], path)
+
+        table = pq.read_table(path)
+        assert table.column("v").to_pylist() == [1.0, 2.5, 3.0]
+        assert table.schema.field("v").type == pyarrow.float64()
+        assert table.column("n").to_pylist() == [1, 2, None]
+        assert not list(tmp_path.glob("*.narrow"))
+
+    def test_decimal_scale_change_widens(self, tmp_path: Path, pyarrow):
+        from qry.domains.export.arrow import ArrowIpcExporter
+
+        path = tmp_path / "out.arrow"
+        batches = [[(Decimal("1.5"),)], [(Decimal("123.25"),)], [(Decimal("0.125"),)]]
+
+        ArrowIpcExporter().export_rows(["amount"], batches, path)
+
+        table = pyarrow.ipc.open_file(path).read_all()
+        assert table.column("amount").to_pylist() == [
+            Decimal("1.5"),
+            Decimal("123.25"),
+            Decimal("0.125"),
+        ]
+        assert table.schema.field("amount").type == pyarrow.decimal128(6, 3)
+
+    def test_integer_beyond_int64_widens_to_strings(self, tmp_path: Path):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        ParquetExporter().export_rows(["v"], [[(1,)], [(2**70,)]], path)
+
+        assert pq.read_table(path).column("v").to_pylist() == ["1", str(2**70)]
+
+    def test_empty_result_keeps_columns(self, tmp_path: Path):
+        from qry.domains.export.arrow import ParquetExporter
+
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "out.parquet"
+
+        assert ParquetExporter().export_rows(["id", "name"], [[]], path) == 0
+        assert pq.read_table(path).column_names == ["id", "name"]
@@ -0,0 +1,73 @@
+"""Tests for the SQL INSERT exporter."""
+
+import datetime
+import io
+import sqlite3
+from decimal import Decimal
+
+import pytest
+
+from qry.domains.connection.models import DatabaseType
+from qry.domains.export.sql import SqlInsertExporter
+
+
+def _export(exporter: SqlInsertExporter, columns, batches) -> str:
+    sink = io.StringIO()
+    exporter.export_stream(columns, batches, sink)
+    return sink.getvalue()
+
+
+class TestSqlInsertExporter:
+    def test_statements_hold_batch_size_rows_across_input_batches(self):
+        exporter = SqlInsertExporter("t", DatabaseType.SQLITE, batch_size=2)
+
+        output = _export(exporter, ["id"], [[(1,)], [(2,), (3,)]])
+
+        assert output == (
+            'INSERT INTO "t" ("id") VALUES\n(1),\n(2);\nINSERT INTO "t" ("id") VALUES\n(3);\n'
+        )
+
+    def test_no_rows_writes_nothing(self):
+        assert _export(SqlInsertExporter(), ["id"], [[]]) == ""
+
+    def test_sqlite_output_loads(self):
+        rows = [(1, "it's", None, 2.5, b"\x00\xff", True), (2, "a\nb", "x", -1.0, b"", False)]
+        columns = ["id", "name", "note", "score", "data", "flag"]
+        conn = sqlite3.connect(":memory:")
+        conn.execute('CREATE TABLE "my ""t""" (id, name, note, score, data, flag)')
+
+        conn.executescript(
+            _export(SqlInsertExporter('my "t"', DatabaseType.SQLITE), columns, [rows])
+        )
+
+        assert conn.execute('SELECT * FROM "my ""t"""').fetchall() == [
+            (1, "it's", None, 2.5, b"\x00\xff", 1),
+            (2, "a\nb", "x", -1.0, b"", 0),
+        ]
+
+    def test_mysql_quoting(self):
+        exporter = SqlInsertExporter("t`x", DatabaseType.MYSQL)
+
+        assert exporter.quote_identifier("t`x") == "`t``x`"
+        assert exporter.literal("a\\'b") == "'a\\\\''b'"
+        assert exporter.literal(b"\x01") == "X'01'"
+        assert exporter.literal(float("nan")) == "NULL"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, "NULL"),
+            (True, "TRUE"),
+            (42, "42"),
+            (Decimal("1.10"), "1.10"),
+            (float("inf"), "'Infinity'"),
+            (Decimal("NaN"), "'NaN'"),
+            (b"\xde\xad", "'\\xdead'"),
+            (datetime.datetime(2024, 1, 2, 3, 4, 5), "'2024-01-02 03:04:05'"),
+            (datetime.date(2024, 1, 2), "'2024-01-02'"),
+            ({"a": [1]}, "'{\"a\": [1]}'"),
+            ("O'Reilly \\", "'O''Reilly \\'"),
+        ],
+    )
+    def test_postgres_literals(self, value, expected):
+        assert SqlInsertExporter(dialect=DatabaseType.POSTGRES).literal(value) == expected
@@ -0,0 +1,96 @@
+"""Tests for query fingerprinting and latency statistics."""
+
+from datetime import datetime, timedelta
+
+from qry.domains.query.fingerprint import fingerprint, normalize_query
+from qry.domains.query.models import ExecutionStatus, HistoryEntry
+from qry.domains.query.stats import aggregate_fingerprints, latency_trend, percentile
+
+
+class TestNormalizeQuery:
+    def test_replaces_literals(self):
+        assert normalize_query("SELECT * FROM t WHERE id = 42 AND name = 'bob'") == (
+            "select * from t where id = ? and name = ?"
+        )
+
+    def test_collapses_literal_lists(self):
+        assert normalize_query("SELECT * FROM t WHERE id IN (1, 2, 3)") == (
+            "select * from t where id in ( ? )"
+        )
+
+    def test_ignores_whitespace_comments_and_semicolon(self):
+        assert normalize_query("select  *\n-- note\nfrom t;") == "select * from t"
+
+    def test_keeps_quoted_identifiers(self):
+        assert normalize_query('SELECT "Name" FROM t') == 'select "Name" from t'
+
+    def test_keeps_numbers_in_identifiers(self):
+        assert normalize_query("SELECT col1 FROM t2") == "select col1 from t2"
+
+
+class TestFingerprint:
+    def test_same_shape_same_fingerprint(self):
+        assert fingerprint("SELECT * FROM t WHERE id = 1") == fingerprint(
+            "select * from t where id = 999"
+        )
+
+    def test_different_shape_different_fingerprint(self):
+        assert fingerprint("SELECT * FROM t WHERE id = 1") != fingerprint(
+            "SELECT * FROM t WHERE name = 1"
+        )
+
+
+class TestStats:
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile([7.0], 95) == 7.0
+
+    def test_latency_trend(self):
+        assert latency_trend([10.0, 10.0]) is None
+        assert latency_trend([10.0, 10.0, 20.0, 20.0]) == 2.0
+
+    def test_aggregate_fingerprints(self):
+        start = datetime(2024, 1, 15, 10, 30)
+
+        def run(query: str, ms: float, minute: int, ok: bool = True) -> HistoryEntry:
+            return HistoryEntry(
+                query=query,
+                timestamp=start + timedelta(minutes=minute),
+                fingerprint=fingerprint(query),
+                duration_ms=ms,
+                status=ExecutionStatus.OK if ok else ExecutionStatus.ERROR,
+            )
+
+        entries = [
+            run("SELECT * FROM t WHERE id = 1", 10.0, 0),
+            run("SELECT 1", 1.0, 1),
+            run("SELECT * FROM t WHERE id = 2", 30.0, 2),
+            run("SELECT * FROM t WHERE id = x", 0.5, 3, ok=False),
+            run("SELECT * FROM t WHERE id = 3", 20.0, 4),
+        ]
+
+        stats = aggregate_fingerprints(entries)
+
+        assert [s.count for s in stats] == [3, 1]
+        slow = stats[0]
+        assert slow.query == "SELECT * FROM t WHERE id = 3"
+        assert slow.p50_ms == 20.0
+        assert slow.max_ms == 30.0
+        assert slow.total_ms == 60.0
+        assert slow.last_run == start + timedelta(minutes=4)
+
+    def test_aggregate_counts_errors_per_fingerprint(self):
+        ts = datetime(2024, 1, 15, 10, 30)
+        entries = [
+            HistoryEntry("SELECT 1", ts, fingerprint="a", duration_ms=1.0),
+            HistoryEntry("SELECT 2", ts, fingerprint="a", status=ExecutionStatus.ERROR),
+            HistoryEntry("SELECT x", ts, fingerprint="b", status=ExecutionStatus.ERROR),
+        ]
+
+        stats = aggregate_fingerprints(entries)
+
+        assert len(stats) == 1
+        assert stats[0].error_count == 1
@@ -0,0 +1,28 @@
+"""Tests for frecency ranking."""
+
+import math
+from datetime import datetime
+
+from qry.domains.query.frecency import HALF_LIFE, combine_ranks, visit_rank
+
+
+class TestFrecency:
+    def test_newer_visit_ranks_higher(self):
+        assert visit_rank(datetime(2024, 1, 2)) > visit_rank(datetime(2024, 1, 1))
+
+    def test_half_life(self):
+        now = datetime(2024, 1, 15)
+        old = now - HALF_LIFE
+
+        # Two uses one half-life ago weigh the same as one use now
+        assert math.isclose(combine_ranks(visit_rank(old), visit_rank(old)), visit_rank(now))
+
+    def test_combine_is_symmetric_and_increasing(self):
+        a = visit_rank(datetime(2024, 1, 1))
+        b = visit_rank(datetime(2024, 1, 10))
+
+        assert combine_ranks(a, b) == combine_ranks(b, a)
+        assert combine_ranks(a, b) > max(a, b)
+
+    def test_combine_far_apart_ranks(self):
+        assert combine_ranks(0.0, 5000.0) == 5000.0
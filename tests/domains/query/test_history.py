@@ -1,10 +1,12 @@
 """Tests for HistoryManager."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from qry.domains.query.history import HistoryManager
+from qry.shared.models import QueryResult
 
 
 class TestHistoryManager:
@@ -33,24 +35,24 @@ class TestHistoryManager:
         assert entries[0].query == "SELECT 1"
 
     def test_get_recent_returns_newest_first(self, history: HistoryManager):
-        history.add("SELECT 1")
-        history.add("SELECT 2")
-        history.add("SELECT 3")
+        history.add("SELECT a")
+        history.add("SELECT b")
+        history.add("SELECT c")
 
         entries = history.get_recent()
 
-        assert entries[0].query == "SELECT 3"
-        assert entries[1].query == "SELECT 2"
-        assert entries[2].query == "SELECT 1"
+        assert entries[0].query == "SELECT c"
+        assert entries[1].query == "SELECT b"
+        assert entries[2].query == "SELECT a"
 
     def test_get_recent_limit(self, history: HistoryManager):
         for i in range(10):
-            history.add(f"SELECT {i}")
+            history.add(f"SELECT c{i}")
 
         entries = history.get_recent(count=3)
 
         assert len(entries) == 3
-        assert entries[0].query == "SELECT 9"
+        assert entries[0].query == "SELECT c9"
 
     def test_search(self, history: HistoryManager):
         history.add("SELECT * FROM users")
@@ -66,7 +68,7 @@ class TestHistoryManager:
 
     def test_search_case_insensitive(self, history: HistoryManager):
         history.add("SELECT * FROM USERS")
-        history.add("select * from users")
+        history.add("select id from users")
 
         results = history.search("users")
 
@@ -84,14 +86,14 @@ class TestHistoryManager:
         history = HistoryManager(max_entries=5)
 
         for i in range(10):
-            history.add(f"SELECT {i}")
+            history.add(f"SELECT c{i}")
 
         entries = history.get_recent()
 
         assert len(entries) == 5
         # Should have the 5 most recent
-        assert entries[0].query == "SELECT 9"
-        assert entries[-1].query == "SELECT 5"
+        assert entries[0].query == "SELECT c9"
+        assert entries[-1].query == "SELECT c5"
 
     def test_search_reverse_returns_newest_first(self, history: HistoryManager):
         history.add("SELECT * FROM users")
@@ -106,16 +108,16 @@ class TestHistoryManager:
 
     def test_search_reverse_respects_limit(self, history: HistoryManager):
         for i in range(10):
-            history.add(f"SELECT {i} FROM users")
+            history.add(f"SELECT c{i} FROM users")
 
         results = history.search_reverse("users", limit=3)
 
         assert len(results) == 3
-        assert results[0].query == "SELECT 9 FROM users"
+        assert results[0].query == "SELECT c9 FROM users"
 
     def test_search_reverse_case_insensitive(self, history: HistoryManager):
         history.add("SELECT * FROM USERS")
-        history.add("select * from users")
+        history.add("select id from users")
 
         results = history.search_reverse("users")
 
@@ -129,6 +131,17 @@ class TestHistoryManager:
 
         assert entries[0].connection_name == "test_db"
 
+    def test_connection_scopes_recent_and_reverse_search(self, history: HistoryManager):
+        history.set_connection("local")
+        history.add("SELECT * FROM users")
+        history.set_connection("prod")
+        history.add("SELECT id FROM users")
+
+        assert [e.query for e in history.get_recent()] == ["SELECT id FROM users"]
+        assert [e.query for e in history.search_reverse("users")] == ["SELECT id FROM users"]
+        assert len(history.get_page("users", 0, 10)) == 1
+        assert len(history.get_page("users", 0, 10, all_connections=True)) == 2
+
     def test_persistence(self, tmp_config_dir: Path):
         history1 = HistoryManager()
         history1.add("SELECT persistent")
@@ -139,3 +152,105 @@ class TestHistoryManager:
 
         assert len(entries) == 1
         assert entries[0].query == "SELECT persistent"
+
+    def test_search_reverse_refines_previous_matches(self, history: HistoryManager):
+        history.add("SELECT * FROM users")
+        history.add("SELECT * FROM user_roles")
+        history.add("SELECT * FROM posts")
+        history.search_reverse("user")
+
+        repo = history._repository
+        with patch.object(repo, "search", wraps=repo.search) as search:
+            results = history.search_reverse("users")
+
+        search.assert_not_called()
+        assert [r.query for r in results] == ["SELECT * FROM users"]
+
+    def test_search_reverse_after_add_queries_repository(self, history: HistoryManager):
+        history.add("SELECT * FROM users")
+        history.search_reverse("user")
+        history.add("SELECT * FROM users_archive")
+
+        results = history.search_reverse("users")
+
+        assert len(results) == 2
+
+    def test_search_reverse_incomplete_results_not_refined(self, history: HistoryManager):
+        for i in range(5):
+            history.add(f"SELECT c{i} FROM users")
+        history.add("SELECT 9 FROM users_old")
+        history.search_reverse("users", limit=3)
+
+        results = history.search_reverse("users_old", limit=3)
+
+        assert [r.query for r in results] == ["SELECT 9 FROM users_old"]
+
+    def test_get_page(self, history: HistoryManager):
+        for i in range(5):
+            history.add(f"SELECT c{i} FROM users")
+
+        assert [e.query for e in history.get_page("", 1, 2)] == [
+            "SELECT c3 FROM users",
+            "SELECT c2 FROM users",
+        ]
+        assert [e.query for e in history.get_page("from users", 4, 2)] == [
+            "SELECT c0 FROM users",
+        ]
+
+    def test_repeated_query_deduplicated(self, history: HistoryManager):
+        history.add("SELECT * FROM users WHERE id = 1")
+        history.add("SELECT * FROM posts")
+        history.add("SELECT * FROM users WHERE id = 2")
+
+        entries = history.get_recent()
+
+        assert [e.query for e in entries] == [
+            "SELECT * FROM users WHERE id = 2",
+            "SELECT * FROM posts",
+        ]
+        assert entries[0].use_count == 2
+
+    def test_frequent_query_ranks_above_newer_one(self, history: HistoryManager):
+        for _ in range(3):
+            history.add("SELECT * FROM users")
+        history.add("SELECT * FROM posts")
+
+        assert [e.query for e in history.get_recent()] == [
+            "SELECT * FROM users",
+            "SELECT * FROM posts",
+        ]
+        assert [e.query for e in history.search_reverse("from")] == [
+            "SELECT * FROM users",
+            "SELECT * FROM posts",
+        ]
+
+    def test_repeated_query_does_not_evict_others(self, tmp_config_dir: Path):
+        history = HistoryManager(max_entries=2)
+        history.add("SELECT * FROM posts")
+        for i in range(10):
+            history.add(f"SELECT * FROM users WHERE id = {i}")
+
+        assert [e.query for e in history.get_recent()] == [
+            "SELECT * FROM users WHERE id = 9",
+            "SELECT * FROM posts",
+        ]
+
+    def test_add_records_execution_details(self, history: HistoryManager):
+        history.add(
+            "SELECT * FROM users WHERE id = 1", QueryResult(row_count=1, execution_time_ms=5.0)
+        )
+        history.add("SELECT * FROM users WHERE id = 2", QueryResult(error="boom"))
+
+        stats = history.fingerprint_stats()
+
+        assert len(stats) == 1
+        assert stats[0].count == 1
+        assert stats[0].error_count == 1
+        assert stats[0].p50_ms == 5.0
+
+    def test_failed_execution_not_in_recent_or_search(self, history: HistoryManager):
+        history.add("SELECT ok_query")
+        history.add("SELECT bad_query", QueryResult(error="boom"))
+
+        assert [e.query for e in history.get_recent()] == ["SELECT ok_query"]
+        assert history.search_reverse("bad_query") == []
@@ -0,0 +1,60 @@
+"""Tests for named query parameters."""
+
+from qry.domains.query.parameters import find_parameters, parse_parameter_sets, to_pyformat
+
+
+class TestFindParameters:
+    def test_finds_names_in_order(self):
+        sql = "SELECT * FROM t WHERE a = :first AND b = :second OR a = :first"
+
+        assert find_parameters(sql) == ["first", "second"]
+
+    def test_ignores_casts_strings_and_comments(self):
+        sql = "SELECT x::int, ':not_param' FROM t -- :nor_this\nWHERE id = :id"
+
+        assert find_parameters(sql) == ["id"]
+
+    def test_no_parameters(self):
+        assert find_parameters("SELECT 1") == []
+
+
+class TestToPyformat:
+    def test_rewrites_placeholders(self):
+        assert to_pyformat("SELECT * FROM t WHERE id = :id") == (
+            "SELECT * FROM t WHERE id = %(id)s"
+        )
+
+    def test_escapes_percent(self):
+        assert to_pyformat("SELECT * FROM t WHERE a LIKE 'x%' AND b = :b") == (
+            "SELECT * FROM t WHERE a LIKE 'x%%' AND b = %(b)s"
+        )
+
+    def test_keeps_casts(self):
+        assert to_pyformat("SELECT :v::int") == "SELECT %(v)s::int"
+
+
+class TestParseParameterSets:
+    def test_without_header_uses_query_order(self):
+        assert parse_parameter_sets("1,a\n2,b\n", ["id", "name"]) == [
+            {"id": "1", "name": "a"},
+            {"id": "2", "name": "b"},
+        ]
+
+    def test_header_may_reorder_columns(self):
+        text = "name,id\na,1\n\nb,2"
+
+        assert parse_parameter_sets(text, ["id", "name"]) == [
+            {"name": "a", "id": "1"},
+            {"name": "b", "id": "2"},
+        ]
+
+    def test_tab_separated_and_quoted(self):
+        assert parse_parameter_sets('id\tname\n1\t"x, y"', ["id", "name"]) == [
+            {"id": "1", "name": "x, y"},
+        ]
+
+    def test_short_row_leaves_parameter_missing(self):
+        assert parse_parameter_sets("1", ["id", "name"]) == [{"id": "1"}]
+
+    def test_empty_text(self):
+        assert parse_parameter_sets("  \n", ["id"]) == []
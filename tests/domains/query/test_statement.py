@@ -0,0 +1,35 @@
+"""Tests for statement classification."""
+
+from qry.domains.query.statement import is_read_only, leading_keywords
+
+
+class TestLeadingKeywords:
+    def test_lowercases_and_limits(self):
+        assert leading_keywords("CREATE INDEX CONCURRENTLY idx ON t (a)", 3) == [
+            "create",
+            "index",
+            "concurrently",
+        ]
+
+    def test_skips_comments(self):
+        assert leading_keywords("-- note\n/* x */ Vacuum t") == ["vacuum", "t"]
+
+    def test_stops_at_non_word(self):
+        assert leading_keywords("(SELECT 1)") == []
+
+
+class TestIsReadOnly:
+    def test_selects_are_read_only(self):
+        assert is_read_only("SELECT * FROM t WHERE name = 'delete me'")
+        assert is_read_only("WITH x AS (SELECT 1) SELECT * FROM x")
+        assert is_read_only('EXPLAIN SELECT "update" FROM t')
+
+    def test_writes_are_not(self):
+        assert not is_read_only("UPDATE t SET a = 1")
+        assert not is_read_only("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d")
+        assert not is_read_only("SELECT * INTO t2 FROM t")
+        assert not is_read_only("SELECT * FROM t FOR UPDATE")
+        assert not is_read_only("EXPLAIN ANALYZE DELETE FROM t")
+
+    def test_empty(self):
+        assert not is_read_only("-- nothing")
@@ -0,0 +1,120 @@
+"""Tests for the shared SQL tokenizer and its incremental cache."""
+
+import pytest
+
+from qry.domains.query.completion import CompletionProvider
+from qry.domains.query.ports import SchemaProvider
+from qry.domains.query.tokenizer import TokenCache, tokenize
+from qry.shared.types import ColumnInfo, TableInfo
+
+
+class TestTokenize:
+    def test_basic_tokens(self):
+        tokens = tokenize("SELECT a, b FROM t;")
+
+        assert tokens[0] == ("word", "SELECT")
+        assert ("comma", ",") in tokens
+        assert tokens[-1] == ("semicolon", ";")
+
+    def test_string_with_escaped_quote(self):
+        assert tokenize("'it''s'") == [("string", "'it''s'")]
+
+    def test_multiline_block_comment_is_one_token(self):
+        assert tokenize("/* a\nb */") == [("comment", "/* a\nb */")]
+
+    def test_unterminated_string(self):
+        assert tokenize("SELECT 'abc") == [
+            ("word", "SELECT"),
+            ("whitespace", " "),
+            ("string", "'abc"),
+        ]
+
+
+class TestTokenCache:
+    SQL = "SELECT id,\n  name -- who\nFROM users /* multi\nline */\nWHERE note = 'a\nb';\nSELECT 2"
+
+    def test_matches_full_tokenize(self):
+        cache = TokenCache()
+
+        assert cache.tokenize(self.SQL) == tokenize(self.SQL)
+
+    def test_unchanged_text_is_not_relexed(self):
+        cache = TokenCache()
+        first = cache.tokenize(self.SQL)
+
+        assert cache.tokenize(self.SQL) is first
+
+    @pytest.mark.parametrize(
+        "edited",
+        [
+            SQL.replace("name", "full_name"),
+            SQL.replace("/* multi", "/* multi */"),
+            SQL.replace("'a\nb'", "'a\nb"),
+            SQL + "\nSELECT 3",
+            "-- header\n" + SQL,
+            SQL.replace("FROM users /* multi\n", ""),
+        ],
+    )
+    def test_edit_matches_full_tokenize(self, edited: str):
+        cache = TokenCache()
+        cache.tokenize(self.SQL)
+
+        assert cache.tokenize(edited) == tokenize(edited)
+
+    def test_relexes_only_edited_line(self):
+        lines = [f"SELECT {i} FROM t{i};" for i in range(100)]
+        cache = TokenCache()
+        cache.tokenize("\n".join(lines))
+
+        lines[50] = "SELECT 50 FROM changed;"
+        cache.tokenize("\n".join(lines))
+
+        assert cache._relexed_lines == 1
+
+    def test_opening_comment_relexes_following_lines(self):
+        cache = TokenCache()
+        cache.tokenize("SELECT 1\nFROM t\nWHERE x = 1")
+
+        tokens = cache.tokenize("SELECT 1 /*\nFROM t\nWHERE x = 1")
+
+        assert cache._relexed_lines == 3
+        assert tokens[-1] == ("comment", "/*\nFROM t\nWHERE x = 1")
+
+
+class _Schema(SchemaProvider):
+    def get_tables(self) -> list[TableInfo]:
+        return [TableInfo(name="users")]
+
+    def get_columns(self, table_name: str) -> list[ColumnInfo]:
+        if table_name == "users":
+            return [ColumnInfo(name="name", data_type="TEXT")]
+        return []
+
+
+class TestCompletionTableContext:
+    @pytest.fixture
+    def provider(self) -> CompletionProvider:
+        return CompletionProvider(_Schema())
+
+    def test_table_after_from(self, provider: CompletionProvider):
+        sql = "SELECT * FROM users WHERE na"
+
+        assert provider._find_table_context(sql, len(sql)) == "users"
+
+    def test_keyword_inside_string_is_ignored(self, provider: CompletionProvider):
+        sql = "SELECT 'FROM posts' FROM users WHERE na"
+
+        assert provider._find_table_context(sql, len(sql)) == "users"
+
+    def test_no_table_without_keyword(self, provider: CompletionProvider):
+        assert provider._find_table_context("SELECT na", 9) is None
+
+    def test_column_completion_uses_shared_cache(self):
+        cache = TokenCache()
+        provider = CompletionProvider(_Schema(), cache)
+        sql = "SELECT * FROM users WHERE na"
+
+        items = provider.get_completions(sql, len(sql))
+
+        assert [i.text for i in items] == ["name"]
+        assert cache._text == sql
@@ -0,0 +1,248 @@
+"""Tests for SqliteHistoryRepository."""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from qry.domains.query.models import ExecutionStatus, HistoryEntry
+from qry.infrastructure.repositories.sqlite_history import SqliteHistoryRepository
+
+
+def _entry(query: str, connection_name: str | None = None) -> HistoryEntry:
+    return HistoryEntry(
+        query=query, timestamp=datetime(2024, 1, 15, 10, 30), connection_name=connection_name
+    )
+
+
+class TestSqliteHistoryRepository:
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> SqliteHistoryRepository:
+        repo = SqliteHistoryRepository(tmp_path / "history.db")
+        yield repo
+        repo.close()
+
+    def test_empty(self, repo: SqliteHistoryRepository):
+        assert repo.load() == []
+        assert repo.recent(10) == []
+
+    def test_append_and_recent(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT 1", "local"))
+        repo.append(_entry("SELECT 2"))
+
+        recent = repo.recent(10)
+
+        assert [e.query for e in recent] == ["SELECT 2", "SELECT 1"]
+        assert recent[1].connection_name == "local"
+        assert recent[1].timestamp == datetime(2024, 1, 15, 10, 30)
+
+    def test_flush_persists(self, repo: SqliteHistoryRepository, tmp_path: Path):
+        repo.append(_entry("SELECT persistent"))
+        repo.flush()
+
+        other = SqliteHistoryRepository(tmp_path / "history.db")
+
+        assert [e.query for e in other.load()] == ["SELECT persistent"]
+        other.close()
+
+    def test_append_prunes_oldest(self, repo: SqliteHistoryRepository):
+        for i in range(10):
+            repo.append(_entry(f"SELECT * FROM t{i}"), max_entries=3)
+
+        assert [e.query for e in repo.load()] == [
+            "SELECT * FROM t7",
+            "SELECT * FROM t8",
+            "SELECT * FROM t9",
+        ]
+
+    def test_search_newest_first(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT * FROM users"))
+        repo.append(_entry("SELECT * FROM posts"))
+        repo.append(_entry("INSERT INTO Users VALUES (1)"))
+
+        results = repo.search("users")
+
+        assert [e.query for e in results] == [
+            "INSERT INTO Users VALUES (1)",
+            "SELECT * FROM users",
+        ]
+
+    def test_search_limit(self, repo: SqliteHistoryRepository):
+        for i in range(10):
+            repo.append(_entry(f"SELECT c{i} FROM users"))
+
+        results = repo.search("from users", limit=2)
+
+        assert [e.query for e in results] == ["SELECT c9 FROM users", "SELECT c8 FROM users"]
+
+    def test_search_short_pattern(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT a"))
+        repo.append(_entry("SELECT b"))
+
+        assert [e.query for e in repo.search("A")] == ["SELECT a"]
+
+    def test_search_pattern_with_quotes(self, repo: SqliteHistoryRepository):
+        repo.append(_entry('SELECT "weird""name" FROM t'))
+
+        assert len(repo.search('"weird""')) == 1
+
+    def test_search_after_prune(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT old_table"), max_entries=1)
+        repo.append(_entry("SELECT new_table"), max_entries=1)
+
+        assert repo.search("old_table") == []
+        assert len(repo.search("new_table")) == 1
+
+    def test_recent_scoped_to_connection(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT * FROM a", "local"))
+        repo.append(_entry("SELECT * FROM b", "prod"))
+        repo.append(_entry("SELECT * FROM c"))
+
+        assert [e.query for e in repo.recent(10, connection_name="local")] == ["SELECT * FROM a"]
+        assert len(repo.recent(10)) == 3
+
+    def test_search_scoped_to_connection(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT * FROM users", "local"))
+        repo.append(_entry("SELECT * FROM users", "prod"))
+
+        assert [e.connection_name for e in repo.search("users", connection_name="prod")] == ["prod"]
+        assert [e.connection_name for e in repo.search("u", connection_name="prod")] == ["prod"]
+        assert len(repo.search("users")) == 2
+
+    def test_clear(self, repo: SqliteHistoryRepository):
+        repo.append(_entry("SELECT 1"))
+
+        repo.clear()
+
+        assert repo.load() == []
+        assert repo.search("SELECT") == []
+
+    def test_imports_legacy_json(self, tmp_path: Path):
+        legacy = {
+            "entries": [
+                {
+                    "query": "SELECT legacy",
+                    "timestamp": "2024-01-15T10:30:00",
+                    "connection_name": None,
+                }
+            ]
+        }
+        (tmp_path / "history.json").write_text(json.dumps(legacy))
+
+        repo = SqliteHistoryRepository(tmp_path / "history.db")
+
+        assert [e.query for e in repo.load()] == ["SELECT legacy"]
+        repo.close()
+
+    def test_execution_details_round_trip(self, repo: SqliteHistoryRepository):
+        entry = _entry("SELECT 1")
+        entry.fingerprint = "abc"
+        entry.duration_ms = 12.5
+        entry.row_count = 1
+        repo.append(entry)
+
+        [loaded] = repo.executions()
+
+        assert loaded.fingerprint == "abc"
+        assert loaded.duration_ms == 12.5
+        assert loaded.row_count == 1
+        assert loaded.status == ExecutionStatus.OK
+
+    def test_failed_executions_hidden_from_recent_and_search(self, repo: SqliteHistoryRepository):
+        failed = _entry("SELECT broken_query")
+        failed.fingerprint = "abc"
+        failed.status = ExecutionStatus.ERROR
+        repo.append(_entry("SELECT working_query"))
+        repo.append(failed)
+
+        assert [e.query for e in repo.recent(10)] == ["SELECT working_query"]
+        assert repo.search("broken_query") == []
+        assert repo.search("b") == []
+        assert [e.status for e in repo.executions()] == [ExecutionStatus.OK, ExecutionStatus.ERROR]
+
+    def test_migrates_existing_database(self, tmp_path: Path):
+        path = tmp_path / "history.db"
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE history (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "query TEXT NOT NULL, timestamp TEXT NOT NULL, connection_name TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO history (query, timestamp) VALUES ('SELECT old_row', '2024-01-15T10:30:00')"
+        )
+        conn.commit()
+        conn.close()
+
+        repo = SqliteHistoryRepository(path)
+
+        [entry] = repo.load()
+        assert entry.status == ExecutionStatus.OK
+        assert entry.fingerprint is not None
+        assert len(repo.search("old_row")) == 1
+        repo.close()
+
+    def test_append_written_in_background(self, tmp_path: Path):
+        repo = SqliteHistoryRepository(tmp_path / "history.db", flush_interval=0.01)
+        repo.append(_entry("SELECT background"))
+
+        repo._writer.join(timeout=5)
+        other = SqliteHistoryRepository(tmp_path / "history.db")
+
+        assert [e.query for e in other.load()] == ["SELECT background"]
+        other.close()
+        repo.close()
+
+    def test_batch_committed_together(self, repo: SqliteHistoryRepository):
+        for i in range(5):
+            repo.append(_entry(f"SELECT * FROM t{i}"))
+
+        assert len(repo.recent(10)) == 5
+
+    def test_concurrent_instances_merge(self, tmp_path: Path):
+        path = tmp_path / "history.db"
+        first = SqliteHistoryRepository(path, flush_interval=0.01)
+        second = SqliteHistoryRepository(path, flush_interval=0.01)
+        for _ in range(3):
+            first.append(_entry("SELECT * FROM users"))
+            second.append(_entry("SELECT * FROM users"))
+        second.append(_entry("SELECT * FROM posts"))
+        first.flush()
+        second.flush()
+
+        entries = first.recent(10)
+
+        assert {e.query: e.use_count for e in entries} == {
+            "SELECT * FROM users": 6,
+            "SELECT * FROM posts": 1,
+        }
+        first.close()
+        second.close()
+
+    def test_first_append_on_another_thread(self, repo: SqliteHistoryRepository):
+        worker = threading.Thread(target=repo.append, args=(_entry("SELECT 1"),))
+        worker.start()
+        worker.join()
+
+        assert [e.query for e in repo.recent(10)] == ["SELECT 1"]
+
+    def test_write_error_raised_on_flush(self, repo: SqliteHistoryRepository):
+        broken = _entry(None)  # type: ignore[arg-type]
+        broken.fingerprint = "abc"
+        repo.append(broken)
+
+        with pytest.raises(sqlite3.Error):
+            repo.flush()
+
+    def test_write_error_not_raised_on_read(self, repo: SqliteHistoryRepository):
+        broken = _entry(None)  # type: ignore[arg-type]
+        broken.fingerprint = "abc"
+        repo.append(broken)
+        repo.append(_entry("SELECT 1"))
+
+        assert repo.recent(10) == []
+        assert repo.search("select") == []
+        with pytest.raises(sqlite3.Error):
+            repo.close()
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -135,3 +136,36 @@ class TestYamlSnippetRepository:
         repo = YamlSnippetRepository(path=path)
         repo.save(Snippet(name="test", query="SELECT 1"))
         assert path.exists()
+
+    def test_get_does_not_reparse_unchanged_file(
+        self, repo: YamlSnippetRepository, sample_snippet: Snippet
+    ):
+        repo.save(sample_snippet)
+
+        with patch.object(repo, "_read", wraps=repo._read) as read:
+            repo.get("select_users")
+            repo.list_all()
+            repo.save(Snippet(name="other", query="SELECT 2"))
+
+        read.assert_not_called()
+
+    def test_reloads_when_file_changes(self, repo: YamlSnippetRepository, tmp_path: Path):
+        repo.save(Snippet(name="first", query="SELECT 1"))
+        other = YamlSnippetRepository(path=tmp_path / "snippets.yaml")
+        other.save(Snippet(name="from_other_process", query="SELECT 22"))
+
+        assert repo.get("from_other_process") is not None
+
+    def test_search_by_text(self, repo: YamlSnippetRepository, sample_snippet: Snippet):
+        repo.save(sample_snippet)
+        repo.save(Snippet(name="count_orders", query="SELECT COUNT(*) FROM orders"))
+
+        assert [s.name for s in repo.search("USERS")] == ["select_users"]
+        assert [s.name for s in repo.search("select")] == ["select_users", "count_orders"]
+
+    def test_search_by_category(self, repo: YamlSnippetRepository, sample_snippet: Snippet):
+        repo.save(sample_snippet)
+        repo.save(Snippet(name="drop_users", query="DROP TABLE users", category="danger"))
+
+        assert [s.name for s in repo.search("users", category="danger")] == ["drop_users"]
+        assert repo.search("users", category="missing") == []
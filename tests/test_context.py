@@ -90,6 +90,80 @@ class TestAppContext:
 
         context.disconnect()
 
+    def test_history_scoped_per_connection(self, context: AppContext, tmp_path: Path):
+        db1 = tmp_path / "db1.db"
+        db2 = tmp_path / "db2.db"
+        for db in [db1, db2]:
+            conn = sqlite3.connect(db)
+            conn.execute("CREATE TABLE test (id INTEGER)")
+            conn.close()
+
+        context.connect(ConnectionConfig(name="db1", db_type=DatabaseType.SQLITE, path=str(db1)))
+        context.query_service.execute("SELECT id FROM test")
+        context.connect(ConnectionConfig(name="db2", db_type=DatabaseType.SQLITE, path=str(db2)))
+        context.query_service.execute("SELECT * FROM test")
+
+        assert context.query_service.history._repository is context.history_repository
+        assert [e.query for e in context.query_service.get_history()] == ["SELECT * FROM test"]
+        assert len(context.query_service.get_history_page("from test", 0, 10)) == 1
+        assert len(context.query_service.get_history_page("from test", 0, 10, True)) == 2
+
+        context.disconnect()
+
+    def test_fan_out(self, context: AppContext, sample_sqlite_db: Path):
+        for name in ("one", "two"):
+            context.save_connection(
+                ConnectionConfig(name=name, db_type=DatabaseType.SQLITE, path=str(sample_sqlite_db))
+            )
+
+        items = list(context.fan_out("SELECT COUNT(*) FROM users", ["two"]))
+
+        assert [(item.connection_name, item.result.rows) for item in items] == [("two", [(2,)])]
+
+    def test_use_scratchpad_keeps_connection(self, context: AppContext, sample_sqlite_db: Path):
+        context.connect(
+            ConnectionConfig(name="test", db_type=DatabaseType.SQLITE, path=str(sample_sqlite_db))
+        )
+        users = context.query_service.execute("SELECT id, name FROM users")
+        context.scratchpad.pin("users", users, source="test")
+
+        context.use_scratchpad(True)
+
+        assert context.using_scratchpad
+        assert context.current_connection.name == "scratchpad"
+        result = context.query_service.execute("SELECT name FROM users WHERE id = 2")
+        assert result.rows == [("Bob",)]
+
+        context.use_scratchpad(False)
+
+        assert context.current_connection.name == "test"
+        assert context.query_service.execute("SELECT COUNT(*) FROM posts").rows == [(1,)]
+        context.close()
+
+    def test_close_drops_scratchpad(self, context: AppContext):
+        context.use_scratchpad(True)
+        path = context.scratchpad.path
+
+        context.close()
+
+        assert not path.exists()
+        assert not context.using_scratchpad
+        assert not context.is_connected
+
+    async def test_create_async_adapter(self, context: AppContext, sample_sqlite_db: Path):
+        assert context.create_async_adapter() is None
+
+        context.connect(
+            ConnectionConfig(name="test", db_type=DatabaseType.SQLITE, path=str(sample_sqlite_db))
+        )
+        adapter = context.create_async_adapter()
+        await adapter.connect()
+
+        assert [t.name for t in await adapter.get_tables()] == ["posts", "users"]
+        assert adapter.adapter is not context.adapter
+        await adapter.disconnect()
+        context.disconnect()
+
     def test_get_connections(self, context: AppContext):
         connections = context.get_connections()
 
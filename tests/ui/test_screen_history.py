@@ -1,6 +1,7 @@
 """Tests for HistoryScreen."""
 
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
 from qry.domains.query.models import HistoryEntry
 from qry.ui.screens.screen_history import HistoryScreen
@@ -71,3 +72,46 @@ class TestHistoryScreen:
             preview += "..."
         assert len(preview) == 63  # 60 + "..."
         assert preview.endswith("...")
+
+    def test_loader_filter_fetches_first_page(self):
+        entries = self._make_entries()
+        calls: list[tuple[str, int, int, bool]] = []
+
+        def loader(
+            pattern: str, offset: int, limit: int, all_connections: bool
+        ) -> list[HistoryEntry]:
+            calls.append((pattern, offset, limit, all_connections))
+            return [e for e in entries if pattern.lower() in e.search_text][offset : offset + limit]
+
+        screen = HistoryScreen(entries[:2], loader=loader, page_size=2)
+        screen._refresh_list = lambda: None
+
+        assert not screen._exhausted
+        screen._apply_filter("select")
+
+        assert calls == [("select", 0, 2, False)]
+        assert [e.query for e in screen._filtered] == ["SELECT * FROM users"]
+        assert screen._exhausted
+
+    def test_toggle_all_connections_reloads(self):
+        calls: list[tuple[str, int, int, bool]] = []
+
+        def loader(
+            pattern: str, offset: int, limit: int, all_connections: bool
+        ) -> list[HistoryEntry]:
+            calls.append((pattern, offset, limit, all_connections))
+            return []
+
+        screen = HistoryScreen(self._make_entries(), loader=loader, page_size=2)
+        screen._refresh_list = lambda: None
+        screen._pattern = "users"
+
+        with patch.object(screen, "query_one", return_value=MagicMock()):
+            screen.action_toggle_all_connections()
+            screen.action_toggle_all_connections()
+
+        assert calls == [("users", 0, 2, True), ("users", 0, 2, False)]
+
+    def test_without_loader_is_exhausted(self):
+        screen = HistoryScreen(self._make_entries())
+        assert screen._exhausted
@@ -0,0 +1,14 @@
+"""Tests for PinScreen."""
+
+from qry.application.scratchpad import PinnedTable
+from qry.ui.screens.screen_pin import format_pinned
+
+
+class TestFormatPinned:
+    def test_nothing_pinned(self):
+        assert format_pinned([]) == "Nothing pinned yet"
+
+    def test_tables_with_sources(self):
+        pinned = [PinnedTable("users", 1200, "prod"), PinnedTable("notes", 3)]
+
+        assert format_pinned(pinned) == "Pinned: users (1,200 rows from prod), notes (3 rows)"
@@ -124,3 +124,14 @@ class TestSnippetScreen:
         snippet = Snippet(name="test", query="SELECT 1")
         label = SnippetScreen._format_snippet_label(snippet)
         assert label == "test"
+
+    @patch.object(SnippetScreen, "_refresh_list")
+    def test_filter_uses_search_callback(self, _mock_refresh):
+        snippets = self._make_snippets()
+        search = MagicMock(return_value=snippets[:1])
+        screen = SnippetScreen(snippets, search=search)
+        event = MagicMock()
+        event.value = " Users "
+        screen.on_input_changed(event)
+        search.assert_called_once_with("users")
+        assert screen._filtered == snippets[:1]
@@ -0,0 +1,43 @@
+"""Tests for the export progress panel helpers."""
+
+from qry.application.export_job import ExportProgress
+from qry.application.import_job import ImportProgress
+from qry.ui.widgets.widget_export_progress import (
+    format_bytes,
+    format_import_progress,
+    format_progress,
+)
+
+
+class TestFormatBytes:
+    def test_bytes(self):
+        assert format_bytes(512) == "512 B"
+
+    def test_megabytes(self):
+        assert format_bytes(3.5 * 1024 * 1024) == "3.5 MB"
+
+
+class TestFormatProgress:
+    def test_streamed_export_has_no_eta(self):
+        progress = ExportProgress(rows=12345, bytes_written=2048, elapsed_seconds=2.0)
+
+        assert format_progress(progress) == "12,345 rows | 2.0 KB | 6,172 rows/s"
+
+    def test_known_total_shows_eta(self):
+        progress = ExportProgress(rows=100, elapsed_seconds=1.0, total_rows=400)
+
+        assert format_progress(progress).endswith("ETA 3s")
+
+
+class TestFormatImportProgress:
+    def test_rejected_rows_and_eta_by_bytes(self):
+        progress = ImportProgress(
+            rows=1000, rejected=3, bytes_read=250, total_bytes=1000, elapsed_seconds=2.0
+        )
+
+        assert format_import_progress(progress) == "1,000 rows | 3 rejected | 500 rows/s | ETA 6s"
+
+    def test_no_rejects(self):
+        progress = ImportProgress(rows=10, elapsed_seconds=1.0)
+
+        assert format_import_progress(progress) == "10 rows | 10 rows/s"
@@ -524,3 +524,20 @@ class TestUpdateBorderTitle:
 
     def test_no_result_noop(self, widget: ResultsTable) -> None:
         widget._update_border_title([])
+
+
+class TestSetResults:
+    def test_summary_shows_total_time(self, widget: ResultsTable) -> None:
+        results = [QueryResult(execution_time_ms=2.0), QueryResult(execution_time_ms=3.0)]
+        widget.set_results(results)
+        assert widget.border_title == "Results - 2 queries (5.0ms)"
+
+    def test_summary_shows_wall_time(self, widget: ResultsTable) -> None:
+        results = [QueryResult(execution_time_ms=2.0), QueryResult(execution_time_ms=3.0)]
+        widget.set_results(results, elapsed_ms=3.5)
+        assert widget.border_title == "Results - 2 queries (3.5ms wall, 5.0ms total)"
+
+    def test_summary_names_first_error(self, widget: ResultsTable) -> None:
+        results = [QueryResult(), QueryResult(error="boom"), QueryResult()]
+        widget.set_results(results, elapsed_ms=1.0)
+        assert widget.border_title.endswith("Error in query 2")